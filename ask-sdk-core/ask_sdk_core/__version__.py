@@ -19,11 +19,11 @@ __pip_package_name__ = 'ask-sdk-core'
 __description__ = ('The ASK SDK Core package provides core Alexa Skills Kit '
                    'functionality, for building Alexa Skills.')
 __url__ = 'https://github.com/alexa/alexa-skills-kit-sdk-for-python'
-__version__ = '1.19.0'
+__version__ = '1.20.0'
 __author__ = 'Alexa Skills Kit'
 __author_email__ = 'ask-sdk-dynamic@amazon.com'
 __license__ = 'Apache 2.0'
 __keywords__ = ['ASK SDK', 'Alexa Skills Kit', 'Alexa', 'Core']
 __install_requires__ = ["requests", "python_dateutil",
-                        "ask-sdk-model>=1.0.0", "ask-sdk-runtime>=1.15.0"]
+                        "ask-sdk-model>=1.0.0", "ask-sdk-runtime>=1.20.0"]
 
@@ -18,25 +18,45 @@
 import typing
 import requests
 import six
-import json
 
 from urllib3.util import parse_url
 
 from ask_sdk_model.services import ApiClient, ApiClientResponse
 
 from .exceptions import ApiClientException
+from .json_codec import get_default_json_codec
 
 if typing.TYPE_CHECKING:
     from typing import Callable, Dict, List, Tuple, Optional
     from ask_sdk_model.services import ApiClientRequest
+    from .json_codec import AbstractJsonCodec
 
 
 class DefaultApiClient(ApiClient):
     """Default ApiClient implementation of
     :py:class:`ask_sdk_model.services.api_client.ApiClient` using the
     `requests` library.
+
+    :param json_codec: Codec used to encode JSON request bodies.
+        Defaulted to
+        :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+    :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
     """
 
+    def __init__(self, json_codec=None):
+        # type: (Optional[AbstractJsonCodec]) -> None
+        """Default ApiClient implementation using the `requests`
+        library.
+
+        :param json_codec: Codec used to encode JSON request bodies.
+            Defaulted to
+            :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+        :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+        """
+        if json_codec is None:
+            json_codec = get_default_json_codec()
+        self.json_codec = json_codec
+
     def invoke(self, request):
         # type: (ApiClientRequest) -> ApiClientResponse
         """Dispatches a request to an API endpoint described in the
@@ -71,7 +91,7 @@ class DefaultApiClient(ApiClient):
                 body_content_type = http_headers.get("Content-type", None)
                 if (body_content_type is not None and
                         "json" in body_content_type):
-                    raw_data = json.dumps(request.body)
+                    raw_data = self.json_codec.dumps(request.body)
                 else:
                     raw_data = request.body
 
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import typing
+
+if typing.TYPE_CHECKING:
+    from typing import Any
+    from ask_sdk_model import RequestEnvelope, ResponseEnvelope, Response
+    from .skill import CustomSkill
+
+
+async def invoke_skill_async(skill, request_envelope, context):
+    # type: (CustomSkill, RequestEnvelope, Any) -> ResponseEnvelope
+    """Invoke the async dispatcher of the skill, to handle the request
+    envelope and return a response envelope.
+
+    Kept in a separate module from :py:mod:`ask_sdk_core.skill`, since
+    coroutine syntax is not supported on Python 2.
+
+    :param skill: Skill instance handling the request
+    :type skill: ask_sdk_core.skill.CustomSkill
+    :param request_envelope: Request Envelope instance containing
+        request information
+    :type request_envelope: RequestEnvelope
+    :param context: Context passed during invocation
+    :type context: Any
+    :return: Response Envelope generated by handling the request
+    :rtype: ResponseEnvelope
+    """
+    handler_input = skill._create_handler_input(
+        request_envelope=request_envelope, context=context)
+
+    response = await skill.async_request_dispatcher.dispatch(
+        handler_input=handler_input)  # type: Response
+
+    return skill._create_response_envelope(
+        handler_input=handler_input, response=response)
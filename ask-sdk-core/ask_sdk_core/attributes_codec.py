@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import typing
+import zlib
+from abc import ABCMeta, abstractmethod
+from six import indexbytes, int2byte
+
+from .json_codec import get_default_json_codec
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Dict, Optional
+    from .json_codec import AbstractJsonCodec
+
+
+# Encoded attributes start with a header byte in the 0x10 - 0x1F
+# range, which JSON text never starts with. The low bits of the
+# header hold the format id and the compression id.
+_HEADER_MARKER = 0x10
+_HEADER_MARKER_MASK = 0xF0
+_FORMAT_ID_SHIFT = 2
+_MAX_ID = 3
+
+
+class AbstractAttributesCodec(object):
+    """Encodes persistent attributes to bytes stored by persistence
+    adapters, and decodes them back.
+
+    Codecs can be provided to persistence adapters supporting them,
+    like :py:class:`ask_sdk_dynamodb.adapter.DynamoDbAdapter` and
+    :py:class:`ask_sdk_s3.adapter.S3Adapter`, to reduce the size of
+    the stored attributes.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def encode(self, attributes):
+        # type: (Dict[str, object]) -> bytes
+        """Encode the attributes to bytes.
+
+        :param attributes: Attributes to be encoded
+        :type attributes: Dict[str, object]
+        :return: Encoded attributes
+        :rtype: bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, data):
+        # type: (bytes) -> Dict[str, object]
+        """Decode the attributes from bytes.
+
+        :param data: Encoded attributes
+        :type data: bytes
+        :return: Decoded attributes
+        :rtype: Dict[str, object]
+        """
+        raise NotImplementedError
+
+
+class AbstractAttributesFormat(object):
+    """Format serializing attributes to bytes, used by
+    :py:class:`AttributesCodec`.
+
+    Each format has a ``format_id`` between 0 and 3, stored in the
+    header of the encoded attributes. Ids 0 to 2 are used by the
+    formats provided by the SDK, and 3 is free for a custom format.
+    """
+    __metaclass__ = ABCMeta
+
+    format_id = None  # type: int
+
+    @abstractmethod
+    def dumps(self, attributes):
+        # type: (Dict[str, object]) -> bytes
+        """Serialize the attributes to bytes.
+
+        :param attributes: Attributes to be serialized
+        :type attributes: Dict[str, object]
+        :return: Serialized attributes
+        :rtype: bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data):
+        # type: (bytes) -> Dict[str, object]
+        """Deserialize the attributes from bytes.
+
+        :param data: Serialized attributes
+        :type data: bytes
+        :return: Deserialized attributes
+        :rtype: Dict[str, object]
+        """
+        raise NotImplementedError
+
+
+class JsonAttributesFormat(AbstractAttributesFormat):
+    """Format serializing attributes to UTF-8 encoded JSON text.
+
+    :param json_codec: Codec used to encode and decode the attributes.
+        Defaulted to :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+    :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+    """
+    format_id = 0
+
+    def __init__(self, json_codec=None):
+        # type: (Optional[AbstractJsonCodec]) -> None
+        """Format serializing attributes to UTF-8 encoded JSON text.
+
+        :param json_codec: Codec used to encode and decode the
+            attributes. Defaulted to
+            :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+        :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+        """
+        if json_codec is None:
+            json_codec = get_default_json_codec()
+        self.json_codec = json_codec
+
+    def dumps(self, attributes):
+        # type: (Dict[str, object]) -> bytes
+        """Serialize the attributes to UTF-8 encoded JSON text.
+
+        :param attributes: Attributes to be serialized
+        :type attributes: Dict[str, object]
+        :return: Serialized attributes
+        :rtype: bytes
+        """
+        return self.json_codec.dumps(attributes).encode("utf-8")
+
+    def loads(self, data):
+        # type: (bytes) -> Dict[str, object]
+        """Deserialize the attributes from UTF-8 encoded JSON text.
+
+        :param data: Serialized attributes
+        :type data: bytes
+        :return: Deserialized attributes
+        :rtype: Dict[str, object]
+        """
+        return self.json_codec.loads(data)
+
+
+class MsgpackAttributesFormat(AbstractAttributesFormat):
+    """Format serializing attributes to
+    `MessagePack <https://pypi.org/project/msgpack/>`__.
+
+    :raises: ImportError if ``msgpack`` is not installed
+    """
+    format_id = 1
+
+    def __init__(self):
+        # type: () -> None
+        """Format serializing attributes to MessagePack.
+
+        :raises: ImportError if ``msgpack`` is not installed
+        """
+        import msgpack  # type: ignore
+        self._msgpack = msgpack
+
+    def dumps(self, attributes):
+        # type: (Dict[str, object]) -> bytes
+        """Serialize the attributes to MessagePack.
+
+        :param attributes: Attributes to be serialized
+        :type attributes: Dict[str, object]
+        :return: Serialized attributes
+        :rtype: bytes
+        """
+        return self._msgpack.packb(attributes, use_bin_type=True)
+
+    def loads(self, data):
+        # type: (bytes) -> Dict[str, object]
+        """Deserialize the attributes from MessagePack.
+
+        :param data: Serialized attributes
+        :type data: bytes
+        :return: Deserialized attributes
+        :rtype: Dict[str, object]
+        """
+        return self._msgpack.unpackb(data, raw=False)
+
+
+class CborAttributesFormat(AbstractAttributesFormat):
+    """Format serializing attributes to
+    `CBOR <https://pypi.org/project/cbor2/>`__.
+
+    :raises: ImportError if ``cbor2`` is not installed
+    """
+    format_id = 2
+
+    def __init__(self):
+        # type: () -> None
+        """Format serializing attributes to CBOR.
+
+        :raises: ImportError if ``cbor2`` is not installed
+        """
+        import cbor2  # type: ignore
+        self._cbor2 = cbor2
+
+    def dumps(self, attributes):
+        # type: (Dict[str, object]) -> bytes
+        """Serialize the attributes to CBOR.
+
+        :param attributes: Attributes to be serialized
+        :type attributes: Dict[str, object]
+        :return: Serialized attributes
+        :rtype: bytes
+        """
+        return self._cbor2.dumps(attributes)
+
+    def loads(self, data):
+        # type: (bytes) -> Dict[str, object]
+        """Deserialize the attributes from CBOR.
+
+        :param data: Serialized attributes
+        :type data: bytes
+        :return: Deserialized attributes
+        :rtype: Dict[str, object]
+        """
+        return self._cbor2.loads(data)
+
+
+class AbstractCompression(object):
+    """Compression of serialized attributes, used by
+    :py:class:`AttributesCodec`.
+
+    Each compression has a ``compression_id`` between 1 and 3, stored
+    in the header of the encoded attributes. Ids 1 and 2 are used by
+    the compressions provided by the SDK, and 3 is free for a custom
+    compression.
+    """
+    __metaclass__ = ABCMeta
+
+    compression_id = None  # type: int
+
+    @abstractmethod
+    def compress(self, data):
+        # type: (bytes) -> bytes
+        """Compress the data.
+
+        :param data: Data to be compressed
+        :type data: bytes
+        :return: Compressed data
+        :rtype: bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def decompress(self, data):
+        # type: (bytes) -> bytes
+        """Decompress the data.
+
+        :param data: Compressed data
+        :type data: bytes
+        :return: Decompressed data
+        :rtype: bytes
+        """
+        raise NotImplementedError
+
+
+class ZlibCompression(AbstractCompression):
+    """Compression using the standard library ``zlib`` module.
+
+    :param level: Compression level, from 1 (fastest) to 9 (smallest).
+        Defaulted to 6
+    :type level: int
+    """
+    compression_id = 1
+
+    def __init__(self, level=6):
+        # type: (int) -> None
+        """Compression using the standard library ``zlib`` module.
+
+        :param level: Compression level, from 1 (fastest) to 9
+            (smallest). Defaulted to 6
+        :type level: int
+        """
+        self.level = level
+
+    def compress(self, data):
+        # type: (bytes) -> bytes
+        """Compress the data with zlib.
+
+        :param data: Data to be compressed
+        :type data: bytes
+        :return: Compressed data
+        :rtype: bytes
+        """
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data):
+        # type: (bytes) -> bytes
+        """Decompress the data with zlib.
+
+        :param data: Compressed data
+        :type data: bytes
+        :return: Decompressed data
+        :rtype: bytes
+        """
+        return zlib.decompress(data)
+
+
+class ZstdCompression(AbstractCompression):
+    """Compression using the
+    `zstandard <https://pypi.org/project/zstandard/>`__ library.
+
+    :param level: Compression level, from 1 (fastest) to 22
+        (smallest). Defaulted to 3
+    :type level: int
+    :raises: ImportError if ``zstandard`` is not installed
+    """
+    compression_id = 2
+
+    def __init__(self, level=3):
+        # type: (int) -> None
+        """Compression using the ``zstandard`` library.
+
+        :param level: Compression level, from 1 (fastest) to 22
+            (smallest). Defaulted to 3
+        :type level: int
+        :raises: ImportError if ``zstandard`` is not installed
+        """
+        import zstandard  # type: ignore
+        self._zstandard = zstandard
+        self.level = level
+
+    def compress(self, data):
+        # type: (bytes) -> bytes
+        """Compress the data with zstandard.
+
+        :param data: Data to be compressed
+        :type data: bytes
+        :return: Compressed data
+        :rtype: bytes
+        """
+        # Compressor objects can't be shared between threads
+        return self._zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def decompress(self, data):
+        # type: (bytes) -> bytes
+        """Decompress the data with zstandard.
+
+        :param data: Compressed data
+        :type data: bytes
+        :return: Decompressed data
+        :rtype: bytes
+        """
+        return self._zstandard.ZstdDecompressor().decompress(data)
+
+
+_FORMAT_CLASSES = {
+    JsonAttributesFormat.format_id: JsonAttributesFormat,
+    MsgpackAttributesFormat.format_id: MsgpackAttributesFormat,
+    CborAttributesFormat.format_id: CborAttributesFormat
+}  # type: Dict[int, Any]
+
+_COMPRESSION_CLASSES = {
+    ZlibCompression.compression_id: ZlibCompression,
+    ZstdCompression.compression_id: ZstdCompression
+}  # type: Dict[int, Any]
+
+
+class AttributesCodec(AbstractAttributesCodec):
+    """Codec serializing attributes with a format, and compressing
+    them with an optional compression.
+
+    The encoded attributes start with a header byte identifying the
+    format and the compression, followed by the serialized and
+    possibly compressed attributes. Attributes smaller than
+    ``min_compress_size`` once serialized are stored uncompressed, as
+    compression doesn't pay off for them.
+
+    Attributes are decoded according to their header, whatever the
+    codec configuration is, so that the format and compression can be
+    changed without migrating the stored attributes. Data without
+    header is decoded as JSON text, as stored by the persistence
+    adapters before the codec was configured.
+
+    :param attributes_format: Format serializing the attributes.
+        Defaulted to :py:class:`JsonAttributesFormat`
+    :type attributes_format: AbstractAttributesFormat
+    :param compression: Compression of the serialized attributes.
+        Defaulted to None, storing the attributes uncompressed
+    :type compression: AbstractCompression
+    :param min_compress_size: Minimum size in bytes of the serialized
+        attributes to be compressed. Defaulted to 1024
+    :type min_compress_size: int
+    """
+
+    def __init__(
+            self, attributes_format=None, compression=None,
+            min_compress_size=1024):
+        # type: (Optional[AbstractAttributesFormat], Optional[AbstractCompression], int) -> None
+        """Codec serializing attributes with a format, and
+        compressing them with an optional compression.
+
+        :param attributes_format: Format serializing the attributes.
+            Defaulted to :py:class:`JsonAttributesFormat`
+        :type attributes_format: AbstractAttributesFormat
+        :param compression: Compression of the serialized attributes.
+            Defaulted to None, storing the attributes uncompressed
+        :type compression: AbstractCompression
+        :param min_compress_size: Minimum size in bytes of the
+            serialized attributes to be compressed. Defaulted to 1024
+        :type min_compress_size: int
+        :raises: ValueError if the format or compression id is out of
+            range
+        """
+        if attributes_format is None:
+            attributes_format = JsonAttributesFormat()
+        if not 0 <= attributes_format.format_id <= _MAX_ID:
+            raise ValueError(
+                "Attributes format id should be between 0 and {}, "
+                "got {}".format(_MAX_ID, attributes_format.format_id))
+        if compression is not None and not (
+                1 <= compression.compression_id <= _MAX_ID):
+            raise ValueError(
+                "Compression id should be between 1 and {}, got {}".format(
+                    _MAX_ID, compression.compression_id))
+        self.attributes_format = attributes_format
+        self.compression = compression
+        self.min_compress_size = min_compress_size
+        self._formats = {
+            attributes_format.format_id: attributes_format
+        }  # type: Dict[int, AbstractAttributesFormat]
+        self._compressions = {}  # type: Dict[int, AbstractCompression]
+        if compression is not None:
+            self._compressions[compression.compression_id] = compression
+
+    def encode(self, attributes):
+        # type: (Dict[str, object]) -> bytes
+        """Encode the attributes to the header byte, followed by the
+        serialized and possibly compressed attributes.
+
+        :param attributes: Attributes to be encoded
+        :type attributes: Dict[str, object]
+        :return: Encoded attributes
+        :rtype: bytes
+        """
+        data = self.attributes_format.dumps(attributes)
+        compression_id = 0
+        if (self.compression is not None and
+                len(data) >= self.min_compress_size):
+            data = self.compression.compress(data)
+            compression_id = self.compression.compression_id
+        header = (_HEADER_MARKER |
+                  self.attributes_format.format_id << _FORMAT_ID_SHIFT |
+                  compression_id)
+        return int2byte(header) + data
+
+    def decode(self, data):
+        # type: (bytes) -> Dict[str, object]
+        """Decode the attributes according to their header byte, or
+        as JSON text if they have no header.
+
+        :param data: Encoded attributes, or attributes stored as JSON
+            text
+        :type data: bytes
+        :return: Decoded attributes
+        :rtype: Dict[str, object]
+        :raises: ValueError if the format or compression in the header
+            is unknown, or its library isn't installed
+        """
+        if not data:
+            return {}
+        header = indexbytes(data, 0)
+        if header & _HEADER_MARKER_MASK != _HEADER_MARKER:
+            return self.__get_format(JsonAttributesFormat.format_id).loads(
+                data)
+
+        payload = data[1:]
+        compression_id = header & _MAX_ID
+        if compression_id:
+            payload = self.__get_compression(compression_id).decompress(
+                payload)
+        return self.__get_format(header >> _FORMAT_ID_SHIFT & _MAX_ID).loads(
+            payload)
+
+    def __get_format(self, format_id):
+        # type: (int) -> AbstractAttributesFormat
+        """Get the format with the id, creating the SDK provided format
+        on first use if it isn't the configured one.
+
+        :param format_id: Id of the format
+        :type format_id: int
+        :return: Format with the id
+        :rtype: AbstractAttributesFormat
+        :raises: ValueError if the format is unknown, or its library
+            isn't installed
+        """
+        attributes_format = self._formats.get(format_id)
+        if attributes_format is None:
+            attributes_format = self.__create(
+                _FORMAT_CLASSES, format_id, "format")
+            self._formats[format_id] = attributes_format
+        return attributes_format
+
+    def __get_compression(self, compression_id):
+        # type: (int) -> AbstractCompression
+        """Get the compression with the id, creating the SDK provided
+        compression on first use if it isn't the configured one.
+
+        :param compression_id: Id of the compression
+        :type compression_id: int
+        :return: Compression with the id
+        :rtype: AbstractCompression
+        :raises: ValueError if the compression is unknown, or its
+            library isn't installed
+        """
+        compression = self._compressions.get(compression_id)
+        if compression is None:
+            compression = self.__create(
+                _COMPRESSION_CLASSES, compression_id, "compression")
+            self._compressions[compression_id] = compression
+        return compression
+
+    @staticmethod
+    def __create(classes, class_id, kind):
+        # type: (Dict[int, Any], int, str) -> Any
+        """Create the SDK provided format or compression with the id.
+
+        :param classes: Format or compression classes, by id
+        :type classes: Dict[int, Any]
+        :param class_id: Id of the format or compression
+        :type class_id: int
+        :param kind: Kind of the class, for error messages
+        :type kind: str
+        :return: Format or compression with the id
+        :rtype: object
+        :raises: ValueError if the id is unknown, or the library of
+            the class isn't installed
+        """
+        if class_id not in classes:
+            raise ValueError(
+                "Attributes encoded with unknown {} id {}".format(
+                    kind, class_id))
+        try:
+            return classes[class_id]()
+        except ImportError as e:
+            raise ValueError(
+                "Attributes encoded with {} {} can't be decoded: {}".format(
+                    kind, classes[class_id].__name__, str(e)))
@@ -15,14 +15,18 @@
 # specific language governing permissions and limitations under the
 # License.
 #
+import copy
 import typing
 from abc import ABCMeta, abstractmethod
-from copy import deepcopy
+from collections import OrderedDict
+from typing import cast, Any
+
+from six import PY2
 
 from .exceptions import AttributesManagerException
 
 if typing.TYPE_CHECKING:
-    from typing import Dict, Optional, Any
+    from typing import Dict, List, Optional, Iterable, Set, Tuple
     from ask_sdk_model import RequestEnvelope
 
 
@@ -62,6 +66,91 @@ class AbstractPersistenceAdapter(object):
         """
         pass
 
+    def save_changed_attributes(
+            self, request_envelope, attributes, changed_keys, removed_keys):
+        # type: (RequestEnvelope, Dict[str, object], Set[str], Set[str]) -> None
+        """Save attributes that changed since they were retrieved, to
+        persistent tier.
+
+        The method is called instead of ``save_attributes`` when the
+        attributes were retrieved using ``get_attributes`` during the
+        request and some of them changed. By default, it saves all the
+        attributes using ``save_attributes``. Adapters that can update
+        only the changed attributes in the persistent tier can override
+        it.
+
+        :param request_envelope: request envelope.
+        :type request_envelope: RequestEnvelope
+        :param attributes: attributes to be saved to persistent tier
+        :type attributes: Dict[str, object]
+        :param changed_keys: keys of the attributes that are added or
+            changed since they were retrieved
+        :type changed_keys: Set[str]
+        :param removed_keys: keys of the attributes that are removed
+            since they were retrieved
+        :type removed_keys: Set[str]
+        :rtype: None
+        """
+        self.save_attributes(
+            request_envelope=request_envelope, attributes=attributes)
+
+    def get_partial_attributes(self, request_envelope, keys):
+        # type: (RequestEnvelope, List[str]) -> Optional[Dict[str, object]]
+        """Get only the attributes with the provided top level keys
+        from persistent tier.
+
+        Adapters that can retrieve only some of the attributes from the
+        persistent tier can override the method. The attributes
+        retrieved this way are saved through
+        :py:meth:`save_partial_attributes`. By default, it returns
+        None, so that all the attributes are retrieved using
+        ``get_attributes`` instead.
+
+        :param request_envelope: Request Envelope from Alexa service
+        :type request_envelope: RequestEnvelope
+        :param keys: Top level keys of the attributes to be retrieved
+        :type keys: List[str]
+        :return: A dictionary of the attributes with the provided keys
+            that exist in persistent tier, or None if retrieving only
+            some attributes isn't supported
+        :rtype: Dict[str, object]
+        """
+        return None
+
+    def save_partial_attributes(
+            self, request_envelope, attributes, changed_keys, removed_keys):
+        # type: (RequestEnvelope, Dict[str, object], Set[str], Set[str]) -> None
+        """Save changes to attributes retrieved using
+        :py:meth:`get_partial_attributes`, to persistent tier.
+
+        The ``attributes`` contain only the retrieved attributes and
+        the attributes added during the request, so the attributes in
+        persistent tier that weren't retrieved have to be kept. By
+        default, it retrieves all the attributes using
+        ``get_attributes``, applies the changes and saves them using
+        ``save_attributes``.
+
+        :param request_envelope: request envelope.
+        :type request_envelope: RequestEnvelope
+        :param attributes: retrieved attributes, with the changes to
+            be saved to persistent tier
+        :type attributes: Dict[str, object]
+        :param changed_keys: keys of the attributes that are added or
+            changed
+        :type changed_keys: Set[str]
+        :param removed_keys: keys of the attributes that are removed
+        :type removed_keys: Set[str]
+        :rtype: None
+        """
+        stored_attributes = dict(
+            self.get_attributes(request_envelope=request_envelope))
+        for key in changed_keys:
+            stored_attributes[key] = attributes[key]
+        for key in removed_keys:
+            stored_attributes.pop(key, None)
+        self.save_attributes(
+            request_envelope=request_envelope, attributes=stored_attributes)
+
     @abstractmethod
     def delete_attributes(self, request_envelope):
         # type: (RequestEnvelope) -> None
@@ -74,10 +163,361 @@ class AbstractPersistenceAdapter(object):
         pass
 
 
+# Mutable values that are copied on first access, instead of being
+# shared with the wrapped structure. Sets are returned by the DynamoDb
+# adapters for string and number set attributes.
+_MUTABLE_TYPES = (dict, list, set, bytearray)
+
+
+def _get_shared_values(values):
+    # type: (Iterable[Any]) -> Dict[int, Any]
+    """Get the mutable values, by id.
+
+    The values are referenced along with their ids, so that the ids
+    can't be reused by other objects while they are tracked.
+
+    :param values: Values of a dict or list
+    :type values: Iterable[Any]
+    :return: Values that are dicts, lists, sets or bytearrays, by id
+    :rtype: Dict[int, Any]
+    """
+    return {
+        id(value): value for value in values
+        if isinstance(value, _MUTABLE_TYPES)}
+
+
+def _is_shared(shared_values, value):
+    # type: (Dict[int, Any], Any) -> bool
+    """Check if the value is one of the shared values.
+
+    :param shared_values: Shared values, by id
+    :type shared_values: Dict[int, Any]
+    :param value: Value to be checked
+    :type value: Any
+    :return: True if the value is the same object as a shared value
+    :rtype: bool
+    """
+    return shared_values.get(id(value)) is value
+
+
+def _copy_on_write(value):
+    # type: (Any) -> Any
+    """Wrap the dict or list value in a copy on write container, or
+    copy the set or bytearray value.
+
+    :param value: Value to be wrapped
+    :type value: Any
+    :return: :py:class:`_CopyOnWriteDict` or
+        :py:class:`_CopyOnWriteList` for dict or list values, a
+        shallow copy for set or bytearray values, the value itself
+        otherwise
+    :rtype: Any
+    """
+    if isinstance(value, (_CopyOnWriteDict, _CopyOnWriteList)):
+        return value
+    if isinstance(value, dict):
+        return _CopyOnWriteDict(value)
+    if isinstance(value, list):
+        return _CopyOnWriteList(value)
+    if isinstance(value, (set, bytearray)):
+        return copy.copy(value)
+    return value
+
+
+def _unwrap_copy_on_write(value):
+    # type: (Any) -> Any
+    """Convert the copy on write containers in the value to builtin
+    dicts and lists.
+
+    Only the containers accessed through the copy on write containers
+    are converted. The values still shared with the wrapped structure
+    are returned as is, so the returned value may share them with the
+    request envelope and should be treated as read only. It is used to
+    serialize the session attributes in the response, without copying
+    the values that weren't accessed.
+
+    :param value: Value to be converted
+    :type value: Any
+    :return: Value with the copy on write containers converted to
+        builtin dicts and lists
+    :rtype: Any
+    """
+    if isinstance(value, _CopyOnWriteDict):
+        return {
+            key: _unwrap_copy_on_write(sub_value)
+            for key, sub_value in dict.items(value)}
+    if isinstance(value, _CopyOnWriteList):
+        return [
+            _unwrap_copy_on_write(sub_value)
+            for sub_value in list.__iter__(value)]
+    return value
+
+
+class _CopyOnWriteDict(dict):
+    """Dict that can be mutated without mutating the dict it wraps.
+
+    The dict is a shallow copy of the wrapped dict. The dict and list
+    values shared with the wrapped dict are replaced by copy on write
+    containers, and the set and bytearray values by copies, when they
+    are first accessed, so that only the accessed path of a nested
+    structure is copied.
+
+    :param wrapped: Dict to be wrapped
+    :type wrapped: Dict[str, Any]
+    """
+
+    def __init__(self, wrapped):
+        # type: (Dict[str, Any]) -> None
+        """Dict that can be mutated without mutating the dict it
+        wraps.
+
+        :param wrapped: Dict to be wrapped
+        :type wrapped: Dict[str, Any]
+        """
+        super(_CopyOnWriteDict, self).__init__(wrapped)
+        self._shared_values = _get_shared_values(dict.values(self))
+
+    def _own(self, key, value):
+        # type: (Any, Any) -> Any
+        """Replace the value shared with the wrapped dict by a copy on
+        write container.
+
+        :param key: Key of the value
+        :type key: Any
+        :param value: Value stored under the key
+        :type value: Any
+        :return: Value that can be mutated without mutating the
+            wrapped dict
+        :rtype: Any
+        """
+        if _is_shared(self._shared_values, value):
+            value = _copy_on_write(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _own_all(self):
+        # type: () -> None
+        """Replace all the values shared with the wrapped dict by copy
+        on write containers.
+
+        :rtype: None
+        """
+        if self._shared_values:
+            for key, value in list(dict.items(self)):
+                self._own(key, value)
+            self._shared_values = {}
+
+    def _add_shared(self, key, value):
+        # type: (Any, Any) -> None
+        """Add a value that is shared with another structure, to be
+        copied on first access.
+
+        :param key: Key of the value
+        :type key: Any
+        :param value: Value to be stored under the key
+        :type value: Any
+        :rtype: None
+        """
+        dict.__setitem__(self, key, value)
+        if isinstance(value, _MUTABLE_TYPES):
+            self._shared_values[id(value)] = value
+
+    def __getitem__(self, key):
+        # type: (Any) -> Any
+        return self._own(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # type: () -> Any
+        # Overridden so that dict(), dict.update and ** unpacking read
+        # the values through __getitem__, instead of copying the shared
+        # values directly.
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        # type: (Any, Any) -> Any
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        # type: (Any, Any) -> Any
+        if key in self:
+            return self[key]
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *args):
+        # type: (Any, *Any) -> Any
+        value = dict.pop(self, key, *args)
+        if _is_shared(self._shared_values, value):
+            return _copy_on_write(value)
+        return value
+
+    def popitem(self):
+        # type: () -> Any
+        key, value = dict.popitem(self)
+        if _is_shared(self._shared_values, value):
+            return key, _copy_on_write(value)
+        return key, value
+
+    def values(self):  # type: ignore
+        # type: () -> Any
+        self._own_all()
+        return dict.values(self)
+
+    def items(self):  # type: ignore
+        # type: () -> Any
+        self._own_all()
+        return dict.items(self)
+
+    def copy(self):
+        # type: () -> Dict[Any, Any]
+        self._own_all()
+        return dict.copy(self)
+
+    if PY2:
+        def itervalues(self):
+            # type: () -> Any
+            self._own_all()
+            return dict.itervalues(self)  # type: ignore
+
+        def iteritems(self):
+            # type: () -> Any
+            self._own_all()
+            return dict.iteritems(self)  # type: ignore
+
+        def viewvalues(self):
+            # type: () -> Any
+            self._own_all()
+            return dict.viewvalues(self)  # type: ignore
+
+        def viewitems(self):
+            # type: () -> Any
+            self._own_all()
+            return dict.viewitems(self)  # type: ignore
+
+
+class _CopyOnWriteList(list):
+    """List that can be mutated without mutating the list it wraps.
+
+    The list is a shallow copy of the wrapped list. The dict and list
+    items shared with the wrapped list are replaced by copy on write
+    containers, and the set and bytearray items by copies, when they
+    are first accessed, so that only the accessed path of a nested
+    structure is copied.
+
+    :param wrapped: List to be wrapped
+    :type wrapped: List[Any]
+    """
+
+    def __init__(self, wrapped):
+        # type: (List[Any]) -> None
+        """List that can be mutated without mutating the list it
+        wraps.
+
+        :param wrapped: List to be wrapped
+        :type wrapped: List[Any]
+        """
+        super(_CopyOnWriteList, self).__init__(wrapped)
+        self._shared_values = _get_shared_values(list.__iter__(self))
+
+    def _own(self, index, value):
+        # type: (int, Any) -> Any
+        """Replace the item shared with the wrapped list by a copy on
+        write container.
+
+        :param index: Index of the item
+        :type index: int
+        :param value: Item stored at the index
+        :type value: Any
+        :return: Item that can be mutated without mutating the
+            wrapped list
+        :rtype: Any
+        """
+        if _is_shared(self._shared_values, value):
+            value = _copy_on_write(value)
+            list.__setitem__(self, index, value)
+        return value
+
+    def _own_all(self):
+        # type: () -> None
+        """Replace all the items shared with the wrapped list by copy
+        on write containers.
+
+        :rtype: None
+        """
+        if self._shared_values:
+            for index, value in enumerate(list(list.__iter__(self))):
+                self._own(index, value)
+            self._shared_values = {}
+
+    def __getitem__(self, index):
+        # type: (Any) -> Any
+        if isinstance(index, slice):
+            self._own_all()
+            return list.__getitem__(self, index)
+        return self._own(index, list.__getitem__(self, index))
+
+    def __iter__(self):
+        # type: () -> Any
+        self._own_all()
+        return list.__iter__(self)
+
+    def __reversed__(self):
+        # type: () -> Any
+        self._own_all()
+        return list.__reversed__(self)
+
+    def __add__(self, other):  # type: ignore
+        # type: (Any) -> List[Any]
+        self._own_all()
+        return list.__add__(self, other)
+
+    def __mul__(self, count):  # type: ignore
+        # type: (Any) -> List[Any]
+        self._own_all()
+        return list.__mul__(self, count)
+
+    __rmul__ = __mul__
+
+    def pop(self, *args):
+        # type: (*Any) -> Any
+        value = list.pop(self, *args)
+        if _is_shared(self._shared_values, value):
+            return _copy_on_write(value)
+        return value
+
+    def copy(self):
+        # type: () -> List[Any]
+        self._own_all()
+        return list.__getitem__(self, slice(None))
+
+    if PY2:
+        def __getslice__(self, start, stop):
+            # type: (int, int) -> List[Any]
+            self._own_all()
+            return list.__getslice__(self, start, stop)  # type: ignore
+
+
 class AttributesManager(object):
     """AttributesManager is a class that handles three level
     attributes: request, session and persistence.
 
+    The session attributes are copied from the request envelope on
+    write. Nested dicts and lists are copied when they are first
+    accessed, so changes to the session attributes never change the
+    request envelope, without copying the parts that aren't accessed.
+
+    The persistent attributes retrieved from the persistence adapter
+    are wrapped the same way, so that the retrieved attributes are kept
+    as a snapshot. Saving the persistent attributes compares them
+    against the snapshot, and is skipped when nothing changed.
+
+    Handlers that need only some of the persistent attributes can get
+    them using :py:meth:`get_persistent`. Persistence adapters
+    supporting it then retrieve only the attributes with the requested
+    keys, and the other attributes are retrieved only if the
+    ``persistent_attributes`` are accessed later.
+
     :param request_envelope: request envelope.
     :type request_envelope: RequestEnvelope
     :param persistence_adapter: class used for storing and
@@ -107,9 +547,13 @@ class AttributesManager(object):
         elif request_envelope.session.attributes is None:
             self._session_attributes = {}
         else:
-            self._session_attributes = deepcopy(
+            self._session_attributes = _CopyOnWriteDict(
                 request_envelope.session.attributes)
         self._persistent_attributes_set = False
+        self._persistent_attributes_snapshot = None  # type: Optional[Dict[str, Any]]
+        # Keys requested through get_persistent, while only some of the
+        # persistent attributes are retrieved.
+        self._persistent_attribute_keys = None  # type: Optional[Set[str]]
 
     @property
     def request_attributes(self):
@@ -164,6 +608,10 @@ class AttributesManager(object):
         # type: () -> Dict[str, object]
         """Attributes stored at the Persistence level of the skill lifecycle.
 
+        If only some of the persistent attributes were retrieved using
+        :py:meth:`get_persistent`, the other attributes are retrieved
+        and added to the same dict.
+
         :return: persistent_attributes retrieved from persistence adapter
         :rtype: Dict[str, object]
         :raises: :py:class:`ask_sdk_core.exceptions.AttributesManagerException`
@@ -173,10 +621,17 @@ class AttributesManager(object):
             raise AttributesManagerException(
                 "Cannot get PersistentAttributes without Persistence adapter")
         if not self._persistent_attributes_set:
-            self._persistence_attributes = (
+            persistence_attributes = (
                 self._persistence_adapter.get_attributes(
                     request_envelope=self._request_envelope))
+            if isinstance(persistence_attributes, dict):
+                self._persistent_attributes_snapshot = persistence_attributes
+                persistence_attributes = _CopyOnWriteDict(
+                    persistence_attributes)
+            self._persistence_attributes = persistence_attributes
             self._persistent_attributes_set = True
+        elif self._persistent_attribute_keys is not None:
+            self._retrieve_remaining_persistent_attributes()
         return self._persistence_attributes
 
     @persistent_attributes.setter
@@ -196,9 +651,123 @@ class AttributesManager(object):
         if not self._persistence_adapter:
             raise AttributesManagerException(
                 "Cannot set PersistentAttributes without persistence adapter!")
+        if self._persistent_attribute_keys is not None:
+            # The attributes that weren't retrieved are replaced too
+            self._persistent_attributes_snapshot = None
+            self._persistent_attribute_keys = None
         self._persistence_attributes = persistent_attributes
         self._persistent_attributes_set = True
 
+    def get_persistent(self, keys):
+        # type: (List[str]) -> Dict[str, object]
+        """Get the persistent attributes, making sure the attributes
+        with the provided top level keys are retrieved.
+
+        If the persistence adapter supports it, only the attributes
+        with the provided keys are retrieved, and the returned dict
+        contains only the attributes retrieved so far during the
+        request. Attributes with other keys are retrieved on later
+        calls requesting them, or when ``persistent_attributes`` is
+        accessed, and are added to the same dict. Otherwise, all the
+        attributes are retrieved, same as ``persistent_attributes``.
+
+        Changes to the returned dict are saved using
+        :py:meth:`save_persistent_attributes`, without changing the
+        attributes that weren't retrieved.
+
+        :param keys: Top level keys of the attributes needed.
+            Duplicate keys are ignored.
+        :type keys: List[str]
+        :return: persistent attributes, containing the attributes with
+            the provided keys, if they exist
+        :rtype: Dict[str, object]
+        :raises: :py:class:`ask_sdk_core.exceptions.AttributesManagerException`
+            if trying to get persistent attributes without persistence adapter
+        """
+        if not self._persistence_adapter:
+            raise AttributesManagerException(
+                "Cannot get PersistentAttributes without Persistence adapter")
+        keys = list(OrderedDict.fromkeys(keys))
+        if not self._persistent_attributes_set:
+            partial_attributes = (
+                self._persistence_adapter.get_partial_attributes(
+                    request_envelope=self._request_envelope, keys=keys))
+            if partial_attributes is None:
+                return self.persistent_attributes
+            self._persistent_attributes_snapshot = dict(partial_attributes)
+            self._persistence_attributes = _CopyOnWriteDict(
+                partial_attributes)
+            self._persistent_attribute_keys = set(keys)
+            self._persistent_attributes_set = True
+        elif self._persistent_attribute_keys is not None:
+            missing_keys = [
+                key for key in keys
+                if key not in self._persistent_attribute_keys]
+            if missing_keys:
+                self._retrieve_missing_persistent_attributes(missing_keys)
+        return self._persistence_attributes
+
+    def _retrieve_missing_persistent_attributes(self, keys):
+        # type: (List[str]) -> None
+        """Retrieve the persistent attributes with the provided keys,
+        and add them to the partially retrieved persistent attributes.
+
+        Attributes already added during the request are kept.
+
+        :param keys: Top level keys of the attributes that aren't
+            retrieved yet
+        :type keys: List[str]
+        :rtype: None
+        """
+        partial_attributes = self._persistence_adapter.get_partial_attributes(
+            request_envelope=self._request_envelope, keys=keys)
+        if partial_attributes is None:
+            self._retrieve_remaining_persistent_attributes()
+            return
+
+        self._merge_retrieved_persistent_attributes(partial_attributes)
+        cast(Any, self._persistent_attribute_keys).update(keys)
+
+    def _retrieve_remaining_persistent_attributes(self):
+        # type: () -> None
+        """Retrieve all the persistent attributes, and add the ones
+        that weren't retrieved to the partially retrieved persistent
+        attributes.
+
+        :rtype: None
+        """
+        attributes = self._persistence_adapter.get_attributes(
+            request_envelope=self._request_envelope)
+        self._persistent_attributes_snapshot = {}
+        self._merge_retrieved_persistent_attributes(attributes)
+        self._persistent_attribute_keys = None
+
+    def _merge_retrieved_persistent_attributes(self, attributes):
+        # type: (Dict[str, Any]) -> None
+        """Add the retrieved attributes to the snapshot and to the
+        partially retrieved persistent attributes.
+
+        Attributes that were already requested, or added during the
+        request, are kept in the persistent attributes.
+
+        :param attributes: Attributes retrieved from the persistence
+            adapter
+        :type attributes: Dict[str, Any]
+        :rtype: None
+        """
+        requested_keys = cast(Any, self._persistent_attribute_keys)
+        persistence_attributes = self._persistence_attributes
+        snapshot = self._persistent_attributes_snapshot
+        for key, value in attributes.items():
+            if snapshot is not None:
+                snapshot[key] = value
+            if (key not in requested_keys and
+                    key not in persistence_attributes):
+                if isinstance(persistence_attributes, _CopyOnWriteDict):
+                    persistence_attributes._add_shared(key, value)
+                else:
+                    persistence_attributes[key] = value
+
     def save_persistent_attributes(self):
         # type: () -> None
         """Save persistent attributes to the persistence layer if a
@@ -212,10 +781,64 @@ class AttributesManager(object):
             raise AttributesManagerException(
                 "Cannot save PersistentAttributes without "
                 "persistence adapter!")
-        if self._persistent_attributes_set:
-            self._persistence_adapter.save_attributes(
-                request_envelope=self._request_envelope,
-                attributes=self._persistence_attributes)
+        if not self._persistent_attributes_set:
+            return
+
+        attributes = _unwrap_copy_on_write(self._persistence_attributes)
+        requested_keys = self._persistent_attribute_keys
+        if self._persistent_attributes_snapshot is None:
+            if requested_keys is None:
+                self._persistence_adapter.save_attributes(
+                    request_envelope=self._request_envelope,
+                    attributes=attributes)
+            else:
+                self._persistence_adapter.save_partial_attributes(
+                    request_envelope=self._request_envelope,
+                    attributes=attributes, changed_keys=set(attributes),
+                    removed_keys=requested_keys.difference(attributes))
+            return
+
+        changed_keys, removed_keys = self._get_persistent_attributes_changes()
+        if changed_keys or removed_keys:
+            if requested_keys is None:
+                self._persistence_adapter.save_changed_attributes(
+                    request_envelope=self._request_envelope,
+                    attributes=attributes, changed_keys=changed_keys,
+                    removed_keys=removed_keys)
+            else:
+                self._persistence_adapter.save_partial_attributes(
+                    request_envelope=self._request_envelope,
+                    attributes=attributes, changed_keys=changed_keys,
+                    removed_keys=removed_keys)
+            # The saved attributes can still be changed by the skill,
+            # so the next save compares against nothing and saves all.
+            self._persistent_attributes_snapshot = None
+
+    def _get_persistent_attributes_changes(self):
+        # type: () -> Tuple[Set[str], Set[str]]
+        """Compare the persistent attributes against the snapshot of
+        the attributes retrieved from the persistence adapter.
+
+        Values that are the same objects as in the snapshot are
+        unchanged, since the mutable snapshot values are never handed
+        out without a copy on write wrapper or a copy. Only the other
+        values are compared by equality.
+
+        :return: Keys of the added or changed attributes and keys of
+            the removed attributes
+        :rtype: Tuple[Set[str], Set[str]]
+        """
+        snapshot = cast(Any, self._persistent_attributes_snapshot)
+        attributes = self._persistence_attributes
+        changed_keys = set()
+        for key, value in dict.items(attributes):
+            if key not in snapshot:
+                changed_keys.add(key)
+            elif value is not snapshot[key] and (
+                    _unwrap_copy_on_write(value) != snapshot[key]):
+                changed_keys.add(key)
+        removed_keys = {key for key in snapshot if key not in attributes}
+        return changed_keys, removed_keys
 
     def delete_persistent_attributes(self):
         # type: () -> None
@@ -234,3 +857,5 @@ class AttributesManager(object):
             request_envelope=self._request_envelope)
         self._persistence_attributes = {}
         self._persistent_attributes_set = False
+        self._persistent_attributes_snapshot = None
+        self._persistent_attribute_keys = None
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import time
+import typing
+from copy import deepcopy
+from collections import OrderedDict
+from threading import RLock
+
+from .attributes_manager import AbstractPersistenceAdapter
+
+if typing.TYPE_CHECKING:
+    from typing import Callable, Dict, List, Optional, Set, Tuple
+    from ask_sdk_model import RequestEnvelope
+
+
+class CachingPersistenceAdapter(AbstractPersistenceAdapter):
+    """Persistence Adapter caching the attributes of another
+    persistence adapter in memory.
+
+    The adapter wraps any
+    :py:class:`ask_sdk_core.attributes_manager.AbstractPersistenceAdapter`
+    and keeps the retrieved and saved attributes in a LRU cache, with
+    a time to live, so that warm AWS Lambda containers and webservice
+    workers don't retrieve the attributes of the same user on every
+    turn of a conversation.
+
+    Attributes are read through the cache, and written through it:
+    saves are passed to the wrapped adapter and update the cache, and
+    deletes invalidate it. Note that the attributes can be changed
+    through other containers or workers, so cached attributes can be
+    stale up to the time to live. Requests that need the attributes
+    from the persistent tier can be identified using ``bypass_cache``.
+    Adapters that save conditionally on what was retrieved for the
+    request, like the DynamoDb adapter with a version attribute,
+    should only be cached for requests that don't save attributes.
+
+    The cache is keyed on ``cache_keygen``, which defaults to the
+    ``partition_keygen`` or ``object_keygen`` of the wrapped adapter.
+    The cached attributes are shared between requests, so they are
+    copied when cached, after being retrieved or saved, and when
+    returned from the cache. Callers can change the returned
+    attributes, same as the attributes returned by the persistence
+    adapter, without changing the cached ones.
+
+    :param persistence_adapter: Persistence adapter to be cached
+    :type persistence_adapter: ask_sdk_core.attributes_manager.AbstractPersistenceAdapter
+    :param cache_keygen: Callable function that takes a request
+        envelope and provides the cache key. Defaulted to the keygen
+        function of the persistence adapter
+    :type cache_keygen: Callable[[ask_sdk_model.RequestEnvelope], str]
+    :param capacity: Maximum number of cached attributes. Defaulted
+        to 1000
+    :type capacity: int
+    :param time_to_live: Time the attributes are valid inside cache
+        in milliseconds. Defaulted to 1 minute
+    :type time_to_live: int
+    :param bypass_cache: Callable function that takes a request
+        envelope and returns True if the attributes have to be
+        retrieved from the persistence adapter, instead of the cache
+    :type bypass_cache: Callable[[ask_sdk_model.RequestEnvelope], bool]
+    :raises: ValueError if no ``cache_keygen`` is provided and the
+        persistence adapter has no keygen function
+    """
+    default_capacity = 1000
+    default_time_to_live = 1000 * 60
+
+    def __init__(
+            self, persistence_adapter, cache_keygen=None,
+            capacity=default_capacity, time_to_live=default_time_to_live,
+            bypass_cache=None):
+        # type: (AbstractPersistenceAdapter, Callable[[RequestEnvelope], str], int, int, Callable[[RequestEnvelope], bool]) -> None
+        """Persistence Adapter caching the attributes of another
+        persistence adapter in memory.
+
+        :param persistence_adapter: Persistence adapter to be cached
+        :type persistence_adapter: ask_sdk_core.attributes_manager.AbstractPersistenceAdapter
+        :param cache_keygen: Callable function that takes a request
+            envelope and provides the cache key. Defaulted to the
+            keygen function of the persistence adapter
+        :type cache_keygen: Callable[[ask_sdk_model.RequestEnvelope], str]
+        :param capacity: Maximum number of cached attributes.
+            Defaulted to 1000
+        :type capacity: int
+        :param time_to_live: Time the attributes are valid inside
+            cache in milliseconds. Defaulted to 1 minute
+        :type time_to_live: int
+        :param bypass_cache: Callable function that takes a request
+            envelope and returns True if the attributes have to be
+            retrieved from the persistence adapter, instead of the
+            cache
+        :type bypass_cache: Callable[[ask_sdk_model.RequestEnvelope], bool]
+        :raises: ValueError if no ``cache_keygen`` is provided and the
+            persistence adapter has no keygen function
+        """
+        if cache_keygen is None:
+            cache_keygen = (
+                getattr(persistence_adapter, "partition_keygen", None) or
+                getattr(persistence_adapter, "object_keygen", None))
+            if cache_keygen is None:
+                raise ValueError(
+                    "Persistence adapter has no partition_keygen or "
+                    "object_keygen, cache_keygen has to be provided")
+
+        self.persistence_adapter = persistence_adapter
+        self.cache_keygen = cache_keygen
+        self.capacity = capacity
+        self.time_to_live = time_to_live
+        self.bypass_cache = bypass_cache
+        self._cache = OrderedDict()  # type: OrderedDict
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def hits(self):
+        # type: () -> int
+        """Number of attribute retrievals served from the cache.
+
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        # type: () -> int
+        """Number of attribute retrievals passed to the persistence
+        adapter, including the ones bypassing the cache.
+
+        :rtype: int
+        """
+        return self._misses
+
+    @property
+    def evictions(self):
+        # type: () -> int
+        """Number of attributes evicted from the cache, to stay within
+        the capacity.
+
+        :rtype: int
+        """
+        return self._evictions
+
+    @property
+    def expirations(self):
+        # type: () -> int
+        """Number of attributes removed from the cache, after their
+        time to live passed.
+
+        :rtype: int
+        """
+        return self._expirations
+
+    def clear(self):
+        # type: () -> None
+        """Remove all the attributes from the cache.
+
+        :rtype: None
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def get_attributes(self, request_envelope):
+        # type: (RequestEnvelope) -> Dict[str, object]
+        """Get attributes from the cache, or from the persistence
+        adapter if they aren't cached.
+
+        A copy of the attributes retrieved from the persistence
+        adapter is cached, and a copy of the cached attributes is
+        returned, so that changes to the returned attributes don't
+        change the cached ones.
+
+        :param request_envelope: Request Envelope from Alexa service
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :return: Attributes retrieved from the cache or from the
+            persistence adapter
+        :rtype: Dict[str, object]
+        """
+        cache_key = self.cache_keygen(request_envelope)
+        attributes = self.__get_cached(request_envelope, cache_key)
+        if attributes is not None:
+            return deepcopy(attributes)
+
+        attributes = self.persistence_adapter.get_attributes(
+            request_envelope=request_envelope)
+        self.__put(cache_key, deepcopy(attributes))
+        return attributes
+
+    def get_partial_attributes(self, request_envelope, keys):
+        # type: (RequestEnvelope, List[str]) -> Optional[Dict[str, object]]
+        """Get the attributes with the provided keys from the cache,
+        or from the persistence adapter if they aren't cached.
+
+        Partial attributes retrieved from the persistence adapter
+        aren't cached. Attributes retrieved from the cache are copied.
+
+        :param request_envelope: Request Envelope from Alexa service
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param keys: Top level keys of the attributes to be retrieved
+        :type keys: List[str]
+        :return: Attributes with the provided keys, or None if the
+            persistence adapter doesn't support retrieving only some
+            attributes
+        :rtype: Dict[str, object]
+        """
+        attributes = self.__get_cached(
+            request_envelope, self.cache_keygen(request_envelope))
+        if attributes is not None:
+            return {
+                key: deepcopy(attributes[key])
+                for key in keys if key in attributes}
+
+        return self.persistence_adapter.get_partial_attributes(
+            request_envelope=request_envelope, keys=keys)
+
+    def save_attributes(self, request_envelope, attributes):
+        # type: (RequestEnvelope, Dict[str, object]) -> None
+        """Save attributes using the persistence adapter, and cache
+        them.
+
+        :param request_envelope: request envelope.
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param attributes: attributes to be saved to persistent tier
+        :type attributes: Dict[str, object]
+        :rtype: None
+        """
+        cache_key = self.cache_keygen(request_envelope)
+        self.__invalidate(cache_key)
+        self.persistence_adapter.save_attributes(
+            request_envelope=request_envelope, attributes=attributes)
+        self.__put(cache_key, deepcopy(attributes))
+
+    def save_changed_attributes(
+            self, request_envelope, attributes, changed_keys, removed_keys):
+        # type: (RequestEnvelope, Dict[str, object], Set[str], Set[str]) -> None
+        """Save changed attributes using the persistence adapter, and
+        cache the attributes.
+
+        :param request_envelope: request envelope.
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param attributes: attributes to be saved to persistent tier
+        :type attributes: Dict[str, object]
+        :param changed_keys: keys of the attributes that are added or
+            changed since they were retrieved
+        :type changed_keys: Set[str]
+        :param removed_keys: keys of the attributes that are removed
+            since they were retrieved
+        :type removed_keys: Set[str]
+        :rtype: None
+        """
+        cache_key = self.cache_keygen(request_envelope)
+        self.__invalidate(cache_key)
+        self.persistence_adapter.save_changed_attributes(
+            request_envelope=request_envelope, attributes=attributes,
+            changed_keys=changed_keys, removed_keys=removed_keys)
+        self.__put(cache_key, deepcopy(attributes))
+
+    def save_partial_attributes(
+            self, request_envelope, attributes, changed_keys, removed_keys):
+        # type: (RequestEnvelope, Dict[str, object], Set[str], Set[str]) -> None
+        """Save changes to partially retrieved attributes using the
+        persistence adapter.
+
+        The changes are applied to the cached attributes, if they are
+        cached.
+
+        :param request_envelope: request envelope.
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param attributes: retrieved attributes, with the changes to
+            be saved to persistent tier
+        :type attributes: Dict[str, object]
+        :param changed_keys: keys of the attributes that are added or
+            changed
+        :type changed_keys: Set[str]
+        :param removed_keys: keys of the attributes that are removed
+        :type removed_keys: Set[str]
+        :rtype: None
+        """
+        cache_key = self.cache_keygen(request_envelope)
+        with self._lock:
+            cached_entry = self._cache.pop(cache_key, None)
+        self.persistence_adapter.save_partial_attributes(
+            request_envelope=request_envelope, attributes=attributes,
+            changed_keys=changed_keys, removed_keys=removed_keys)
+
+        if cached_entry is not None and self.__is_fresh(cached_entry):
+            cached_attributes = dict(cached_entry[1])
+            for key in changed_keys:
+                cached_attributes[key] = deepcopy(attributes[key])
+            for key in removed_keys:
+                cached_attributes.pop(key, None)
+            self.__put(cache_key, cached_attributes)
+
+    def delete_attributes(self, request_envelope):
+        # type: (RequestEnvelope) -> None
+        """Delete attributes using the persistence adapter, and remove
+        them from the cache.
+
+        :param request_envelope: request envelope.
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :rtype: None
+        """
+        self.__invalidate(self.cache_keygen(request_envelope))
+        self.persistence_adapter.delete_attributes(
+            request_envelope=request_envelope)
+
+    def __get_cached(self, request_envelope, cache_key):
+        # type: (RequestEnvelope, str) -> Optional[Dict[str, object]]
+        """Get the cached attributes, if they are fresh and the cache
+        isn't bypassed for the request.
+
+        :param request_envelope: Request Envelope from Alexa service
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param cache_key: Key of the attributes in the cache
+        :type cache_key: str
+        :return: Cached attributes, or None on cache miss
+        :rtype: Dict[str, object]
+        """
+        if self.bypass_cache is not None and self.bypass_cache(
+                request_envelope):
+            with self._lock:
+                self._misses += 1
+            return None
+
+        with self._lock:
+            cached_entry = self._cache.pop(cache_key, None)
+            if cached_entry is not None:
+                if self.__is_fresh(cached_entry):
+                    self._cache[cache_key] = cached_entry
+                    self._hits += 1
+                    return cached_entry[1]
+                self._expirations += 1
+            self._misses += 1
+            return None
+
+    def __put(self, cache_key, attributes):
+        # type: (str, Dict[str, object]) -> None
+        """Cache the attributes, evicting the least recently used
+        attributes if the cache is full.
+
+        :param cache_key: Key of the attributes in the cache
+        :type cache_key: str
+        :param attributes: Attributes to be cached
+        :type attributes: Dict[str, object]
+        :rtype: None
+        """
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            self._cache.pop(cache_key, None)
+            while len(self._cache) >= self.capacity:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+            self._cache[cache_key] = (
+                int(round(time.time() * 1000)), attributes)
+
+    def __invalidate(self, cache_key):
+        # type: (str) -> None
+        """Remove the attributes from the cache.
+
+        :param cache_key: Key of the attributes in the cache
+        :type cache_key: str
+        :rtype: None
+        """
+        with self._lock:
+            self._cache.pop(cache_key, None)
+
+    def __is_fresh(self, cached_entry):
+        # type: (Tuple[int, Dict[str, object]]) -> bool
+        """Check if the cached attributes are within the time to live.
+
+        :param cached_entry: Time the attributes were cached in
+            milliseconds, and the attributes
+        :type cached_entry: Tuple[int, Dict[str, object]]
+        :return: True if the attributes are not stale
+        :rtype: bool
+        """
+        current_time = int(round(time.time() * 1000))
+        return (current_time - cached_entry[0]) < self.time_to_live
@@ -21,6 +21,7 @@
 
 from .request_components import (
     AbstractRequestHandler, AbstractRequestInterceptor,
-    AbstractResponseInterceptor)
+    AbstractResponseInterceptor, AbstractAsyncRequestHandler,
+    AbstractAsyncRequestInterceptor, AbstractAsyncResponseInterceptor)
 from .exception_components import (
-    AbstractExceptionHandler)
+    AbstractExceptionHandler, AbstractAsyncExceptionHandler)
@@ -19,13 +19,14 @@ import typing
 from abc import abstractmethod
 
 from ask_sdk_runtime.dispatch_components.exception_components import (
-    AbstractExceptionHandler as GenericExceptionHandler
+    AbstractExceptionHandler as GenericExceptionHandler,
+    AbstractAsyncExceptionHandler as GenericAsyncExceptionHandler
 )
 
 from ..exceptions import DispatchException
 
 if typing.TYPE_CHECKING:
-    from typing import Union
+    from typing import Union, Awaitable
     from ask_sdk_model import Response
     from ..handler_input import HandlerInput
 
@@ -66,3 +67,38 @@ class AbstractExceptionHandler(GenericExceptionHandler):
         :rtype: Union[None, Response]
         """
         raise NotImplementedError
+
+
+class AbstractAsyncExceptionHandler(GenericAsyncExceptionHandler):
+    """Exception Handler with coroutine ``can_handle`` and ``handle``
+    methods, for skills invoked through
+    :py:meth:`ask_sdk_core.skill.CustomSkill.invoke_async`.
+    """
+    @abstractmethod
+    def can_handle(self, handler_input, exception):  # type: ignore
+        # type: (HandlerInput, Exception) -> Awaitable[bool]
+        """Coroutine checking if the handler can support the exception
+        raised during dispatch.
+
+        :param handler_input: Handler Input instance.
+        :type handler_input: HandlerInput
+        :param exception: Exception raised during dispatch.
+        :type exception: Exception
+        :return: Boolean whether handler can handle exception or not.
+        :rtype: Awaitable[bool]
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def handle(self, handler_input, exception):  # type: ignore
+        # type: (HandlerInput, Exception) -> Awaitable[Union[Response, None]]
+        """Coroutine processing the handler input and exception.
+
+        :param handler_input: Handler Input instance.
+        :type handler_input: HandlerInput
+        :param exception: Exception raised during dispatch.
+        :type exception: Exception
+        :return: Optional response object to serve as dispatch return.
+        :rtype: Awaitable[Union[None, Response]]
+        """
+        raise NotImplementedError
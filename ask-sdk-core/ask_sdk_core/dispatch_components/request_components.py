@@ -21,10 +21,13 @@ from abc import abstractmethod
 from ask_sdk_runtime.dispatch_components.request_components import (
     AbstractRequestHandler as GenericRequestHandler,
     AbstractRequestInterceptor as GenericRequestInterceptor,
-    AbstractResponseInterceptor as GenericResponseInterceptor)
+    AbstractResponseInterceptor as GenericResponseInterceptor,
+    AbstractAsyncRequestHandler as GenericAsyncRequestHandler,
+    AbstractAsyncRequestInterceptor as GenericAsyncRequestInterceptor,
+    AbstractAsyncResponseInterceptor as GenericAsyncResponseInterceptor)
 
 if typing.TYPE_CHECKING:
-    from typing import Union
+    from typing import Union, Awaitable
     from ask_sdk_model import Response
     from ..handler_input import HandlerInput
 
@@ -107,3 +110,75 @@ class AbstractResponseInterceptor(GenericResponseInterceptor):
         :rtype: None
         """
         raise NotImplementedError
+
+
+class AbstractAsyncRequestHandler(GenericAsyncRequestHandler):
+    """Request Handler with coroutine ``can_handle`` and ``handle``
+    methods, for skills invoked through
+    :py:meth:`ask_sdk_core.skill.CustomSkill.invoke_async`.
+    """
+
+    @abstractmethod
+    def can_handle(self, handler_input):  # type: ignore
+        # type: (HandlerInput) -> Awaitable[bool]
+        """Coroutine returning true if Request Handler can handle the
+        Request inside Handler Input.
+
+        :param handler_input: Handler Input instance with
+            Request Envelope containing Request.
+        :type handler_input: HandlerInput
+        :return: Boolean value that tells the dispatcher if the
+            current request can be handled by this handler.
+        :rtype: Awaitable[bool]
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def handle(self, handler_input):  # type: ignore
+        # type: (HandlerInput) -> Awaitable[Union[None, Response]]
+        """Coroutine handling the Request inside handler input and
+        providing a Response for dispatcher to return.
+
+        :param handler_input: Handler Input instance with
+            Request Envelope containing Request.
+        :type handler_input: HandlerInput
+        :return: Response for the dispatcher to return or None
+        :rtype: Awaitable[Union[Response, None]]
+        """
+        raise NotImplementedError
+
+
+class AbstractAsyncRequestInterceptor(GenericAsyncRequestInterceptor):
+    """Interceptor with a coroutine ``process`` method, that runs
+    before the handler is called.
+    """
+    @abstractmethod
+    def process(self, handler_input):  # type: ignore
+        # type: (HandlerInput) -> Awaitable[None]
+        """Coroutine processing the input before the Handler is run.
+
+        :param handler_input: Handler Input instance.
+        :type handler_input: HandlerInput
+        :rtype: Awaitable[None]
+        """
+        raise NotImplementedError
+
+
+class AbstractAsyncResponseInterceptor(GenericAsyncResponseInterceptor):
+    """Interceptor with a coroutine ``process`` method, that runs
+    after the handler is called.
+    """
+    @abstractmethod
+    def process(self, handler_input, response):  # type: ignore
+        # type: (HandlerInput, Response) -> Awaitable[None]
+        """Coroutine processing the input and the response after the
+        Handler is run.
+
+        :param handler_input: Handler Input instance.
+        :type handler_input: HandlerInput
+        :param response: Execution result of the Handler on
+            handler input.
+        :type response: Union[None, :py:class:`ask_sdk_model.response.Response`]
+        :rtype: Awaitable[None]
+        """
+        raise NotImplementedError
@@ -36,6 +36,13 @@ class PersistenceException(AskSdkException):
     pass
 
 
+class PersistenceConflictException(PersistenceException):
+    """Exception class for Persistence Adapter saves conflicting with
+    a concurrent change of the persisted attributes.
+    """
+    pass
+
+
 class ApiClientException(AskSdkException):
     """Exception class for ApiClient Adapter processing."""
     pass
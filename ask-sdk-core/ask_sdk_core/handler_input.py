@@ -20,7 +20,8 @@ from .response_helper import ResponseFactory
 from .view_resolvers import TemplateFactory
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Dict
+    from typing import Any, Dict, Optional
+    from ask_sdk_runtime.metrics import DispatchTimings
     from ask_sdk_model import RequestEnvelope
     from ask_sdk_model.response import Response
     from ask_sdk_model.services import ServiceClientFactory
@@ -52,6 +53,11 @@ class HandlerInput(object):
         ask_sdk_model.services.service_client_factory.ServiceClientFactory
     :param template_factory: Template Factory to chain loaders and renderer
     :type template_factory: :py:class:`ask_sdk_core.view_resolver.TemplateFactory`
+
+    When metrics sinks are registered on the skill builder, the
+    dispatcher sets the timings of the dispatch phases on the
+    ``dispatch_timings`` attribute, as a
+    :py:class:`ask_sdk_runtime.metrics.DispatchTimings` instance.
     """
     def __init__(
             self, request_envelope, attributes_manager=None,
@@ -81,6 +87,7 @@ class HandlerInput(object):
         self.attributes_manager = attributes_manager
         self.response_builder = ResponseFactory()
         self.template_factory = template_factory
+        self.dispatch_timings = None  # type: Optional[DispatchTimings]
 
     @property
     def service_client_factory(self):
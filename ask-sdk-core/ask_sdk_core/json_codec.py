@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import json
+import typing
+from abc import ABCMeta, abstractmethod
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Optional, Union
+
+
+class AbstractJsonCodec(object):
+    """Encodes python structures to JSON text and decodes JSON text
+    back to python structures.
+
+    The codec is used by the SDK components converting request and
+    response payloads and persisted attributes from and to JSON, like
+    :py:class:`ask_sdk_core.serialize.DefaultSerializer` and
+    :py:class:`ask_sdk_core.api_client.DefaultApiClient`.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def dumps(self, obj):
+        # type: (Any) -> str
+        """Encode the python structure to JSON text.
+
+        :param obj: Python structure made up of ``dict``, ``list``
+            and primitive values.
+        :type obj: object
+        :return: JSON text
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data):
+        # type: (Union[str, bytes]) -> Any
+        """Decode the JSON text to a python structure.
+
+        :param data: JSON text
+        :type data: Union[str, bytes]
+        :return: Python structure made up of ``dict``, ``list`` and
+            primitive values.
+        :rtype: object
+        """
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(AbstractJsonCodec):
+    """JSON codec using the standard library ``json`` module."""
+
+    def dumps(self, obj):
+        # type: (Any) -> str
+        """Encode the python structure to JSON text.
+
+        :param obj: Python structure made up of ``dict``, ``list``
+            and primitive values.
+        :type obj: object
+        :return: JSON text
+        :rtype: str
+        """
+        return json.dumps(obj)
+
+    def loads(self, data):
+        # type: (Union[str, bytes]) -> Any
+        """Decode the JSON text to a python structure.
+
+        :param data: JSON text
+        :type data: Union[str, bytes]
+        :return: Python structure made up of ``dict``, ``list`` and
+            primitive values.
+        :rtype: object
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(AbstractJsonCodec):
+    """JSON codec using the `orjson <https://pypi.org/project/orjson/>`__
+    library.
+
+    Dict keys that are not strings are converted to strings, same as
+    the standard library ``json`` module. Integers wider than 64 bits
+    are encoded with the standard library ``json`` module.
+
+    Unlike the standard library ``json`` module, ``orjson`` decodes
+    integers wider than 64 bits to ``float``, losing precision, and
+    encodes ``NaN`` and ``Infinity`` as ``null``. The codec is hence
+    not used by default, and should only be configured when the
+    payloads don't contain such values.
+
+    :raises: ImportError if ``orjson`` is not installed
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """JSON codec using the ``orjson`` library.
+
+        :raises: ImportError if ``orjson`` is not installed
+        """
+        import orjson  # type: ignore
+        self._orjson = orjson
+
+    def dumps(self, obj):
+        # type: (Any) -> str
+        """Encode the python structure to JSON text.
+
+        :param obj: Python structure made up of ``dict``, ``list``
+            and primitive values.
+        :type obj: object
+        :return: JSON text
+        :rtype: str
+        """
+        try:
+            return self._orjson.dumps(
+                obj, option=self._orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # orjson rejects integers wider than 64 bits
+            return json.dumps(obj)
+
+    def loads(self, data):
+        # type: (Union[str, bytes]) -> Any
+        """Decode the JSON text to a python structure.
+
+        :param data: JSON text
+        :type data: Union[str, bytes]
+        :return: Python structure made up of ``dict``, ``list`` and
+            primitive values.
+        :rtype: object
+        """
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(AbstractJsonCodec):
+    """JSON codec using the `ujson <https://pypi.org/project/ujson/>`__
+    library.
+
+    Unlike the standard library ``json`` module, ``ujson`` escapes
+    forward slashes and may round floats differently in the last
+    digit. The codec is hence not used by default.
+
+    :raises: ImportError if ``ujson`` is not installed
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """JSON codec using the ``ujson`` library.
+
+        :raises: ImportError if ``ujson`` is not installed
+        """
+        import ujson  # type: ignore
+        self._ujson = ujson
+
+    def dumps(self, obj):
+        # type: (Any) -> str
+        """Encode the python structure to JSON text.
+
+        :param obj: Python structure made up of ``dict``, ``list``
+            and primitive values.
+        :type obj: object
+        :return: JSON text
+        :rtype: str
+        """
+        return self._ujson.dumps(obj)
+
+    def loads(self, data):
+        # type: (Union[str, bytes]) -> Any
+        """Decode the JSON text to a python structure.
+
+        :param data: JSON text
+        :type data: Union[str, bytes]
+        :return: Python structure made up of ``dict``, ``list`` and
+            primitive values.
+        :rtype: object
+        """
+        return self._ujson.loads(data)
+
+
+_default_json_codec = StdlibJsonCodec()
+_fast_json_codec = None  # type: Optional[AbstractJsonCodec]
+
+
+def get_default_json_codec():
+    # type: () -> AbstractJsonCodec
+    """Get the JSON codec used when no codec is configured.
+
+    The default codec uses the standard library ``json`` module, so
+    that payloads and persisted attributes are decoded and encoded
+    without loss. Faster codecs are opt-in, through the ``json_codec``
+    attribute of the skill builder or the ``json_codec`` argument of
+    the components using a codec, for eg:
+    ``skill_builder.json_codec = get_fast_json_codec()``.
+
+    :return: Default JSON codec.
+    :rtype: AbstractJsonCodec
+    """
+    return _default_json_codec
+
+
+def get_fast_json_codec():
+    # type: () -> AbstractJsonCodec
+    """Get the fastest installed JSON codec.
+
+    The codec uses ``orjson`` when it is installed, else ``ujson``
+    when it is installed, and falls back to the standard library
+    ``json`` module otherwise. The codec is selected on first call and
+    shared afterwards. Check :py:class:`OrjsonCodec` and
+    :py:class:`UjsonCodec` for the differences to the standard library
+    ``json`` module, before configuring the codec.
+
+    :return: Fastest installed JSON codec.
+    :rtype: AbstractJsonCodec
+    """
+    global _fast_json_codec
+    if _fast_json_codec is None:
+        for codec_class in (OrjsonCodec, UjsonCodec):
+            try:
+                _fast_json_codec = codec_class()
+                break
+            except ImportError:
+                continue
+        else:
+            _fast_json_codec = StdlibJsonCodec()
+    return _fast_json_codec
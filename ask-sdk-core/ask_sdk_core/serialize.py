@@ -17,9 +17,10 @@
 #
 import sys
 import re
-import json
 import typing
 import decimal
+import threading
+from collections import OrderedDict
 from datetime import date, datetime
 
 from six import iteritems
@@ -32,6 +33,7 @@ from typing import cast, Any
 from ask_sdk_model.services import Serializer
 
 from .exceptions import SerializationException
+from .json_codec import get_default_json_codec
 
 unicode_type = text_type
 
@@ -42,11 +44,42 @@ except NameError:
 
 if typing.TYPE_CHECKING:
     from typing import (
-        TypeVar, Dict, List, Tuple, Union, Any, Optional)
+        TypeVar, Dict, List, Tuple, Union, Any, Optional, FrozenSet)
+    from .json_codec import AbstractJsonCodec
     T = TypeVar('T')
 
 
+_LIST_TYPE = 0
+_MIXED_LIST_TYPE = 1
+_DICT_TYPE = 2
+_EMPTY_LIST_TYPE = 3
+_EMPTY_DICT_TYPE = 4
+_CLASS_TYPE = 5
+
+# Type strings of the attributes that are never deserialized lazily.
+_EAGER_TYPES = frozenset(['str', 'int', 'long', 'float', 'bool', 'object'])
+
+_LIST_TYPE_PATTERN = re.compile(r'list\[(.*)\]')
+_DICT_TYPE_PATTERN = re.compile(r'dict\(([^,]*), (.*)\)')
+
+
 class DefaultSerializer(Serializer):
+    """Serializer for ask sdk models and python primitives.
+
+    Type strings in the ``deserialized_types`` of the models are parsed
+    and resolved to classes once per serializer instance, and cached
+    for later deserializations.
+
+    :param type_cache_size: Maximum number of type strings cached by
+        the serializer.
+    :type type_cache_size: int
+    :param json_codec: Codec used to decode JSON payloads. Defaulted to
+        :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+    :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+    :param lazy_deserialization: Deserialize the model attributes that
+        aren't primitives on first access, instead of upfront.
+    :type lazy_deserialization: bool
+    """
     PRIMITIVE_TYPES = (float, bool, bytes, text_type) + integer_types
     NATIVE_TYPES_MAPPING = {
         'int': int,
@@ -59,6 +92,39 @@ class DefaultSerializer(Serializer):
         'object': object,
     }
 
+    def __init__(
+            self, type_cache_size=1024, json_codec=None,
+            lazy_deserialization=False):
+        # type: (int, Optional[AbstractJsonCodec], bool) -> None
+        """Serializer for ask sdk models and python primitives.
+
+        With ``lazy_deserialization`` enabled, deserialized models keep
+        the parsed payload of their attributes that aren't primitives,
+        and deserialize each of them on first access. The models are
+        instances of subclasses of the model classes, so ``isinstance``
+        checks, equality and serialization work as for the eagerly
+        deserialized models. Errors in the payload of a lazy attribute
+        are raised on first access to the attribute.
+
+        :param type_cache_size: Maximum number of type strings cached
+            by the serializer.
+        :type type_cache_size: int
+        :param json_codec: Codec used to decode JSON payloads.
+            Defaulted to
+            :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+        :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+        :param lazy_deserialization: Deserialize the model attributes
+            that aren't primitives on first access, instead of upfront.
+        :type lazy_deserialization: bool
+        """
+        if json_codec is None:
+            json_codec = get_default_json_codec()
+        self.json_codec = json_codec
+        self.lazy_deserialization = lazy_deserialization
+        self.type_cache_size = type_cache_size
+        self._type_cache = OrderedDict()  # type: OrderedDict
+        self._type_cache_lock = threading.Lock()
+
     def serialize(self, obj):  # type: ignore
         # type: (Any) -> Union[Dict[str, Any], List, Tuple, str, int, float, bytes, None]
         """Builds a serialized object.
@@ -101,29 +167,20 @@ class DefaultSerializer(Serializer):
                 return float(obj)
 
         if isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict
-            # All the non null attributes under `deserialized_types`
-            # map are considered for serialization.
-            # The `attribute_map` provides the key names to be used
-            # in the dict. In case of missing `attribute_map` mapping,
-            # the original attribute name is retained as the key name.
-            class_attribute_map = getattr(obj, 'attribute_map', {})
-            class_attribute_map.update(
-                {
-                    k: k for k in obj.deserialized_types.keys()
-                    if k not in class_attribute_map
-                }
-            )
-
-            obj_dict = {
-                class_attribute_map[attr]: getattr(obj, attr)
-                for attr, _ in iteritems(obj.deserialized_types)
-                if getattr(obj, attr) is not None
-            }
-
-        return {key: self.serialize(val) for key, val in iteritems(obj_dict)}
+            return {key: self.serialize(val) for key, val in iteritems(obj)}
+
+        # Convert model obj to dict
+        # All the non null attributes under `deserialized_types`
+        # map are considered for serialization.
+        # The `attribute_map` provides the key names to be used
+        # in the dict. In case of missing `attribute_map` mapping,
+        # the original attribute name is retained as the key name.
+        obj_dict = {}
+        for attr, key, _ in _get_model_plan(type(obj)).fields:
+            val = getattr(obj, attr)
+            if val is not None:
+                obj_dict[key] = self.serialize(val)
+        return obj_dict
 
     def deserialize(self, payload, obj_type):
         # type: (Optional[str], Union[T, str]) -> Any
@@ -162,13 +219,35 @@ class DefaultSerializer(Serializer):
             return None
 
         try:
-            payload = json.loads(payload)
+            payload = self.json_codec.loads(payload)
         except Exception:
             raise SerializationException(
                 "Couldn't parse response body: {}".format(payload))
 
         return self.__deserialize(payload, obj_type)
 
+    def deserialize_from_dict(self, payload, obj_type):
+        # type: (Any, Union[T, str]) -> Any
+        """Deserializes already parsed payload into an instance of
+        provided ``obj_type``.
+
+        The method works the same way as :py:meth:`deserialize`, but
+        takes the payload as the python structures (``dict``, ``list``
+        and primitive values) the JSON payload decodes to, instead of
+        the JSON string. It is used when the payload is already parsed,
+        for eg: the event passed to an AWS Lambda function, to avoid
+        encoding the payload to JSON and decoding it again.
+
+        :param payload: parsed data to be deserialized.
+        :type payload: Union[Dict[str, Any], List, str, int, float, bool]
+        :param obj_type: resolved class name for deserialized object
+        :type obj_type: Union[object, str]
+        :return: deserialized object
+        :rtype: object
+        :raises: :py:class:`ask_sdk_core.exceptions.SerializationException`
+        """
+        return self.__deserialize(payload, obj_type)
+
     def __deserialize(self, payload, obj_type):
         # type: (Optional[str], Union[T, str]) -> Any
         """Deserializes payload into a model object.
@@ -184,45 +263,29 @@ class DefaultSerializer(Serializer):
             return None
 
         if isinstance(obj_type, str):
-            if obj_type.startswith('list['):
-                # Get object type for each item in the list
+            type_kind, type_args = self.__resolve_type(obj_type)
+            if type_kind == _LIST_TYPE:
                 # Deserialize each item using the object type.
-                sub_obj_type =  re.match(
-                    'list\[(.*)\]', obj_type)
-                if sub_obj_type is None:
-                    return []
-                sub_obj_types = sub_obj_type.group(1)
-                deserialized_list = []  # type: List
-                if "," in sub_obj_types:
-                    # list contains objects of different types
-                    for sub_payload, sub_obj_types in zip(
-                            payload, sub_obj_types.split(",")):
-                        deserialized_list.append(self.__deserialize(
-                            sub_payload, sub_obj_types.strip()))
-                else:
-                    for sub_payload in payload:
-                        deserialized_list.append(self.__deserialize(
-                            sub_payload, sub_obj_types.strip()))
-                return deserialized_list
-
-            if obj_type.startswith('dict('):
-                # Get object type for each k,v pair in the dict
+                return [
+                    self.__deserialize(sub_payload, type_args)
+                    for sub_payload in cast(Any, payload)]
+            if type_kind == _MIXED_LIST_TYPE:
+                # list contains objects of different types
+                return [
+                    self.__deserialize(sub_payload, sub_obj_type)
+                    for sub_payload, sub_obj_type in zip(
+                        cast(Any, payload), type_args)]
+            if type_kind == _DICT_TYPE:
                 # Deserialize each value using the object type of v.
-                sub_obj_type = re.match(
-                    'dict\(([^,]*), (.*)\)', obj_type)
-                if sub_obj_type is None:
-                    return {}
-                sub_obj_types = sub_obj_type.group(2)
                 return {
-                    k: self.__deserialize(v, sub_obj_types)
+                    k: self.__deserialize(v, type_args)
                     for k, v in iteritems(cast(Any, payload))
                 }
-            # convert str to class
-            if obj_type in self.NATIVE_TYPES_MAPPING:
-                obj_type = self.NATIVE_TYPES_MAPPING[obj_type]  # type: ignore
-            else:
-                # deserialize models
-                obj_type = self.__load_class_from_name(obj_type)
+            if type_kind == _EMPTY_LIST_TYPE:
+                return []
+            if type_kind == _EMPTY_DICT_TYPE:
+                return {}
+            obj_type = type_args
 
         if obj_type in self.PRIMITIVE_TYPES:
             return self.__deserialize_primitive(payload, obj_type)
@@ -235,6 +298,73 @@ class DefaultSerializer(Serializer):
         else:
             return self.__deserialize_model(payload, obj_type)
 
+    def __resolve_type(self, obj_type):
+        # type: (str) -> Tuple[int, Any]
+        """Resolve the type string into a type descriptor, using the
+        type resolution cache of the serializer.
+
+        The descriptor is a ``(kind, args)`` tuple, where ``args`` is
+        the item type string for lists, the tuple of item type strings
+        for lists of different types, the value type string for dicts
+        and the resolved class for other types.
+
+        Descriptors are cached per type string, so that the type
+        strings are parsed and the classes imported only once. The
+        cache is bounded by ``type_cache_size``, evicting the oldest
+        type strings first. Type strings that can't be resolved are
+        not cached.
+
+        :param obj_type: type string of the object
+        :type obj_type: str
+        :return: type descriptor of the type string
+        :rtype: tuple(int, object)
+        :raises: :py:class:`ask_sdk_core.exceptions.SerializationException`
+        """
+        descriptor = self._type_cache.get(obj_type)
+        if descriptor is not None:
+            return descriptor
+
+        descriptor = self.__parse_type(obj_type)
+        with self._type_cache_lock:
+            self._type_cache[obj_type] = descriptor
+            while len(self._type_cache) > self.type_cache_size:
+                self._type_cache.popitem(last=False)
+        return descriptor
+
+    def __parse_type(self, obj_type):
+        # type: (str) -> Tuple[int, Any]
+        """Parse the type string into a type descriptor.
+
+        :param obj_type: type string of the object
+        :type obj_type: str
+        :return: type descriptor of the type string
+        :rtype: tuple(int, object)
+        :raises: :py:class:`ask_sdk_core.exceptions.SerializationException`
+        """
+        if obj_type.startswith('list['):
+            # Get object type for each item in the list
+            sub_obj_type = _LIST_TYPE_PATTERN.match(obj_type)
+            if sub_obj_type is None:
+                return _EMPTY_LIST_TYPE, None
+            sub_obj_types = sub_obj_type.group(1)
+            if "," in sub_obj_types:
+                return _MIXED_LIST_TYPE, tuple(
+                    t.strip() for t in sub_obj_types.split(","))
+            return _LIST_TYPE, sub_obj_types.strip()
+
+        if obj_type.startswith('dict('):
+            # Get object type for each k,v pair in the dict
+            sub_obj_type = _DICT_TYPE_PATTERN.match(obj_type)
+            if sub_obj_type is None:
+                return _EMPTY_DICT_TYPE, None
+            return _DICT_TYPE, sub_obj_type.group(2)
+
+        # convert str to class
+        if obj_type in self.NATIVE_TYPES_MAPPING:
+            return _CLASS_TYPE, self.NATIVE_TYPES_MAPPING[obj_type]
+        # deserialize models
+        return _CLASS_TYPE, self.__load_class_from_name(obj_type)
+
     def __load_class_from_name(self, class_name):
         # type: (str) -> T
         """Load the class from the ``class_name`` provided.
@@ -297,6 +427,10 @@ class DefaultSerializer(Serializer):
         """Deserialize datetime instance in ISO8601 format to
         date/datetime object.
 
+        Strict ISO8601 payloads, like the timestamps in the Alexa
+        requests, are parsed using ``datetime.fromisoformat`` when
+        available, and any other payload using ``dateutil``.
+
         :param payload: data to be deserialized in ISO8601 format
         :type payload: str
         :param obj_type: primitive datatype str
@@ -307,8 +441,7 @@ class DefaultSerializer(Serializer):
         """
         obj_cast = cast(Any, obj_type)
         try:
-            from dateutil.parser import parse
-            parsed_datetime = parse(payload)
+            parsed_datetime = _parse_datetime(payload)
             if obj_type is date:
                 return parsed_datetime.date()
             else:
@@ -338,36 +471,44 @@ class DefaultSerializer(Serializer):
                 return obj_cast(payload)
 
             if hasattr(obj_cast, 'deserialized_types'):
-                if hasattr(obj_cast, 'get_real_child_model'):
+                plan = _get_model_plan(obj_cast)
+                if plan.has_discriminator:
                     obj_cast = self.__get_obj_by_discriminator(
                         payload, obj_cast)
+                    plan = _get_model_plan(obj_cast)
+
+                payload_dict = cast(Any, payload)
+                if self.lazy_deserialization and plan.lazy_fields:
+                    deserialized_model = _get_lazy_model_class(obj_cast)()
+                    deserialized_model._lazy_payload = payload_dict
+                    deserialized_model._lazy_deserialize = self.__deserialize
+                    # Lazy attributes present in payload are
+                    # deserialized on first access.
+                    model_dict = deserialized_model.__dict__
+                    for class_param_name, payload_param_name, _ in (
+                            plan.lazy_fields):
+                        if payload_param_name in payload_dict:
+                            model_dict.pop(class_param_name, None)
+                    fields = plan.eager_fields
+                else:
+                    deserialized_model = obj_cast()
+                    fields = plan.fields
 
-                class_deserialized_types = obj_cast.deserialized_types
-                class_attribute_map = getattr(obj_cast, 'attribute_map', {})
-                class_attribute_map.update(
-                    {
-                        k: k for k in obj_cast.deserialized_types.keys()
-                        if k not in class_attribute_map
-                    }
-                )
-
-                deserialized_model = obj_cast()
-                for class_param_name, payload_param_name in iteritems(
-                        class_attribute_map):
-                    if payload_param_name in payload:
+                for class_param_name, payload_param_name, param_type in (
+                        fields):
+                    if payload_param_name in payload_dict:
                         setattr(
                             deserialized_model,
                             class_param_name,
                             self.__deserialize(
-                                payload[payload_param_name],
-                                class_deserialized_types[class_param_name]))
-
-                additional_params = [
-                    param for param in payload
-                    if param not in class_attribute_map.values()]
+                                payload_dict[payload_param_name],
+                                param_type))
 
-                for add_param in additional_params:
-                    setattr(deserialized_model, add_param, payload[cast(Any,add_param)])
+                payload_keys = plan.payload_keys
+                for param in payload_dict:
+                    if param not in payload_keys:
+                        setattr(
+                            deserialized_model, param, payload_dict[param])
                 return deserialized_model
             else:
                 return payload
@@ -395,4 +536,232 @@ class DefaultSerializer(Serializer):
                 "Couldn't resolve object by discriminator type "
                 "for {} class".format(obj_type))
 
-        return self.__load_class_from_name(namespaced_class_name)
+        return self.__resolve_type(namespaced_class_name)[1]
+
+
+class _ModelPlan(object):
+    """Serialization plan of a model class, built once from the
+    ``deserialized_types`` and ``attribute_map`` of the class.
+
+    :param model_class: Model class the plan is built for.
+    :type model_class: object
+    """
+    __slots__ = (
+        "fields", "eager_fields", "lazy_fields", "payload_keys",
+        "has_discriminator")
+
+    def __init__(self, model_class):
+        # type: (Any) -> None
+        """Serialization plan of a model class, built once from the
+        ``deserialized_types`` and ``attribute_map`` of the class.
+
+        :param model_class: Model class the plan is built for.
+        :type model_class: object
+        """
+        attribute_map = getattr(model_class, 'attribute_map', None) or {}
+        # (attribute name, payload key, attribute type) for every
+        # attribute under `deserialized_types`. In case of missing
+        # `attribute_map` mapping, the attribute name is the payload key.
+        self.fields = tuple(
+            (attr, attribute_map.get(attr, attr), attr_type)
+            for attr, attr_type in iteritems(
+                model_class.deserialized_types)
+        )  # type: Tuple[Tuple[str, str, Any], ...]
+        # Attributes of primitive types are always deserialized
+        # eagerly. Other attributes are deserialized on first access,
+        # when lazy deserialization is enabled.
+        self.eager_fields = tuple(
+            field for field in self.fields if field[2] in _EAGER_TYPES)
+        self.lazy_fields = tuple(
+            field for field in self.fields if field[2] not in _EAGER_TYPES)
+        # Payload keys mapped to model attributes. Other payload keys
+        # are set as additional attributes on deserialization.
+        self.payload_keys = frozenset(
+            [key for _, key, _ in self.fields] +
+            list(attribute_map.values()))  # type: FrozenSet[str]
+        self.has_discriminator = hasattr(
+            model_class, 'get_real_child_model')  # type: bool
+
+
+_model_plans = {}  # type: Dict[Any, _ModelPlan]
+
+
+def _get_model_plan(model_class):
+    # type: (Any) -> _ModelPlan
+    """Get the serialization plan of the model class, building it on
+    first use.
+
+    Plans are immutable, so concurrent first uses can only build
+    duplicate plans, of which one is kept.
+
+    :param model_class: Model class with ``deserialized_types``.
+    :type model_class: object
+    :return: Serialization plan of the model class.
+    :rtype: _ModelPlan
+    """
+    plan = _model_plans.get(model_class)
+    if plan is None:
+        plan = _ModelPlan(model_class)
+        _model_plans[model_class] = plan
+    return plan
+
+
+class _LazyModel(object):
+    """Mixin for model classes created by
+    :py:func:`_get_lazy_model_class`, holding the payload of the
+    attributes that are not deserialized yet.
+    """
+    __slots__ = ("_lazy_payload", "_lazy_deserialize")
+
+    _lazy_fields = ()  # type: Tuple[Tuple[str, str, Any], ...]
+
+    def _materialize(self):
+        # type: () -> None
+        """Deserialize all the attributes not deserialized yet."""
+        for attr, _, _ in self._lazy_fields:
+            getattr(self, attr)
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        self._materialize()
+        if isinstance(other, _LazyModel):
+            other._materialize()
+        return super(_LazyModel, self).__eq__(other)  # type: ignore
+
+    def __ne__(self, other):
+        # type: (object) -> bool
+        return not self == other
+
+    def __reduce_ex__(self, protocol):
+        # type: (Any) -> Any
+        # Copy and pickle as an instance of the model class, since
+        # the lazy model class can't be looked up by name.
+        self._materialize()
+        return _restore_model, (type(self).__bases__[1], self.__dict__)
+
+
+def _restore_model(model_class, model_dict):
+    # type: (Any, Dict[str, Any]) -> Any
+    """Create an instance of the model class with the attributes in
+    the dict, when unpickling or copying a lazy model.
+
+    :param model_class: Model class.
+    :type model_class: object
+    :param model_dict: Attributes of the model.
+    :type model_dict: Dict[str, object]
+    :return: Instance of the model class.
+    :rtype: object
+    """
+    model = model_class.__new__(model_class)
+    model.__dict__.update(model_dict)
+    return model
+
+
+def _lazy_attribute(attr, payload_key, attr_type):
+    # type: (str, str, Any) -> property
+    """Create the property deserializing the attribute of a lazy model
+    on first access.
+
+    Concurrent first accesses can deserialize the attribute more than
+    once, but all of them return the same deserialized value.
+
+    :param attr: Attribute name.
+    :type attr: str
+    :param payload_key: Payload key of the attribute.
+    :type payload_key: str
+    :param attr_type: Type string of the attribute.
+    :type attr_type: object
+    :return: Property for the attribute.
+    :rtype: property
+    """
+    def getter(self):
+        # type: (Any) -> Any
+        model_dict = self.__dict__
+        try:
+            return model_dict[attr]
+        except KeyError:
+            value = self._lazy_deserialize(
+                self._lazy_payload[payload_key], attr_type)
+            return model_dict.setdefault(attr, value)
+
+    def setter(self, value):
+        # type: (Any, Any) -> None
+        self.__dict__[attr] = value
+
+    return property(getter, setter)
+
+
+_lazy_model_classes = {}  # type: Dict[Any, Any]
+
+
+def _get_lazy_model_class(model_class):
+    # type: (Any) -> Any
+    """Get the lazy subclass of the model class, creating it on first
+    use.
+
+    Instances of the subclass deserialize the non primitive attributes
+    on first access. The subclass keeps the name of the model class,
+    so ``isinstance`` checks and ``object_type`` discriminators keep
+    working.
+
+    :param model_class: Model class with ``deserialized_types``.
+    :type model_class: object
+    :return: Lazy subclass of the model class.
+    :rtype: object
+    """
+    lazy_class = _lazy_model_classes.get(model_class)
+    if lazy_class is None:
+        lazy_fields = _get_model_plan(model_class).lazy_fields
+        class_dict = {
+            attr: _lazy_attribute(attr, payload_key, attr_type)
+            for attr, payload_key, attr_type in lazy_fields
+        }  # type: Dict[str, Any]
+        class_dict["__slots__"] = ()
+        class_dict["__module__"] = model_class.__module__
+        class_dict["_lazy_fields"] = lazy_fields
+        lazy_class = type(
+            model_class.__name__, (_LazyModel, model_class), class_dict)
+        _lazy_model_classes[model_class] = lazy_class
+    return lazy_class
+
+
+try:
+    _fromisoformat = datetime.fromisoformat  # type: ignore
+except AttributeError:
+    # Python versions older than 3.7
+    _fromisoformat = None
+
+_dateutil_parser = None  # type: Any
+
+
+def _parse_datetime(payload):
+    # type: (str) -> datetime
+    """Parse the ISO8601 payload to a datetime object.
+
+    Payloads in the format produced by ``datetime.isoformat``,
+    optionally with a ``Z`` UTC designator, are parsed using
+    ``datetime.fromisoformat``. UTC timestamps are then returned with
+    ``datetime.timezone.utc`` as tzinfo. Any other payload, or every
+    payload on Python versions without ``datetime.fromisoformat``, is
+    parsed using ``dateutil.parser.parse``, imported on first use.
+
+    :param payload: data in ISO8601 format
+    :type payload: str
+    :return: parsed datetime object
+    :rtype: datetime
+    :raises: ValueError if the payload cannot be parsed, ImportError
+        if the payload needs ``dateutil``, which is not installed
+    """
+    if _fromisoformat is not None:
+        try:
+            if payload[-1:] in ("Z", "z"):
+                return _fromisoformat(payload[:-1] + "+00:00")
+            return _fromisoformat(payload)
+        except (TypeError, ValueError):
+            pass
+
+    global _dateutil_parser
+    if _dateutil_parser is None:
+        from dateutil import parser
+        _dateutil_parser = parser
+    return _dateutil_parser.parse(payload)
@@ -21,25 +21,28 @@ from ask_sdk_model.services import ServiceClientFactory, ApiConfiguration
 from ask_sdk_model import ResponseEnvelope
 
 from ask_sdk_runtime.skill import AbstractSkill, RuntimeConfiguration
-from ask_sdk_runtime.dispatch import GenericRequestDispatcher
+from ask_sdk_runtime.dispatch import (
+    GenericRequestDispatcher, FrozenRequestDispatcher)
 from ask_sdk_runtime.exceptions import AskSdkException
 from ask_sdk_runtime.utils import UserAgentManager
 
 from .serialize import DefaultSerializer
 from .handler_input import HandlerInput
-from .attributes_manager import AttributesManager
+from .attributes_manager import AttributesManager, _unwrap_copy_on_write
 from .view_resolvers import TemplateFactory
 from .utils import RESPONSE_FORMAT_VERSION, user_agent_info
 from .__version__ import __version__
 
 if typing.TYPE_CHECKING:
-    from typing import List, Dict, Any
+    from typing import List, Dict, Any, Optional, Awaitable
     from ask_sdk_model.services import ApiClient
     from ask_sdk_model import RequestEnvelope, Response
     from ask_sdk_runtime.dispatch_components import (
         GenericRequestMapper, GenericHandlerAdapter, GenericExceptionMapper,
         AbstractRequestInterceptor, AbstractResponseInterceptor)
+    from ask_sdk_runtime.async_dispatch import AsyncRequestDispatcher
     from .attributes_manager import AbstractPersistenceAdapter
+    from .json_codec import AbstractJsonCodec
 
 
 class SkillConfiguration(RuntimeConfiguration):
@@ -68,14 +71,20 @@ class SkillConfiguration(RuntimeConfiguration):
     :type custom_user_agent: str
     :param skill_id: ID of the skill.
     :type skill_id: str
+    :param json_codec: JSON codec used by the skill serializer.
+    :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+    :param lazy_deserialization: Deserialize request envelope
+        attributes on first access.
+    :type lazy_deserialization: bool
     """
 
     def __init__(
             self, request_mappers, handler_adapters,
             request_interceptors=None, response_interceptors=None,
             exception_mapper=None, persistence_adapter=None,
-            api_client=None, custom_user_agent=None, skill_id=None):
-        # type: (List[GenericRequestMapper], List[GenericHandlerAdapter], List[AbstractRequestInterceptor], List[AbstractResponseInterceptor], GenericExceptionMapper, AbstractPersistenceAdapter, ApiClient, str, str) -> None
+            api_client=None, custom_user_agent=None, skill_id=None,
+            json_codec=None, lazy_deserialization=False):
+        # type: (List[GenericRequestMapper], List[GenericHandlerAdapter], List[AbstractRequestInterceptor], List[AbstractResponseInterceptor], GenericExceptionMapper, AbstractPersistenceAdapter, ApiClient, str, str, Optional[AbstractJsonCodec], bool) -> None
         """Configuration object that represents standard components
         needed for building :py:class:`Skill`.
 
@@ -101,6 +110,15 @@ class SkillConfiguration(RuntimeConfiguration):
         :type custom_user_agent: str
         :param skill_id: ID of the skill.
         :type skill_id: str
+        :param json_codec: JSON codec used by the skill serializer.
+            Defaulted to
+            :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+        :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+        :param lazy_deserialization: Deserialize request envelope
+            attributes on first access. Check
+            :py:class:`ask_sdk_core.serialize.DefaultSerializer` for
+            details.
+        :type lazy_deserialization: bool
         """
         super(SkillConfiguration, self).__init__(
             request_mappers=request_mappers,
@@ -112,6 +130,8 @@ class SkillConfiguration(RuntimeConfiguration):
         self.api_client = api_client
         self.custom_user_agent = custom_user_agent
         self.skill_id = skill_id
+        self.json_codec = json_codec
+        self.lazy_deserialization = lazy_deserialization
 
 
 class CustomSkill(AbstractSkill):
@@ -136,15 +156,24 @@ class CustomSkill(AbstractSkill):
         """
         self.persistence_adapter = skill_configuration.persistence_adapter
         self.api_client = skill_configuration.api_client
-        self.serializer = DefaultSerializer()
+        self.serializer = DefaultSerializer(
+            json_codec=skill_configuration.json_codec,
+            lazy_deserialization=skill_configuration.lazy_deserialization)
         self.skill_id = skill_configuration.skill_id
         self.custom_user_agent = skill_configuration.custom_user_agent
         self.loaders = skill_configuration.loaders
         self.renderer = skill_configuration.renderer
 
-        self.request_dispatcher = GenericRequestDispatcher(
-            options=skill_configuration
-        )
+        if skill_configuration.frozen:
+            self.request_dispatcher = FrozenRequestDispatcher(
+                options=skill_configuration
+            )  # type: GenericRequestDispatcher
+        else:
+            self.request_dispatcher = GenericRequestDispatcher(
+                options=skill_configuration
+            )
+        self._skill_configuration = skill_configuration
+        self._async_request_dispatcher = None  # type: Optional[AsyncRequestDispatcher]
 
         UserAgentManager.register_component(
             user_agent_info(sdk_version=__version__))
@@ -179,6 +208,68 @@ class CustomSkill(AbstractSkill):
         :return: Response Envelope generated by handling the request
         :rtype: ResponseEnvelope
         """
+        handler_input = self._create_handler_input(
+            request_envelope=request_envelope, context=context)
+
+        response = self.request_dispatcher.dispatch(
+            handler_input=handler_input)  # type: Response
+
+        return self._create_response_envelope(
+            handler_input=handler_input, response=response)
+
+    def invoke_async(self, request_envelope, context):
+        # type: (RequestEnvelope, Any) -> Awaitable[ResponseEnvelope]
+        """Coroutine that invokes the async dispatcher, to handle the
+        request envelope and return a response envelope.
+
+        The request is dispatched through
+        :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`,
+        which awaits async dispatch components and runs synchronous
+        ones on an executor. Only available on Python 3.
+
+        :param request_envelope: Request Envelope instance containing
+            request information
+        :type request_envelope: RequestEnvelope
+        :param context: Context passed during invocation
+        :type context: Any
+        :return: Response Envelope generated by handling the request
+        :rtype: Awaitable[ResponseEnvelope]
+        """
+        from .async_skill import invoke_skill_async
+        return invoke_skill_async(
+            skill=self, request_envelope=request_envelope, context=context)
+
+    @property
+    def async_request_dispatcher(self):
+        # type: () -> AsyncRequestDispatcher
+        """Async request dispatcher of the skill, created on first
+        access. Only available on Python 3.
+
+        :return: Async request dispatcher built from the skill
+            configuration.
+        :rtype: ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher
+        """
+        if self._async_request_dispatcher is None:
+            from ask_sdk_runtime.async_dispatch import AsyncRequestDispatcher
+            self._async_request_dispatcher = AsyncRequestDispatcher(
+                options=self._skill_configuration)
+        return self._async_request_dispatcher
+
+    def _create_handler_input(self, request_envelope, context):
+        # type: (RequestEnvelope, Any) -> HandlerInput
+        """Verify the skill id and build the handler input for the
+        request envelope.
+
+        :param request_envelope: Request Envelope instance containing
+            request information
+        :type request_envelope: RequestEnvelope
+        :param context: Context passed during invocation
+        :type context: Any
+        :return: Handler Input instance to be dispatched
+        :rtype: HandlerInput
+        :raises: :py:class:`ask_sdk_runtime.exceptions.AskSdkException`
+            if skill id verification fails
+        """
         if (self.skill_id is not None and
                 request_envelope.context.system.application.application_id !=
                 self.skill_id):
@@ -203,19 +294,28 @@ class CustomSkill(AbstractSkill):
             request_envelope=request_envelope,
             persistence_adapter=self.persistence_adapter)
 
-        handler_input = HandlerInput(
+        return HandlerInput(
             request_envelope=request_envelope,
             attributes_manager=attributes_manager,
             context=context,
             service_client_factory=factory,
             template_factory=template_factory)
 
-        response = self.request_dispatcher.dispatch(
-            handler_input=handler_input)  # type: Response
+    def _create_response_envelope(self, handler_input, response):
+        # type: (HandlerInput, Response) -> ResponseEnvelope
+        """Build the response envelope for the dispatched handler input.
+
+        :param handler_input: Handler Input instance that was dispatched
+        :type handler_input: HandlerInput
+        :param response: Response returned by the dispatcher
+        :type response: Response
+        :return: Response Envelope containing the response
+        :rtype: ResponseEnvelope
+        """
         session_attributes = None
 
-        if request_envelope.session is not None:
-            session_attributes = (
+        if handler_input.request_envelope.session is not None:
+            session_attributes = _unwrap_copy_on_write(
                 handler_input.attributes_manager.session_attributes)
 
         return ResponseEnvelope(
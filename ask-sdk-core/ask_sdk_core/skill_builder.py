@@ -15,7 +15,6 @@
 # specific language governing permissions and limitations under the
 # License.
 #
-import json
 import typing
 
 from ask_sdk_model import RequestEnvelope
@@ -24,11 +23,15 @@ from ask_sdk_runtime.skill_builder import AbstractSkillBuilder
 from ask_sdk_runtime.utils import UserAgentManager
 
 from .skill import CustomSkill, SkillConfiguration
+from .utils.predicate import get_routing_keys
 
 if typing.TYPE_CHECKING:
-    from typing import Callable, TypeVar, Dict, List
+    from typing import (
+        Callable, TypeVar, Dict, List, Iterable, Hashable, Optional)
+    from .handler_input import HandlerInput
     from ask_sdk_model.services import ApiClient
     from .attributes_manager import AbstractPersistenceAdapter
+    from .json_codec import AbstractJsonCodec
     from ask_sdk_runtime.view_resolvers import (
         AbstractTemplateLoader, AbstractTemplateRenderer)
     T = TypeVar('T')
@@ -37,6 +40,16 @@ if typing.TYPE_CHECKING:
 class SkillBuilder(AbstractSkillBuilder):
     """Skill Builder with helper functions for building
     :py:class:`ask_sdk_core.skill.Skill` object.
+
+    The ``json_codec`` attribute can be set to an
+    :py:class:`ask_sdk_core.json_codec.AbstractJsonCodec` instance, to
+    configure the JSON codec used by the skill serializer. By default,
+    :py:func:`ask_sdk_core.json_codec.get_default_json_codec` is used.
+
+    The ``lazy_deserialization`` attribute can be set to ``True``, to
+    deserialize the request envelope attributes that aren't primitives
+    on first access, instead of upfront. Check
+    :py:class:`ask_sdk_core.serialize.DefaultSerializer` for details.
     """
 
     def __init__(self):
@@ -44,6 +57,9 @@ class SkillBuilder(AbstractSkillBuilder):
         super(SkillBuilder, self).__init__()
         self.custom_user_agent = None  # type: str
         self.skill_id = None
+        self.json_codec = None  # type: Optional[AbstractJsonCodec]
+        self.lazy_deserialization = False
+        self._skill = None  # type: Optional[CustomSkill]
 
     @property
     def skill_configuration(self):
@@ -55,6 +71,9 @@ class SkillBuilder(AbstractSkillBuilder):
         self.runtime_configuration = typing.cast(SkillConfiguration, self.runtime_configuration)
         self.runtime_configuration.custom_user_agent = self.custom_user_agent
         self.runtime_configuration.skill_id = self.skill_id
+        self.runtime_configuration.json_codec = self.json_codec
+        self.runtime_configuration.lazy_deserialization = (
+            self.lazy_deserialization)
         self.runtime_configuration = self.__populate_missing_attributes(
             self.runtime_configuration)
 
@@ -81,8 +100,44 @@ class SkillBuilder(AbstractSkillBuilder):
 
         return CustomSkill(skill_configuration=skill_configuration)
 
+    @property
+    def skill(self):
+        # type: () -> CustomSkill
+        """Skill object shared by the invocations of the
+        :py:meth:`lambda_handler` handler function.
+
+        The skill is created from the registered components on first
+        access and reused afterwards, so that warm invocations on the
+        same container don't rebuild the skill configuration, the
+        serializer and the dispatcher. Call :py:meth:`invalidate_skill`
+        after changing the registered components, to create the skill
+        again on next access.
+
+        :return: a skill object that can be used for invocation.
+        :rtype: CustomSkill
+        """
+        skill = self._skill
+        if skill is None:
+            skill = self.create()
+            self._skill = skill
+        return skill
+
+    def invalidate_skill(self):
+        # type: () -> None
+        """Discard the skill object shared by the invocations of the
+        :py:meth:`lambda_handler` handler function.
+
+        The skill is created again from the registered components on
+        the next invocation. This is needed only when components are
+        registered or changed on the builder after the first
+        invocation.
+
+        :rtype: None
+        """
+        self._skill = None
+
     def lambda_handler(self):
-        # type: () -> Callable[[str, T], Dict[str, T]]
+        # type: () -> Callable[[Dict[str, T], T], Dict[str, T]]
         """Create a handler function that can be used as handler in
         AWS Lambda console.
 
@@ -93,27 +148,57 @@ class SkillBuilder(AbstractSkillBuilder):
 
         As mentioned in the `AWS Lambda Handler docs <https://docs.aws.
         amazon.com/lambda/latest/dg/python-programming-model-handler-types.html>`__,
-        the handler function receives the event attribute as a ``str``
-        representing the input request envelope JSON from Alexa service,
-        which is deserialized to
+        the handler function receives the event attribute as a ``dict``
+        representing the parsed input request envelope JSON from Alexa
+        service, which is deserialized directly to
         :py:class:`ask_sdk_model.request_envelope.RequestEnvelope`, before
         invoking the skill. The output from the handler function would
         be the serialized
         :py:class:`ask_sdk_model.response_envelope.ResponseEnvelope` class
         from the appropriate skill handler.
 
+        The skill is created on the first invocation and reused on
+        the following invocations, through the :py:attr:`skill`
+        property. Use :py:meth:`invalidate_skill` to pick up components
+        registered after the first invocation.
+
         :return: Handler function to tag on AWS Lambda console.
         """
         def wrapper(event, context):
-            # type: (str, T) -> Dict[str, T]
-            skill = CustomSkill(skill_configuration=self.skill_configuration)
-            request_envelope = skill.serializer.deserialize(
-                payload=json.dumps(event), obj_type=RequestEnvelope)
+            # type: (Dict[str, T], T) -> Dict[str, T]
+            skill = self.skill
+            request_envelope = skill.serializer.deserialize_from_dict(
+                payload=event, obj_type=RequestEnvelope)
             response_envelope = skill.invoke(
                 request_envelope=request_envelope, context=context)
             return skill.serializer.serialize(response_envelope)  # type:ignore
         return wrapper
 
+    def enable_request_indexing(self, routing_keys_func=get_routing_keys):
+        # type: (Callable[[HandlerInput], Iterable[Hashable]]) -> None
+        """Route requests to handlers through a request type and
+        intent name index.
+
+        Handlers registered through the ``request_handler`` decorator
+        with :py:func:`ask_sdk_core.utils.predicate.is_intent_name`,
+        :py:func:`ask_sdk_core.utils.predicate.is_request_type` or
+        :py:func:`ask_sdk_core.utils.predicate.is_canfulfill_intent_name`
+        predicates, or compositions of them exposing a routing key, are
+        looked up by the request type and intent name of the incoming
+        request. Class based handlers can set a
+        ``routing_key`` attribute to the same ``(request_type,
+        intent_name)`` format to be indexed. All other handlers are
+        still checked in registration order, so the first matching
+        handler is the same as without the index.
+
+        :param routing_keys_func: Callable that takes the handler input
+            and returns the routing keys it matches on. Defaulted to
+            :py:func:`ask_sdk_core.utils.predicate.get_routing_keys`
+        :type routing_keys_func: Callable[[HandlerInput], Iterable[Hashable]]
+        :rtype: None
+        """
+        super(SkillBuilder, self).enable_request_indexing(routing_keys_func)
+
     def add_custom_user_agent(self, user_agent):
         # type: (str) -> None
         """Adds the user agent to the skill instance.
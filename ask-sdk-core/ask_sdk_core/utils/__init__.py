@@ -19,7 +19,8 @@ import sys
 
 from ..__version__ import __version__
 from .predicate import (
-    is_canfulfill_intent_name, is_intent_name, is_request_type)
+    is_canfulfill_intent_name, is_intent_name, is_request_type,
+    is_dialog_state, has_slot_value, get_routing_keys)
 from ask_sdk_runtime.utils import user_agent_info
 from .request_util import (
     get_slot, get_slot_value, get_account_linking_access_token,
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+if typing.TYPE_CHECKING:
+    from typing import Callable, List, TypeVar
+    T = TypeVar("T")
+    R = TypeVar("R")
+
+
+def map_concurrently(func, items, max_concurrency):
+    # type: (Callable[[T], R], List[T], int) -> List[R]
+    """Apply the function to the items, with at most
+    ``max_concurrency`` calls running at the same time.
+
+    The calls run on the threads of a
+    :py:class:`concurrent.futures.ThreadPoolExecutor`, created for
+    the call, and are made in the calling thread if
+    ``max_concurrency`` is 1 or there is only one item. It is used by
+    the persistence adapters to send batches of requests, so the
+    function should only share thread safe objects across calls, like
+    ``boto3`` clients.
+
+    :param func: Function to be applied
+    :type func: Callable[[T], R]
+    :param items: Items the function is applied to
+    :type items: List[T]
+    :param max_concurrency: Maximum number of calls running at the
+        same time
+    :type max_concurrency: int
+    :return: Results of the function, in the order of the items
+    :rtype: List[R]
+    :raises: The first exception raised by the function, in the
+        order of the items, after all the calls are done
+    """
+    if max_concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    return [future.result() for future in futures]
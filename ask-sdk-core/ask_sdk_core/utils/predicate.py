@@ -21,12 +21,350 @@ from ask_sdk_model import IntentRequest
 from ask_sdk_model.canfulfill import CanFulfillIntentRequest
 
 if typing.TYPE_CHECKING:
-    from typing import Callable
+    from typing import Callable, Tuple, Optional, Union, List
+    from ask_sdk_model import DialogState
     from ..handler_input import HandlerInput
 
 
+class Predicate(object):
+    """Callable predicate on
+    :py:class:`ask_sdk_core.handler_input.HandlerInput`, that exposes
+    what it matches on.
+
+    Predicates can be passed as ``can_handle_func`` wherever a
+    ``Callable[[HandlerInput], bool]`` is accepted. They can be combined
+    with ``&``, ``|`` and ``~`` into :py:class:`AndPredicate`,
+    :py:class:`OrPredicate` and :py:class:`NotPredicate` instances,
+    whose ``predicates`` attribute holds the operands.
+
+    The ``request_type``, ``intent_name``, ``dialog_state`` and
+    ``slot_name`` attributes describe the condition checked by the
+    predicate, and are ``None`` if the predicate doesn't check them.
+    The ``routing_key`` is the ``(request_type, intent_name)`` tuple
+    that every matching input has, which is used for indexed request
+    routing, or ``None`` if there is no such key.
+    """
+    request_type = None  # type: Optional[str]
+    intent_name = None  # type: Optional[str]
+    dialog_state = None  # type: Optional[DialogState]
+    slot_name = None  # type: Optional[str]
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        """Checks if the handler input matches the predicate.
+
+        :param handler_input: The handler input instance that is
+            generally passed in the sdk's request and exception
+            components
+        :type handler_input: ask_sdk_core.handler_input.HandlerInput
+        :return: Boolean if the handler input matches the predicate
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+    @property
+    def routing_key(self):
+        # type: () -> Optional[Tuple[str, Optional[str]]]
+        """Routing key that every matching input has, if any.
+
+        :rtype: Optional[Tuple[str, Optional[str]]]
+        """
+        if self.request_type is None:
+            return None
+        return self.request_type, self.intent_name
+
+    def __and__(self, other):
+        # type: (Callable[[HandlerInput], bool]) -> Predicate
+        return AndPredicate(self, other)
+
+    def __rand__(self, other):
+        # type: (Callable[[HandlerInput], bool]) -> Predicate
+        return AndPredicate(other, self)
+
+    def __or__(self, other):
+        # type: (Callable[[HandlerInput], bool]) -> Predicate
+        return OrPredicate(self, other)
+
+    def __ror__(self, other):
+        # type: (Callable[[HandlerInput], bool]) -> Predicate
+        return OrPredicate(other, self)
+
+    def __invert__(self):
+        # type: () -> Predicate
+        return NotPredicate(self)
+
+
+class FunctionPredicate(Predicate):
+    """Predicate wrapping a plain ``Callable[[HandlerInput], bool]``.
+
+    The wrapped function is opaque, so the predicate doesn't expose
+    any structure.
+
+    :param func: Function that checks the handler input
+    :type func: Callable[[HandlerInput], bool]
+    """
+    def __init__(self, func):
+        # type: (Callable[[HandlerInput], bool]) -> None
+        if not callable(func):
+            raise TypeError("Predicate function should be a callable")
+        self.func = func
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return bool(self.func(handler_input))
+
+    def __repr__(self):
+        # type: () -> str
+        return "FunctionPredicate({!r})".format(self.func)
+
+
+class RequestTypePredicate(Predicate):
+    """Predicate matching the request type of the input.
+
+    :param request_type: request type to be matched with the input's
+        request
+    :type request_type: str
+    """
+    def __init__(self, request_type):
+        # type: (str) -> None
+        self.request_type = request_type
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return (handler_input.request_envelope.request.object_type ==
+                self.request_type)
+
+    def __repr__(self):
+        # type: () -> str
+        return "is_request_type({!r})".format(self.request_type)
+
+
+class IntentNamePredicate(Predicate):
+    """Predicate matching the intent name of an Intent Request.
+
+    :param intent_name: Name to be matched with the Intent Request Name
+    :type intent_name: str
+    """
+    request_type = "IntentRequest"
+
+    def __init__(self, intent_name):
+        # type: (str) -> None
+        self.intent_name = intent_name
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return (isinstance(
+            handler_input.request_envelope.request, IntentRequest) and
+                handler_input.request_envelope.request.intent.name ==
+                self.intent_name)
+
+    def __repr__(self):
+        # type: () -> str
+        return "is_intent_name({!r})".format(self.intent_name)
+
+
+class CanFulfillIntentNamePredicate(Predicate):
+    """Predicate matching the intent name of a CanFulfill Intent
+    Request.
+
+    :param intent_name: Name to be matched with the CanFulfill Intent
+        Request Name
+    :type intent_name: str
+    """
+    request_type = "CanFulfillIntentRequest"
+
+    def __init__(self, intent_name):
+        # type: (str) -> None
+        self.intent_name = intent_name
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return (isinstance(
+            handler_input.request_envelope.request, CanFulfillIntentRequest) and
+                handler_input.request_envelope.request.intent.name ==
+                self.intent_name)
+
+    def __repr__(self):
+        # type: () -> str
+        return "is_canfulfill_intent_name({!r})".format(self.intent_name)
+
+
+class DialogStatePredicate(Predicate):
+    """Predicate matching the dialog state of an Intent Request.
+
+    :param dialog_state: Dialog state to be matched with the Intent
+        Request dialog state
+    :type dialog_state: ask_sdk_model.dialog_state.DialogState
+    """
+    request_type = "IntentRequest"
+
+    def __init__(self, dialog_state):
+        # type: (DialogState) -> None
+        self.dialog_state = dialog_state
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return (isinstance(
+            handler_input.request_envelope.request, IntentRequest) and
+                handler_input.request_envelope.request.dialog_state ==
+                self.dialog_state)
+
+    def __repr__(self):
+        # type: () -> str
+        return "is_dialog_state({!r})".format(self.dialog_state)
+
+
+class SlotValuePredicate(Predicate):
+    """Predicate matching an Intent Request having a value for a slot.
+
+    :param slot_name: Name of the slot that should have a value
+    :type slot_name: str
+    """
+    request_type = "IntentRequest"
+
+    def __init__(self, slot_name):
+        # type: (str) -> None
+        self.slot_name = slot_name
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        request = handler_input.request_envelope.request
+        if not isinstance(request, IntentRequest) or not request.intent.slots:
+            return False
+        slot = request.intent.slots.get(self.slot_name, None)
+        return slot is not None and slot.value is not None
+
+    def __repr__(self):
+        # type: () -> str
+        return "has_slot_value({!r})".format(self.slot_name)
+
+
+class AndPredicate(Predicate):
+    """Predicate matching when all the operand predicates match.
+
+    The operands are checked in order and the check stops at the first
+    operand that doesn't match. Structure attributes are taken from the
+    operands, since every one of them holds for a matching input.
+
+    :param predicates: Operand predicates or plain callables
+    :type predicates: Callable[[HandlerInput], bool]
+    """
+    def __init__(self, *predicates):
+        # type: (*Callable[[HandlerInput], bool]) -> None
+        self.predicates = _flatten(AndPredicate, predicates)
+        for predicate in self.predicates:
+            for attribute in (
+                    "request_type", "intent_name", "dialog_state",
+                    "slot_name"):
+                value = getattr(predicate, attribute)
+                if value is not None and getattr(self, attribute) is None:
+                    setattr(self, attribute, value)
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return all(
+            predicate(handler_input) for predicate in self.predicates)
+
+    def __repr__(self):
+        # type: () -> str
+        return "({})".format(" & ".join(repr(p) for p in self.predicates))
+
+
+class OrPredicate(Predicate):
+    """Predicate matching when any of the operand predicates match.
+
+    Structure attributes are only exposed when all the operands agree
+    on them.
+
+    :param predicates: Operand predicates or plain callables
+    :type predicates: Callable[[HandlerInput], bool]
+    """
+    def __init__(self, *predicates):
+        # type: (*Callable[[HandlerInput], bool]) -> None
+        self.predicates = _flatten(OrPredicate, predicates)
+        for attribute in (
+                "request_type", "intent_name", "dialog_state", "slot_name"):
+            values = set(
+                getattr(predicate, attribute)
+                for predicate in self.predicates)
+            if len(values) == 1:
+                setattr(self, attribute, values.pop())
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return any(
+            predicate(handler_input) for predicate in self.predicates)
+
+    def __repr__(self):
+        # type: () -> str
+        return "({})".format(" | ".join(repr(p) for p in self.predicates))
+
+
+class NotPredicate(Predicate):
+    """Predicate matching when the operand predicate doesn't match.
+
+    The negation doesn't expose any structure, since a non matching
+    input can be of any request type.
+
+    :param predicate: Operand predicate or plain callable
+    :type predicate: Callable[[HandlerInput], bool]
+    """
+    def __init__(self, predicate):
+        # type: (Callable[[HandlerInput], bool]) -> None
+        self.predicates = _flatten(NotPredicate, [predicate])
+
+    def __call__(self, handler_input):
+        # type: (HandlerInput) -> bool
+        return not self.predicates[0](handler_input)
+
+    def __repr__(self):
+        # type: () -> str
+        return "~{!r}".format(self.predicates[0])
+
+
+def _flatten(predicate_class, predicates):
+    # type: (type, typing.Iterable[Callable[[HandlerInput], bool]]) -> List[Predicate]
+    """Wrap plain callables into predicates and inline nested operands
+    of the same ``predicate_class``, except for negations.
+    """
+    flattened = []  # type: List[Predicate]
+    for predicate in predicates:
+        if not isinstance(predicate, Predicate):
+            predicate = FunctionPredicate(predicate)
+        if (predicate_class is not NotPredicate and
+                type(predicate) is predicate_class):
+            flattened.extend(typing.cast(typing.Any, predicate).predicates)
+        else:
+            flattened.append(predicate)
+    return flattened
+
+
+def get_routing_keys(handler_input):
+    # type: (HandlerInput) -> Tuple[Tuple[str, Optional[str]], ...]
+    """Return the routing keys of the request in handler input.
+
+    The keys match the ``routing_key`` attribute of the predicates
+    returned by :py:func:`is_canfulfill_intent_name`,
+    :py:func:`is_intent_name` and :py:func:`is_request_type`, and can be
+    used for indexed request routing in the skill builder.
+
+    :param handler_input: The handler input instance that is generally
+        passed in the sdk's request and exception components
+    :type handler_input: ask_sdk_core.handler_input.HandlerInput
+    :return: Tuple of ``(request_type, intent_name)`` keys, with
+        ``None`` as the intent name for the request type key
+    :rtype: Tuple[Tuple[str, Optional[str]], ...]
+    """
+    request = handler_input.request_envelope.request
+    request_type = request.object_type
+    intent = getattr(request, "intent", None)
+    if intent is not None:
+        return (request_type, intent.name), (request_type, None)
+    return ((request_type, None), )
+
+
 def is_canfulfill_intent_name(name):
-    # type: (str) -> Callable[[HandlerInput], bool]
+    # type: (str) -> Predicate
     """A predicate function returning a boolean, when name matches the
     intent name in a CanFulfill Intent Request.
 
@@ -40,18 +378,13 @@ def is_canfulfill_intent_name(name):
     :type name: str
     :return: Predicate function that can be used to check name of the
         request
-    :rtype: Callable[[HandlerInput], bool]
+    :rtype: Predicate
     """
-    def can_handle_wrapper(handler_input):
-        # type: (HandlerInput) -> bool
-        return (isinstance(
-            handler_input.request_envelope.request, CanFulfillIntentRequest) and
-                handler_input.request_envelope.request.intent.name == name)
-    return can_handle_wrapper
+    return CanFulfillIntentNamePredicate(name)
 
 
 def is_intent_name(name):
-    # type: (str) -> Callable[[HandlerInput], bool]
+    # type: (str) -> Predicate
     """A predicate function returning a boolean, when name matches the
     name in Intent Request.
 
@@ -65,18 +398,13 @@ def is_intent_name(name):
     :type name: str
     :return: Predicate function that can be used to check name of the
         request
-    :rtype: Callable[[HandlerInput], bool]
+    :rtype: Predicate
     """
-    def can_handle_wrapper(handler_input):
-        # type: (HandlerInput) -> bool
-        return (isinstance(
-            handler_input.request_envelope.request, IntentRequest) and
-                handler_input.request_envelope.request.intent.name == name)
-    return can_handle_wrapper
+    return IntentNamePredicate(name)
 
 
 def is_request_type(request_type):
-    # type: (str) -> Callable[[HandlerInput], bool]
+    # type: (str) -> Predicate
     """A predicate function returning a boolean, when request type is
     the passed-in type.
 
@@ -88,10 +416,45 @@ def is_request_type(request_type):
     :type request_type: str
     :return: Predicate function that can be used to check the type of
         the request
-    :rtype: Callable[[HandlerInput], bool]
+    :rtype: Predicate
     """
-    def can_handle_wrapper(handler_input):
-        # type: (HandlerInput) -> bool
-        return (handler_input.request_envelope.request.object_type ==
-                request_type)
-    return can_handle_wrapper
+    return RequestTypePredicate(request_type)
+
+
+def is_dialog_state(dialog_state):
+    # type: (DialogState) -> Predicate
+    """A predicate function returning a boolean, when the dialog state
+    of the Intent Request is the passed-in state.
+
+    The function can be applied on a
+    :py:class:`ask_sdk_core.handler_input.HandlerInput`, to check if
+    the input is of :py:class:`ask_sdk_model.intent_request.IntentRequest`
+    type and if its dialog state matches with the passed state.
+
+    :param dialog_state: Dialog state to be matched with the Intent
+        Request dialog state
+    :type dialog_state: ask_sdk_model.dialog_state.DialogState
+    :return: Predicate function that can be used to check the dialog
+        state of the request
+    :rtype: Predicate
+    """
+    return DialogStatePredicate(dialog_state)
+
+
+def has_slot_value(slot_name):
+    # type: (str) -> Predicate
+    """A predicate function returning a boolean, when the Intent
+    Request has a value for the passed-in slot.
+
+    The function can be applied on a
+    :py:class:`ask_sdk_core.handler_input.HandlerInput`, to check if
+    the input is of :py:class:`ask_sdk_model.intent_request.IntentRequest`
+    type and if the slot with the passed name has a value.
+
+    :param slot_name: Name of the slot that should have a value
+    :type slot_name: str
+    :return: Predicate function that can be used to check the slot
+        presence in the request
+    :rtype: Predicate
+    """
+    return SlotValuePredicate(slot_name)
@@ -36,3 +36,15 @@ class MockPersistenceAdapter(AbstractPersistenceAdapter):
     def delete_attributes(self, request_envelope):
         self.del_count += 1
         self.attributes = {}
+
+
+class MockPartialPersistenceAdapter(MockPersistenceAdapter):
+    def __init__(self):
+        super(MockPartialPersistenceAdapter, self).__init__()
+        self.requested_keys = []
+
+    def get_partial_attributes(self, request_envelope, keys):
+        self.requested_keys.append(keys)
+        return {
+            key: value for key, value in self.attributes.items()
+            if key in keys}
@@ -20,6 +20,7 @@ import json
 
 from ask_sdk_model.services import ApiClientRequest
 from ask_sdk_core.api_client import DefaultApiClient
+from ask_sdk_core.json_codec import AbstractJsonCodec
 from ask_sdk_core.exceptions import ApiClientException
 
 from .data.mock_response_object import MockResponse
@@ -202,6 +203,26 @@ class TestDefaultApiClient(unittest.TestCase):
                 headers={'Content-type': 'application/json'},
                 url=self.valid_request.url)
 
+    def test_api_client_send_request_with_configured_json_codec(self):
+        test_json_codec = mock.MagicMock(spec=AbstractJsonCodec)
+        test_json_codec.dumps.return_value = "encoded body"
+        test_api_client = DefaultApiClient(json_codec=test_json_codec)
+        self.valid_request.body = {"test": "body"}
+        self.valid_request.method = "POST"
+        self.valid_request.headers = [("Content-type", "application/json")]
+
+        with mock.patch(
+                "requests.post",
+                side_effect=lambda *args, **kwargs: self.valid_mock_response
+        ) as mock_post:
+            test_api_client.invoke(self.valid_request)
+            mock_post.assert_called_once_with(
+                data="encoded body",
+                headers={'Content-type': 'application/json'},
+                url=self.valid_request.url)
+
+        test_json_codec.dumps.assert_called_once_with({"test": "body"})
+
     def test_api_client_send_request_with_raw_data_unchanged_for_non_json_content(
             self):
         test_data = "test\nstring"
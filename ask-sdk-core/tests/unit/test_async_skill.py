@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import asyncio
+import unittest
+
+from ask_sdk_model import (
+    RequestEnvelope, Context, Application, Response, Session)
+from ask_sdk_model.interfaces.system import SystemState
+
+from ask_sdk_core.skill_builder import SkillBuilder
+from ask_sdk_core.exceptions import AskSdkException
+
+
+class TestSkillInvokeAsync(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.skill_builder = SkillBuilder()
+        self.request_envelope = RequestEnvelope(
+            context=Context(system=SystemState(
+                application=Application(application_id="test"))),
+            session=Session(attributes={"foo": "bar"}))
+
+    def tearDown(self):
+        self.loop.close()
+
+    def invoke_async(self, skill):
+        return self.loop.run_until_complete(skill.invoke_async(
+            request_envelope=self.request_envelope, context=None))
+
+    def test_invoke_async_with_coroutine_handler(self):
+        test_response = Response()
+
+        @self.skill_builder.request_handler(can_handle_func=lambda i: True)
+        async def test_handler(handler_input):
+            handler_input.attributes_manager.session_attributes["baz"] = 1
+            return test_response
+
+        response_envelope = self.invoke_async(self.skill_builder.create())
+
+        assert response_envelope.response == test_response, (
+            "Async skill invocation returned incorrect response from "
+            "coroutine request handler")
+        assert response_envelope.session_attributes == {
+            "foo": "bar", "baz": 1}, (
+            "Async skill invocation didn't propagate session attributes to "
+            "response envelope")
+
+    def test_invoke_async_with_sync_handler(self):
+        test_response = Response()
+
+        @self.skill_builder.request_handler(can_handle_func=lambda i: True)
+        def test_handler(handler_input):
+            return test_response
+
+        response_envelope = self.invoke_async(self.skill_builder.create())
+
+        assert response_envelope.response == test_response, (
+            "Async skill invocation returned incorrect response from "
+            "synchronous request handler")
+
+    def test_invoke_async_throw_exception_when_skill_id_doesnt_match(self):
+        self.skill_builder.skill_id = "123"
+
+        with self.assertRaises(AskSdkException) as exc:
+            self.invoke_async(self.skill_builder.create())
+
+        assert "Skill ID Verification failed" in str(exc.exception), (
+            "Async skill invocation didn't throw verification error when "
+            "Skill ID doesn't match Application ID")
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import sys
+import json
+import zlib
+import unittest
+
+from ask_sdk_core.attributes_codec import (
+    AttributesCodec, AbstractAttributesFormat, AbstractCompression,
+    JsonAttributesFormat, MsgpackAttributesFormat, CborAttributesFormat,
+    ZlibCompression, ZstdCompression)
+from ask_sdk_core.json_codec import StdlibJsonCodec
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+
+def get_available_formats():
+    formats = [JsonAttributesFormat(json_codec=StdlibJsonCodec())]
+    for format_class in (MsgpackAttributesFormat, CborAttributesFormat):
+        try:
+            formats.append(format_class())
+        except ImportError:
+            pass
+    return formats
+
+
+def get_available_compressions():
+    compressions = [None, ZlibCompression()]
+    try:
+        compressions.append(ZstdCompression())
+    except ImportError:
+        pass
+    return compressions
+
+
+class ReversedCompression(AbstractCompression):
+    compression_id = 3
+
+    def compress(self, data):
+        return data[::-1]
+
+    def decompress(self, data):
+        return data[::-1]
+
+
+class TestAttributesCodec(unittest.TestCase):
+    def setUp(self):
+        self.test_attributes = {
+            "counter": 3,
+            "profile": {"name": u"√ user", "score": 2.5, "active": True},
+            "history": [{"turn": index, "answer": None}
+                        for index in range(100)]
+        }
+
+    def test_codecs_round_trip(self):
+        for attributes_format in get_available_formats():
+            for compression in get_available_compressions():
+                codec = AttributesCodec(
+                    attributes_format=attributes_format,
+                    compression=compression, min_compress_size=0)
+
+                encoded = codec.encode(self.test_attributes)
+
+                assert isinstance(encoded, bytes), (
+                    "Attributes codec didn't encode attributes to bytes")
+                assert codec.decode(encoded) == self.test_attributes, (
+                    "Attributes codec with {} and {} didn't decode "
+                    "encoded attributes".format(
+                        type(attributes_format).__name__,
+                        type(compression).__name__))
+
+    def test_encode_header_identifies_format_and_compression(self):
+        codec = AttributesCodec(
+            attributes_format=JsonAttributesFormat(
+                json_codec=StdlibJsonCodec()),
+            compression=ZlibCompression(), min_compress_size=0)
+
+        encoded = codec.encode(self.test_attributes)
+
+        assert encoded[:1] == b"\x11", (
+            "Attributes codec encoded incorrect header for JSON format "
+            "with zlib compression")
+        assert json.loads(zlib.decompress(encoded[1:]).decode(
+            "utf-8")) == self.test_attributes, (
+            "Attributes codec didn't store zlib compressed JSON after "
+            "the header")
+
+    def test_encode_small_attributes_uncompressed(self):
+        codec = AttributesCodec(
+            attributes_format=JsonAttributesFormat(
+                json_codec=StdlibJsonCodec()),
+            compression=ZlibCompression(), min_compress_size=1024)
+
+        encoded = codec.encode({"counter": 3})
+
+        assert encoded == b'\x10{"counter": 3}', (
+            "Attributes codec compressed attributes smaller than the "
+            "minimum compression size")
+
+    def test_decode_legacy_json_text(self):
+        codec = AttributesCodec(compression=ZlibCompression())
+
+        assert codec.decode(
+            json.dumps(self.test_attributes).encode(
+                "utf-8")) == self.test_attributes, (
+            "Attributes codec didn't decode attributes stored as JSON "
+            "text without header")
+        assert codec.decode(b' \n{"counter": 3}') == {"counter": 3}, (
+            "Attributes codec didn't decode JSON text starting with "
+            "whitespace")
+
+    def test_decode_empty_data(self):
+        codec = AttributesCodec()
+
+        assert codec.decode(b"") == {}, (
+            "Attributes codec didn't decode empty data to empty "
+            "attributes")
+
+    def test_decode_attributes_encoded_with_other_codec(self):
+        encoding_codec = AttributesCodec(
+            attributes_format=JsonAttributesFormat(
+                json_codec=StdlibJsonCodec()),
+            compression=ZlibCompression(), min_compress_size=0)
+        decoding_codec = AttributesCodec(
+            attributes_format=mock.MagicMock(
+                spec=AbstractAttributesFormat, format_id=1))
+
+        assert decoding_codec.decode(encoding_codec.encode(
+            self.test_attributes)) == self.test_attributes, (
+            "Attributes codec didn't decode attributes encoded with "
+            "another format and compression")
+
+    def test_custom_compression(self):
+        codec = AttributesCodec(
+            attributes_format=JsonAttributesFormat(
+                json_codec=StdlibJsonCodec()),
+            compression=ReversedCompression(), min_compress_size=0)
+
+        encoded = codec.encode({"counter": 3})
+
+        assert encoded == b'\x13}3 :"retnuoc"{', (
+            "Attributes codec didn't encode attributes with custom "
+            "compression")
+        assert codec.decode(encoded) == {"counter": 3}, (
+            "Attributes codec didn't decode attributes with custom "
+            "compression")
+
+    def test_decode_unknown_compression_raises_value_error(self):
+        codec = AttributesCodec()
+
+        with self.assertRaises(ValueError) as exc:
+            codec.decode(b'\x13}3 :"retnuoc"{')
+
+        assert "unknown compression id 3" in str(exc.exception), (
+            "Attributes codec didn't raise ValueError for unknown "
+            "compression id")
+
+    def test_decode_uninstalled_format_raises_value_error(self):
+        codec = AttributesCodec()
+
+        with mock.patch.dict(sys.modules, {"msgpack": None}):
+            with self.assertRaises(ValueError) as exc:
+                codec.decode(b"\x14\x81\xa1a\x01")
+
+        assert "MsgpackAttributesFormat" in str(exc.exception), (
+            "Attributes codec didn't raise ValueError for format with "
+            "library not installed")
+
+    def test_invalid_compression_id_raises_value_error(self):
+        compression = mock.MagicMock(
+            spec=AbstractCompression, compression_id=0)
+
+        with self.assertRaises(ValueError):
+            AttributesCodec(compression=compression)
+
+    def test_invalid_format_id_raises_value_error(self):
+        attributes_format = mock.MagicMock(
+            spec=AbstractAttributesFormat, format_id=4)
+
+        with self.assertRaises(ValueError):
+            AttributesCodec(attributes_format=attributes_format)
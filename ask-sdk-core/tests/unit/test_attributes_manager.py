@@ -16,13 +16,21 @@
 # License.
 #
 
+import copy
+import pickle
 import unittest
 
 from ask_sdk_model.request_envelope import RequestEnvelope
 from ask_sdk_model.session import Session
 from ask_sdk_core.attributes_manager import (
-    AttributesManager, AttributesManagerException)
-from .data.mock_persistence_adapter import MockPersistenceAdapter
+    AttributesManager, AttributesManagerException, _unwrap_copy_on_write)
+from .data.mock_persistence_adapter import (
+    MockPersistenceAdapter, MockPartialPersistenceAdapter)
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
 
 
 class TestAttributesManager(unittest.TestCase):
@@ -87,6 +95,116 @@ class TestAttributesManager(unittest.TestCase):
             "AttributesManager should raise error when trying to get session "
             "attributes from out of session envelope")
 
+    def test_session_attributes_changes_not_applied_to_request_envelope(self):
+        original_attributes = {
+            "score": 1,
+            "game": {"board": [["x", None], [None, "o"]], "turn": "x"},
+            "players": [{"name": "a", "wins": 0}, {"name": "b", "wins": 2}],
+            "settings": {"level": 3}
+        }
+        session = Session(attributes=copy.deepcopy(original_attributes))
+        request_envelope = RequestEnvelope(session=session)
+        attributes_manager = AttributesManager(
+            request_envelope=request_envelope)
+
+        session_attributes = attributes_manager.session_attributes
+        session_attributes["score"] += 1
+        session_attributes["game"]["board"][1][0] = "x"
+        session_attributes.get("game")["turn"] = "o"
+        for player in session_attributes["players"]:
+            player["wins"] += 1
+        session_attributes.setdefault("history", []).append("x")
+
+        assert session.attributes == original_attributes, (
+            "AttributesManager changed request envelope session attributes "
+            "when session attributes are changed")
+        assert session_attributes == {
+            "score": 2,
+            "game": {"board": [["x", None], ["x", "o"]], "turn": "o"},
+            "players": [{"name": "a", "wins": 1}, {"name": "b", "wins": 3}],
+            "settings": {"level": 3},
+            "history": ["x"]
+        }, (
+            "AttributesManager fails to apply changes to session attributes")
+        assert attributes_manager.session_attributes is session_attributes, (
+            "AttributesManager returned different session attributes "
+            "objects for the same request")
+
+    def test_session_attributes_copy_only_accessed_values(self):
+        session = Session(attributes={
+            "game": {"turn": "x"}, "settings": {"level": 3}})
+        request_envelope = RequestEnvelope(session=session)
+        attributes_manager = AttributesManager(
+            request_envelope=request_envelope)
+
+        session_attributes = attributes_manager.session_attributes
+        session_attributes["game"]["turn"] = "o"
+
+        assert dict.__getitem__(session_attributes, "settings") is (
+            session.attributes["settings"]), (
+            "AttributesManager copied session attributes values that "
+            "weren't accessed")
+
+    def test_session_attributes_keep_values_set_by_skill(self):
+        session = Session(attributes={"game": {"turn": "x"}})
+        request_envelope = RequestEnvelope(session=session)
+        attributes_manager = AttributesManager(
+            request_envelope=request_envelope)
+        new_game = {"turn": "o"}
+
+        attributes_manager.session_attributes["game"] = new_game
+        attributes_manager.session_attributes["game"]["turn"] = "x"
+
+        assert new_game == {"turn": "x"}, (
+            "AttributesManager copied session attributes values set by "
+            "the skill")
+
+    def test_session_attributes_copy_and_pickle(self):
+        session = Session(attributes={"players": [{"name": "a"}]})
+        request_envelope = RequestEnvelope(session=session)
+        attributes_manager = AttributesManager(
+            request_envelope=request_envelope)
+        session_attributes = attributes_manager.session_attributes
+
+        for copied_attributes in (
+                copy.deepcopy(session_attributes),
+                pickle.loads(pickle.dumps(session_attributes))):
+            copied_attributes["players"][0]["name"] = "b"
+
+            assert session.attributes == {"players": [{"name": "a"}]}, (
+                "AttributesManager session attributes copy changed request "
+                "envelope session attributes")
+            assert copied_attributes == {"players": [{"name": "b"}]}, (
+                "AttributesManager session attributes copy fails to apply "
+                "changes")
+
+    def test_unwrap_session_attributes_to_builtin_containers(self):
+        session = Session(attributes={
+            "game": {"board": ["x", None]}, "settings": {"level": 3}})
+        request_envelope = RequestEnvelope(session=session)
+        attributes_manager = AttributesManager(
+            request_envelope=request_envelope)
+        attributes_manager.session_attributes["game"]["board"][1] = "o"
+
+        unwrapped_attributes = _unwrap_copy_on_write(
+            attributes_manager.session_attributes)
+
+        assert unwrapped_attributes == {
+            "game": {"board": ["x", "o"]}, "settings": {"level": 3}}, (
+            "Unwrapping session attributes changed their values")
+        assert type(unwrapped_attributes) is dict, (
+            "Unwrapping session attributes didn't return builtin dict")
+        assert type(unwrapped_attributes["game"]) is dict, (
+            "Unwrapping session attributes didn't convert accessed dict "
+            "to builtin dict")
+        assert type(unwrapped_attributes["game"]["board"]) is list, (
+            "Unwrapping session attributes didn't convert accessed list "
+            "to builtin list")
+        assert unwrapped_attributes["settings"] is (
+            session.attributes["settings"]), (
+            "Unwrapping session attributes copied values that weren't "
+            "accessed")
+
     def test_get_persistent_attributes(self):
         session = Session()
         request_envelope = RequestEnvelope(
@@ -260,4 +378,298 @@ class TestAttributesManager(unittest.TestCase):
 
         assert attributes_manager._persistence_adapter.attributes == {}, (
             "AttributesManager fails to delete persistent attributes via "
-            "persistence adapter")
\ No newline at end of file
+            "persistence adapter")
+    def get_attributes_manager_with_loaded_attributes(self, attributes):
+        persistence_adapter = MockPersistenceAdapter()
+        persistence_adapter.attributes = attributes
+        attributes_manager = AttributesManager(
+            request_envelope=RequestEnvelope(session=Session()),
+            persistence_adapter=persistence_adapter)
+        attributes_manager.persistent_attributes
+        return attributes_manager
+
+    def test_save_persistent_attributes_skipped_when_only_read(self):
+        attributes_manager = (
+            self.get_attributes_manager_with_loaded_attributes(
+                {"counter": 1, "game": {"turn": "x"}}))
+
+        assert attributes_manager.persistent_attributes["game"]["turn"] == (
+            "x"), (
+            "AttributesManager fails to get nested persistent attributes")
+        attributes_manager.persistent_attributes["counter"] = 1
+        attributes_manager.save_persistent_attributes()
+
+        assert attributes_manager._persistence_adapter.save_count == 0, (
+            "AttributesManager saved persistent attributes that didn't "
+            "change")
+
+    def test_save_persistent_attributes_passes_changed_keys(self):
+        loaded_attributes = {
+            "counter": 1, "game": {"turn": "x"}, "history": ["x"],
+            "settings": {"level": 3}}
+        attributes_manager = (
+            self.get_attributes_manager_with_loaded_attributes(
+                loaded_attributes))
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        persistent_attributes = attributes_manager.persistent_attributes
+        persistent_attributes["game"]["turn"] = "o"
+        persistent_attributes["new"] = True
+        persistent_attributes["settings"]["level"] = 3
+        del persistent_attributes["history"]
+
+        with mock.patch.object(
+                persistence_adapter, "save_changed_attributes",
+                wraps=persistence_adapter.save_changed_attributes) as (
+                mock_save_changed_attributes):
+            attributes_manager.save_persistent_attributes()
+
+        mock_save_changed_attributes.assert_called_once_with(
+            request_envelope=attributes_manager._request_envelope,
+            attributes={
+                "counter": 1, "game": {"turn": "o"}, "new": True,
+                "settings": {"level": 3}},
+            changed_keys={"game", "new"}, removed_keys={"history"})
+        assert persistence_adapter.save_count == 1, (
+            "AttributesManager fails to save changed persistent attributes "
+            "using save_attributes by default")
+        assert type(persistence_adapter.attributes["game"]) is dict, (
+            "AttributesManager saved persistent attributes with copy on "
+            "write containers")
+        assert loaded_attributes == {
+            "counter": 1, "game": {"turn": "x"}, "history": ["x"],
+            "settings": {"level": 3}}, (
+            "AttributesManager changed the persistent attributes retrieved "
+            "from persistence adapter")
+
+    def test_save_persistent_attributes_detects_changes_in_sets(self):
+        loaded_attributes = {
+            "visited": {"a"}, "games": [{"moves": {"x"}}],
+            "data": bytearray(b"a")}
+        attributes_manager = (
+            self.get_attributes_manager_with_loaded_attributes(
+                loaded_attributes))
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        persistent_attributes = attributes_manager.persistent_attributes
+        persistent_attributes["visited"].add("b")
+        persistent_attributes["games"][0]["moves"].add("o")
+        persistent_attributes["data"].extend(b"b")
+        attributes_manager.save_persistent_attributes()
+
+        assert persistence_adapter.save_count == 1, (
+            "AttributesManager fails to save persistent attributes changed "
+            "in place in set and bytearray values")
+        assert persistence_adapter.attributes == {
+            "visited": {"a", "b"}, "games": [{"moves": {"x", "o"}}],
+            "data": bytearray(b"ab")}, (
+            "AttributesManager saved incorrect persistent attributes "
+            "changed in place in set and bytearray values")
+        assert loaded_attributes == {
+            "visited": {"a"}, "games": [{"moves": {"x"}}],
+            "data": bytearray(b"a")}, (
+            "AttributesManager changed the set and bytearray values "
+            "retrieved from persistence adapter")
+
+    def test_save_persistent_attributes_after_reassign_save_and_reuse(self):
+        attributes_manager = (
+            self.get_attributes_manager_with_loaded_attributes(
+                {"a": [1], "b": {"c": 1}}))
+
+        persistent_attributes = attributes_manager.persistent_attributes
+        persistent_attributes["a"] = "x"
+        persistent_attributes["b"] = "y"
+        attributes_manager.save_persistent_attributes()
+        new_values = [[] for _ in range(100)] + [{} for _ in range(100)]
+        for index, value in enumerate(new_values):
+            persistent_attributes["z{}".format(index)] = value
+
+        for index, value in enumerate(new_values):
+            assert persistent_attributes["z{}".format(index)] is value, (
+                "AttributesManager replaced a value set during the request "
+                "by a copy, after the retrieved values were released")
+
+    def test_save_persistent_attributes_detects_changes_in_copies(self):
+        attributes_manager = (
+            self.get_attributes_manager_with_loaded_attributes(
+                {"game": {"turn": "x"}}))
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        persistent_attributes = dict(attributes_manager.persistent_attributes)
+        persistent_attributes["game"]["turn"] = "o"
+        attributes_manager.persistent_attributes = persistent_attributes
+        attributes_manager.save_persistent_attributes()
+
+        assert persistence_adapter.attributes == {"game": {"turn": "o"}}, (
+            "AttributesManager fails to save persistent attributes changed "
+            "in a copy")
+
+    def test_save_persistent_attributes_skipped_when_set_to_same_values(self):
+        attributes_manager = (
+            self.get_attributes_manager_with_loaded_attributes(
+                {"game": {"turn": "x"}}))
+
+        attributes_manager.persistent_attributes = {"game": {"turn": "x"}}
+        attributes_manager.save_persistent_attributes()
+
+        assert attributes_manager._persistence_adapter.save_count == 0, (
+            "AttributesManager saved persistent attributes set to the "
+            "retrieved values")
+
+    def test_save_persistent_attributes_again_saves_all_attributes(self):
+        attributes_manager = (
+            self.get_attributes_manager_with_loaded_attributes(
+                {"counter": 1}))
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        attributes_manager.persistent_attributes["counter"] = 2
+        attributes_manager.save_persistent_attributes()
+        attributes_manager.persistent_attributes["counter"] = 3
+
+        with mock.patch.object(
+                persistence_adapter, "save_changed_attributes") as (
+                mock_save_changed_attributes):
+            attributes_manager.save_persistent_attributes()
+
+        self.assertFalse(
+            mock_save_changed_attributes.called,
+            "AttributesManager saved only changed persistent attributes "
+            "after they were already saved")
+        assert persistence_adapter.attributes == {"counter": 3}, (
+            "AttributesManager fails to save persistent attributes changed "
+            "after they were saved")
+
+    def get_attributes_manager_with_partial_adapter(self):
+        persistence_adapter = MockPartialPersistenceAdapter()
+        persistence_adapter.attributes = {
+            "counter": 1, "game": {"turn": "x"}, "history": [1, 2, 3]}
+        return AttributesManager(
+            request_envelope=RequestEnvelope(session=Session()),
+            persistence_adapter=persistence_adapter)
+
+    def test_get_persistent_retrieves_all_attributes_by_default(self):
+        attributes_manager = AttributesManager(
+            request_envelope=RequestEnvelope(session=Session()),
+            persistence_adapter=MockPersistenceAdapter())
+
+        assert attributes_manager.get_persistent(keys=["key_1"]) == {
+            "key_1": "v1", "key_2": "v2"}, (
+            "AttributesManager fails to get persistent attributes when "
+            "persistence adapter can't retrieve partial attributes")
+        assert attributes_manager._persistence_adapter.get_count == 1, (
+            "AttributesManager didn't retrieve persistent attributes when "
+            "persistence adapter can't retrieve partial attributes")
+
+    def test_get_persistent_retrieves_only_requested_keys(self):
+        attributes_manager = self.get_attributes_manager_with_partial_adapter()
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        persistent_attributes = attributes_manager.get_persistent(
+            keys=["counter", "missing"])
+
+        assert persistent_attributes == {"counter": 1}, (
+            "AttributesManager fails to get partial persistent attributes")
+        persistent_attributes["counter"] = 2
+
+        assert attributes_manager.get_persistent(
+            keys=["counter", "game"]) is persistent_attributes, (
+            "AttributesManager returned different persistent attributes "
+            "objects for the same request")
+        assert persistent_attributes == {
+            "counter": 2, "game": {"turn": "x"}}, (
+            "AttributesManager fails to merge later requested partial "
+            "persistent attributes")
+        assert persistence_adapter.requested_keys == [
+            ["counter", "missing"], ["game"]], (
+            "AttributesManager requested already retrieved keys from "
+            "persistence adapter")
+        assert persistence_adapter.get_count == 0, (
+            "AttributesManager retrieved all persistent attributes when "
+            "only some were requested")
+
+    def test_get_persistent_removes_duplicate_keys(self):
+        attributes_manager = self.get_attributes_manager_with_partial_adapter()
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        attributes_manager.get_persistent(keys=["counter", "counter"])
+        attributes_manager.get_persistent(keys=["game", "history", "game"])
+
+        assert persistence_adapter.requested_keys == [
+            ["counter"], ["game", "history"]], (
+            "AttributesManager requested duplicate keys from persistence "
+            "adapter")
+
+    def test_persistent_attributes_merge_remaining_attributes(self):
+        attributes_manager = self.get_attributes_manager_with_partial_adapter()
+
+        persistent_attributes = attributes_manager.get_persistent(
+            keys=["counter", "game"])
+        persistent_attributes["counter"] = 2
+        del persistent_attributes["game"]
+        persistent_attributes["new"] = True
+
+        assert attributes_manager.persistent_attributes is (
+            persistent_attributes), (
+            "AttributesManager returned different persistent attributes "
+            "objects for the same request")
+        assert persistent_attributes == {
+            "counter": 2, "history": [1, 2, 3], "new": True}, (
+            "AttributesManager fails to merge remaining persistent "
+            "attributes into partial persistent attributes")
+
+        with mock.patch.object(
+                attributes_manager._persistence_adapter,
+                "save_changed_attributes") as mock_save_changed_attributes:
+            attributes_manager.save_persistent_attributes()
+
+        mock_save_changed_attributes.assert_called_once_with(
+            request_envelope=attributes_manager._request_envelope,
+            attributes={"counter": 2, "history": [1, 2, 3], "new": True},
+            changed_keys={"counter", "new"}, removed_keys={"game"})
+
+    def test_save_partial_persistent_attributes_keeps_other_attributes(self):
+        attributes_manager = self.get_attributes_manager_with_partial_adapter()
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        persistent_attributes = attributes_manager.get_persistent(
+            keys=["counter", "game"])
+        persistent_attributes["game"]["turn"] = "o"
+        persistent_attributes["new"] = True
+
+        with mock.patch.object(
+                persistence_adapter, "save_partial_attributes",
+                wraps=persistence_adapter.save_partial_attributes) as (
+                mock_save_partial_attributes):
+            attributes_manager.save_persistent_attributes()
+
+        mock_save_partial_attributes.assert_called_once_with(
+            request_envelope=attributes_manager._request_envelope,
+            attributes={"counter": 1, "game": {"turn": "o"}, "new": True},
+            changed_keys={"game", "new"}, removed_keys=set())
+        assert persistence_adapter.attributes == {
+            "counter": 1, "game": {"turn": "o"}, "history": [1, 2, 3],
+            "new": True}, (
+            "AttributesManager fails to save partial persistent attributes "
+            "without changing the other attributes")
+
+    def test_save_partial_persistent_attributes_skipped_when_only_read(self):
+        attributes_manager = self.get_attributes_manager_with_partial_adapter()
+
+        attributes_manager.get_persistent(keys=["game"])["game"]["turn"]
+        attributes_manager.save_persistent_attributes()
+
+        assert attributes_manager._persistence_adapter.save_count == 0, (
+            "AttributesManager saved partial persistent attributes that "
+            "didn't change")
+
+    def test_set_persistent_attributes_after_partial_retrieval(self):
+        attributes_manager = self.get_attributes_manager_with_partial_adapter()
+        persistence_adapter = attributes_manager._persistence_adapter
+
+        attributes_manager.get_persistent(keys=["counter"])
+        attributes_manager.persistent_attributes = {"counter": 5}
+        attributes_manager.save_persistent_attributes()
+
+        assert persistence_adapter.attributes == {"counter": 5}, (
+            "AttributesManager fails to replace all persistent attributes "
+            "set after partial retrieval")
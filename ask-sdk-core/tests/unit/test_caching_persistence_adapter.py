@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import unittest
+
+from ask_sdk_model import RequestEnvelope, Context
+from ask_sdk_model.interfaces.system import SystemState
+from ask_sdk_model.user import User
+from ask_sdk_core.attributes_manager import AttributesManager
+from ask_sdk_core.caching_persistence_adapter import (
+    CachingPersistenceAdapter)
+from .data.mock_persistence_adapter import (
+    MockPersistenceAdapter, MockPartialPersistenceAdapter)
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+
+def user_keygen(request_envelope):
+    return request_envelope.context.system.user.user_id
+
+
+def build_request_envelope(user_id):
+    return RequestEnvelope(context=Context(
+        system=SystemState(user=User(user_id=user_id))))
+
+
+class TestCachingPersistenceAdapter(unittest.TestCase):
+    def setUp(self):
+        self.persistence_adapter = MockPartialPersistenceAdapter()
+        self.request_envelope = build_request_envelope("test_user")
+        self.caching_adapter = CachingPersistenceAdapter(
+            persistence_adapter=self.persistence_adapter,
+            cache_keygen=user_keygen)
+
+    def test_default_cache_keygen_uses_adapter_partition_keygen(self):
+        self.persistence_adapter.partition_keygen = user_keygen
+
+        caching_adapter = CachingPersistenceAdapter(
+            persistence_adapter=self.persistence_adapter)
+
+        assert caching_adapter.cache_keygen is user_keygen, (
+            "Caching Persistence Adapter didn't default cache keygen to "
+            "partition keygen of persistence adapter")
+
+    def test_default_cache_keygen_uses_adapter_object_keygen(self):
+        self.persistence_adapter.object_keygen = user_keygen
+
+        caching_adapter = CachingPersistenceAdapter(
+            persistence_adapter=self.persistence_adapter)
+
+        assert caching_adapter.cache_keygen is user_keygen, (
+            "Caching Persistence Adapter didn't default cache keygen to "
+            "object keygen of persistence adapter")
+
+    def test_no_cache_keygen_raises_error(self):
+        with self.assertRaises(ValueError) as exc:
+            CachingPersistenceAdapter(
+                persistence_adapter=self.persistence_adapter)
+
+        assert "cache_keygen has to be provided" in str(exc.exception), (
+            "Caching Persistence Adapter didn't raise error when no cache "
+            "keygen is available")
+
+    def test_get_attributes_caches_attributes(self):
+        first = self.caching_adapter.get_attributes(self.request_envelope)
+        second = self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert first == {"key_1": "v1", "key_2": "v2"}, (
+            "Caching Persistence Adapter retrieved incorrect attributes")
+        assert second == first, (
+            "Caching Persistence Adapter didn't return cached attributes")
+        assert self.persistence_adapter.get_count == 1, (
+            "Caching Persistence Adapter retrieved cached attributes from "
+            "persistence adapter")
+        assert self.caching_adapter.hits == 1, (
+            "Caching Persistence Adapter didn't count cache hit")
+        assert self.caching_adapter.misses == 1, (
+            "Caching Persistence Adapter didn't count cache miss")
+
+    def test_get_attributes_caches_copy_of_retrieved_attributes(self):
+        self.persistence_adapter.attributes = {"visited": {"a"}}
+
+        retrieved = self.caching_adapter.get_attributes(self.request_envelope)
+        retrieved["visited"].add("b")
+        retrieved["counter"] = 1
+
+        assert self.caching_adapter.get_attributes(
+            self.request_envelope) == {"visited": {"a"}}, (
+            "Caching Persistence Adapter cached the attributes retrieved "
+            "from persistence adapter without copying them")
+
+    def test_get_attributes_returns_copy_of_cached_attributes(self):
+        self.persistence_adapter.attributes = {"visited": {"a"}}
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        cached = self.caching_adapter.get_attributes(self.request_envelope)
+        cached["visited"].add("b")
+        partial = self.caching_adapter.get_partial_attributes(
+            self.request_envelope, keys=["visited"])
+        partial["visited"].add("c")
+
+        assert self.caching_adapter.get_attributes(
+            self.request_envelope) == {"visited": {"a"}}, (
+            "Caching Persistence Adapter returned cached attributes "
+            "without copying them")
+        assert self.persistence_adapter.get_count == 1, (
+            "Caching Persistence Adapter retrieved cached attributes from "
+            "persistence adapter")
+
+    def test_get_attributes_caches_per_key(self):
+        self.caching_adapter.get_attributes(self.request_envelope)
+        self.caching_adapter.get_attributes(
+            build_request_envelope("other_user"))
+
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter shared cached attributes across "
+            "cache keys")
+
+    def test_get_attributes_after_time_to_live(self):
+        self.caching_adapter.time_to_live = 1000
+
+        with mock.patch(
+                "ask_sdk_core.caching_persistence_adapter.time.time",
+                side_effect=[10.0, 10.5, 11.5, 11.5]):
+            self.caching_adapter.get_attributes(self.request_envelope)
+            self.caching_adapter.get_attributes(self.request_envelope)
+            self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter didn't retrieve attributes from "
+            "persistence adapter after time to live")
+        assert self.caching_adapter.expirations == 1, (
+            "Caching Persistence Adapter didn't count expired attributes")
+        assert self.caching_adapter.hits == 1, (
+            "Caching Persistence Adapter counted incorrect cache hits")
+        assert self.caching_adapter.misses == 2, (
+            "Caching Persistence Adapter counted incorrect cache misses")
+
+    def test_get_attributes_evicts_least_recently_used(self):
+        self.caching_adapter.capacity = 2
+        first_user = build_request_envelope("first_user")
+        second_user = build_request_envelope("second_user")
+        third_user = build_request_envelope("third_user")
+
+        self.caching_adapter.get_attributes(first_user)
+        self.caching_adapter.get_attributes(second_user)
+        self.caching_adapter.get_attributes(first_user)
+        self.caching_adapter.get_attributes(third_user)
+        self.persistence_adapter.get_count = 0
+
+        self.caching_adapter.get_attributes(first_user)
+        assert self.persistence_adapter.get_count == 0, (
+            "Caching Persistence Adapter evicted recently used attributes")
+
+        self.caching_adapter.get_attributes(second_user)
+        assert self.persistence_adapter.get_count == 1, (
+            "Caching Persistence Adapter didn't evict least recently used "
+            "attributes")
+        assert self.caching_adapter.evictions == 2, (
+            "Caching Persistence Adapter didn't count evictions")
+
+    def test_get_attributes_with_zero_capacity(self):
+        self.caching_adapter.capacity = 0
+
+        self.caching_adapter.get_attributes(self.request_envelope)
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter cached attributes with zero "
+            "capacity")
+
+    def test_get_attributes_bypassing_cache(self):
+        self.caching_adapter.bypass_cache = lambda request_envelope: True
+        self.caching_adapter.get_attributes(self.request_envelope)
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter returned cached attributes when "
+            "bypassing cache")
+
+        self.caching_adapter.bypass_cache = None
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter didn't refresh cache with "
+            "attributes retrieved when bypassing cache")
+
+    def test_save_attributes_writes_through_cache(self):
+        attributes = {"key_1": "v3", "nested": {"key": "value"}}
+
+        self.caching_adapter.save_attributes(
+            self.request_envelope, attributes)
+        attributes["nested"]["key"] = "changed"
+        cached = self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.save_count == 1, (
+            "Caching Persistence Adapter didn't save attributes using "
+            "persistence adapter")
+        assert self.persistence_adapter.get_count == 0, (
+            "Caching Persistence Adapter didn't cache saved attributes")
+        assert cached == {"key_1": "v3", "nested": {"key": "value"}}, (
+            "Caching Persistence Adapter cached attributes sharing state "
+            "with saved attributes")
+
+    def test_save_attributes_failure_invalidates_cache(self):
+        self.caching_adapter.get_attributes(self.request_envelope)
+        self.persistence_adapter.save_attributes = mock.MagicMock(
+            side_effect=Exception("test exception"))
+
+        with self.assertRaises(Exception):
+            self.caching_adapter.save_attributes(
+                self.request_envelope, {"key_1": "v3"})
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter kept cached attributes after "
+            "failing to save attributes")
+
+    def test_save_changed_attributes_writes_through_cache(self):
+        self.persistence_adapter.save_changed_attributes = mock.MagicMock()
+
+        self.caching_adapter.save_changed_attributes(
+            self.request_envelope, {"key_1": "v3"}, {"key_1"}, {"key_2"})
+        cached = self.caching_adapter.get_attributes(self.request_envelope)
+
+        self.persistence_adapter.save_changed_attributes.assert_called_once_with(
+            request_envelope=self.request_envelope,
+            attributes={"key_1": "v3"}, changed_keys={"key_1"},
+            removed_keys={"key_2"})
+        assert cached == {"key_1": "v3"}, (
+            "Caching Persistence Adapter didn't cache saved changed "
+            "attributes")
+
+    def test_get_partial_attributes_from_cache(self):
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        partial = self.caching_adapter.get_partial_attributes(
+            self.request_envelope, ["key_1", "key_3"])
+
+        assert partial == {"key_1": "v1"}, (
+            "Caching Persistence Adapter retrieved incorrect partial "
+            "attributes from cache")
+        assert self.persistence_adapter.requested_keys == [], (
+            "Caching Persistence Adapter retrieved cached partial "
+            "attributes from persistence adapter")
+
+    def test_get_partial_attributes_not_cached(self):
+        partial = self.caching_adapter.get_partial_attributes(
+            self.request_envelope, ["key_1"])
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert partial == {"key_1": "v1"}, (
+            "Caching Persistence Adapter retrieved incorrect partial "
+            "attributes from persistence adapter")
+        assert self.persistence_adapter.requested_keys == [["key_1"]], (
+            "Caching Persistence Adapter didn't retrieve partial "
+            "attributes from persistence adapter")
+        assert self.persistence_adapter.get_count == 1, (
+            "Caching Persistence Adapter cached partial attributes")
+
+    def test_save_partial_attributes_updates_cache(self):
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        self.caching_adapter.save_partial_attributes(
+            self.request_envelope, {"key_1": "v3"}, {"key_1"}, {"key_2"})
+        cached = self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.attributes == {"key_1": "v3"}, (
+            "Caching Persistence Adapter didn't save partial attributes "
+            "using persistence adapter")
+        assert cached == {"key_1": "v3"}, (
+            "Caching Persistence Adapter didn't apply saved partial "
+            "attributes to cache")
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter invalidated cache on saving "
+            "partial attributes")
+
+    def test_save_partial_attributes_not_cached(self):
+        self.caching_adapter.save_partial_attributes(
+            self.request_envelope, {"key_1": "v3"}, {"key_1"}, set())
+        self.persistence_adapter.get_count = 0
+
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.get_count == 1, (
+            "Caching Persistence Adapter cached partial attributes")
+
+    def test_delete_attributes_invalidates_cache(self):
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        self.caching_adapter.delete_attributes(self.request_envelope)
+        attributes = self.caching_adapter.get_attributes(
+            self.request_envelope)
+
+        assert self.persistence_adapter.del_count == 1, (
+            "Caching Persistence Adapter didn't delete attributes using "
+            "persistence adapter")
+        assert attributes == {}, (
+            "Caching Persistence Adapter returned cached attributes after "
+            "delete")
+
+    def test_clear(self):
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        self.caching_adapter.clear()
+        self.caching_adapter.get_attributes(self.request_envelope)
+
+        assert self.persistence_adapter.get_count == 2, (
+            "Caching Persistence Adapter didn't clear cache")
+
+    def test_attributes_manager_with_caching_adapter(self):
+        self.request_envelope.session = None
+        for _ in range(2):
+            attributes_manager = AttributesManager(
+                request_envelope=self.request_envelope,
+                persistence_adapter=self.caching_adapter)
+            attributes = attributes_manager.persistent_attributes
+            attributes["counter"] = attributes.get("counter", 0) + 1
+            attributes_manager.save_persistent_attributes()
+
+        assert self.persistence_adapter.get_count == 1, (
+            "Caching Persistence Adapter didn't cache attributes across "
+            "requests")
+        assert self.persistence_adapter.attributes["counter"] == 2, (
+            "Caching Persistence Adapter returned stale attributes "
+            "across requests")
+
+    def test_attributes_manager_changes_dont_reach_cache(self):
+        self.request_envelope.session = None
+        self.persistence_adapter.attributes = {"visited": {"a"}}
+        attributes_manager = AttributesManager(
+            request_envelope=self.request_envelope,
+            persistence_adapter=self.caching_adapter)
+
+        attributes_manager.persistent_attributes["visited"].add("b")
+
+        assert self.caching_adapter.get_attributes(
+            self.request_envelope) == {"visited": {"a"}}, (
+            "Caching Persistence Adapter cached attributes changed "
+            "through AttributesManager before they were saved")
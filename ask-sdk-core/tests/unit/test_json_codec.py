@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import sys
+import json
+import unittest
+
+from ask_sdk_core import json_codec
+from ask_sdk_core.json_codec import (
+    StdlibJsonCodec, OrjsonCodec, UjsonCodec, get_default_json_codec,
+    get_fast_json_codec)
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+
+def get_available_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+class TestJsonCodec(unittest.TestCase):
+    def setUp(self):
+        self.test_obj = {
+            "version": "1.0",
+            "session": {"new": True, "attributes": {"counter": 3}},
+            "items": [1, 2.5, None, False, u"√"]
+        }
+
+    def tearDown(self):
+        json_codec._fast_json_codec = None
+
+    def test_codecs_round_trip(self):
+        for codec in get_available_codecs():
+            encoded = codec.dumps(self.test_obj)
+
+            assert isinstance(encoded, str), (
+                "{} didn't encode object to JSON text".format(
+                    type(codec).__name__))
+            assert json.loads(encoded) == self.test_obj, (
+                "{} encoded object incorrectly".format(type(codec).__name__))
+            assert codec.loads(json.dumps(self.test_obj)) == self.test_obj, (
+                "{} decoded JSON text incorrectly".format(
+                    type(codec).__name__))
+
+    def test_codecs_encode_non_str_keys_as_str(self):
+        for codec in get_available_codecs():
+            assert codec.loads(codec.dumps({1: "one"})) == {"1": "one"}, (
+                "{} didn't encode non string dict keys to strings".format(
+                    type(codec).__name__))
+
+    def test_codecs_raise_value_error_on_invalid_json(self):
+        for codec in get_available_codecs():
+            with self.assertRaises(ValueError):
+                codec.loads("{invalid")
+
+    def test_orjson_codec_encodes_big_integers(self):
+        try:
+            codec = OrjsonCodec()
+        except ImportError:
+            self.skipTest("orjson isn't installed")
+
+        assert codec.dumps({"id": 10 ** 30}) == json.dumps(
+            {"id": 10 ** 30}), (
+            "orjson codec didn't encode integer wider than 64 bits")
+
+    def test_default_codec_is_stdlib(self):
+        with mock.patch.dict(sys.modules, {"orjson": mock.MagicMock()}):
+            assert isinstance(get_default_json_codec(), StdlibJsonCodec), (
+                "Default JSON codec isn't stdlib codec when orjson is "
+                "installed")
+        assert get_default_json_codec().loads(
+            "12345678901234567890123456789") == (
+            12345678901234567890123456789), (
+            "Default JSON codec didn't decode big integer without loss")
+
+    def test_fast_codec_prefers_orjson(self):
+        with mock.patch.dict(sys.modules, {"orjson": mock.MagicMock()}):
+            json_codec._fast_json_codec = None
+
+            assert isinstance(get_fast_json_codec(), OrjsonCodec), (
+                "Fast JSON codec isn't orjson codec when orjson is "
+                "installed")
+
+    def test_fast_codec_falls_back_to_ujson(self):
+        with mock.patch.dict(
+                sys.modules, {"orjson": None, "ujson": mock.MagicMock()}):
+            json_codec._fast_json_codec = None
+
+            assert isinstance(get_fast_json_codec(), UjsonCodec), (
+                "Fast JSON codec isn't ujson codec when only ujson is "
+                "installed")
+
+    def test_fast_codec_falls_back_to_stdlib(self):
+        with mock.patch.dict(sys.modules, {"orjson": None, "ujson": None}):
+            json_codec._fast_json_codec = None
+
+            assert isinstance(get_fast_json_codec(), StdlibJsonCodec), (
+                "Fast JSON codec isn't stdlib codec when neither orjson "
+                "nor ujson is installed")
+
+    def test_fast_codec_is_shared(self):
+        json_codec._fast_json_codec = None
+
+        assert get_fast_json_codec() is get_fast_json_codec(), (
+            "Fast JSON codec isn't shared across calls")
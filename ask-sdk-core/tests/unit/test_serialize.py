@@ -16,13 +16,20 @@
 # License.
 #
 import unittest
+import copy
 import datetime
 import decimal
+import pickle
+import threading
 
+from dateutil import tz
 from six import text_type
+from ask_sdk_model import RequestEnvelope, IntentRequest
 from mock import patch
 
+from ask_sdk_core import serialize
 from ask_sdk_core.serialize import DefaultSerializer
+from ask_sdk_core.json_codec import StdlibJsonCodec
 from ask_sdk_core.exceptions import SerializationException
 
 from . import data
@@ -150,6 +157,29 @@ class TestSerialization(unittest.TestCase):
         assert self.test_serializer.serialize(test_obj_inst) == expected_dict, \
             "Default Serializer serialized object with incomplete attribute map incorrectly"
 
+    def test_model_obj_serialization_does_not_mutate_attribute_map(self):
+        test_obj_inst = data.ModelTestObject4(str_var="test", float_var=3.14)
+
+        self.test_serializer.serialize(test_obj_inst)
+        self.test_serializer.deserialize_from_dict(
+            {"str_var": "test", "floatingValue": 3.14},
+            data.ModelTestObject4)
+
+        assert data.ModelTestObject4.attribute_map == {
+            'float_var': 'floatingValue'}, (
+            "Default Serializer mutated attribute map of the model class")
+
+    def test_model_obj_serialization_reuses_model_plan(self):
+        with patch(
+                "ask_sdk_core.serialize._ModelPlan",
+                wraps=serialize._ModelPlan) as mock_plan, patch.dict(
+                "ask_sdk_core.serialize._model_plans", clear=True):
+            for _ in range(3):
+                self.test_serializer.serialize(
+                    data.ModelTestObject3(str_var="test", int_var=123))
+
+        mock_plan.assert_called_once_with(data.ModelTestObject3)
+
     def test_enum_obj_serialization(self):
         test_model_obj_2 = data.ModelTestObject2(int_var=123)
         test_enum_obj = data.ModelEnumObject("ENUM_VAL_1")
@@ -196,7 +226,7 @@ class TestSerialization(unittest.TestCase):
 
 class TestDeserialization(unittest.TestCase):
     def setUp(self):
-        self.test_serializer = DefaultSerializer()
+        self.test_serializer = DefaultSerializer(json_codec=StdlibJsonCodec())
 
     def test_none_obj_deserialization(self):
         test_payload = None
@@ -242,7 +272,7 @@ class TestDeserialization(unittest.TestCase):
                 "Default Serializer deserialized long object incorrectly"
 
     def test_primitive_obj_deserialization_raising_unicode_exception(self):
-        test_serializer = DefaultSerializer()
+        test_serializer = DefaultSerializer(json_codec=StdlibJsonCodec())
         mocked_primitive_type = mock.Mock(
             side_effect=UnicodeEncodeError('hitchhiker', u"", 42, 43, 'the universe and everything else'))
 
@@ -257,7 +287,7 @@ class TestDeserialization(unittest.TestCase):
                 "Default Serializer deserialized primitive type which raises UnicodeEncodeError incorrectly"
 
     def test_primitive_obj_deserialization_raising_type_error(self):
-        test_serializer = DefaultSerializer()
+        test_serializer = DefaultSerializer(json_codec=StdlibJsonCodec())
         mocked_primitive_type = mock.Mock(side_effect=TypeError())
 
         test_serializer.PRIMITIVE_TYPES = [mocked_primitive_type]
@@ -329,6 +359,43 @@ class TestDeserialization(unittest.TestCase):
                     "Default Serializer didn't return datetime correctly for import errors"
                 parse_class.assert_called_once_with(test_payload)
 
+    @unittest.skipIf(
+        not hasattr(datetime.datetime, "fromisoformat"),
+        "datetime.fromisoformat is not available")
+    def test_utc_datetime_obj_deserialization_without_dateutil(self):
+        test_obj_type = datetime.datetime
+        test_cases = {
+            "2018-01-01T10:20:30Z": datetime.datetime(
+                2018, 1, 1, 10, 20, 30, tzinfo=tz.tzutc()),
+            "2018-01-01T10:20:30.123Z": datetime.datetime(
+                2018, 1, 1, 10, 20, 30, 123000, tzinfo=tz.tzutc()),
+            "2018-01-01T10:20:30+05:30": datetime.datetime(
+                2018, 1, 1, 4, 50, 30, tzinfo=tz.tzutc()),
+        }
+
+        with patch("dateutil.parser.parse") as parse_class:
+            for test_payload, expected_obj in test_cases.items():
+                assert self.test_serializer.deserialize_from_dict(
+                    test_payload, test_obj_type) == expected_obj, (
+                    "Default Serializer deserialized ISO8601 datetime {} "
+                    "incorrectly".format(test_payload))
+
+            self.assertFalse(
+                parse_class.called,
+                "Default Serializer parsed strict ISO8601 datetime using "
+                "dateutil")
+
+    def test_non_iso_datetime_obj_deserialization_falls_back_to_dateutil(
+            self):
+        test_payload = "January 1 2018 10:20:30"
+        test_obj_type = datetime.datetime
+
+        expected_obj = datetime.datetime(2018, 1, 1, 10, 20, 30)
+        assert self.test_serializer.deserialize_from_dict(
+            test_payload, test_obj_type) == expected_obj, (
+            "Default Serializer didn't parse non ISO8601 datetime using "
+            "dateutil")
+
     def test_obj_type_deserialization(self):
         test_payload = "test"
         test_obj_type = object
@@ -555,3 +622,213 @@ class TestDeserialization(unittest.TestCase):
             assert "Couldn't resolve object by discriminator type" in str(exc.exception), (
                 "Default Serializer didn't throw SerializationException when deserialization is called with invalid "
                 "discriminator type in payload and parent model")
+
+    def test_deserialize_from_dict_skips_json_parsing(self):
+        test_payload = {
+            "ChildType": 'ChildType2',
+            "var1": "Some string",
+            "var3Object": {
+                "var4Int": 123
+            },
+            "testIntVar": 456
+        }
+        test_obj_type = data.ModelChildObject2
+        expected_sub_obj = data.ModelTestObject2(int_var=123)
+        expected_obj = data.ModelChildObject2(
+            str_var="Some string", obj_var=expected_sub_obj, test_int_var=456)
+
+        with patch("json.loads") as mock_json_loader:
+            assert self.test_serializer.deserialize_from_dict(
+                test_payload, test_obj_type) == expected_obj, (
+                "Default Serializer deserialized parsed model object "
+                "incorrectly")
+            mock_json_loader.assert_not_called()
+
+    def test_deserialize_from_dict_list_of_model_objects(self):
+        test_payload = [{"var4Int": 123}, {"var4Int": 456}]
+        test_obj_type = "list[{}]".format(
+            "{}.{}".format(
+                data.ModelTestObject2.__module__,
+                data.ModelTestObject2.__name__))
+
+        assert self.test_serializer.deserialize_from_dict(
+            test_payload, test_obj_type) == [
+            data.ModelTestObject2(int_var=123),
+            data.ModelTestObject2(int_var=456)], (
+            "Default Serializer deserialized parsed list of model objects "
+            "incorrectly")
+
+    def test_deserialize_from_dict_none_payload(self):
+        assert self.test_serializer.deserialize_from_dict(
+            None, data.ModelTestObject2) is None, (
+            "Default Serializer deserialized parsed None payload "
+            "incorrectly")
+
+    def test_type_resolution_cached_across_deserializations(self):
+        test_obj_type = "list[tests.unit.data.ModelTestObject2]"
+        test_payload = [{"var4Int": 123}, {"var4Int": 456}]
+        expected_obj = [
+            data.ModelTestObject2(int_var=123),
+            data.ModelTestObject2(int_var=456)]
+
+        with patch.object(
+                DefaultSerializer,
+                "_DefaultSerializer__load_class_from_name",
+                return_value=data.ModelTestObject2) as mock_load_class:
+            for _ in range(3):
+                assert self.test_serializer.deserialize_from_dict(
+                    test_payload, test_obj_type) == expected_obj, (
+                    "Default Serializer deserialized list of model objects "
+                    "incorrectly with cached type resolution")
+
+        mock_load_class.assert_called_once_with(
+            "tests.unit.data.ModelTestObject2")
+
+    def test_type_resolution_cache_is_bounded(self):
+        test_serializer = DefaultSerializer(type_cache_size=2)
+
+        for payload, obj_type in (
+                ([], "list[str]"), ([], "list[int]"), ({}, "dict(str, str)")):
+            test_serializer.deserialize_from_dict(payload, obj_type)
+
+        assert list(test_serializer._type_cache) == [
+            "list[int]", "dict(str, str)"], (
+            "Default Serializer didn't evict the oldest type strings from "
+            "a full type resolution cache")
+
+    def test_unresolvable_type_not_cached(self):
+        test_obj_type = "tests.unit.data.MissingModelObject"
+
+        for _ in range(2):
+            with self.assertRaises(SerializationException) as exc:
+                self.test_serializer.deserialize_from_dict(
+                    {"var4Int": 123}, test_obj_type)
+
+            assert "Unable to resolve class" in str(exc.exception), (
+                "Default Serializer didn't throw SerializationException "
+                "when type string can't be resolved")
+
+        assert test_obj_type not in self.test_serializer._type_cache, (
+            "Default Serializer cached a type string that can't be resolved")
+
+    def test_concurrent_deserialization_with_shared_type_cache(self):
+        test_obj_type = "dict(str, tests.unit.data.ModelTestObject2)"
+        test_payload = {"a": {"var4Int": 1}, "b": {"var4Int": 2}}
+        expected_obj = {
+            "a": data.ModelTestObject2(int_var=1),
+            "b": data.ModelTestObject2(int_var=2)}
+        results = []
+
+        def deserialize():
+            for _ in range(50):
+                results.append(self.test_serializer.deserialize_from_dict(
+                    test_payload, test_obj_type))
+
+        threads = [threading.Thread(target=deserialize) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [expected_obj] * 200, (
+            "Default Serializer deserialized incorrectly when type cache is "
+            "shared across threads")
+
+
+class TestLazyDeserialization(unittest.TestCase):
+    def setUp(self):
+        self.lazy_serializer = DefaultSerializer(lazy_deserialization=True)
+        self.eager_serializer = DefaultSerializer()
+        self.test_payload = {
+            "version": "1.0",
+            "session": {"new": True, "attributes": {"counter": 1}},
+            "context": {
+                "System": {"application": {"applicationId": "test"}}
+            },
+            "request": {
+                "type": "IntentRequest",
+                "requestId": "test_request_id",
+                "timestamp": "2018-01-01T10:20:30",
+                "intent": {"name": "TestIntent"}
+            }
+        }
+
+    def test_lazy_model_deserializes_attributes_on_first_access(self):
+        request_envelope = self.lazy_serializer.deserialize_from_dict(
+            self.test_payload, RequestEnvelope)
+
+        assert isinstance(request_envelope, RequestEnvelope), (
+            "Lazy deserialized model isn't an instance of the model class")
+        assert request_envelope.version == "1.0", (
+            "Lazy deserialization didn't deserialize primitive attribute "
+            "upfront")
+        assert "request" not in request_envelope.__dict__, (
+            "Lazy deserialization deserialized model attribute upfront")
+
+        request = request_envelope.request
+
+        assert isinstance(request, IntentRequest), (
+            "Lazy deserialization didn't resolve the child model class "
+            "through the discriminator")
+        assert request_envelope.request is request, (
+            "Lazy deserialization deserialized attribute again on second "
+            "access")
+        assert request.intent.name == "TestIntent", (
+            "Lazy deserialization deserialized nested model incorrectly")
+        assert request.timestamp == datetime.datetime(
+            2018, 1, 1, 10, 20, 30), (
+            "Lazy deserialization deserialized datetime incorrectly")
+        assert "context" not in request_envelope.__dict__, (
+            "Lazy deserialization deserialized untouched attribute")
+
+    def test_lazy_model_equals_and_serializes_as_eager_model(self):
+        lazy_envelope = self.lazy_serializer.deserialize_from_dict(
+            self.test_payload, RequestEnvelope)
+        eager_envelope = self.eager_serializer.deserialize_from_dict(
+            self.test_payload, RequestEnvelope)
+
+        assert self.eager_serializer.serialize(lazy_envelope) == (
+            self.eager_serializer.serialize(eager_envelope)), (
+            "Lazy deserialized model serialized differently than eagerly "
+            "deserialized model")
+        assert eager_envelope == lazy_envelope, (
+            "Eagerly deserialized model isn't equal to lazy deserialized "
+            "model")
+        assert lazy_envelope == eager_envelope, (
+            "Lazy deserialized model isn't equal to eagerly deserialized "
+            "model")
+
+    def test_lazy_model_copies_to_model_class(self):
+        lazy_envelope = self.lazy_serializer.deserialize_from_dict(
+            self.test_payload, RequestEnvelope)
+        eager_envelope = self.eager_serializer.deserialize_from_dict(
+            self.test_payload, RequestEnvelope)
+
+        copied_envelope = copy.deepcopy(lazy_envelope)
+        unpickled_envelope = pickle.loads(pickle.dumps(lazy_envelope))
+
+        for envelope in (copied_envelope, unpickled_envelope):
+            assert type(envelope) is RequestEnvelope, (
+                "Copy of lazy deserialized model isn't an instance of the "
+                "model class")
+            assert envelope == eager_envelope, (
+                "Copy of lazy deserialized model isn't equal to eagerly "
+                "deserialized model")
+
+    def test_lazy_model_attribute_set_before_access(self):
+        request_envelope = self.lazy_serializer.deserialize_from_dict(
+            self.test_payload, RequestEnvelope)
+
+        request_envelope.context = None
+
+        assert request_envelope.context is None, (
+            "Lazy deserialized model didn't keep the attribute set before "
+            "first access")
+
+    def test_lazy_model_invalid_attribute_raises_on_access(self):
+        self.test_payload["request"]["timestamp"] = "abc-wx-yzT25:80:90"
+        request_envelope = self.lazy_serializer.deserialize_from_dict(
+            self.test_payload, RequestEnvelope)
+
+        with self.assertRaises(SerializationException):
+            request_envelope.request.timestamp
@@ -182,3 +182,36 @@ class TestSkill(unittest.TestCase):
             "Invalid Session Attributes propagated from Request Envelope "
             "session to Response Envelope, "
             "during skill invocation")
+
+    def test_skill_invoke_pass_changed_session_attributes_to_response_envelope(
+            self):
+        mock_request_envelope = RequestEnvelope(
+            context=Context(system=SystemState(
+                application=Application(application_id="test"))),
+            session=Session(attributes={"game": {"board": ["x", None]}}))
+
+        def change_session_attributes(handler_input, handler):
+            session_attributes = (
+                handler_input.attributes_manager.session_attributes)
+            session_attributes["game"]["board"][1] = "o"
+
+        self.mock_handler_adapter.supports.return_value = True
+        self.mock_handler_adapter.execute.side_effect = (
+            change_session_attributes)
+
+        skill_config = self.create_skill_config()
+        skill_config.skill_id = "test"
+        skill = CustomSkill(skill_configuration=skill_config)
+
+        response_envelope = skill.invoke(
+            request_envelope=mock_request_envelope, context=None)
+
+        assert skill.serializer.serialize(
+            response_envelope)["sessionAttributes"] == {
+            "game": {"board": ["x", "o"]}}, (
+            "Changed Session Attributes are not propagated to Response "
+            "Envelope, during skill invocation")
+        assert mock_request_envelope.session.attributes == {
+            "game": {"board": ["x", None]}}, (
+            "Request Envelope session attributes changed during skill "
+            "invocation")
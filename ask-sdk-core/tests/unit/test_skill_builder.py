@@ -18,11 +18,14 @@
 import unittest
 import inspect
 
-from ask_sdk_model import Response
+from ask_sdk_model import Response, RequestEnvelope, IntentRequest, Intent
 from ask_sdk_runtime.dispatch_components import (
-    GenericHandlerAdapter, GenericExceptionMapper)
+    GenericHandlerAdapter, GenericExceptionMapper, IndexedRequestMapper)
 from ask_sdk_runtime.utils import UserAgentManager
+from ask_sdk_runtime.dispatch import FrozenRequestDispatcher
+from ask_sdk_runtime.metrics import DispatchPhase, InMemoryMetricsSink
 
+from ask_sdk_core.json_codec import AbstractJsonCodec
 from ask_sdk_core.skill import CustomSkill
 from ask_sdk_core.skill_builder import SkillBuilder, CustomSkillBuilder
 from ask_sdk_core.dispatch_components import (
@@ -30,7 +33,10 @@ from ask_sdk_core.dispatch_components import (
     AbstractRequestInterceptor, AbstractResponseInterceptor)
 from ask_sdk_core.exceptions import SkillBuilderException
 from ask_sdk_core.__version__ import __version__
-from ask_sdk_core.utils import RESPONSE_FORMAT_VERSION, user_agent_info
+from ask_sdk_core.utils import (
+    RESPONSE_FORMAT_VERSION, user_agent_info, is_intent_name,
+    is_request_type)
+from ask_sdk_core.handler_input import HandlerInput
 
 try:
     import mock
@@ -233,6 +239,149 @@ class TestSkillBuilder(unittest.TestCase):
             "Response Envelope from lambda handler invocation has incorrect "
             "response than built by skill")
 
+    def test_lambda_handler_reuses_skill_across_invocations(self):
+        mock_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        mock_request_handler.can_handle.return_value = True
+        mock_request_handler.handle.return_value = Response()
+        self.sb.add_request_handler(request_handler=mock_request_handler)
+        mock_request_envelope_payload = {
+            "context": {
+                "System": {
+                    "application": {
+                        "applicationId": "test"
+                    }
+                }
+            }
+        }
+        self.sb.skill_id = "test"
+        lambda_handler = self.sb.lambda_handler()
+
+        with mock.patch.object(
+                self.sb, "create", wraps=self.sb.create) as mock_create:
+            lambda_handler(event=mock_request_envelope_payload, context=None)
+            skill = self.sb.skill
+            lambda_handler(event=mock_request_envelope_payload, context=None)
+
+        mock_create.assert_called_once_with()
+        assert self.sb.skill is skill, (
+            "Skill Builder Lambda Handler didn't reuse the skill across "
+            "invocations")
+        assert mock_request_handler.handle.call_count == 2, (
+            "Skill Builder Lambda Handler didn't invoke the reused skill")
+
+    def test_invalidate_skill_creates_new_skill_on_next_access(self):
+        skill = self.sb.skill
+        self.sb.skill_id = "test"
+
+        assert self.sb.skill is skill, (
+            "Skill Builder created a new skill without invalidation")
+
+        self.sb.invalidate_skill()
+
+        assert self.sb.skill is not skill, (
+            "Skill Builder didn't create a new skill after invalidation")
+        assert self.sb.skill.skill_id == "test", (
+            "Skill Builder didn't pick up the configuration changes after "
+            "invalidation")
+
+    def test_enable_request_indexing_routes_to_first_matching_handler(self):
+        @self.sb.request_handler(can_handle_func=is_intent_name("OtherIntent"))
+        def other_intent_handler(handler_input):
+            return "other intent"
+
+        @self.sb.request_handler(
+            can_handle_func=lambda handler_input: False)
+        def never_handler(handler_input):
+            return "never"
+
+        @self.sb.request_handler(can_handle_func=is_request_type("IntentRequest"))
+        def intent_request_handler(handler_input):
+            return "intent request"
+
+        @self.sb.request_handler(can_handle_func=is_intent_name("TestIntent"))
+        def test_intent_handler(handler_input):
+            return "test intent"
+
+        self.sb.enable_request_indexing()
+        actual_config = self.sb.skill_configuration
+        test_handler_input = HandlerInput(
+            request_envelope=RequestEnvelope(request=IntentRequest(
+                intent=Intent(name="TestIntent"))))
+
+        request_mapper = actual_config.request_mappers[0]
+        assert isinstance(request_mapper, IndexedRequestMapper), (
+            "Skill Builder didn't create an Indexed Request Mapper when "
+            "request indexing is enabled")
+        assert request_mapper.get_request_handler_chain(
+            test_handler_input).request_handler.handle(
+            test_handler_input) == "intent request", (
+            "Indexed Request Mapper didn't route to the first registered "
+            "matching handler")
+
+    def test_add_metrics_sink_attaches_timings_to_handler_input(self):
+        test_metrics_sink = InMemoryMetricsSink()
+        handler_inputs = []
+
+        @self.sb.request_handler(can_handle_func=lambda handler_input: True)
+        def test_intent_handler(handler_input):
+            handler_inputs.append(handler_input)
+            return Response()
+
+        self.sb.add_metrics_sink(test_metrics_sink)
+        self.sb.create().invoke(
+            request_envelope=RequestEnvelope(request=IntentRequest(
+                intent=Intent(name="TestIntent"))), context=None)
+
+        assert handler_inputs[0].dispatch_timings.request_handler == \
+            "RequestHandlerTestIntentHandler", (
+            "Dispatcher didn't attach labelled dispatch timings to handler "
+            "input when a metrics sink is registered")
+        assert len(test_metrics_sink.get_durations(
+            DispatchPhase.HANDLER_EXECUTION,
+            request_handler="RequestHandlerTestIntentHandler")) == 1, (
+            "Dispatcher didn't report handler execution timing to metrics "
+            "sink registered on skill builder")
+
+    def test_enable_frozen_dispatch_creates_frozen_dispatcher(self):
+        test_response = Response()
+
+        @self.sb.request_handler(can_handle_func=lambda handler_input: True)
+        def test_intent_handler(handler_input):
+            return test_response
+
+        self.sb.enable_frozen_dispatch()
+        skill = self.sb.create()
+
+        assert isinstance(
+            skill.request_dispatcher, FrozenRequestDispatcher), (
+            "Skill Builder didn't create a skill with frozen dispatcher, "
+            "when frozen dispatch is enabled")
+        assert skill.invoke(
+            request_envelope=RequestEnvelope(request=IntentRequest(
+                intent=Intent(name="TestIntent"))),
+            context=None).response == test_response, (
+            "Skill with frozen dispatcher returned incorrect response")
+
+    def test_json_codec_configures_skill_serializer(self):
+        test_json_codec = mock.MagicMock(spec=AbstractJsonCodec)
+        self.sb.json_codec = test_json_codec
+
+        skill = self.sb.create()
+
+        assert skill.serializer.json_codec is test_json_codec, (
+            "Skill Builder didn't configure the skill serializer with the "
+            "provided JSON codec")
+
+    def test_lazy_deserialization_configures_skill_serializer(self):
+        assert not self.sb.create().serializer.lazy_deserialization, (
+            "Skill Builder enabled lazy deserialization by default")
+
+        self.sb.lazy_deserialization = True
+
+        assert self.sb.create().serializer.lazy_deserialization, (
+            "Skill Builder didn't enable lazy deserialization on the skill "
+            "serializer")
+
     def test_should_append_additional_user_agent(self):
         additional_user_agent = "test_string"
         sdk_user_agent = user_agent_info(sdk_version=__version__)
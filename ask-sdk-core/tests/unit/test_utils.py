@@ -17,6 +17,7 @@
 #
 import unittest
 import random
+import threading
 
 from ask_sdk_model import (
     IntentRequest, RequestEnvelope, Intent, SessionEndedRequest, Context,
@@ -31,7 +32,11 @@ from ask_sdk_core.utils import (
     get_slot, get_slot_value, get_account_linking_access_token,
     get_api_access_token, get_device_id, get_dialog_state, get_intent_name,
     get_locale, get_request_type, is_new_session, get_supported_interfaces,
-    get_user_id, get_slot_value_v2, get_simple_slot_values)
+    get_user_id, get_slot_value_v2, get_simple_slot_values, get_routing_keys,
+    is_dialog_state, has_slot_value)
+from ask_sdk_core.utils.concurrency import map_concurrently
+from ask_sdk_core.utils.predicate import (
+    Predicate, AndPredicate, OrPredicate, NotPredicate, FunctionPredicate)
 from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_core.exceptions import AskSdkException
 
@@ -128,6 +133,167 @@ def test_is_request_type_not_match():
         "is_request_type matcher matched with the incorrect request type")
 
 
+def test_predicates_routing_key():
+    assert is_canfulfill_intent_name("TestIntent").routing_key == (
+        "CanFulfillIntentRequest", "TestIntent"), (
+        "is_canfulfill_intent_name matcher has incorrect routing key")
+    assert is_intent_name("TestIntent").routing_key == (
+        "IntentRequest", "TestIntent"), (
+        "is_intent_name matcher has incorrect routing key")
+    assert is_request_type("LaunchRequest").routing_key == (
+        "LaunchRequest", None), (
+        "is_request_type matcher has incorrect routing key")
+
+
+def test_is_dialog_state_match():
+    test_handler_input = HandlerInput(
+        request_envelope=RequestEnvelope(request=IntentRequest(
+            intent=Intent(name="TestIntent"),
+            dialog_state=DialogState.IN_PROGRESS)))
+
+    assert is_dialog_state(DialogState.IN_PROGRESS)(test_handler_input), (
+        "is_dialog_state matcher didn't match with the correct dialog state")
+    assert not is_dialog_state(DialogState.COMPLETED)(test_handler_input), (
+        "is_dialog_state matcher matched with the incorrect dialog state")
+
+
+def test_is_dialog_state_not_match_non_intent_request():
+    test_handler_input = HandlerInput(
+        request_envelope=RequestEnvelope(request=LaunchRequest()))
+
+    assert not is_dialog_state(DialogState.STARTED)(test_handler_input), (
+        "is_dialog_state matcher matched with the incorrect request type")
+
+
+def test_has_slot_value_match():
+    test_handler_input = HandlerInput(
+        request_envelope=RequestEnvelope(request=IntentRequest(
+            intent=Intent(name="TestIntent", slots={
+                "filled": Slot(name="filled", value="value"),
+                "empty": Slot(name="empty")}))))
+
+    assert has_slot_value("filled")(test_handler_input), (
+        "has_slot_value matcher didn't match slot with a value")
+    assert not has_slot_value("empty")(test_handler_input), (
+        "has_slot_value matcher matched slot without a value")
+    assert not has_slot_value("missing")(test_handler_input), (
+        "has_slot_value matcher matched a missing slot")
+
+
+def test_predicate_composition():
+    test_handler_input = HandlerInput(
+        request_envelope=RequestEnvelope(request=IntentRequest(
+            intent=Intent(name="TestIntent"),
+            dialog_state=DialogState.STARTED)))
+
+    assert (is_intent_name("TestIntent") &
+            is_dialog_state(DialogState.STARTED))(test_handler_input), (
+        "And predicate didn't match when all operands match")
+    assert not (is_intent_name("TestIntent") &
+                is_dialog_state(DialogState.COMPLETED))(test_handler_input), (
+        "And predicate matched when an operand doesn't match")
+    assert (is_intent_name("OtherIntent") |
+            is_intent_name("TestIntent"))(test_handler_input), (
+        "Or predicate didn't match when an operand matches")
+    assert (~is_request_type("LaunchRequest"))(test_handler_input), (
+        "Not predicate matched the negated operand")
+    assert (is_request_type("IntentRequest") &
+            (lambda handler_input: True))(test_handler_input), (
+        "And predicate didn't match with a plain callable operand")
+
+
+def test_predicate_composition_structure():
+    and_predicate = (
+        is_intent_name("TestIntent") & is_dialog_state(DialogState.STARTED) &
+        has_slot_value("slot"))
+    assert isinstance(and_predicate, AndPredicate)
+    assert len(and_predicate.predicates) == 3, (
+        "And predicate didn't flatten nested And predicates")
+    assert and_predicate.request_type == "IntentRequest"
+    assert and_predicate.intent_name == "TestIntent"
+    assert and_predicate.dialog_state == DialogState.STARTED
+    assert and_predicate.slot_name == "slot"
+    assert and_predicate.routing_key == ("IntentRequest", "TestIntent"), (
+        "And predicate has incorrect routing key")
+
+    or_predicate = is_intent_name("TestIntent") | is_intent_name("Other")
+    assert isinstance(or_predicate, OrPredicate)
+    assert or_predicate.routing_key == ("IntentRequest", None), (
+        "Or predicate has incorrect routing key")
+
+    mixed_predicate = is_intent_name("TestIntent") | (lambda x: True)
+    assert isinstance(mixed_predicate.predicates[1], FunctionPredicate)
+    assert mixed_predicate.routing_key is None, (
+        "Or predicate with an opaque operand has a routing key")
+
+    not_predicate = ~is_intent_name("TestIntent")
+    assert isinstance(not_predicate, NotPredicate)
+    assert not_predicate.routing_key is None, (
+        "Not predicate has a routing key")
+    assert isinstance(not_predicate, Predicate)
+
+
+def test_get_routing_keys_for_intent_request():
+    test_handler_input = HandlerInput(
+        request_envelope=RequestEnvelope(request=IntentRequest(
+            intent=Intent(name="TestIntent"))))
+
+    assert get_routing_keys(test_handler_input) == (
+        ("IntentRequest", "TestIntent"), ("IntentRequest", None)), (
+        "get_routing_keys returned incorrect keys for intent request")
+
+
+def test_get_routing_keys_for_non_intent_request():
+    test_handler_input = HandlerInput(
+        request_envelope=RequestEnvelope(request=LaunchRequest()))
+
+    assert get_routing_keys(test_handler_input) == (
+        ("LaunchRequest", None), ), (
+        "get_routing_keys returned incorrect keys for launch request")
+
+
+class TestMapConcurrently(unittest.TestCase):
+    def test_map_concurrently_keeps_order_of_items(self):
+        thread_names = set()
+
+        def square(item):
+            thread_names.add(threading.current_thread().name)
+            return item * item
+
+        assert map_concurrently(square, list(range(10)), 4) == [
+            item * item for item in range(10)], (
+            "map_concurrently didn't return results in order of items")
+        assert threading.current_thread().name not in thread_names, (
+            "map_concurrently didn't apply function on worker threads")
+
+    def test_map_concurrently_without_concurrency(self):
+        thread_names = set()
+
+        def square(item):
+            thread_names.add(threading.current_thread().name)
+            return item * item
+
+        assert map_concurrently(square, [1, 2, 3], 1) == [1, 4, 9], (
+            "map_concurrently returned incorrect results without "
+            "concurrency")
+        assert thread_names == {threading.current_thread().name}, (
+            "map_concurrently didn't apply function on calling thread "
+            "without concurrency")
+
+    def test_map_concurrently_raises_exception(self):
+        def fail_on_odd(item):
+            if item % 2:
+                raise ValueError("odd item {}".format(item))
+            return item
+
+        with self.assertRaises(ValueError) as exc:
+            map_concurrently(fail_on_odd, [0, 1, 2, 3], 2)
+
+        assert "odd item 1" in str(exc.exception), (
+            "map_concurrently didn't raise the first exception in order "
+            "of items")
+
+
 class TestViewportOrientation(unittest.TestCase):
     def test_portrait_orientation(self):
         width = 0
@@ -26,4 +26,4 @@ __author_email__ = 'ask-sdk-dynamic@amazon.com'
 __license__ = 'Apache 2.0'
 __keywords__ = ['ASK SDK', 'Alexa Skills Kit', 'Alexa', 'ASK SDK Core',
                 'Persistence', 'DynamoDB']
-__install_requires__ = ["boto3", "ask-sdk-core>=1.1.0"]
+__install_requires__ = ["boto3", "ask-sdk-core>=1.20.0"]
@@ -15,18 +15,29 @@
 # specific language governing permissions and limitations under the
 # License.
 #
-import boto3
+import random
+import time
 import typing
-from boto3.session import ResourceNotExistsError
+import weakref
+from collections import OrderedDict
+from decimal import Decimal
+from threading import Lock
+from six import PY2
 from ask_sdk_core.attributes_manager import AbstractPersistenceAdapter
-from ask_sdk_core.exceptions import PersistenceException
+from ask_sdk_core.exceptions import (
+    PersistenceException, PersistenceConflictException)
+from ask_sdk_core.utils.concurrency import map_concurrently
 
 from .partition_keygen import user_id_partition_keygen
 
 if typing.TYPE_CHECKING:
-    from typing import Callable, Dict
+    from typing import (
+        Callable, Dict, Set, Any, List, Optional, Tuple, Iterable, TypeVar)
+    from ask_sdk_core.attributes_codec import AbstractAttributesCodec
     from ask_sdk_model import RequestEnvelope
     from boto3.resources.base import ServiceResource
+    from botocore.client import BaseClient
+    T = TypeVar("T")
 
 
 class DynamoDbAdapter(AbstractPersistenceAdapter):
@@ -37,6 +48,46 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
     dynamodb operations. The adapter tries to create the table if
     ``create_table`` is set, during initialization.
 
+    If ``update_changed_attributes`` is set, the attributes that
+    changed since they were retrieved are saved with a single
+    ``update_item`` call, setting and removing only the changed
+    attributes in the item. This reduces the request size and the
+    write latency for large items. Note that the write capacity
+    consumed by ``update_item`` still depends on the full item size.
+
+    Attributes are retrieved with strongly consistent reads, unless
+    ``consistent_read`` is unset for the adapter or for a single
+    retrieval. Eventually consistent reads consume half the read
+    capacity, but can return attributes that are missing the latest
+    saves.
+
+    If ``version_attribute_name`` is set, the item stores a version
+    number under that name, incremented on every save. Saves are then
+    conditional on the item still having the version retrieved for
+    the same request envelope, and raise
+    :py:class:`ask_sdk_core.exceptions.PersistenceConflictException`
+    if the item changed in between, instead of overwriting the change.
+    Attributes saved without being retrieved first can only create
+    new items, or overwrite items without version.
+
+    The attributes of many partition keys can be retrieved, saved and
+    deleted at once, for offline jobs like migrations, through
+    :py:meth:`batch_get_attributes`, :py:meth:`batch_save_attributes`
+    and :py:meth:`batch_delete_attributes`. The keys are split into
+    ``batch_get_item`` and ``batch_write_item`` requests, sent with
+    bounded concurrency through the low-level client of the resource,
+    as the resource isn't thread safe. The keys left unprocessed by
+    DynamoDb are retried with exponential backoff.
+
+    If ``attributes_codec`` is set, the attributes are stored as a
+    single binary value encoded by the codec, instead of a map. Using
+    a compact format and compression reduces the item size, and so
+    the capacity units consumed by reads and writes. Items storing the
+    attributes as a map are still retrieved, and converted on their
+    next save. As the attributes can't be retrieved or updated
+    partially in a binary value, all the attributes are always
+    retrieved and saved.
+
     :param table_name: Name of the table to be created or used
     :type table_name: str
     :param partition_key_name: Partition key name to be used.
@@ -55,16 +106,43 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
     :type partition_keygen: Callable[[RequestEnvelope], str]
     :param dynamodb_resource: Resource to be used, to perform
         dynamo operations. Defaulted to resource generated from
-        boto3
+        boto3, on first use
     :type dynamodb_resource: boto3.resources.base.ServiceResource
+    :param update_changed_attributes: Should the adapter save only
+        the changed attributes with an ``update_item`` call, when they
+        are known. Defaulted to False
+    :type update_changed_attributes: bool
+    :param consistent_read: Should the attributes be retrieved with
+        strongly consistent reads. Defaulted to True
+    :type consistent_read: bool
+    :param version_attribute_name: Attribute name for storing the
+        version of the item, to save attributes only if the item
+        didn't change since they were retrieved. Defaulted to None,
+        saving attributes unconditionally
+    :type version_attribute_name: str
+    :param attributes_codec: Codec used to encode the attributes to
+        compact and compressed bytes, stored as a binary value, like
+        :py:class:`ask_sdk_core.attributes_codec.AttributesCodec`.
+        Attributes stored as a map before the codec was set are still
+        retrieved. Defaulted to None, storing the attributes as a map
+    :type attributes_codec: ask_sdk_core.attributes_codec.AbstractAttributesCodec
     """
 
+    BATCH_GET_MAX_KEYS = 100
+    BATCH_WRITE_MAX_ITEMS = 25
+    BATCH_MAX_RETRIES = 8
+    BATCH_RETRY_BASE_DELAY = 0.05
+    BATCH_RETRY_MAX_DELAY = 5.0
+    DEFAULT_MAX_CONCURRENCY = 4
+
     def __init__(
             self, table_name, partition_key_name="id",
             attribute_name="attributes", create_table=False,
             partition_keygen=user_id_partition_keygen,
-            dynamodb_resource=boto3.resource("dynamodb")):
-        # type: (str, str, str, bool, Callable[[RequestEnvelope], str], ServiceResource) -> None
+            dynamodb_resource=None,
+            update_changed_attributes=False, consistent_read=True,
+            version_attribute_name=None, attributes_codec=None):
+        # type: (str, str, str, bool, Callable[[RequestEnvelope], str], ServiceResource, bool, bool, str, Optional[AbstractAttributesCodec]) -> None
         """Persistence Adapter implementation using Amazon DynamoDb.
 
         Amazon DynamoDb based persistence adapter implementation. This
@@ -90,19 +168,77 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
         :type partition_keygen: Callable[[RequestEnvelope], str]
         :param dynamodb_resource: Resource to be used, to perform
             dynamo operations. Defaulted to resource generated from
-            boto3
+            boto3, on first use
         :type dynamodb_resource: boto3.resources.base.ServiceResource
+        :param update_changed_attributes: Should the adapter save only
+            the changed attributes with an ``update_item`` call, when they
+            are known. Defaulted to False
+        :type update_changed_attributes: bool
+        :param consistent_read: Should the attributes be retrieved with
+            strongly consistent reads. Defaulted to True
+        :type consistent_read: bool
+        :param version_attribute_name: Attribute name for storing the
+            version of the item, to save attributes only if the item
+            didn't change since they were retrieved. Defaulted to None,
+            saving attributes unconditionally
+        :type version_attribute_name: str
+        :param attributes_codec: Codec used to encode the attributes to
+            compact and compressed bytes, stored as a binary value, like
+            :py:class:`ask_sdk_core.attributes_codec.AttributesCodec`.
+            Attributes stored as a map before the codec was set are still
+            retrieved. Defaulted to None, storing the attributes as a map
+        :type attributes_codec: ask_sdk_core.attributes_codec.AbstractAttributesCodec
         """
         self.table_name = table_name
         self.partition_key_name = partition_key_name
         self.attribute_name = attribute_name
         self.create_table = create_table
         self.partition_keygen = partition_keygen
+        self._lock = Lock()
+        self._dynamodb = None  # type: Optional[ServiceResource]
+        self._table = None  # type: Any
         self.dynamodb = dynamodb_resource
+        self.update_changed_attributes = update_changed_attributes
+        self.consistent_read = consistent_read
+        self.version_attribute_name = version_attribute_name
+        self.attributes_codec = attributes_codec
+        self._versions = {}  # type: Dict[int, Tuple[Any, str, Any]]
         self.__create_table_if_not_exists()
 
-    def get_attributes(self, request_envelope):
-        # type: (RequestEnvelope) -> Dict[str, object]
+    @property
+    def dynamodb(self):
+        # type: () -> ServiceResource
+        """Resource used to perform dynamo operations.
+
+        The resource is generated from boto3 on first access, if no
+        resource is provided.
+
+        :return: DynamoDb resource
+        :rtype: boto3.resources.base.ServiceResource
+        """
+        if self._dynamodb is None:
+            with self._lock:
+                if self._dynamodb is None:
+                    self._dynamodb = self._build_dynamodb()
+        return self._dynamodb
+
+    @dynamodb.setter
+    def dynamodb(self, dynamodb_resource):
+        # type: (ServiceResource) -> None
+        """Set the resource used to perform dynamo operations.
+
+        :param dynamodb_resource: Resource to be used, to perform
+            dynamo operations. The resource is generated from boto3 on
+            first access if set to None
+        :type dynamodb_resource: boto3.resources.base.ServiceResource
+        :rtype: None
+        """
+        with self._lock:
+            self._dynamodb = dynamodb_resource
+            self._table = None
+
+    def get_attributes(self, request_envelope, consistent_read=None):
+        # type: (RequestEnvelope, Optional[bool]) -> Dict[str, object]
         """Get attributes from table in Dynamodb resource.
 
         Retrieves the attributes from Dynamodb table. If the table
@@ -114,27 +250,36 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
         :param request_envelope: Request Envelope passed during skill
             invocation
         :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param consistent_read: Should the attributes be retrieved
+            with a strongly consistent read. Defaulted to None, using
+            the ``consistent_read`` setting of the adapter
+        :type consistent_read: bool
         :return: Attributes stored under the partition keygen mapping
             in the table
         :rtype: Dict[str, object]
         :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
         """
         try:
-            table = self.dynamodb.Table(self.table_name)
+            table = self._get_table()
             partition_key_val = self.partition_keygen(request_envelope)
             response = table.get_item(
                 Key={self.partition_key_name: partition_key_val},
-                ConsistentRead=True)
+                ConsistentRead=self.__is_consistent_read(consistent_read))
+            if self.version_attribute_name is not None:
+                self.__store_version(
+                    request_envelope, partition_key_val,
+                    response.get("Item", {}).get(self.version_attribute_name))
             if "Item" in response:
-                return response["Item"][self.attribute_name]
+                return self.__decode_attributes(
+                    response["Item"][self.attribute_name])
             else:
                 return {}
-        except ResourceNotExistsError:
-            raise PersistenceException(
-                "DynamoDb table {} doesn't exist or in the process of "
-                "being created. Failed to get attributes from "
-                "DynamoDb table.".format(self.table_name))
         except Exception as e:
+            if _is_resource_not_exists_error(e):
+                raise PersistenceException(
+                    "DynamoDb table {} doesn't exist or in the process of "
+                    "being created. Failed to get attributes from "
+                    "DynamoDb table.".format(self.table_name))
             raise PersistenceException(
                 "Failed to retrieve attributes from DynamoDb table. "
                 "Exception of type {} occurred: {}".format(
@@ -146,7 +291,9 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
 
         Saves the attributes into Dynamodb table. Raises
         PersistenceException if table doesn't exist or ``put_item`` fails
-        on the table.
+        on the table. If ``version_attribute_name`` is set, raises
+        PersistenceConflictException if the item changed since the
+        attributes were retrieved.
 
         :param request_envelope: Request Envelope passed during skill
             invocation
@@ -158,17 +305,272 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
         :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
         """
         try:
-            table = self.dynamodb.Table(self.table_name)
+            table = self._get_table()
             partition_key_val = self.partition_keygen(request_envelope)
-            table.put_item(
-                Item={self.partition_key_name: partition_key_val,
-                      self.attribute_name: attributes})
-        except ResourceNotExistsError:
+            item = {
+                self.partition_key_name: partition_key_val,
+                self.attribute_name: self.__encode_attributes(attributes)
+            }  # type: Dict[str, Any]
+            if self.version_attribute_name is None:
+                table.put_item(Item=item)
+                return
+
+            version = self.__get_version(request_envelope, partition_key_val)
+            condition, names, values = self.__version_condition(version)
+            next_version = 1 if version is None else version + 1
+            item[self.version_attribute_name] = next_version
+            put_kwargs = {
+                "ConditionExpression": condition,
+                "ExpressionAttributeNames": names
+            }  # type: Dict[str, Any]
+            if values:
+                put_kwargs["ExpressionAttributeValues"] = values
+            table.put_item(Item=item, **put_kwargs)
+            self.__store_version(
+                request_envelope, partition_key_val, next_version)
+        except Exception as e:
+            if _is_resource_not_exists_error(e):
+                raise PersistenceException(
+                    "DynamoDb table {} doesn't exist. Failed to save "
+                    "attributes to DynamoDb table.".format(self.table_name))
+            if e.__class__.__name__ == "ConditionalCheckFailedException":
+                raise PersistenceConflictException(
+                    "Failed to save attributes to DynamoDb table, as the "
+                    "item changed since the attributes were retrieved.")
             raise PersistenceException(
-                "DynamoDb table {} doesn't exist. Failed to save attributes "
-                "to DynamoDb table.".format(
-                    self.table_name))
+                "Failed to save attributes to DynamoDb table. Exception of "
+                "type {} occurred: {}".format(
+                    type(e).__name__, str(e)))
+
+    def save_changed_attributes(
+            self, request_envelope, attributes, changed_keys, removed_keys):
+        # type: (RequestEnvelope, Dict[str, object], Set[str], Set[str]) -> None
+        """Saves changed attributes to table in Dynamodb resource.
+
+        If ``update_changed_attributes`` is set, sets the changed
+        attributes and removes the removed attributes in the item,
+        through ``update_item``. If the item or its attributes don't
+        exist in the table, saves all the attributes through
+        ``put_item`` instead. Else, or if ``attributes_codec`` is set,
+        saves all the attributes through :py:meth:`save_attributes`.
+        Raises PersistenceException if
+        table doesn't exist or ``update_item`` fails on the table.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param attributes: Attributes stored under the partition keygen
+            mapping in the table
+        :type attributes: Dict[str, object]
+        :param changed_keys: Keys of the attributes added or changed
+            since they were retrieved
+        :type changed_keys: Set[str]
+        :param removed_keys: Keys of the attributes removed since they
+            were retrieved
+        :type removed_keys: Set[str]
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        if (not self.update_changed_attributes or
+                self.attributes_codec is not None):
+            self.save_attributes(
+                request_envelope=request_envelope, attributes=attributes)
+            return
+
+        self.__update_attributes(
+            request_envelope=request_envelope, attributes=attributes,
+            changed_keys=changed_keys, removed_keys=removed_keys)
+
+    def get_partial_attributes(
+            self, request_envelope, keys, consistent_read=None):
+        # type: (RequestEnvelope, List[str], Optional[bool]) -> Optional[Dict[str, object]]
+        """Get the attributes with the provided keys from table in
+        Dynamodb resource.
+
+        Retrieves only the attributes with the provided top level keys
+        from Dynamodb table, through a ``ProjectionExpression`` on the
+        attribute paths. Returns None if ``attributes_codec`` is set,
+        so that all the attributes are retrieved through
+        :py:meth:`get_attributes` instead. Raises PersistenceException
+        if table doesn't exist or ``get_item`` fails on the table.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param keys: Top level keys of the attributes to be retrieved
+        :type keys: List[str]
+        :param consistent_read: Should the attributes be retrieved
+            with a strongly consistent read. Defaulted to None, using
+            the ``consistent_read`` setting of the adapter
+        :type consistent_read: bool
+        :return: Attributes with the provided keys stored under the
+            partition keygen mapping in the table, or None if
+            ``attributes_codec`` is set
+        :rtype: Dict[str, object]
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        if self.attributes_codec is not None:
+            return None
+        if not keys:
+            return {}
+
+        expression_names = {"#attributes": self.attribute_name}
+        projections = []
+        # Overlapping projection paths are rejected by DynamoDb
+        for index, key in enumerate(OrderedDict.fromkeys(keys)):
+            expression_names["#key{}".format(index)] = key
+            projections.append("#attributes.#key{}".format(index))
+        if self.version_attribute_name is not None:
+            expression_names["#version"] = self.version_attribute_name
+            projections.append("#version")
+
+        try:
+            table = self._get_table()
+            partition_key_val = self.partition_keygen(request_envelope)
+            response = table.get_item(
+                Key={self.partition_key_name: partition_key_val},
+                ConsistentRead=self.__is_consistent_read(consistent_read),
+                ProjectionExpression=", ".join(projections),
+                ExpressionAttributeNames=expression_names)
+            item = response.get("Item", {})
+            if self.version_attribute_name is not None:
+                self.__store_version(
+                    request_envelope, partition_key_val,
+                    item.get(self.version_attribute_name))
+            return item.get(self.attribute_name, {})
         except Exception as e:
+            if _is_resource_not_exists_error(e):
+                raise PersistenceException(
+                    "DynamoDb table {} doesn't exist or in the process of "
+                    "being created. Failed to get attributes from "
+                    "DynamoDb table.".format(self.table_name))
+            raise PersistenceException(
+                "Failed to retrieve attributes from DynamoDb table. "
+                "Exception of type {} occurred: {}".format(
+                    type(e).__name__, str(e)))
+
+    def save_partial_attributes(
+            self, request_envelope, attributes, changed_keys, removed_keys):
+        # type: (RequestEnvelope, Dict[str, object], Set[str], Set[str]) -> None
+        """Saves changes to partially retrieved attributes to table in
+        Dynamodb resource.
+
+        Sets the changed attributes and removes the removed attributes
+        in the item, through ``update_item``, keeping the other
+        attributes in the item. If the item or its attributes don't
+        exist in the table, saves the attributes through ``put_item``
+        instead. If ``attributes_codec`` is set, retrieves all the
+        attributes, applies the changes and saves them through
+        :py:meth:`save_attributes`. Raises PersistenceException if
+        table doesn't exist or ``update_item`` fails on the table.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param attributes: Retrieved attributes, with the changes to be
+            stored under the partition keygen mapping in the table
+        :type attributes: Dict[str, object]
+        :param changed_keys: Keys of the attributes added or changed
+        :type changed_keys: Set[str]
+        :param removed_keys: Keys of the attributes removed
+        :type removed_keys: Set[str]
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        if self.attributes_codec is not None:
+            super(DynamoDbAdapter, self).save_partial_attributes(
+                request_envelope=request_envelope, attributes=attributes,
+                changed_keys=changed_keys, removed_keys=removed_keys)
+            return
+
+        self.__update_attributes(
+            request_envelope=request_envelope, attributes=attributes,
+            changed_keys=changed_keys, removed_keys=removed_keys)
+
+    def __update_attributes(
+            self, request_envelope, attributes, changed_keys, removed_keys):
+        # type: (RequestEnvelope, Dict[str, object], Set[str], Set[str]) -> None
+        """Sets the changed attributes and removes the removed
+        attributes in the item, falling back to ``put_item`` if the
+        item or its attributes don't exist.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param attributes: Attributes containing the changed attributes
+        :type attributes: Dict[str, object]
+        :param changed_keys: Keys of the attributes added or changed
+        :type changed_keys: Set[str]
+        :param removed_keys: Keys of the attributes removed
+        :type removed_keys: Set[str]
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        expression_names = {"#attributes": self.attribute_name}
+        expression_values = {}  # type: Dict[str, Any]
+        set_actions = []
+        remove_actions = []
+        for index, key in enumerate(sorted(changed_keys)):
+            expression_names["#set{}".format(index)] = key
+            expression_values[":set{}".format(index)] = attributes[key]
+            set_actions.append(
+                "#attributes.#set{0} = :set{0}".format(index))
+        for index, key in enumerate(sorted(removed_keys)):
+            expression_names["#remove{}".format(index)] = key
+            remove_actions.append("#attributes.#remove{}".format(index))
+
+        update_expression = []
+        if set_actions:
+            update_expression.append("SET " + ", ".join(set_actions))
+        if remove_actions:
+            update_expression.append("REMOVE " + ", ".join(remove_actions))
+        if not update_expression:
+            return
+
+        try:
+            table = self._get_table()
+            partition_key_val = self.partition_keygen(request_envelope)
+            condition = "attribute_exists(#attributes)"
+            version = next_version = None
+            if self.version_attribute_name is not None:
+                version = self.__get_version(
+                    request_envelope, partition_key_val)
+                version_condition, names, values = self.__version_condition(
+                    version)
+                next_version = 1 if version is None else version + 1
+                condition += " AND " + version_condition
+                expression_names.update(names)
+                expression_values.update(values)
+                expression_values[":next_version"] = next_version
+                if set_actions:
+                    update_expression[0] += ", #version = :next_version"
+                else:
+                    update_expression.insert(0, "SET #version = :next_version")
+
+            update_kwargs = {
+                "UpdateExpression": " ".join(update_expression),
+                "ConditionExpression": condition,
+                "ExpressionAttributeNames": expression_names
+            }  # type: Dict[str, Any]
+            if expression_values:
+                update_kwargs["ExpressionAttributeValues"] = expression_values
+
+            table.update_item(
+                Key={self.partition_key_name: partition_key_val},
+                **update_kwargs)
+            if next_version is not None:
+                self.__store_version(
+                    request_envelope, partition_key_val, next_version)
+        except Exception as e:
+            if _is_resource_not_exists_error(e):
+                raise PersistenceException(
+                    "DynamoDb table {} doesn't exist. Failed to save "
+                    "attributes to DynamoDb table.".format(self.table_name))
+            if e.__class__.__name__ == "ConditionalCheckFailedException":
+                # Item or its attributes don't exist yet
+                self.save_attributes(
+                    request_envelope=request_envelope, attributes=attributes)
+                return
             raise PersistenceException(
                 "Failed to save attributes to DynamoDb table. Exception of "
                 "type {} occurred: {}".format(
@@ -189,21 +591,489 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
         :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
         """
         try:
-            table = self.dynamodb.Table(self.table_name)
+            table = self._get_table()
             partition_key_val = self.partition_keygen(request_envelope)
             table.delete_item(
                 Key={self.partition_key_name: partition_key_val})
-        except ResourceNotExistsError:
-            raise PersistenceException(
-                "DynamoDb table {} doesn't exist. Failed to delete attributes "
-                "from DynamoDb table.".format(
-                    self.table_name))
+            if self.version_attribute_name is not None:
+                self.__store_version(
+                    request_envelope, partition_key_val, None)
         except Exception as e:
+            if _is_resource_not_exists_error(e):
+                raise PersistenceException(
+                    "DynamoDb table {} doesn't exist. Failed to delete "
+                    "attributes from DynamoDb table.".format(self.table_name))
             raise PersistenceException(
                 "Failed to delete attributes in DynamoDb table. Exception of "
                 "type {} occurred: {}".format(
                     type(e).__name__, str(e)))
 
+    def batch_get_attributes(
+            self, partition_keys, consistent_read=None,
+            max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        # type: (Iterable[str], Optional[bool], int) -> Dict[str, Dict[str, object]]
+        """Get the attributes of many partition keys from table in
+        Dynamodb resource.
+
+        The keys are retrieved through ``batch_get_item`` requests of
+        up to 100 keys, sent with at most ``max_concurrency`` requests
+        in flight. Keys left unprocessed by DynamoDb are retried with
+        exponential backoff. Raises PersistenceException if a request
+        fails, or keys are still unprocessed after the retries.
+
+        :param partition_keys: Partition key values, as provided by
+            the partition keygen function
+        :type partition_keys: Iterable[str]
+        :param consistent_read: Should the attributes be retrieved
+            with strongly consistent reads. Defaulted to None, using
+            the ``consistent_read`` setting of the adapter
+        :type consistent_read: bool
+        :param max_concurrency: Maximum number of requests sent at
+            the same time. Defaulted to 4
+        :type max_concurrency: int
+        :return: Attributes by partition key value, for the keys
+            having an item in the table
+        :rtype: Dict[str, Dict[str, object]]
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        keys = list(OrderedDict.fromkeys(partition_keys))
+        consistent_read = self.__is_consistent_read(consistent_read)
+
+        def get_chunk(chunk):
+            # type: (List[str]) -> List[Tuple[str, Dict[str, object]]]
+            request_items = {self.table_name: {
+                "Keys": [{self.partition_key_name: key} for key in chunk],
+                "ConsistentRead": consistent_read,
+                "ProjectionExpression": "#key, #attributes",
+                "ExpressionAttributeNames": {
+                    "#key": self.partition_key_name,
+                    "#attributes": self.attribute_name}
+            }}
+            items = []
+            for response in self.__send_batch(
+                    self._batch_get_item, request_items, "UnprocessedKeys"):
+                items.extend(
+                    response.get("Responses", {}).get(self.table_name, []))
+            return [
+                (item[self.partition_key_name], self.__decode_attributes(
+                    item.get(self.attribute_name, {})))
+                for item in items]
+
+        try:
+            chunks = map_concurrently(
+                get_chunk, _chunk(keys, self.BATCH_GET_MAX_KEYS),
+                max_concurrency)
+        except PersistenceException:
+            raise
+        except Exception as e:
+            raise PersistenceException(
+                "Failed to retrieve attributes from DynamoDb table. "
+                "Exception of type {} occurred: {}".format(
+                    type(e).__name__, str(e)))
+
+        attributes = {}  # type: Dict[str, Dict[str, object]]
+        for chunk_attributes in chunks:
+            attributes.update(chunk_attributes)
+        return attributes
+
+    def batch_save_attributes(
+            self, attributes_by_key,
+            max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        # type: (Dict[str, Dict[str, object]], int) -> None
+        """Save the attributes of many partition keys to table in
+        Dynamodb resource.
+
+        The attributes are saved through ``batch_write_item``
+        requests of up to 25 items, sent with at most
+        ``max_concurrency`` requests in flight. Items left unprocessed
+        by DynamoDb are retried with exponential backoff. Note that
+        batch writes can't be conditional, so the items are saved
+        without version, even if ``version_attribute_name`` is set.
+        Raises PersistenceException if a request fails, or items are
+        still unprocessed after the retries.
+
+        :param attributes_by_key: Attributes to be saved, by partition
+            key value
+        :type attributes_by_key: Dict[str, Dict[str, object]]
+        :param max_concurrency: Maximum number of requests sent at
+            the same time. Defaulted to 4
+        :type max_concurrency: int
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        write_requests = [
+            {"PutRequest": {"Item": {
+                self.partition_key_name: key,
+                self.attribute_name: self.__encode_attributes(attributes)}}}
+            for key, attributes in attributes_by_key.items()]
+        self.__batch_write(
+            write_requests, max_concurrency,
+            "Failed to save attributes to DynamoDb table.")
+
+    def batch_delete_attributes(
+            self, partition_keys, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        # type: (Iterable[str], int) -> None
+        """Delete the attributes of many partition keys from table in
+        Dynamodb resource.
+
+        The items are deleted through ``batch_write_item`` requests of
+        up to 25 keys, sent with at most ``max_concurrency`` requests
+        in flight. Keys left unprocessed by DynamoDb are retried with
+        exponential backoff. Raises PersistenceException if a request
+        fails, or keys are still unprocessed after the retries.
+
+        :param partition_keys: Partition key values, as provided by
+            the partition keygen function
+        :type partition_keys: Iterable[str]
+        :param max_concurrency: Maximum number of requests sent at
+            the same time. Defaulted to 4
+        :type max_concurrency: int
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        write_requests = [
+            {"DeleteRequest": {"Key": {self.partition_key_name: key}}}
+            for key in OrderedDict.fromkeys(partition_keys)]
+        self.__batch_write(
+            write_requests, max_concurrency,
+            "Failed to delete attributes in DynamoDb table.")
+
+    def _get_batch_client(self):
+        # type: () -> BaseClient
+        """Get the client used to send the batch requests.
+
+        The batch requests are sent from many threads, so they are
+        sent through the low-level client of the resource, which is
+        thread safe, unlike the resource itself.
+
+        :return: DynamoDb client
+        :rtype: botocore.client.BaseClient
+        """
+        return self.dynamodb.meta.client
+
+    def _serialize_item(self, item):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        """Convert the item or key of a batch request to the DynamoDb
+        attribute value format, using the ``boto3`` ``TypeSerializer``,
+        same as the resource.
+
+        :param item: Item with python values
+        :type item: Dict[str, Any]
+        :return: Item with DynamoDb attribute values
+        :rtype: Dict[str, Any]
+        """
+        from boto3.dynamodb.types import TypeSerializer
+        serializer = TypeSerializer()
+        return {key: serializer.serialize(value) for key, value in item.items()}
+
+    def _deserialize_item(self, item):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        """Convert the item or key of a batch response from the
+        DynamoDb attribute value format, using the ``boto3``
+        ``TypeDeserializer``, same as the resource.
+
+        :param item: Item with DynamoDb attribute values
+        :type item: Dict[str, Any]
+        :return: Item with python values
+        :rtype: Dict[str, Any]
+        """
+        from boto3.dynamodb.types import TypeDeserializer
+        deserializer = TypeDeserializer()
+        return {
+            key: deserializer.deserialize(value)
+            for key, value in item.items()}
+
+    def _batch_get_item(self, request_items):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        """Send a ``batch_get_item`` request through the batch client.
+
+        The keys and items are converted from and to the DynamoDb
+        attribute value format.
+
+        :param request_items: Keys to be retrieved, by table name
+        :type request_items: Dict[str, Any]
+        :return: Response with the retrieved items and the
+            unprocessed keys, by table name
+        :rtype: Dict[str, Any]
+        """
+        response = self._get_batch_client().batch_get_item(RequestItems={
+            table_name: dict(
+                keys_and_attributes, Keys=[
+                    self._serialize_item(key)
+                    for key in keys_and_attributes["Keys"]])
+            for table_name, keys_and_attributes in request_items.items()})
+        return {
+            "Responses": {
+                table_name: [self._deserialize_item(item) for item in items]
+                for table_name, items in response.get(
+                    "Responses", {}).items()},
+            "UnprocessedKeys": {
+                table_name: dict(
+                    keys_and_attributes, Keys=[
+                        self._deserialize_item(key)
+                        for key in keys_and_attributes["Keys"]])
+                for table_name, keys_and_attributes in response.get(
+                    "UnprocessedKeys", {}).items()}
+        }
+
+    def _batch_write_item(self, request_items):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        """Send a ``batch_write_item`` request through the batch
+        client.
+
+        The items and keys are converted from and to the DynamoDb
+        attribute value format.
+
+        :param request_items: Put and delete requests, by table name
+        :type request_items: Dict[str, Any]
+        :return: Response with the unprocessed requests, by table name
+        :rtype: Dict[str, Any]
+        """
+        response = self._get_batch_client().batch_write_item(RequestItems={
+            table_name: [
+                _convert_write_request(write_request, self._serialize_item)
+                for write_request in write_requests]
+            for table_name, write_requests in request_items.items()})
+        return {
+            "UnprocessedItems": {
+                table_name: [
+                    _convert_write_request(
+                        write_request, self._deserialize_item)
+                    for write_request in write_requests]
+                for table_name, write_requests in response.get(
+                    "UnprocessedItems", {}).items()}
+        }
+
+    def __batch_write(self, write_requests, max_concurrency, error_message):
+        # type: (List[Dict[str, Any]], int, str) -> None
+        """Send the write requests in chunks through
+        ``batch_write_item``.
+
+        :param write_requests: Put and delete requests
+        :type write_requests: List[Dict[str, Any]]
+        :param max_concurrency: Maximum number of requests sent at
+            the same time
+        :type max_concurrency: int
+        :param error_message: Message of the exception raised if a
+            request fails
+        :type error_message: str
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        def write_chunk(chunk):
+            # type: (List[Dict[str, Any]]) -> None
+            self.__send_batch(
+                self._batch_write_item, {self.table_name: chunk},
+                "UnprocessedItems")
+
+        try:
+            map_concurrently(
+                write_chunk,
+                _chunk(write_requests, self.BATCH_WRITE_MAX_ITEMS),
+                max_concurrency)
+        except PersistenceException:
+            raise
+        except Exception as e:
+            raise PersistenceException(
+                "{} Exception of type {} occurred: {}".format(
+                    error_message, type(e).__name__, str(e)))
+
+    def __send_batch(self, operation, request_items, unprocessed_name):
+        # type: (Callable[[Dict[str, Any]], Dict[str, Any]], Dict[str, Any], str) -> List[Dict[str, Any]]
+        """Send the batch request, retrying the unprocessed keys or
+        items with exponential backoff.
+
+        :param operation: Batch operation sending the request
+        :type operation: Callable[[Dict[str, Any]], Dict[str, Any]]
+        :param request_items: Request items of the batch request
+        :type request_items: Dict[str, Any]
+        :param unprocessed_name: Name of the unprocessed keys or items
+            in the response
+        :type unprocessed_name: str
+        :return: Responses of the request and its retries
+        :rtype: List[Dict[str, Any]]
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+            if keys or items are unprocessed after the retries
+        """
+        responses = []
+        attempt = 0
+        while True:
+            response = operation(request_items)
+            responses.append(response)
+            unprocessed = response.get(unprocessed_name, {}).get(
+                self.table_name)
+            if not unprocessed:
+                return responses
+            if attempt >= self.BATCH_MAX_RETRIES:
+                raise PersistenceException(
+                    "Failed to process batch request on DynamoDb table {}, "
+                    "requests still unprocessed after {} retries.".format(
+                        self.table_name, attempt))
+            time.sleep(random.uniform(0, min(
+                self.BATCH_RETRY_MAX_DELAY,
+                self.BATCH_RETRY_BASE_DELAY * (2 ** attempt))))
+            attempt += 1
+            request_items = {self.table_name: unprocessed}
+
+    def __encode_attributes(self, attributes):
+        # type: (Dict[str, object]) -> Any
+        """Encode the attributes to be stored in the item.
+
+        :param attributes: Attributes to be stored
+        :type attributes: Dict[str, object]
+        :return: Attributes encoded by ``attributes_codec``, or the
+            attributes themselves if no codec is set
+        :rtype: object
+        """
+        if self.attributes_codec is None:
+            return attributes
+        data = self.attributes_codec.encode(attributes)
+        if PY2:
+            # boto3 stores str values as strings on Python 2
+            return bytearray(data)
+        return data
+
+    def __decode_attributes(self, value):
+        # type: (Any) -> Dict[str, object]
+        """Decode the attributes stored in the item.
+
+        :param value: Attributes value stored in the item
+        :type value: object
+        :return: Attributes decoded by ``attributes_codec``, or the
+            value itself if no codec is set or it is a map
+        :rtype: Dict[str, object]
+        """
+        if self.attributes_codec is None:
+            return value
+        if isinstance(value, dict):
+            # Attributes stored as a map before the codec was set
+            return _replace_decimals(value)
+        # The resource retrieves binary values as boto3 Binary objects
+        return self.attributes_codec.decode(getattr(value, "value", value))
+
+    def __is_consistent_read(self, consistent_read):
+        # type: (Optional[bool]) -> bool
+        """Resolve the read consistency of a retrieval.
+
+        :param consistent_read: Read consistency provided for the
+            retrieval, or None to use the adapter setting
+        :type consistent_read: bool
+        :return: True if the retrieval is strongly consistent
+        :rtype: bool
+        """
+        if consistent_read is None:
+            return self.consistent_read
+        return consistent_read
+
+    def __version_condition(self, version):
+        # type: (Any) -> Tuple[str, Dict[str, str], Dict[str, Any]]
+        """Build the condition for the item to have the version.
+
+        :param version: Version retrieved for the item, or None if
+            the item or its version didn't exist
+        :type version: int
+        :return: Condition expression, with its attribute names and
+            values
+        :rtype: Tuple[str, Dict[str, str], Dict[str, Any]]
+        """
+        names = {
+            "#version": self.version_attribute_name}  # type: Dict[str, str]
+        if version is None:
+            return "attribute_not_exists(#version)", names, {}
+        return "#version = :version", names, {":version": version}
+
+    def __store_version(self, request_envelope, partition_key_val, version):
+        # type: (RequestEnvelope, str, Any) -> None
+        """Store the version of the item for the request envelope.
+
+        The version is kept as long as the request envelope is
+        referenced, so that saves for the same request envelope are
+        conditional on it.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param partition_key_val: Partition key of the item
+        :type partition_key_val: str
+        :param version: Version of the item, or None if the item or
+            its version doesn't exist
+        :type version: int
+        :rtype: None
+        """
+        envelope_id = id(request_envelope)
+        versions = self._versions
+
+        def discard(reference):
+            # type: (Any) -> None
+            entry = versions.get(envelope_id)
+            if entry is not None and entry[0] is reference:
+                versions.pop(envelope_id, None)
+
+        versions[envelope_id] = (
+            weakref.ref(request_envelope, discard), partition_key_val,
+            version)
+
+    def __get_version(self, request_envelope, partition_key_val):
+        # type: (RequestEnvelope, str) -> Any
+        """Get the version of the item stored for the request envelope.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.RequestEnvelope
+        :param partition_key_val: Partition key of the item
+        :type partition_key_val: str
+        :return: Version of the item, or None if the item or its
+            version didn't exist, or it wasn't retrieved for the
+            request envelope
+        :rtype: int
+        """
+        entry = self._versions.get(id(request_envelope))
+        if (entry is None or entry[0]() is not request_envelope or
+                entry[1] != partition_key_val):
+            return None
+        return entry[2]
+
+    def _build_dynamodb(self):
+        # type: () -> ServiceResource
+        """Generate the resource used to perform dynamo operations,
+        when no resource is provided.
+
+        :return: DynamoDb resource generated from boto3
+        :rtype: boto3.resources.base.ServiceResource
+        """
+        import boto3
+        return boto3.resource("dynamodb")
+
+    def _build_table(self, dynamodb):
+        # type: (ServiceResource) -> Any
+        """Build the table used to perform item operations.
+
+        :param dynamodb: Resource to be used, to perform dynamo
+            operations
+        :type dynamodb: boto3.resources.base.ServiceResource
+        :return: DynamoDb table
+        :rtype: boto3.resources.base.ServiceResource
+        """
+        return dynamodb.Table(self.table_name)
+
+    def _get_table(self):
+        # type: () -> Any
+        """Get the table used to perform item operations.
+
+        The table is built on first call and reused afterwards.
+
+        :return: DynamoDb table
+        :rtype: boto3.resources.base.ServiceResource
+        """
+        table = self._table
+        if table is None:
+            dynamodb = self.dynamodb
+            with self._lock:
+                if self._table is None:
+                    self._table = self._build_table(dynamodb)
+                table = self._table
+        return table
+
     def __create_table_if_not_exists(self):
         # type: () -> None
         """Creates table in Dynamodb resource if it doesn't exist and
@@ -242,3 +1112,73 @@ class DynamoDbAdapter(AbstractPersistenceAdapter):
                         "failed: Exception of type {} "
                         "occurred: {}".format(
                             type(e).__name__, str(e)))
+
+
+def _is_resource_not_exists_error(exception):
+    # type: (Exception) -> bool
+    """Check if the exception is raised by boto3 for a resource that
+    doesn't exist.
+
+    The exception is checked by name, so that ``boto3`` isn't
+    imported until the resource is used.
+
+    :param exception: Exception raised by boto3
+    :type exception: Exception
+    :return: True if the exception is a ``ResourceNotExistsError``
+    :rtype: bool
+    """
+    return type(exception).__name__ == "ResourceNotExistsError"
+
+
+def _replace_decimals(value):
+    # type: (Any) -> Any
+    """Replace the ``Decimal`` values retrieved by the resource with
+    ``int`` or ``float`` values, in nested dicts and lists.
+
+    :param value: Value retrieved from the table
+    :type value: object
+    :return: Value without ``Decimal`` values, so that it can be
+        encoded by an attributes codec
+    :rtype: object
+    """
+    if isinstance(value, dict):
+        return {key: _replace_decimals(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_replace_decimals(item) for item in value]
+    if isinstance(value, Decimal):
+        if value == value.to_integral_value():
+            return int(value)
+        return float(value)
+    return value
+
+
+def _chunk(items, size):
+    # type: (List[T], int) -> List[List[T]]
+    """Split the items in chunks of the size.
+
+    :param items: Items to be split
+    :type items: List[T]
+    :param size: Maximum size of the chunks
+    :type size: int
+    :return: Chunks of items
+    :rtype: List[List[T]]
+    """
+    return [items[index:index + size] for index in range(0, len(items), size)]
+
+
+def _convert_write_request(write_request, convert_item):
+    # type: (Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]
+    """Convert the item or key of the put or delete request.
+
+    :param write_request: Put or delete request
+    :type write_request: Dict[str, Any]
+    :param convert_item: Function converting the item or key
+    :type convert_item: Callable[[Dict[str, Any]], Dict[str, Any]]
+    :return: Put or delete request with the converted item or key
+    :rtype: Dict[str, Any]
+    """
+    if "PutRequest" in write_request:
+        return {"PutRequest": {
+            "Item": convert_item(write_request["PutRequest"]["Item"])}}
+    return {"DeleteRequest": {
+        "Key": convert_item(write_request["DeleteRequest"]["Key"])}}
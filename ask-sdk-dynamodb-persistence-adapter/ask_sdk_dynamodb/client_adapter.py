@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import math
+import typing
+
+import six
+
+from .adapter import DynamoDbAdapter
+from .partition_keygen import user_id_partition_keygen
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping  # type: ignore
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional
+    from ask_sdk_core.attributes_codec import AbstractAttributesCodec
+    from ask_sdk_model import RequestEnvelope
+    from botocore.client import BaseClient
+
+
+class DynamoDbClientAdapter(DynamoDbAdapter):
+    """Persistence Adapter implementation using the low-level Amazon
+    DynamoDb client.
+
+    Same as :py:class:`ask_sdk_dynamodb.adapter.DynamoDbAdapter`, but
+    the dynamodb operations are performed through the low-level
+    ``boto3`` client instead of the resource, avoiding the overhead
+    of the resource layer on every call. The attributes are converted
+    from and to the DynamoDb attribute value format by the adapter,
+    with a fast path for ``str``, ``int``, ``float``, ``bool``,
+    ``None``, ``dict`` and ``list`` values.
+
+    Numbers are retrieved as ``int`` or ``float`` values, instead of
+    the ``Decimal`` values retrieved by the resource, and ``float``
+    values can be saved directly. Note that floats without a
+    fractional part, like ``2.0``, are retrieved as ``int`` values,
+    as DynamoDb doesn't keep the number format.
+
+    Most of the remaining time spent saving large attributes is the
+    request parameter validation by ``botocore``, which can be turned
+    off by providing a client created with
+    ``botocore.config.Config(parameter_validation=False)``.
+
+    :param table_name: Name of the table to be created or used
+    :type table_name: str
+    :param partition_key_name: Partition key name to be used.
+        Defaulted to 'id'
+    :type partition_key_name: str
+    :param attribute_name: Attribute name for storing and
+        retrieving attributes from dynamodb.
+        Defaulted to 'attributes'
+    :type attribute_name: str
+    :param create_table: Should the adapter try to create the table
+        if it doesn't exist. Defaulted to False
+    :type create_table: bool
+    :param partition_keygen: Callable function that takes a
+        request envelope and provides a unique partition key value.
+        Defaulted to user id keygen function
+    :type partition_keygen: Callable[[RequestEnvelope], str]
+    :param dynamodb_client: Client to be used, to perform dynamo
+        operations. Defaulted to client generated from boto3, on
+        first use
+    :type dynamodb_client: botocore.client.BaseClient
+    :param update_changed_attributes: Should the adapter save only
+        the changed attributes with an ``update_item`` call, when they
+        are known. Defaulted to False
+    :type update_changed_attributes: bool
+    :param consistent_read: Should the attributes be retrieved with
+        strongly consistent reads. Defaulted to True
+    :type consistent_read: bool
+    :param version_attribute_name: Attribute name for storing the
+        version of the item, to save attributes only if the item
+        didn't change since they were retrieved. Defaulted to None,
+        saving attributes unconditionally
+    :type version_attribute_name: str
+    :param attributes_codec: Codec used to encode the attributes to
+        compact and compressed bytes, stored as a binary value, like
+        :py:class:`ask_sdk_core.attributes_codec.AttributesCodec`.
+        Attributes stored as a map before the codec was set are still
+        retrieved. Defaulted to None, storing the attributes as a map
+    :type attributes_codec: ask_sdk_core.attributes_codec.AbstractAttributesCodec
+    """
+
+    def __init__(
+            self, table_name, partition_key_name="id",
+            attribute_name="attributes", create_table=False,
+            partition_keygen=user_id_partition_keygen,
+            dynamodb_client=None, update_changed_attributes=False,
+            consistent_read=True, version_attribute_name=None,
+            attributes_codec=None):
+        # type: (str, str, str, bool, Callable[[RequestEnvelope], str], BaseClient, bool, bool, str, Optional[AbstractAttributesCodec]) -> None
+        """Persistence Adapter implementation using the low-level
+        Amazon DynamoDb client.
+
+        :param table_name: Name of the table to be created or used
+        :type table_name: str
+        :param partition_key_name: Partition key name to be used.
+            Defaulted to 'id'
+        :type partition_key_name: str
+        :param attribute_name: Attribute name for storing and
+            retrieving attributes from dynamodb.
+            Defaulted to 'attributes'
+        :type attribute_name: str
+        :param create_table: Should the adapter try to create the table
+            if it doesn't exist. Defaulted to False
+        :type create_table: bool
+        :param partition_keygen: Callable function that takes a
+            request envelope and provides a unique partition key value.
+            Defaulted to user id keygen function
+        :type partition_keygen: Callable[[RequestEnvelope], str]
+        :param dynamodb_client: Client to be used, to perform dynamo
+            operations. Defaulted to client generated from boto3, on
+            first use
+        :type dynamodb_client: botocore.client.BaseClient
+        :param update_changed_attributes: Should the adapter save only
+            the changed attributes with an ``update_item`` call, when
+            they are known. Defaulted to False
+        :type update_changed_attributes: bool
+        :param consistent_read: Should the attributes be retrieved with
+            strongly consistent reads. Defaulted to True
+        :type consistent_read: bool
+        :param version_attribute_name: Attribute name for storing the
+            version of the item, to save attributes only if the item
+            didn't change since they were retrieved. Defaulted to None,
+            saving attributes unconditionally
+        :type version_attribute_name: str
+        :param attributes_codec: Codec used to encode the attributes to
+            compact and compressed bytes, stored as a binary value, like
+            :py:class:`ask_sdk_core.attributes_codec.AttributesCodec`.
+            Attributes stored as a map before the codec was set are still
+            retrieved. Defaulted to None, storing the attributes as a map
+        :type attributes_codec: ask_sdk_core.attributes_codec.AbstractAttributesCodec
+        """
+        super(DynamoDbClientAdapter, self).__init__(
+            table_name=table_name, partition_key_name=partition_key_name,
+            attribute_name=attribute_name, create_table=create_table,
+            partition_keygen=partition_keygen,
+            dynamodb_resource=dynamodb_client,
+            update_changed_attributes=update_changed_attributes,
+            consistent_read=consistent_read,
+            version_attribute_name=version_attribute_name,
+            attributes_codec=attributes_codec)
+
+    def _build_dynamodb(self):
+        # type: () -> BaseClient
+        """Generate the client used to perform dynamo operations,
+        when no client is provided.
+
+        :return: DynamoDb client generated from boto3
+        :rtype: botocore.client.BaseClient
+        """
+        import boto3
+        return boto3.client("dynamodb")
+
+    def _build_table(self, dynamodb):
+        # type: (BaseClient) -> Any
+        """Build the table used to perform item operations.
+
+        :param dynamodb: Client to be used, to perform dynamo
+            operations
+        :type dynamodb: botocore.client.BaseClient
+        :return: Table performing item operations through the client
+        :rtype: _ClientTable
+        """
+        return _ClientTable(client=dynamodb, table_name=self.table_name)
+
+    def _get_batch_client(self):
+        # type: () -> BaseClient
+        """Get the client used to send the batch requests.
+
+        :return: DynamoDb client of the adapter
+        :rtype: botocore.client.BaseClient
+        """
+        return self.dynamodb
+
+    def _serialize_item(self, item):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        """Convert the item or key of a batch request to the DynamoDb
+        attribute value format.
+
+        :param item: Item with python values
+        :type item: Dict[str, Any]
+        :return: Item with DynamoDb attribute values
+        :rtype: Dict[str, Any]
+        """
+        return serialize_item(item)
+
+    def _deserialize_item(self, item):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        """Convert the item or key of a batch response from the
+        DynamoDb attribute value format.
+
+        :param item: Item with DynamoDb attribute values
+        :type item: Dict[str, Any]
+        :return: Item with python values
+        :rtype: Dict[str, Any]
+        """
+        return deserialize_item(item)
+
+
+class _ClientTable(object):
+    """Table performing the item operations used by the adapter
+    through the low-level DynamoDb client.
+
+    The operations take and return items in the same format as the
+    ``boto3`` table resource, converting them from and to the
+    DynamoDb attribute value format.
+
+    :param client: Client to be used, to perform dynamo operations
+    :type client: botocore.client.BaseClient
+    :param table_name: Name of the table
+    :type table_name: str
+    """
+
+    def __init__(self, client, table_name):
+        # type: (BaseClient, str) -> None
+        """Table performing the item operations through the low-level
+        DynamoDb client.
+
+        :param client: Client to be used, to perform dynamo operations
+        :type client: botocore.client.BaseClient
+        :param table_name: Name of the table
+        :type table_name: str
+        """
+        self.client = client
+        self.table_name = table_name
+
+    def get_item(self, Key, **kwargs):
+        # type: (Dict[str, Any], Any) -> Dict[str, Any]
+        """Get the item with the key from the table.
+
+        :param Key: Primary key of the item
+        :type Key: Dict[str, Any]
+        :return: Response with the retrieved item, if it exists
+        :rtype: Dict[str, Any]
+        """
+        response = self.client.get_item(
+            TableName=self.table_name, Key=serialize_item(Key), **kwargs)
+        if "Item" in response:
+            response["Item"] = deserialize_item(response["Item"])
+        return response
+
+    def put_item(self, Item, **kwargs):
+        # type: (Dict[str, Any], Any) -> Dict[str, Any]
+        """Put the item in the table.
+
+        :param Item: Item to be put, including its primary key
+        :type Item: Dict[str, Any]
+        :return: Response of the put operation
+        :rtype: Dict[str, Any]
+        """
+        _serialize_expression_values(kwargs)
+        return self.client.put_item(
+            TableName=self.table_name, Item=serialize_item(Item), **kwargs)
+
+    def update_item(self, Key, **kwargs):
+        # type: (Dict[str, Any], Any) -> Dict[str, Any]
+        """Update the item with the key in the table.
+
+        :param Key: Primary key of the item
+        :type Key: Dict[str, Any]
+        :return: Response of the update operation
+        :rtype: Dict[str, Any]
+        """
+        _serialize_expression_values(kwargs)
+        return self.client.update_item(
+            TableName=self.table_name, Key=serialize_item(Key), **kwargs)
+
+    def delete_item(self, Key, **kwargs):
+        # type: (Dict[str, Any], Any) -> Dict[str, Any]
+        """Delete the item with the key from the table.
+
+        :param Key: Primary key of the item
+        :type Key: Dict[str, Any]
+        :return: Response of the delete operation
+        :rtype: Dict[str, Any]
+        """
+        _serialize_expression_values(kwargs)
+        return self.client.delete_item(
+            TableName=self.table_name, Key=serialize_item(Key), **kwargs)
+
+
+def _serialize_expression_values(kwargs):
+    # type: (Dict[str, Any]) -> None
+    """Convert the expression attribute values of the operation
+    parameters to the DynamoDb attribute value format, in place.
+    """
+    if "ExpressionAttributeValues" in kwargs:
+        kwargs["ExpressionAttributeValues"] = serialize_item(
+            kwargs["ExpressionAttributeValues"])
+
+
+def serialize_item(item):
+    # type: (Dict[str, Any]) -> Dict[str, Dict[str, Any]]
+    """Convert the item to the DynamoDb attribute value format, used
+    by the low-level client.
+
+    ``str``, ``int``, ``float``, ``bool``, ``None``, ``dict``, ``list``
+    and ``tuple`` values are converted directly. Other values, like
+    ``Decimal`` and ``set`` values, are converted using the ``boto3``
+    ``TypeSerializer``.
+
+    :param item: Item with python values
+    :type item: Dict[str, Any]
+    :return: Item with DynamoDb attribute values
+    :rtype: Dict[str, Dict[str, Any]]
+    :raises: TypeError if a value can't be converted
+    """
+    return {key: serialize_value(value) for key, value in item.items()}
+
+
+def serialize_value(value):
+    # type: (Any) -> Dict[str, Any]
+    """Convert the value to the DynamoDb attribute value format.
+
+    The converter for the value type is looked up once, and cached
+    for the following values of the same type.
+
+    :param value: Python value
+    :type value: object
+    :return: DynamoDb attribute value
+    :rtype: Dict[str, Any]
+    :raises: TypeError if the value can't be converted
+    """
+    serializer = _serializers.get(type(value))
+    if serializer is None:
+        serializer = _find_serializer(type(value))
+    return serializer(value)
+
+
+def deserialize_item(item):
+    # type: (Dict[str, Dict[str, Any]]) -> Dict[str, Any]
+    """Convert the item from the DynamoDb attribute value format, used
+    by the low-level client.
+
+    Numbers are converted to ``int`` values, or ``float`` values if
+    they have a fraction or an exponent, binary values to ``bytes``
+    and sets to ``set`` values.
+
+    :param item: Item with DynamoDb attribute values
+    :type item: Dict[str, Dict[str, Any]]
+    :return: Item with python values
+    :rtype: Dict[str, Any]
+    :raises: TypeError if an attribute value type is unknown
+    """
+    return {key: deserialize_value(value) for key, value in item.items()}
+
+
+def deserialize_value(value):
+    # type: (Dict[str, Any]) -> Any
+    """Convert the value from the DynamoDb attribute value format.
+
+    :param value: DynamoDb attribute value
+    :type value: Dict[str, Any]
+    :return: Python value
+    :rtype: object
+    :raises: TypeError if the attribute value type is unknown
+    """
+    for value_type, data in value.items():
+        deserializer = _deserializers.get(value_type)
+        if deserializer is None:
+            raise TypeError(
+                "DynamoDb type {} is not supported".format(value_type))
+        return deserializer(data)
+    raise TypeError("DynamoDb attribute value has no type")
+
+
+def _serialize_string(value):
+    # type: (Any) -> Dict[str, Any]
+    return {"S": value}
+
+
+def _serialize_bool(value):
+    # type: (bool) -> Dict[str, Any]
+    return {"BOOL": value}
+
+
+def _serialize_int(value):
+    # type: (int) -> Dict[str, Any]
+    return {"N": str(int(value))}
+
+
+def _serialize_float(value):
+    # type: (float) -> Dict[str, Any]
+    if math.isinf(value) or math.isnan(value):
+        raise TypeError("Infinity and NaN are not supported by DynamoDb")
+    return {"N": repr(float(value))}
+
+
+def _serialize_none(value):
+    # type: (None) -> Dict[str, Any]
+    return {"NULL": True}
+
+
+def _serialize_binary(value):
+    # type: (Any) -> Dict[str, Any]
+    return {"B": value}
+
+
+def _serialize_map(value):
+    # type: (Mapping) -> Dict[str, Any]
+    return {"M": {
+        key: serialize_value(item) for key, item in value.items()}}
+
+
+def _serialize_list(value):
+    # type: (Any) -> Dict[str, Any]
+    return {"L": [serialize_value(item) for item in value]}
+
+
+_type_serializer = None  # type: Any
+
+
+def _serialize_with_type_serializer(value):
+    # type: (Any) -> Dict[str, Any]
+    global _type_serializer
+    if _type_serializer is None:
+        from boto3.dynamodb.types import TypeSerializer
+        _type_serializer = TypeSerializer()
+    return _type_serializer.serialize(value)
+
+
+_serializers = {
+    bool: _serialize_bool,
+    float: _serialize_float,
+    type(None): _serialize_none,
+    dict: _serialize_map,
+    list: _serialize_list,
+    tuple: _serialize_list,
+    bytearray: _serialize_binary
+}  # type: Dict[type, Callable[[Any], Dict[str, Any]]]
+for _string_type in six.string_types:
+    _serializers[_string_type] = _serialize_string
+for _integer_type in six.integer_types:
+    _serializers[_integer_type] = _serialize_int
+if six.PY3:
+    _serializers[bytes] = _serialize_binary
+
+
+def _find_serializer(value_type):
+    # type: (type) -> Callable[[Any], Dict[str, Any]]
+    """Find the converter for subclasses of the supported types, and
+    cache it for the type.
+
+    Types that aren't supported directly are converted using the
+    ``boto3`` ``TypeSerializer``.
+    """
+    if issubclass(value_type, bool):
+        serializer = _serialize_bool  # type: Callable[[Any], Dict[str, Any]]
+    elif issubclass(value_type, six.integer_types):
+        serializer = _serialize_int
+    elif issubclass(value_type, float):
+        serializer = _serialize_float
+    elif issubclass(value_type, six.string_types):
+        serializer = _serialize_string
+    elif issubclass(value_type, Mapping):
+        serializer = _serialize_map
+    elif issubclass(value_type, (list, tuple)):
+        serializer = _serialize_list
+    else:
+        serializer = _serialize_with_type_serializer
+    _serializers[value_type] = serializer
+    return serializer
+
+
+def _deserialize_number(data):
+    # type: (str) -> Any
+    if "." in data or "e" in data or "E" in data:
+        return float(data)
+    return int(data)
+
+
+def _deserialize_map(data):
+    # type: (Dict[str, Dict[str, Any]]) -> Dict[str, Any]
+    return {key: deserialize_value(value) for key, value in data.items()}
+
+
+def _deserialize_list(data):
+    # type: (List[Dict[str, Any]]) -> List[Any]
+    return [deserialize_value(value) for value in data]
+
+
+def _identity(data):
+    # type: (Any) -> Any
+    return data
+
+
+_deserializers = {
+    "S": _identity,
+    "N": _deserialize_number,
+    "BOOL": _identity,
+    "NULL": lambda data: None,
+    "M": _deserialize_map,
+    "L": _deserialize_list,
+    "B": bytes,
+    "SS": set,
+    "NS": lambda data: set(_deserialize_number(item) for item in data),
+    "BS": lambda data: set(bytes(item) for item in data)
+}  # type: Dict[str, Callable[[Any], Any]]
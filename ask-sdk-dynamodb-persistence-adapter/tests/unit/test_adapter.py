@@ -16,10 +16,16 @@
 # License.
 #
 import unittest
+from decimal import Decimal
 
+from boto3.dynamodb.types import Binary
 from boto3.exceptions import ResourceNotExistsError
 from ask_sdk_model import RequestEnvelope
-from ask_sdk_core.exceptions import PersistenceException
+from ask_sdk_core.attributes_codec import (
+    AttributesCodec, JsonAttributesFormat, ZlibCompression)
+from ask_sdk_core.exceptions import (
+    PersistenceException, PersistenceConflictException)
+from ask_sdk_core.json_codec import StdlibJsonCodec
 from ask_sdk_dynamodb.adapter import DynamoDbAdapter
 
 try:
@@ -32,6 +38,10 @@ class ResourceInUseException(Exception):
     pass
 
 
+class ConditionalCheckFailedException(Exception):
+    pass
+
+
 class TestDynamoDbAdapter(unittest.TestCase):
     def setUp(self):
         self.dynamodb_resource = mock.Mock()
@@ -241,6 +251,241 @@ class TestDynamoDbAdapter(unittest.TestCase):
                 self.attributes}), (
             "DynamoDb Put item called with incorrect parameters")
 
+    def test_save_changed_attributes_puts_item_by_default(self):
+        mock_table = mock.Mock()
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+
+        test_dynamodb_adapter.save_changed_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes, changed_keys={"test_key"},
+            removed_keys=set())
+
+        mock_table.put_item.assert_called_once_with(
+            Item={"id": "test_partition_key", "attributes": self.attributes})
+        self.assertFalse(
+            mock_table.update_item.called,
+            "Save changed attributes updated item when "
+            "update_changed_attributes isn't set")
+
+    def test_save_changed_attributes_updates_item(self):
+        mock_table = mock.Mock()
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_attributes = {"counter": 2, "new key": "test_val", "other": 1}
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            attribute_name="custom_attr", update_changed_attributes=True)
+
+        test_dynamodb_adapter.save_changed_attributes(
+            request_envelope=self.request_envelope,
+            attributes=test_attributes, changed_keys={"counter", "new key"},
+            removed_keys={"removed"})
+
+        mock_table.update_item.assert_called_once_with(
+            Key={"id": "test_partition_key"},
+            UpdateExpression=(
+                "SET #attributes.#set0 = :set0, "
+                "#attributes.#set1 = :set1 "
+                "REMOVE #attributes.#remove0"),
+            ConditionExpression="attribute_exists(#attributes)",
+            ExpressionAttributeNames={
+                "#attributes": "custom_attr", "#set0": "counter",
+                "#set1": "new key", "#remove0": "removed"},
+            ExpressionAttributeValues={":set0": 2, ":set1": "test_val"}), (
+            "Save changed attributes provided incorrect update expression "
+            "for update item call")
+        self.assertFalse(
+            mock_table.put_item.called,
+            "Save changed attributes put whole item when the item exists")
+
+    def test_save_removed_attributes_updates_item_without_values(self):
+        mock_table = mock.Mock()
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            update_changed_attributes=True)
+
+        test_dynamodb_adapter.save_changed_attributes(
+            request_envelope=self.request_envelope, attributes={},
+            changed_keys=set(), removed_keys={"removed"})
+
+        mock_table.update_item.assert_called_once_with(
+            Key={"id": "test_partition_key"},
+            UpdateExpression="REMOVE #attributes.#remove0",
+            ConditionExpression="attribute_exists(#attributes)",
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#remove0": "removed"}), (
+            "Save changed attributes provided incorrect update expression "
+            "for update item call removing attributes")
+
+    def test_save_changed_attributes_puts_item_when_item_doesnt_exist(self):
+        mock_table = mock.Mock()
+        mock_table.update_item.side_effect = ConditionalCheckFailedException(
+            "test exception")
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            update_changed_attributes=True)
+
+        test_dynamodb_adapter.save_changed_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes, changed_keys={"test_key"},
+            removed_keys=set())
+
+        mock_table.put_item.assert_called_once_with(
+            Item={"id": "test_partition_key", "attributes": self.attributes})
+
+    def test_save_changed_attributes_update_item_fails(self):
+        mock_table = mock.Mock()
+        mock_table.update_item.side_effect = Exception("test exception")
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            update_changed_attributes=True)
+
+        with self.assertRaises(PersistenceException) as exc:
+            test_dynamodb_adapter.save_changed_attributes(
+                request_envelope=self.request_envelope,
+                attributes=self.attributes, changed_keys={"test_key"},
+                removed_keys=set())
+
+        assert "Failed to save attributes to DynamoDb table" in str(
+            exc.exception), (
+            "Save changed attributes didn't raise Persistence Exception when "
+            "update item failed on dynamodb resource")
+        self.assertFalse(
+            mock_table.put_item.called,
+            "Save changed attributes put whole item when update item failed")
+
+    def test_get_partial_attributes_uses_projection_expression(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {
+            "Item": {"custom_attr": self.attributes}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            attribute_name="custom_attr")
+
+        assert test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope,
+            keys=["test_key", "missing key"]) == self.attributes, (
+            "Get partial attributes from dynamodb table retrieves wrong "
+            "values")
+        mock_table.get_item.assert_called_once_with(
+            Key={"id": "test_partition_key"}, ConsistentRead=True,
+            ProjectionExpression="#attributes.#key0, #attributes.#key1",
+            ExpressionAttributeNames={
+                "#attributes": "custom_attr", "#key0": "test_key",
+                "#key1": "missing key"}), (
+            "Get partial attributes provided incorrect projection expression "
+            "for get item call")
+
+    def test_get_partial_attributes_removes_duplicate_keys(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {
+            "Item": {"attributes": self.attributes}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+        test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope,
+            keys=["test_key", "other_key", "test_key"])
+
+        mock_table.get_item.assert_called_once_with(
+            Key={"id": "test_partition_key"}, ConsistentRead=True,
+            ProjectionExpression="#attributes.#key0, #attributes.#key1",
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#key0": "test_key",
+                "#key1": "other_key"}), (
+            "Get partial attributes provided overlapping projection paths "
+            "for duplicate keys")
+
+    def test_get_partial_attributes_returns_empty_dict_for_no_item(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {}
+        self.dynamodb_resource.Table.return_value = mock_table
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+
+        assert test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope, keys=["test_key"]) == {}, (
+            "Get partial attributes returns incorrect response when no item "
+            "is present in dynamodb table for provided key")
+        assert test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope, keys=[]) == {}, (
+            "Get partial attributes returns incorrect response when no keys "
+            "are provided")
+        mock_table.get_item.assert_called_once()
+
+    def test_get_partial_attributes_get_item_fails(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.side_effect = Exception("test exception")
+        self.dynamodb_resource.Table.return_value = mock_table
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+
+        with self.assertRaises(PersistenceException) as exc:
+            test_dynamodb_adapter.get_partial_attributes(
+                request_envelope=self.request_envelope, keys=["test_key"])
+
+        assert "Failed to retrieve attributes from DynamoDb table" in str(
+            exc.exception), (
+            "Get partial attributes didn't raise Persistence Exception when "
+            "get item failed on dynamodb resource")
+
+    def test_save_partial_attributes_updates_item(self):
+        mock_table = mock.Mock()
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+
+        test_dynamodb_adapter.save_partial_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes, changed_keys={"test_key"},
+            removed_keys=set())
+
+        mock_table.update_item.assert_called_once_with(
+            Key={"id": "test_partition_key"},
+            UpdateExpression="SET #attributes.#set0 = :set0",
+            ConditionExpression="attribute_exists(#attributes)",
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#set0": "test_key"},
+            ExpressionAttributeValues={":set0": "test_val"}), (
+            "Save partial attributes provided incorrect update expression "
+            "for update item call")
+        self.assertFalse(
+            mock_table.put_item.called,
+            "Save partial attributes put partial item when the item exists")
+
     def test_save_attributes_fails_with_no_existing_table(self):
         self.dynamodb_resource.Table.side_effect = ResourceNotExistsError(
             "test", "test", "test")
@@ -377,6 +622,711 @@ class TestDynamoDbAdapter(unittest.TestCase):
             "Create table called on dynamodb resource when create_table flag "
             "is set as False")
 
+    def test_default_resource_created_on_first_use(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {}
+        self.dynamodb_resource.Table.return_value = mock_table
+
+        with mock.patch(
+                "boto3.resource",
+                return_value=self.dynamodb_resource) as mock_resource:
+            test_dynamodb_adapter = DynamoDbAdapter(
+                table_name="test_table",
+                partition_keygen=self.partition_keygen)
+
+            mock_resource.assert_not_called(), (
+                "DynamoDb resource created during adapter initialization")
+
+            test_dynamodb_adapter.get_attributes(
+                request_envelope=self.request_envelope)
+            test_dynamodb_adapter.save_attributes(
+                request_envelope=self.request_envelope,
+                attributes=self.attributes)
+
+        mock_resource.assert_called_once_with("dynamodb"), (
+            "DynamoDb resource not created once on first use")
+        assert test_dynamodb_adapter.dynamodb == self.dynamodb_resource, (
+            "DynamoDb resource created on first use not set on adapter")
+
+    def test_table_reused_across_calls(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {}
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes)
+        test_dynamodb_adapter.delete_attributes(
+            request_envelope=self.request_envelope)
+
+        self.dynamodb_resource.Table.assert_called_once_with("test_table"), (
+            "DynamoDb table not reused across adapter calls")
+
+    def test_table_reset_on_resource_change(self):
+        other_dynamodb_resource = mock.Mock()
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+        test_dynamodb_adapter.delete_attributes(
+            request_envelope=self.request_envelope)
+
+        test_dynamodb_adapter.dynamodb = other_dynamodb_resource
+        test_dynamodb_adapter.delete_attributes(
+            request_envelope=self.request_envelope)
+
+        other_dynamodb_resource.Table.assert_called_once_with(
+            "test_table"), (
+            "DynamoDb table not retrieved from changed dynamodb resource")
+
+    def test_table_retrieval_retried_after_failure(self):
+        self.dynamodb_resource.Table.side_effect = [
+            ResourceNotExistsError("test", "test", "test"), mock.Mock()]
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+
+        with self.assertRaises(PersistenceException):
+            test_dynamodb_adapter.delete_attributes(
+                request_envelope=self.request_envelope)
+        test_dynamodb_adapter.delete_attributes(
+            request_envelope=self.request_envelope)
+
+        assert self.dynamodb_resource.Table.call_count == 2, (
+            "DynamoDb table retrieval not retried after failure")
+
+    def test_get_attributes_eventually_consistent(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource, consistent_read=False)
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope, consistent_read=True)
+
+        assert mock_table.get_item.call_args_list == [
+            mock.call(Key={"id": "test_partition_key"},
+                      ConsistentRead=False),
+            mock.call(Key={"id": "test_partition_key"},
+                      ConsistentRead=True)], (
+            "Get attributes didn't use adapter read consistency, or didn't "
+            "override it with read consistency of the call")
+
+    def test_get_partial_attributes_eventually_consistent(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource)
+
+        test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope, keys=["test_key"],
+            consistent_read=False)
+
+        assert mock_table.get_item.call_args[1]["ConsistentRead"] is False, (
+            "Get partial attributes didn't use read consistency of the call")
+
+    def test_save_attributes_with_version_after_get(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            version_attribute_name="version")
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes)
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes)
+
+        assert mock_table.put_item.call_args_list == [
+            mock.call(
+                Item={"id": "test_partition_key",
+                      "attributes": self.attributes, "version": version + 1},
+                ConditionExpression="#version = :version",
+                ExpressionAttributeNames={"#version": "version"},
+                ExpressionAttributeValues={":version": version})
+            for version in (3, 4)], (
+            "Save attributes didn't put item conditional on retrieved "
+            "version")
+
+    def test_save_attributes_with_version_without_get(self):
+        mock_table = mock.Mock()
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            version_attribute_name="version")
+
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes)
+
+        mock_table.put_item.assert_called_once_with(
+            Item={"id": "test_partition_key",
+                  "attributes": self.attributes, "version": 1},
+            ConditionExpression="attribute_not_exists(#version)",
+            ExpressionAttributeNames={"#version": "version"}), (
+            "Save attributes without retrieved version didn't put item "
+            "conditional on no existing version")
+
+    def test_save_attributes_with_version_of_other_request_envelope(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            version_attribute_name="version")
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=RequestEnvelope(), attributes=self.attributes)
+
+        assert mock_table.put_item.call_args[1]["ConditionExpression"] == (
+            "attribute_not_exists(#version)"), (
+            "Save attributes used version retrieved for other request "
+            "envelope")
+
+    def test_version_discarded_with_request_envelope(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table",
+            partition_keygen=lambda request_envelope: "test_partition_key",
+            dynamodb_resource=self.dynamodb_resource,
+            version_attribute_name="version")
+        request_envelope = RequestEnvelope()
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=request_envelope)
+        del request_envelope
+
+        assert test_dynamodb_adapter._versions == {}, (
+            "Retrieved version kept after request envelope is discarded")
+
+    def test_save_attributes_with_version_conflict(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        mock_table.put_item.side_effect = ConditionalCheckFailedException(
+            "test exception")
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            version_attribute_name="version")
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        with self.assertRaises(PersistenceConflictException) as exc:
+            test_dynamodb_adapter.save_attributes(
+                request_envelope=self.request_envelope,
+                attributes=self.attributes)
+
+        assert "item changed since the attributes were retrieved" in str(
+            exc.exception), (
+            "Save attributes didn't raise Persistence Conflict Exception "
+            "when item version changed")
+        assert isinstance(exc.exception, PersistenceException), (
+            "Persistence Conflict Exception isn't a Persistence Exception")
+
+    def test_save_changed_attributes_with_version_updates_item(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            update_changed_attributes=True, version_attribute_name="version")
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.save_changed_attributes(
+            request_envelope=self.request_envelope,
+            attributes={"new_key": "new_val"}, changed_keys={"new_key"},
+            removed_keys={"test_key"})
+
+        mock_table.update_item.assert_called_once_with(
+            Key={"id": "test_partition_key"},
+            UpdateExpression=(
+                "SET #attributes.#set0 = :set0, #version = :next_version "
+                "REMOVE #attributes.#remove0"),
+            ConditionExpression=(
+                "attribute_exists(#attributes) AND #version = :version"),
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#set0": "new_key",
+                "#remove0": "test_key", "#version": "version"},
+            ExpressionAttributeValues={
+                ":set0": "new_val", ":version": 3, ":next_version": 4}), (
+            "Save changed attributes didn't update item conditional on "
+            "retrieved version")
+
+    def test_save_removed_attributes_with_version_updates_item(self):
+        mock_table = mock.Mock()
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            update_changed_attributes=True, version_attribute_name="version")
+
+        test_dynamodb_adapter.save_changed_attributes(
+            request_envelope=self.request_envelope,
+            attributes={}, changed_keys=set(), removed_keys={"test_key"})
+
+        mock_table.update_item.assert_called_once_with(
+            Key={"id": "test_partition_key"},
+            UpdateExpression=(
+                "SET #version = :next_version REMOVE #attributes.#remove0"),
+            ConditionExpression=(
+                "attribute_exists(#attributes) AND "
+                "attribute_not_exists(#version)"),
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#remove0": "test_key",
+                "#version": "version"},
+            ExpressionAttributeValues={":next_version": 1}), (
+            "Save removed attributes didn't update item conditional on no "
+            "existing version")
+
+    def test_save_changed_attributes_with_version_conflict(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        mock_table.update_item.side_effect = ConditionalCheckFailedException(
+            "test exception")
+        mock_table.put_item.side_effect = ConditionalCheckFailedException(
+            "test exception")
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            update_changed_attributes=True, version_attribute_name="version")
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        with self.assertRaises(PersistenceConflictException):
+            test_dynamodb_adapter.save_changed_attributes(
+                request_envelope=self.request_envelope,
+                attributes={"new_key": "new_val"}, changed_keys={"new_key"},
+                removed_keys=set())
+
+        assert mock_table.put_item.call_args[1]["ConditionExpression"] == (
+            "#version = :version"), (
+            "Save changed attributes didn't fall back to put item "
+            "conditional on retrieved version")
+
+    def test_get_partial_attributes_with_version(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            version_attribute_name="version")
+
+        assert test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope,
+            keys=["test_key"]) == self.attributes, (
+            "Get partial attributes with version retrieves wrong values")
+        test_dynamodb_adapter.save_partial_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes, changed_keys={"test_key"},
+            removed_keys=set())
+
+        mock_table.get_item.assert_called_once_with(
+            Key={"id": "test_partition_key"}, ConsistentRead=True,
+            ProjectionExpression="#attributes.#key0, #version",
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#key0": "test_key",
+                "#version": "version"}), (
+            "Get partial attributes didn't retrieve item version")
+        assert mock_table.update_item.call_args[1][
+            "ExpressionAttributeValues"][":version"] == 3, (
+            "Save partial attributes didn't use retrieved version")
+
+    def test_delete_attributes_resets_version(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": self.attributes, "version": 3}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            version_attribute_name="version")
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.delete_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes)
+
+        assert mock_table.put_item.call_args[1]["ConditionExpression"] == (
+            "attribute_not_exists(#version)"), (
+            "Save attributes after delete used version retrieved before "
+            "delete")
+
+    def test_batch_get_attributes_in_chunks(self):
+        keys = ["key_{}".format(index) for index in range(150)]
+        mock_client = self.dynamodb_resource.meta.client
+        mock_client.batch_get_item.side_effect = lambda RequestItems: {
+            "Responses": {"test_table": [
+                {"id": key["id"], "attributes": {"M": {"key": key["id"]}}}
+                for key in RequestItems["test_table"]["Keys"]]}}
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource,
+            consistent_read=False)
+
+        attributes = test_dynamodb_adapter.batch_get_attributes(
+            keys + ["key_0"], max_concurrency=1)
+
+        assert attributes == {key: {"key": key} for key in keys}, (
+            "Batch get attributes retrieved wrong values")
+        first_call, second_call = mock_client.batch_get_item.call_args_list
+        assert first_call == mock.call(RequestItems={"test_table": {
+            "Keys": [{"id": {"S": key}} for key in keys[:100]],
+            "ConsistentRead": False,
+            "ProjectionExpression": "#key, #attributes",
+            "ExpressionAttributeNames": {
+                "#key": "id", "#attributes": "attributes"}}}), (
+            "Batch get item called with incorrect parameters")
+        assert second_call[1]["RequestItems"]["test_table"]["Keys"] == [
+            {"id": {"S": key}} for key in keys[100:]], (
+            "Batch get item not called with remaining keys")
+
+    def test_batch_get_attributes_with_concurrency(self):
+        keys = ["key_{}".format(index) for index in range(250)]
+        mock_client = self.dynamodb_resource.meta.client
+        mock_client.batch_get_item.side_effect = lambda RequestItems: {
+            "Responses": {"test_table": [
+                {"id": key["id"], "attributes": {"M": {"key": key["id"]}}}
+                for key in RequestItems["test_table"]["Keys"]]}}
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource)
+
+        attributes = test_dynamodb_adapter.batch_get_attributes(
+            keys, max_concurrency=3)
+
+        assert attributes == {
+            key: {"key": key} for key in keys}, (
+            "Batch get attributes retrieved wrong values with concurrent "
+            "requests")
+        assert mock_client.batch_get_item.call_count == 3, (
+            "Batch get attributes didn't split keys in chunks for "
+            "concurrent requests")
+        self.assertFalse(
+            self.dynamodb_resource.batch_get_item.called,
+            "Batch get attributes used the resource, which isn't thread "
+            "safe")
+
+    def test_batch_get_attributes_retries_unprocessed_keys(self):
+        mock_client = self.dynamodb_resource.meta.client
+        mock_client.batch_get_item.side_effect = [
+            {"Responses": {"test_table": [
+                {"id": {"S": "first_key"},
+                 "attributes": {"M": {"key": {"S": "first"}}}}]},
+             "UnprocessedKeys": {"test_table": {
+                 "Keys": [{"id": {"S": "second_key"}}],
+                 "ConsistentRead": True}}},
+            {"Responses": {"test_table": [
+                {"id": {"S": "second_key"},
+                 "attributes": {"M": {"count": {"N": "2"}}}}]},
+             "UnprocessedKeys": {}}]
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource)
+
+        with mock.patch("ask_sdk_dynamodb.adapter.time.sleep") as mock_sleep:
+            attributes = test_dynamodb_adapter.batch_get_attributes(
+                ["first_key", "second_key"])
+
+        assert attributes == {
+            "first_key": {"key": "first"},
+            "second_key": {"count": 2}}, (
+            "Batch get attributes didn't retrieve unprocessed keys")
+        mock_client.batch_get_item.assert_called_with(
+            RequestItems={"test_table": {
+                "Keys": [{"id": {"S": "second_key"}}],
+                "ConsistentRead": True}}), (
+            "Batch get item not retried with unprocessed keys")
+        mock_sleep.assert_called_once(), (
+            "Batch get attributes didn't back off before retrying")
+
+    def test_batch_get_attributes_fails_after_retries(self):
+        mock_client = self.dynamodb_resource.meta.client
+        mock_client.batch_get_item.return_value = {
+            "UnprocessedKeys": {"test_table": {
+                "Keys": [{"id": {"S": "key"}}]}}}
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource)
+
+        with mock.patch("ask_sdk_dynamodb.adapter.time.sleep"):
+            with self.assertRaises(PersistenceException) as exc:
+                test_dynamodb_adapter.batch_get_attributes(["key"])
+
+        assert "still unprocessed after 8 retries" in str(exc.exception), (
+            "Batch get attributes didn't raise Persistence Exception when "
+            "keys are unprocessed after retries")
+        assert mock_client.batch_get_item.call_count == 9, (
+            "Batch get item not retried the maximum number of times")
+
+    def test_batch_get_attributes_fails(self):
+        self.dynamodb_resource.meta.client.batch_get_item.side_effect = (
+            Exception("test exception"))
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource)
+
+        with self.assertRaises(PersistenceException) as exc:
+            test_dynamodb_adapter.batch_get_attributes(["key"])
+
+        assert "test exception" in str(exc.exception), (
+            "Batch get attributes didn't raise Persistence Exception when "
+            "batch get item failed")
+
+    def test_batch_save_attributes_in_chunks(self):
+        mock_client = self.dynamodb_resource.meta.client
+        mock_client.batch_write_item.return_value = {}
+        attributes_by_key = {
+            "key_{}".format(index): {"index": index} for index in range(30)}
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource)
+
+        test_dynamodb_adapter.batch_save_attributes(attributes_by_key)
+
+        write_requests = []
+        for call in mock_client.batch_write_item.call_args_list:
+            chunk = call[1]["RequestItems"]["test_table"]
+            assert len(chunk) <= 25, (
+                "Batch write item called with more than 25 requests")
+            write_requests.extend(chunk)
+        assert sorted(
+            write_requests,
+            key=lambda request: request["PutRequest"]["Item"]["id"]["S"]) == (
+            sorted([
+                {"PutRequest": {"Item": {
+                    "id": {"S": key},
+                    "attributes": {"M": {
+                        "index": {"N": str(attributes["index"])}}}}}}
+                for key, attributes in attributes_by_key.items()],
+                key=lambda request: request["PutRequest"]["Item"]["id"]["S"])
+        ), "Batch write item called with incorrect put requests"
+
+    def test_batch_delete_attributes_retries_unprocessed_items(self):
+        unprocessed_items = [
+            {"DeleteRequest": {"Key": {"id": {"S": "second_key"}}}}]
+        mock_client = self.dynamodb_resource.meta.client
+        mock_client.batch_write_item.side_effect = [
+            {"UnprocessedItems": {"test_table": unprocessed_items}}, {}]
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource)
+
+        with mock.patch("ask_sdk_dynamodb.adapter.time.sleep"):
+            test_dynamodb_adapter.batch_delete_attributes(
+                ["first_key", "second_key"])
+
+        assert mock_client.batch_write_item.call_args_list == [
+            mock.call(RequestItems={"test_table": [
+                {"DeleteRequest": {"Key": {"id": {"S": "first_key"}}}},
+                {"DeleteRequest": {"Key": {"id": {"S": "second_key"}}}}]}),
+            mock.call(RequestItems={"test_table": unprocessed_items})], (
+            "Batch write item not retried with unprocessed delete requests")
+
+    def test_batch_delete_attributes_fails(self):
+        self.dynamodb_resource.meta.client.batch_write_item.side_effect = (
+            Exception("test exception"))
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource)
+
+        with self.assertRaises(PersistenceException) as exc:
+            test_dynamodb_adapter.batch_delete_attributes(["key"])
+
+        assert "Failed to delete attributes in DynamoDb table" in str(
+            exc.exception), (
+            "Batch delete attributes didn't raise Persistence Exception "
+            "when batch write item failed")
+
+    def get_attributes_codec(self):
+        return AttributesCodec(
+            attributes_format=JsonAttributesFormat(
+                json_codec=StdlibJsonCodec()),
+            compression=ZlibCompression(), min_compress_size=0)
+
+    def test_save_attributes_with_attributes_codec(self):
+        mock_table = mock.Mock()
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        attributes_codec = self.get_attributes_codec()
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            attributes_codec=attributes_codec)
+
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope,
+            attributes=self.attributes)
+
+        mock_table.put_item.assert_called_once_with(Item={
+            "id": "test_partition_key",
+            "attributes": attributes_codec.encode(self.attributes)}), (
+            "Put item not called with attributes encoded by attributes "
+            "codec")
+
+    def test_get_attributes_with_attributes_codec(self):
+        attributes_codec = self.get_attributes_codec()
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": Binary(attributes_codec.encode(self.attributes))}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            attributes_codec=attributes_codec)
+
+        assert test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope) == self.attributes, (
+            "Get attributes didn't decode binary value with attributes "
+            "codec")
+
+    def test_get_legacy_map_attributes_with_attributes_codec(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {"attributes": {
+            "count": Decimal("3"), "scores": [Decimal("2.5")]}}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            attributes_codec=self.get_attributes_codec())
+
+        attributes = test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+
+        assert attributes == {"count": 3, "scores": [2.5]}, (
+            "Get attributes didn't retrieve attributes stored as map with "
+            "attributes codec")
+        assert type(attributes["count"]) is int, (
+            "Get attributes didn't convert decimal values of attributes "
+            "stored as map")
+
+    def test_get_attributes_with_invalid_encoded_attributes_fails(self):
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": Binary(b"\x11invalid")}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            attributes_codec=self.get_attributes_codec())
+
+        with self.assertRaises(PersistenceException):
+            test_dynamodb_adapter.get_attributes(
+                request_envelope=self.request_envelope)
+
+    def test_partial_attributes_with_attributes_codec_use_full_item(self):
+        attributes_codec = self.get_attributes_codec()
+        mock_table = mock.Mock()
+        mock_table.get_item.return_value = {"Item": {
+            "attributes": Binary(attributes_codec.encode(
+                {"count": 1, "name": "test_name"}))}}
+        self.dynamodb_resource.Table.return_value = mock_table
+        self.partition_keygen.return_value = "test_partition_key"
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_resource=self.dynamodb_resource,
+            update_changed_attributes=True,
+            attributes_codec=attributes_codec)
+
+        assert test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope, keys=["count"]) is None, (
+            "Get partial attributes didn't return None with attributes "
+            "codec")
+        test_dynamodb_adapter.save_partial_attributes(
+            request_envelope=self.request_envelope,
+            attributes={"count": 2}, changed_keys={"count"},
+            removed_keys=set())
+        test_dynamodb_adapter.save_changed_attributes(
+            request_envelope=self.request_envelope,
+            attributes={"count": 3}, changed_keys={"count"},
+            removed_keys=set())
+
+        mock_table.update_item.assert_not_called(), (
+            "Update item called with attributes codec")
+        assert mock_table.put_item.call_args_list == [
+            mock.call(Item={
+                "id": "test_partition_key",
+                "attributes": attributes_codec.encode(
+                    {"count": 2, "name": "test_name"})}),
+            mock.call(Item={
+                "id": "test_partition_key",
+                "attributes": attributes_codec.encode({"count": 3})})], (
+            "Changed attributes not saved with put item with attributes "
+            "codec")
+
+    def test_batch_attributes_with_attributes_codec(self):
+        attributes_codec = self.get_attributes_codec()
+        mock_client = self.dynamodb_resource.meta.client
+        mock_client.batch_get_item.return_value = {
+            "Responses": {"test_table": [
+                {"id": {"S": "first_key"},
+                 "attributes": {"B": attributes_codec.encode({"count": 1})}},
+                {"id": {"S": "second_key"},
+                 "attributes": {"M": {"count": {"N": "2"}}}}]}}
+        mock_client.batch_write_item.return_value = {}
+        test_dynamodb_adapter = DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=self.dynamodb_resource,
+            attributes_codec=attributes_codec)
+
+        attributes = test_dynamodb_adapter.batch_get_attributes(
+            ["first_key", "second_key"])
+        test_dynamodb_adapter.batch_save_attributes(attributes)
+
+        assert attributes == {
+            "first_key": {"count": 1}, "second_key": {"count": 2}}, (
+            "Batch get attributes didn't decode attributes with "
+            "attributes codec")
+        write_requests = mock_client.batch_write_item.call_args[1][
+            "RequestItems"]["test_table"]
+        assert sorted(
+            write_requests,
+            key=lambda request: request["PutRequest"]["Item"]["id"]["S"]) == [
+            {"PutRequest": {"Item": {
+                "id": {"S": "first_key"},
+                "attributes": {"B": attributes_codec.encode({"count": 1})}}}},
+            {"PutRequest": {"Item": {
+                "id": {"S": "second_key"},
+                "attributes": {"B": attributes_codec.encode(
+                    {"count": 2})}}}}], (
+            "Batch save attributes didn't encode attributes with "
+            "attributes codec")
+
     def tearDown(self):
         self.dynamodb_resource = None
         self.partition_keygen = None
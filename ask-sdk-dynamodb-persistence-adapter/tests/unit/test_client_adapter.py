@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import unittest
+from collections import OrderedDict
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
+from ask_sdk_model import RequestEnvelope
+from ask_sdk_core.attributes_codec import (
+    AttributesCodec, JsonAttributesFormat, ZlibCompression)
+from ask_sdk_core.exceptions import PersistenceException
+from ask_sdk_core.json_codec import StdlibJsonCodec
+from ask_sdk_dynamodb.client_adapter import (
+    DynamoDbClientAdapter, serialize_item, deserialize_item)
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+
+class ConditionalCheckFailedException(Exception):
+    pass
+
+
+class TestItemSerialization(unittest.TestCase):
+    def setUp(self):
+        self.item = {
+            "name": u"test_name",
+            "count": 3,
+            "enabled": True,
+            "empty": None,
+            "map": {"nested": [1, u"two", {"three": False}]},
+            "list": [],
+            "big": 10 ** 30
+        }
+
+    def test_serialize_item_matches_type_serializer(self):
+        type_serializer = TypeSerializer()
+        expected_item = {
+            key: type_serializer.serialize(value)
+            for key, value in self.item.items()}
+
+        assert serialize_item(self.item) == expected_item, (
+            "Item serialization doesn't match boto3 type serializer")
+
+    def test_deserialize_item_returns_native_numbers(self):
+        type_deserializer = TypeDeserializer()
+        serialized_item = serialize_item(self.item)
+
+        deserialized_item = deserialize_item(serialized_item)
+
+        assert deserialized_item == self.item, (
+            "Item deserialization didn't return the serialized item")
+        assert type(deserialized_item["count"]) is int, (
+            "Item deserialization didn't return int for integer numbers")
+        assert deserialized_item == {
+            key: type_deserializer.deserialize(value)
+            for key, value in serialized_item.items()}, (
+            "Item deserialization doesn't match boto3 type deserializer")
+
+    def test_float_round_trip(self):
+        serialized_item = serialize_item({"pi": 3.14, "small": 1e-20})
+
+        assert serialized_item == {
+            "pi": {"N": "3.14"}, "small": {"N": "1e-20"}}, (
+            "Item serialization didn't serialize floats to DynamoDb numbers")
+        assert deserialize_item(serialized_item) == {
+            "pi": 3.14, "small": 1e-20}, (
+            "Item deserialization didn't return float for fractional numbers")
+
+    def test_serialize_invalid_float_raises_error(self):
+        with self.assertRaises(TypeError):
+            serialize_item({"value": float("nan")})
+
+    def test_serialize_subclasses(self):
+        serialized_item = serialize_item({
+            "ordered": OrderedDict([("key", "value")]),
+            "tuple": (1, 2)})
+
+        assert serialized_item == {
+            "ordered": {"M": {"key": {"S": "value"}}},
+            "tuple": {"L": [{"N": "1"}, {"N": "2"}]}}, (
+            "Item serialization didn't serialize subclasses of supported "
+            "types")
+
+    def test_serialize_other_types_with_type_serializer(self):
+        serialized_item = serialize_item({
+            "decimal": Decimal("1.5"), "strings": {"a"}})
+
+        assert serialized_item == {
+            "decimal": {"N": "1.5"}, "strings": {"SS": ["a"]}}, (
+            "Item serialization didn't fall back to boto3 type serializer")
+
+    def test_serialize_unsupported_type_raises_error(self):
+        with self.assertRaises(TypeError):
+            serialize_item({"value": object()})
+
+    def test_deserialize_sets_and_binary(self):
+        deserialized_item = deserialize_item({
+            "strings": {"SS": ["a", "b"]}, "numbers": {"NS": ["1", "2.5"]},
+            "binary": {"B": b"data"}})
+
+        assert deserialized_item == {
+            "strings": {"a", "b"}, "numbers": {1, 2.5},
+            "binary": b"data"}, (
+            "Item deserialization didn't deserialize sets and binary values")
+
+    def test_deserialize_unknown_type_raises_error(self):
+        with self.assertRaises(TypeError):
+            deserialize_item({"value": {"UNKNOWN": "test"}})
+
+
+class TestDynamoDbClientAdapter(unittest.TestCase):
+    def setUp(self):
+        self.dynamodb_client = mock.Mock()
+        self.partition_keygen = mock.Mock(return_value="test_partition_key")
+        self.request_envelope = RequestEnvelope()
+        self.test_dynamodb_adapter = DynamoDbClientAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_client=self.dynamodb_client)
+
+    def test_get_attributes(self):
+        self.dynamodb_client.get_item.return_value = {"Item": {
+            "id": {"S": "test_partition_key"},
+            "attributes": {"M": {"count": {"N": "2"}}}}}
+
+        attributes = self.test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+
+        assert attributes == {"count": 2}, (
+            "Get attributes from dynamodb client retrieves wrong values")
+        self.dynamodb_client.get_item.assert_called_once_with(
+            TableName="test_table", Key={"id": {"S": "test_partition_key"}},
+            ConsistentRead=True), (
+            "DynamoDb client get item called with incorrect parameters")
+
+    def test_get_attributes_no_item(self):
+        self.dynamodb_client.get_item.return_value = {}
+
+        assert self.test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope) == {}, (
+            "Get attributes returns incorrect response when no item is "
+            "present in dynamodb table for provided key")
+
+    def test_get_attributes_fails(self):
+        self.dynamodb_client.get_item.side_effect = Exception(
+            "test exception")
+
+        with self.assertRaises(PersistenceException) as exc:
+            self.test_dynamodb_adapter.get_attributes(
+                request_envelope=self.request_envelope)
+
+        assert "test exception" in str(exc.exception), (
+            "Get attributes didn't raise Persistence Exception when get "
+            "item failed on dynamodb client")
+
+    def test_save_attributes(self):
+        self.test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope,
+            attributes={"score": 1.5})
+
+        self.dynamodb_client.put_item.assert_called_once_with(
+            TableName="test_table", Item={
+                "id": {"S": "test_partition_key"},
+                "attributes": {"M": {"score": {"N": "1.5"}}}}), (
+            "DynamoDb client put item called with incorrect parameters")
+
+    def test_save_attributes_with_version(self):
+        test_dynamodb_adapter = DynamoDbClientAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_client=self.dynamodb_client,
+            version_attribute_name="version")
+        self.dynamodb_client.get_item.return_value = {"Item": {
+            "attributes": {"M": {}}, "version": {"N": "3"}}}
+
+        test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope, attributes={})
+
+        self.dynamodb_client.put_item.assert_called_once_with(
+            TableName="test_table", Item={
+                "id": {"S": "test_partition_key"},
+                "attributes": {"M": {}}, "version": {"N": "4"}},
+            ConditionExpression="#version = :version",
+            ExpressionAttributeNames={"#version": "version"},
+            ExpressionAttributeValues={":version": {"N": "3"}}), (
+            "DynamoDb client put item called with incorrect parameters")
+
+    def test_attributes_codec_stores_binary_value(self):
+        attributes_codec = AttributesCodec(
+            attributes_format=JsonAttributesFormat(
+                json_codec=StdlibJsonCodec()),
+            compression=ZlibCompression(), min_compress_size=0)
+        test_dynamodb_adapter = DynamoDbClientAdapter(
+            table_name="test_table", partition_keygen=self.partition_keygen,
+            dynamodb_client=self.dynamodb_client,
+            attributes_codec=attributes_codec)
+        encoded_attributes = attributes_codec.encode({"count": 2})
+        self.dynamodb_client.get_item.return_value = {"Item": {
+            "id": {"S": "test_partition_key"},
+            "attributes": {"B": encoded_attributes}}}
+
+        attributes = test_dynamodb_adapter.get_attributes(
+            request_envelope=self.request_envelope)
+        test_dynamodb_adapter.save_attributes(
+            request_envelope=self.request_envelope, attributes=attributes)
+
+        assert attributes == {"count": 2}, (
+            "Get attributes from dynamodb client didn't decode binary "
+            "value with attributes codec")
+        self.dynamodb_client.put_item.assert_called_once_with(
+            TableName="test_table", Item={
+                "id": {"S": "test_partition_key"},
+                "attributes": {"B": encoded_attributes}}), (
+            "DynamoDb client put item not called with binary value "
+            "encoded by attributes codec")
+
+    def test_batch_get_attributes(self):
+        self.dynamodb_client.batch_get_item.side_effect = [
+            {"Responses": {"test_table": [{
+                "id": {"S": "first_key"},
+                "attributes": {"M": {"count": {"N": "1"}}}}]},
+             "UnprocessedKeys": {"test_table": {
+                 "Keys": [{"id": {"S": "second_key"}}],
+                 "ConsistentRead": True}}},
+            {"Responses": {"test_table": [{
+                "id": {"S": "second_key"},
+                "attributes": {"M": {"count": {"N": "2"}}}}]}}]
+
+        with mock.patch("ask_sdk_dynamodb.adapter.time.sleep"):
+            attributes = self.test_dynamodb_adapter.batch_get_attributes(
+                ["first_key", "second_key"])
+
+        assert attributes == {
+            "first_key": {"count": 1}, "second_key": {"count": 2}}, (
+            "Batch get attributes from dynamodb client retrieves wrong "
+            "values")
+        self.dynamodb_client.batch_get_item.assert_called_with(
+            RequestItems={"test_table": {
+                "Keys": [{"id": {"S": "second_key"}}],
+                "ConsistentRead": True}}), (
+            "DynamoDb client batch get item not retried with serialized "
+            "unprocessed keys")
+
+    def test_batch_save_and_delete_attributes(self):
+        self.dynamodb_client.batch_write_item.return_value = {}
+
+        self.test_dynamodb_adapter.batch_save_attributes(
+            {"first_key": {"count": 1}})
+        self.test_dynamodb_adapter.batch_delete_attributes(["second_key"])
+
+        assert self.dynamodb_client.batch_write_item.call_args_list == [
+            mock.call(RequestItems={"test_table": [{"PutRequest": {"Item": {
+                "id": {"S": "first_key"},
+                "attributes": {"M": {"count": {"N": "1"}}}}}}]}),
+            mock.call(RequestItems={"test_table": [{"DeleteRequest": {
+                "Key": {"id": {"S": "second_key"}}}}]})], (
+            "DynamoDb client batch write item called with incorrect "
+            "parameters")
+
+    def test_get_partial_attributes(self):
+        self.dynamodb_client.get_item.return_value = {"Item": {
+            "attributes": {"M": {"count": {"N": "2"}}}}}
+
+        attributes = self.test_dynamodb_adapter.get_partial_attributes(
+            request_envelope=self.request_envelope, keys=["count"])
+
+        assert attributes == {"count": 2}, (
+            "Get partial attributes from dynamodb client retrieves wrong "
+            "values")
+        self.dynamodb_client.get_item.assert_called_once_with(
+            TableName="test_table", Key={"id": {"S": "test_partition_key"}},
+            ConsistentRead=True, ProjectionExpression="#attributes.#key0",
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#key0": "count"}), (
+            "DynamoDb client get item called with incorrect parameters")
+
+    def test_save_partial_attributes(self):
+        self.test_dynamodb_adapter.save_partial_attributes(
+            request_envelope=self.request_envelope,
+            attributes={"count": 3}, changed_keys={"count"},
+            removed_keys=set())
+
+        self.dynamodb_client.update_item.assert_called_once_with(
+            TableName="test_table", Key={"id": {"S": "test_partition_key"}},
+            UpdateExpression="SET #attributes.#set0 = :set0",
+            ConditionExpression="attribute_exists(#attributes)",
+            ExpressionAttributeNames={
+                "#attributes": "attributes", "#set0": "count"},
+            ExpressionAttributeValues={":set0": {"N": "3"}}), (
+            "DynamoDb client update item called with incorrect parameters")
+
+    def test_save_partial_attributes_without_item_puts_item(self):
+        self.dynamodb_client.update_item.side_effect = (
+            ConditionalCheckFailedException("test exception"))
+
+        self.test_dynamodb_adapter.save_partial_attributes(
+            request_envelope=self.request_envelope,
+            attributes={"count": 3}, changed_keys={"count"},
+            removed_keys=set())
+
+        self.dynamodb_client.put_item.assert_called_once_with(
+            TableName="test_table", Item={
+                "id": {"S": "test_partition_key"},
+                "attributes": {"M": {"count": {"N": "3"}}}}), (
+            "DynamoDb client put item not called when item doesn't exist")
+
+    def test_delete_attributes(self):
+        self.test_dynamodb_adapter.delete_attributes(
+            request_envelope=self.request_envelope)
+
+        self.dynamodb_client.delete_item.assert_called_once_with(
+            TableName="test_table",
+            Key={"id": {"S": "test_partition_key"}}), (
+            "DynamoDb client delete item called with incorrect parameters")
+
+    def test_create_table(self):
+        DynamoDbClientAdapter(
+            table_name="test_table", create_table=True,
+            dynamodb_client=self.dynamodb_client)
+
+        self.dynamodb_client.create_table.assert_called_once_with(
+            TableName="test_table",
+            KeySchema=[{'AttributeName': 'id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[
+                {'AttributeName': 'id', 'AttributeType': 'S'}],
+            ProvisionedThroughput={
+                'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}), (
+            "DynamoDb client create table called with incorrect parameters")
+
+    def test_default_client_created_on_first_use(self):
+        self.dynamodb_client.get_item.return_value = {}
+
+        with mock.patch(
+                "boto3.client",
+                return_value=self.dynamodb_client) as mock_client:
+            test_dynamodb_adapter = DynamoDbClientAdapter(
+                table_name="test_table",
+                partition_keygen=self.partition_keygen)
+            mock_client.assert_not_called(), (
+                "DynamoDb client created during adapter initialization")
+
+            test_dynamodb_adapter.get_attributes(
+                request_envelope=self.request_envelope)
+
+        mock_client.assert_called_once_with("dynamodb"), (
+            "DynamoDb client not created on first use")
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import asyncio
+import functools
+import inspect
+import typing
+
+from .dispatch import ASYNC_COMPONENT_TYPES
+from .dispatch_components import (
+    GenericRequestMapper, GenericExceptionMapper, RequestInterceptorGroup)
+from .exceptions import DispatchException
+from .metrics import (
+    DispatchPhase, DispatchTimings, DISABLED_DISPATCH_TIMINGS,
+    attach_timings, report_timings)
+
+if typing.TYPE_CHECKING:
+    from typing import Union, TypeVar, Any, Callable, Optional
+    from concurrent.futures import Executor
+    from .skill import RuntimeConfiguration
+    from .dispatch_components import (
+        GenericRequestHandlerChain, AbstractExceptionHandler)
+    Input = TypeVar('Input')
+    Output = TypeVar('Output')
+
+
+class AsyncRequestDispatcher(object):
+    """Asyncio implementation of the request dispatcher.
+
+    The dispatcher follows the same flow as
+    :py:class:`ask_sdk_runtime.dispatch.GenericRequestDispatcher`, with
+    a coroutine ``dispatch`` method. Async components, i.e. instances of
+    :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractAsyncRequestHandler`,
+    :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractAsyncRequestInterceptor`,
+    :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractAsyncResponseInterceptor`
+    and
+    :py:class:`ask_sdk_runtime.dispatch_components.exception_components.AbstractAsyncExceptionHandler`,
+    are awaited on the event loop. The ``handle`` and ``process``
+    methods of synchronous components are run on the ``executor``, so
+    that they don't block the event loop. The ``can_handle`` methods of
+    synchronous handlers are expected to be cheap, and are called
+    directly.
+
+    Handler chains are looked up through the
+    ``get_candidate_handler_chains`` method of
+    :py:class:`ask_sdk_runtime.dispatch_components.request_components.GenericRequestMapper`
+    instances, so that async ``can_handle`` methods can be awaited.
+    Other request mappers are called synchronously.
+
+    Dispatch phases are timed and reported to the configured metrics
+    sinks, the same way as in the generic dispatcher.
+
+    :param options: Runtime configuration instance, containing list of
+        dispatch components required for Dispatcher Initialization.
+    :type options: RuntimeConfiguration
+    :param executor: Executor to run synchronous components on.
+        Defaulted to the default executor of the event loop.
+    :type executor: concurrent.futures.Executor
+    """
+
+    def __init__(self, options, executor=None):
+        # type: (RuntimeConfiguration, Optional[Executor]) -> None
+        """Asyncio implementation of the request dispatcher.
+
+        :param options: Runtime configuration instance, containing list
+            of dispatch components required for Dispatcher
+            Initialization.
+        :type options: RuntimeConfiguration
+        :param executor: Executor to run synchronous components on.
+            Defaulted to the default executor of the event loop.
+        :type executor: concurrent.futures.Executor
+        """
+        if options.handler_adapters is None:
+            options.handler_adapters = []
+
+        if options.request_mappers is None:
+            options.request_mappers = []
+
+        if options.request_interceptors is None:
+            options.request_interceptors = []
+
+        if options.response_interceptors is None:
+            options.response_interceptors = []
+
+        self.handler_adapters = options.handler_adapters
+        self.request_mappers = options.request_mappers
+        self.exception_mapper = options.exception_mapper
+        self.request_interceptors = options.request_interceptors
+        self.response_interceptors = options.response_interceptors
+        self.metrics_sinks = options.metrics_sinks
+        self.executor = executor
+
+    async def dispatch(self, handler_input):
+        # type: (Input) -> Union[Output, None]
+        """Dispatches an incoming request to the appropriate
+        request handler and returns the output.
+
+        Before running the request on the appropriate request handler,
+        dispatcher runs any predefined global request interceptors.
+        On successful response returned from request handler, dispatcher
+        runs predefined global response interceptors, before returning
+        the response.
+
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :return: generic output handled by the handler, optionally
+            containing a response
+        :rtype: Union[None, Output]
+        :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+        """
+        if not self.metrics_sinks:
+            return await self.__dispatch(
+                handler_input, DISABLED_DISPATCH_TIMINGS)
+
+        timings = DispatchTimings()
+        attach_timings(handler_input, timings)
+        start = timings.start()
+        try:
+            return await self.__dispatch(handler_input, timings)
+        finally:
+            timings.record(DispatchPhase.DISPATCH, start)
+            report_timings(self.metrics_sinks, timings)
+
+    async def __dispatch(self, handler_input, timings):
+        # type: (Input, DispatchTimings) -> Union[Output, None]
+        """Run the interceptors and the request handler on the input,
+        delegating any exception to the exception mapper.
+
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :param timings: Timings of the dispatch phases.
+        :type timings: ask_sdk_runtime.metrics.DispatchTimings
+        :return: generic output handled by the handler, optionally
+            containing a response
+        :rtype: Union[None, Output]
+        """
+        try:
+            start = timings.start()
+            for request_interceptor in self.request_interceptors:
+                if isinstance(request_interceptor, RequestInterceptorGroup):
+                    await self.__process_interceptor_group(
+                        request_interceptor, handler_input)
+                else:
+                    await self.__execute(
+                        request_interceptor, request_interceptor.process,
+                        handler_input=handler_input)
+            timings.record(DispatchPhase.GLOBAL_REQUEST_INTERCEPTORS, start)
+
+            output = await self.__dispatch_request(handler_input, timings)  # type: Union[Output, None]
+
+            start = timings.start()
+            for response_interceptor in self.response_interceptors:
+                await self.__execute(
+                    response_interceptor, response_interceptor.process,
+                    handler_input=handler_input, response=output)
+            timings.record(DispatchPhase.GLOBAL_RESPONSE_INTERCEPTORS, start)
+
+            return output
+        except Exception as e:
+            if self.exception_mapper is not None:
+                start = timings.start()
+                exception_handler = await self.__get_exception_handler(
+                    handler_input, e)
+                timings.record(DispatchPhase.EXCEPTION_MAPPING, start)
+                if exception_handler is None:
+                    raise e
+
+                timings.set_exception_handler(exception_handler)
+                start = timings.start()
+                try:
+                    return await self.__execute(
+                        exception_handler, exception_handler.handle,
+                        handler_input, e)
+                finally:
+                    timings.record(DispatchPhase.EXCEPTION_HANDLING, start)
+            else:
+                raise e
+
+    async def __execute(self, component, func, *args, **kwargs):
+        # type: (Any, Callable, *Any, **Any) -> Any
+        """Run a method of a dispatch component.
+
+        The method is called on the event loop and its result awaited,
+        if the component is an async component. Otherwise the method is
+        run on the dispatcher executor.
+
+        :param component: Dispatch component the method belongs to.
+        :type component: object
+        :param func: Method of the component to be run.
+        :type func: Callable
+        :return: Result of the method.
+        :rtype: object
+        """
+        return await self.__execute_on(
+            self.executor, component, func, *args, **kwargs)
+
+    async def __process_interceptor_group(self, interceptor_group,
+                                          handler_input):
+        # type: (RequestInterceptorGroup, Input) -> None
+        """Process the input on all interceptors of the group
+        concurrently.
+
+        Async interceptors of the group are gathered on the event loop
+        and synchronous ones are run on the thread pool of the group.
+        Once all of them finish, the exception raised by the first
+        failing interceptor, in registration order, is re-raised.
+
+        :param interceptor_group: Group of independent request
+            interceptors.
+        :type interceptor_group: RequestInterceptorGroup
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :rtype: None
+        """
+        results = await asyncio.gather(
+            *[self.__execute_on(
+                interceptor_group.executor, interceptor,
+                interceptor.process, handler_input=handler_input)
+              for interceptor in interceptor_group.request_interceptors],
+            return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def __execute_on(self, executor, component, func, *args,
+                           **kwargs):
+        # type: (Optional[Executor], Any, Callable, *Any, **Any) -> Any
+        """Run a method of a dispatch component, using the provided
+        executor for synchronous components.
+
+        :param executor: Executor to run synchronous components on.
+        :type executor: concurrent.futures.Executor
+        :param component: Dispatch component the method belongs to.
+        :type component: object
+        :param func: Method of the component to be run.
+        :type func: Callable
+        :return: Result of the method.
+        :rtype: object
+        """
+        if isinstance(component, ASYNC_COMPONENT_TYPES):
+            return await _resolve(func(*args, **kwargs))
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(func, *args, **kwargs))
+
+    async def __dispatch_request(self, handler_input, timings):
+        # type: (Input, DispatchTimings) -> Union[Output, None]
+        """Process the request and return handler output.
+
+        :param handler_input: generic input to the dispatcher containing
+            incoming request and other context.
+        :type handler_input: Input
+        :param timings: Timings of the dispatch phases.
+        :type timings: ask_sdk_runtime.metrics.DispatchTimings
+        :return: Output from the 'handle' method execution of the
+            supporting handler.
+        :rtype: Union[None, Output]
+        :raises DispatchException if there is no supporting
+            handler chain or adapter
+        """
+        start = timings.start()
+        request_handler_chain = await self.__get_request_handler_chain(
+            handler_input)
+        timings.record(DispatchPhase.REQUEST_MAPPING, start)
+
+        if request_handler_chain is None:
+            raise DispatchException(
+                "Unable to find a suitable request handler")
+
+        request_handler = request_handler_chain.request_handler
+        timings.set_request_handler(request_handler)
+
+        start = timings.start()
+        supported_handler_adapter = None
+        for adapter in self.handler_adapters:
+            if adapter.supports(request_handler):
+                supported_handler_adapter = adapter
+                break
+        timings.record(DispatchPhase.HANDLER_ADAPTER_RESOLUTION, start)
+
+        if supported_handler_adapter is None:
+            raise DispatchException(
+                "Unable to find a suitable request adapter")
+
+        start = timings.start()
+        local_request_interceptors = request_handler_chain.request_interceptors
+        for interceptor in local_request_interceptors:
+            await self.__execute(
+                interceptor, interceptor.process, handler_input=handler_input)
+        timings.record(DispatchPhase.LOCAL_REQUEST_INTERCEPTORS, start)
+
+        start = timings.start()
+        output = await self.__execute(
+            request_handler, supported_handler_adapter.execute,
+            handler_input=handler_input, handler=request_handler)  # type: Union[Output, None]
+        timings.record(DispatchPhase.HANDLER_EXECUTION, start)
+
+        start = timings.start()
+        local_response_interceptors = (
+            request_handler_chain.response_interceptors)
+        for response_interceptor in local_response_interceptors:
+            await self.__execute(
+                response_interceptor, response_interceptor.process,
+                handler_input=handler_input, response=output)
+        timings.record(DispatchPhase.LOCAL_RESPONSE_INTERCEPTORS, start)
+
+        return output
+
+    async def __get_request_handler_chain(self, handler_input):
+        # type: (Input) -> Optional[GenericRequestHandlerChain]
+        """Find the first handler chain that can handle the input,
+        awaiting async ``can_handle`` methods.
+
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :return: Handler Chain that can handle the input.
+        :rtype: Union[None, GenericRequestHandlerChain]
+        """
+        for mapper in self.request_mappers:
+            if isinstance(mapper, GenericRequestMapper):
+                for chain in mapper.get_candidate_handler_chains(
+                        handler_input):
+                    if await _resolve(chain.request_handler.can_handle(
+                            handler_input=handler_input)):
+                        return chain
+            else:
+                request_handler_chain = mapper.get_request_handler_chain(
+                    handler_input)
+                if request_handler_chain is not None:
+                    return request_handler_chain
+        return None
+
+    async def __get_exception_handler(self, handler_input, exception):
+        # type: (Input, Exception) -> Optional[AbstractExceptionHandler]
+        """Find the first exception handler that can handle the input
+        and exception, awaiting async ``can_handle`` methods.
+
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :param exception: Exception raised during dispatch.
+        :type exception: Exception
+        :return: Exception Handler that can handle the input or None.
+        :rtype: Union[None, AbstractExceptionHandler]
+        """
+        exception_mapper = self.exception_mapper
+        if not isinstance(exception_mapper, GenericExceptionMapper):
+            return exception_mapper.get_handler(handler_input, exception)
+
+        for handler in exception_mapper.get_candidate_handlers(exception):
+            if await _resolve(handler.can_handle(
+                    handler_input=handler_input, exception=exception)):
+                return handler
+        return None
+
+
+async def _resolve(result):
+    # type: (Any) -> Any
+    """Await the result if it is awaitable."""
+    if inspect.isawaitable(result):
+        return await result
+    return result
@@ -15,18 +15,34 @@
 # specific language governing permissions and limitations under the
 # License.
 #
+import functools
 import typing
 from abc import ABCMeta, abstractmethod
 
+from .dispatch_components import (
+    GenericRequestMapper, GenericHandlerAdapter, AbstractAsyncRequestHandler,
+    AbstractAsyncRequestInterceptor, AbstractAsyncResponseInterceptor,
+    AbstractAsyncExceptionHandler)
 from .exceptions import DispatchException
+from .metrics import (
+    DispatchPhase, DispatchTimings, DISABLED_DISPATCH_TIMINGS,
+    attach_timings, report_timings)
 
 if typing.TYPE_CHECKING:
-    from typing import Union, TypeVar
+    from typing import (
+        Union, TypeVar, Tuple, Dict, Callable, Any, Optional, List)
     from .skill import RuntimeConfiguration
+    from .dispatch_components.request_components import (
+        AbstractRequestMapper, GenericRequestHandlerChain)
     Input = TypeVar('Input')
     Output = TypeVar('Output')
 
 
+ASYNC_COMPONENT_TYPES = (
+    AbstractAsyncRequestHandler, AbstractAsyncRequestInterceptor,
+    AbstractAsyncResponseInterceptor, AbstractAsyncExceptionHandler)
+
+
 class AbstractRequestDispatcher(object):
     """Dispatcher which handles dispatching input request to the
     corresponding handler.
@@ -65,6 +81,16 @@ class GenericRequestDispatcher(AbstractRequestDispatcher):
     . If the handler raises any exception, it is delegated to
     :py:class:`ask_sdk_runtime.dispatch_components.exception_components.ExceptionMapper`
     to handle or raise it to the upper stack.
+
+    If metrics sinks are configured, the dispatch phases are timed.
+    The :py:class:`ask_sdk_runtime.metrics.DispatchTimings` are
+    attached to the input as ``dispatch_timings`` and reported to the
+    sinks at the end of the dispatch.
+
+    Async dispatch components can only be dispatched by
+    :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`.
+    A :py:class:`ask_sdk_runtime.exceptions.DispatchException` is
+    raised when the dispatcher finds one, instead of running it.
     """
 
     def __init__(self, options):
@@ -92,6 +118,7 @@ class GenericRequestDispatcher(AbstractRequestDispatcher):
         self.exception_mapper = options.exception_mapper
         self.request_interceptors = options.request_interceptors
         self.response_interceptors = options.response_interceptors
+        self.metrics_sinks = options.metrics_sinks
 
     def dispatch(self, handler_input):
         # type: (Input) -> Union[Output, None]
@@ -111,29 +138,69 @@ class GenericRequestDispatcher(AbstractRequestDispatcher):
         :rtype: Union[None, Output]
         :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
         """
+        if not self.metrics_sinks:
+            return self.__dispatch(handler_input, DISABLED_DISPATCH_TIMINGS)
+
+        timings = DispatchTimings()
+        attach_timings(handler_input, timings)
+        start = timings.start()
+        try:
+            return self.__dispatch(handler_input, timings)
+        finally:
+            timings.record(DispatchPhase.DISPATCH, start)
+            report_timings(self.metrics_sinks, timings)
+
+    def __dispatch(self, handler_input, timings):
+        # type: (Input, DispatchTimings) -> Union[Output, None]
+        """Run the interceptors and the request handler on the input,
+        delegating any exception to the exception mapper.
+
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :param timings: Timings of the dispatch phases.
+        :type timings: ask_sdk_runtime.metrics.DispatchTimings
+        :return: generic output handled by the handler, optionally
+            containing a response
+        :rtype: Union[None, Output]
+        """
         try:
+            start = timings.start()
             for request_interceptor in self.request_interceptors:
+                _check_sync_component(request_interceptor)
                 request_interceptor.process(handler_input=handler_input)
+            timings.record(DispatchPhase.GLOBAL_REQUEST_INTERCEPTORS, start)
 
-            output = self.__dispatch_request(handler_input)  # type: Union[Output, None]
+            output = self.__dispatch_request(handler_input, timings)  # type: Union[Output, None]
 
+            start = timings.start()
             for response_interceptor in self.response_interceptors:
+                _check_sync_component(response_interceptor)
                 response_interceptor.process(
                     handler_input=handler_input, response=output)
+            timings.record(DispatchPhase.GLOBAL_RESPONSE_INTERCEPTORS, start)
 
             return output
         except Exception as e:
             if self.exception_mapper is not None:
+                start = timings.start()
                 exception_handler = self.exception_mapper.get_handler(
                     handler_input, e)
+                timings.record(DispatchPhase.EXCEPTION_MAPPING, start)
                 if exception_handler is None:
                     raise e
-                return exception_handler.handle(handler_input, e)
+                _check_sync_component(exception_handler)
+
+                timings.set_exception_handler(exception_handler)
+                start = timings.start()
+                try:
+                    return exception_handler.handle(handler_input, e)
+                finally:
+                    timings.record(DispatchPhase.EXCEPTION_HANDLING, start)
             else:
                 raise e
 
-    def __dispatch_request(self, handler_input):
-        # type: (Input) -> Union[Output, None]
+    def __dispatch_request(self, handler_input, timings):
+        # type: (Input, DispatchTimings) -> Union[Output, None]
         """Process the request and return handler output.
 
         When the method is invoked, using the registered list of
@@ -147,45 +214,345 @@ class GenericRequestDispatcher(AbstractRequestDispatcher):
         :param handler_input: generic input to the dispatcher containing
             incoming request and other context.
         :type handler_input: Input
+        :param timings: Timings of the dispatch phases.
+        :type timings: ask_sdk_runtime.metrics.DispatchTimings
         :return: Output from the 'handle' method execution of the
             supporting handler.
         :rtype: Union[None, Output]
         :raises DispatchException if there is no supporting
             handler chain or adapter
         """
+        start = timings.start()
         request_handler_chain = None
         for mapper in self.request_mappers:
             request_handler_chain = mapper.get_request_handler_chain(
                 handler_input)
             if request_handler_chain is not None:
                 break
+        timings.record(DispatchPhase.REQUEST_MAPPING, start)
 
         if request_handler_chain is None:
             raise DispatchException(
                 "Unable to find a suitable request handler")
 
         request_handler = request_handler_chain.request_handler
+        _check_sync_component(request_handler)
+        timings.set_request_handler(request_handler)
+
+        start = timings.start()
         supported_handler_adapter = None
         for adapter in self.handler_adapters:
             if adapter.supports(request_handler):
                 supported_handler_adapter = adapter
                 break
+        timings.record(DispatchPhase.HANDLER_ADAPTER_RESOLUTION, start)
 
         if supported_handler_adapter is None:
             raise DispatchException(
                 "Unable to find a suitable request adapter")
 
+        start = timings.start()
         local_request_interceptors = request_handler_chain.request_interceptors
         for interceptor in local_request_interceptors:
+            _check_sync_component(interceptor)
             interceptor.process(handler_input=handler_input)
+        timings.record(DispatchPhase.LOCAL_REQUEST_INTERCEPTORS, start)
 
+        start = timings.start()
         output = supported_handler_adapter.execute(
             handler_input=handler_input, handler=request_handler)  # type: Union[Output, None]
+        timings.record(DispatchPhase.HANDLER_EXECUTION, start)
 
+        start = timings.start()
         local_response_interceptors = (
             request_handler_chain.response_interceptors)
         for response_interceptor in local_response_interceptors:
+            _check_sync_component(response_interceptor)
             response_interceptor.process(
                 handler_input=handler_input, response=output)
+        timings.record(DispatchPhase.LOCAL_RESPONSE_INTERCEPTORS, start)
 
         return output
+
+
+class FrozenRequestDispatcher(GenericRequestDispatcher):
+    """Implementation of :py:class:`GenericRequestDispatcher` working on
+    a pipeline precompiled from the runtime configuration.
+
+    The components are resolved once, during initialization, instead
+    of on every dispatch:
+
+    - the supported handler adapter is resolved for every registered
+      request handler,
+    - the handler chains are flattened into tuples of the bound
+      ``can_handle``, ``handle`` and interceptor ``process`` methods,
+    - the global interceptor lists are stored as tuples, and empty
+      phases are skipped.
+
+    Interceptors, adapters and handler chains registered after
+    initialization are not picked up, apart from the chains looked up
+    through ``get_candidate_handler_chains`` of
+    :py:class:`ask_sdk_runtime.dispatch_components.request_components.GenericRequestMapper`
+    subclasses, such as the indexed request mapper, which are compiled
+    on first use. Handler chains returned by other request mappers are
+    compiled on every dispatch.
+
+    When metrics sinks are configured, dispatch falls back to the
+    instrumented :py:class:`GenericRequestDispatcher` flow.
+
+    :param options: Runtime configuration instance, containing list of
+        dispatch components required for Dispatcher Initialization.
+    :type options: RuntimeConfiguration
+    """
+
+    def __init__(self, options):
+        # type: (RuntimeConfiguration) -> None
+        """Implementation of :py:class:`GenericRequestDispatcher`
+        working on a pipeline precompiled from the runtime
+        configuration.
+
+        :param options: Runtime configuration instance, containing list
+            of dispatch components required for Dispatcher
+            Initialization.
+        :type options: RuntimeConfiguration
+        """
+        super(FrozenRequestDispatcher, self).__init__(options=options)
+        self._request_interceptors = tuple(
+            _get_sync_process(interceptor)
+            for interceptor in self.request_interceptors)
+        self._response_interceptors = tuple(
+            _get_sync_process(interceptor)
+            for interceptor in self.response_interceptors)
+        self._compiled_chains = {}  # type: Dict[int, Tuple[GenericRequestHandlerChain, Tuple]]
+        self._request_mappers = tuple(
+            self.__compile_mapper(mapper)
+            for mapper in self.request_mappers)
+
+    def dispatch(self, handler_input):
+        # type: (Input) -> Union[Output, None]
+        """Dispatches an incoming request to the appropriate
+        request handler and returns the output, through the
+        precompiled pipeline.
+
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :return: generic output handled by the handler, optionally
+            containing a response
+        :rtype: Union[None, Output]
+        :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+        """
+        if self.metrics_sinks:
+            return super(FrozenRequestDispatcher, self).dispatch(
+                handler_input)
+
+        try:
+            if self._request_interceptors:
+                for process in self._request_interceptors:
+                    process(handler_input=handler_input)
+
+            output = self.__dispatch_request(handler_input)  # type: Union[Output, None]
+
+            if self._response_interceptors:
+                for process_response in self._response_interceptors:
+                    process_response(
+                        handler_input=handler_input, response=output)
+
+            return output
+        except Exception as e:
+            if self.exception_mapper is not None:
+                exception_handler = self.exception_mapper.get_handler(
+                    handler_input, e)
+                if exception_handler is None:
+                    raise e
+                _check_sync_component(exception_handler)
+                return exception_handler.handle(handler_input, e)
+            else:
+                raise e
+
+    def __dispatch_request(self, handler_input):
+        # type: (Input) -> Union[Output, None]
+        """Find the compiled handler chain that can handle the input,
+        and run it.
+
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :return: Output from the 'handle' method execution of the
+            supporting handler.
+        :rtype: Union[None, Output]
+        :raises DispatchException if there is no supporting
+            handler chain or adapter
+        """
+        compiled_chain = None
+        for mapper, compiled_chains in self._request_mappers:
+            if compiled_chains is None:
+                compiled_chain = self.__get_compiled_chain(
+                    mapper, handler_input)
+            else:
+                for chain in compiled_chains:
+                    if chain[0](handler_input=handler_input):
+                        compiled_chain = chain
+                        break
+            if compiled_chain is not None:
+                break
+
+        if compiled_chain is None:
+            raise DispatchException(
+                "Unable to find a suitable request handler")
+
+        (_, execute, local_request_interceptors,
+         local_response_interceptors) = compiled_chain
+
+        if execute is None:
+            raise DispatchException(
+                "Unable to find a suitable request adapter")
+
+        if local_request_interceptors:
+            for process in local_request_interceptors:
+                process(handler_input=handler_input)
+
+        output = execute(handler_input)  # type: Union[Output, None]
+
+        if local_response_interceptors:
+            for process_response in local_response_interceptors:
+                process_response(handler_input=handler_input, response=output)
+
+        return output
+
+    def __compile_mapper(self, mapper):
+        # type: (AbstractRequestMapper) -> Tuple[AbstractRequestMapper, Optional[Tuple[Tuple, ...]]]
+        """Compile the handler chains of the request mapper.
+
+        The chains of a plain
+        :py:class:`ask_sdk_runtime.dispatch_components.request_components.GenericRequestMapper`
+        are compiled into a tuple, checked in order. For other
+        :py:class:`ask_sdk_runtime.dispatch_components.request_components.GenericRequestMapper`
+        implementations, the compiled chains are looked up from their
+        candidate chains on dispatch.
+
+        :param mapper: Request mapper to compile.
+        :type mapper: AbstractRequestMapper
+        :return: Request mapper and its compiled chains, if the chains
+            are checked in order.
+        :rtype: tuple
+        """
+        if not isinstance(mapper, GenericRequestMapper):
+            return mapper, None
+
+        compiled_chains = tuple(
+            self.__compile_chain(chain)
+            for chain in mapper.request_handler_chains)
+        if type(mapper) is GenericRequestMapper:
+            return mapper, compiled_chains
+        return mapper, None
+
+    def __compile_chain(self, chain, cache=True):
+        # type: (GenericRequestHandlerChain, bool) -> Tuple
+        """Compile the handler chain into a tuple of the bound
+        ``can_handle`` method, the execute callable of the supported
+        adapter, and the bound ``process`` methods of the local request
+        and response interceptors.
+
+        :param chain: Request handler chain to compile.
+        :type chain: GenericRequestHandlerChain
+        :param cache: Cache the compiled chain for the chain instance.
+        :type cache: bool
+        :return: Compiled handler chain.
+        :rtype: tuple
+        """
+        if cache:
+            cached = self._compiled_chains.get(id(chain))
+            if cached is not None:
+                return cached[1]
+
+        request_handler = chain.request_handler
+        execute = None  # type: Optional[Callable[[Any], Any]]
+        for adapter in self.handler_adapters:
+            if adapter.supports(request_handler):
+                if isinstance(request_handler, ASYNC_COMPONENT_TYPES):
+                    execute = functools.partial(
+                        _raise_async_component, request_handler)
+                elif type(adapter) is GenericHandlerAdapter:
+                    execute = request_handler.handle
+                else:
+                    execute = functools.partial(
+                        _execute_adapter, adapter, request_handler)
+                break
+
+        compiled_chain = (
+            request_handler.can_handle, execute,
+            tuple(_get_sync_process(interceptor)
+                  for interceptor in chain.request_interceptors),
+            tuple(_get_sync_process(interceptor)
+                  for interceptor in chain.response_interceptors))
+        if cache:
+            # The chain is kept referenced, so that its id isn't reused
+            self._compiled_chains[id(chain)] = (chain, compiled_chain)
+        return compiled_chain
+
+    def __get_compiled_chain(self, mapper, handler_input):
+        # type: (AbstractRequestMapper, Input) -> Optional[Tuple]
+        """Look up the compiled chain that can handle the input, from a
+        request mapper that wasn't compiled into an ordered tuple.
+
+        :param mapper: Request mapper to look up the chain from.
+        :type mapper: AbstractRequestMapper
+        :param handler_input: generic input to the dispatcher
+        :type handler_input: Input
+        :return: Compiled handler chain that can handle the input.
+        :rtype: Optional[tuple]
+        """
+        if isinstance(mapper, GenericRequestMapper):
+            for chain in mapper.get_candidate_handler_chains(handler_input):
+                compiled_chain = self.__compile_chain(chain)
+                if compiled_chain[0](handler_input=handler_input):
+                    return compiled_chain
+            return None
+
+        request_handler_chain = mapper.get_request_handler_chain(
+            handler_input)
+        if request_handler_chain is None:
+            return None
+        return self.__compile_chain(
+            typing.cast("GenericRequestHandlerChain", request_handler_chain),
+            cache=False)
+
+
+def _check_sync_component(component):
+    # type: (Any) -> None
+    """Check that the dispatch component can be run by the
+    synchronous dispatchers.
+
+    :param component: Dispatch component to be run.
+    :type component: object
+    :rtype: None
+    :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+        if the component is an async component
+    """
+    if isinstance(component, ASYNC_COMPONENT_TYPES):
+        _raise_async_component(component)
+
+
+def _raise_async_component(component, *args, **kwargs):
+    # type: (Any, *Any, **Any) -> Any
+    """Raise the exception for an async component found by the
+    synchronous dispatchers."""
+    raise DispatchException(
+        "{} is an async dispatch component, which can only be dispatched "
+        "by AsyncRequestDispatcher, e.g. through invoke_async of the "
+        "skill".format(type(component).__name__))
+
+
+def _get_sync_process(interceptor):
+    # type: (Any) -> Callable[..., Any]
+    """Get the ``process`` method of the interceptor, or a callable
+    raising the exception for async components, for the precompiled
+    pipeline."""
+    if isinstance(interceptor, ASYNC_COMPONENT_TYPES):
+        return functools.partial(_raise_async_component, interceptor)
+    return interceptor.process
+
+
+def _execute_adapter(adapter, handler, handler_input):
+    # type: (Any, Any, Any) -> Any
+    """Execute the handler on the input through the handler adapter."""
+    return adapter.execute(handler_input=handler_input, handler=handler)
@@ -21,7 +21,10 @@
 
 from .request_components import (
     AbstractRequestHandler, AbstractRequestInterceptor,
-    AbstractResponseInterceptor, GenericHandlerAdapter,
-    GenericRequestMapper, GenericRequestHandlerChain)
+    AbstractResponseInterceptor, AbstractAsyncRequestHandler,
+    AbstractAsyncRequestInterceptor, AbstractAsyncResponseInterceptor,
+    GenericHandlerAdapter, GenericRequestMapper, GenericRequestHandlerChain,
+    IndexedRequestMapper, RequestInterceptorGroup)
 from .exception_components import (
-    AbstractExceptionHandler, GenericExceptionMapper)
+    AbstractExceptionHandler, AbstractAsyncExceptionHandler,
+    GenericExceptionMapper)
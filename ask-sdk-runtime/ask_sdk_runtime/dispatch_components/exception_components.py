@@ -16,7 +16,8 @@
 # License.
 #
 from abc import ABCMeta, abstractmethod
-from typing import TypeVar, Generic, Union, List
+from typing import (
+    TypeVar, Generic, Union, List, Awaitable, Dict, Tuple, Optional)
 
 from ..exceptions import DispatchException
 
@@ -31,6 +32,12 @@ class AbstractExceptionHandler(Generic[Input, Output]):
     can_handle and handle. The ``can_handle`` method checks if the handler
     can support the input and the exception. The ``handle`` method
     processes the input and exception, to optionally produce an output.
+
+    Handlers that only support a specific exception class can declare
+    it as an ``exception_type`` class attribute.
+    :py:class:`GenericExceptionMapper` indexes such handlers on the
+    exception class, and checks them only for exceptions of that class
+    or its subclasses.
     """
     __metaclass__ = ABCMeta
 
@@ -66,6 +73,49 @@ class AbstractExceptionHandler(Generic[Input, Output]):
         raise NotImplementedError
 
 
+class AbstractAsyncExceptionHandler(AbstractExceptionHandler):
+    """Exception Handler with coroutine ``can_handle`` and ``handle``
+    methods.
+
+    Async exception handlers are dispatched by
+    :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`,
+    which awaits the coroutines returned by ``can_handle`` and
+    ``handle``, instead of running them on an executor.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def can_handle(self, handler_input, exception):  # type: ignore
+        # type: (Input, Exception) -> Awaitable[bool]
+        """Coroutine checking if the handler can support the exception
+        raised during dispatch.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :param exception: Exception raised during dispatch.
+        :type exception: Exception
+        :return: Boolean whether handler can handle exception or not.
+        :rtype: Awaitable[bool]
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def handle(self, handler_input, exception):  # type: ignore
+        # type: (Input, Exception) -> Awaitable[Union[Output, None]]
+        """Coroutine processing the dispatch input and exception.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :param exception: Exception raised during dispatch.
+        :type exception: Exception
+        :return: Optional output object to serve as dispatch return.
+        :rtype: Awaitable[Union[None, Output]]
+        """
+        raise NotImplementedError
+
+
 class AbstractExceptionMapper(Generic[Input]):
     """Mapper to register custom Exception Handler instances.
 
@@ -107,6 +157,15 @@ class GenericExceptionMapper(AbstractExceptionMapper):
     handle the dispatch input and the exception raised from the dispatch
     method.
 
+    Exception handlers declaring an ``exception_type`` attribute are
+    only checked for exceptions of that class and its subclasses. For
+    an exception, the handlers without an ``exception_type`` and the
+    handlers whose ``exception_type`` matches the exception are checked
+    in registration order, so the first registered handler that can
+    handle the exception wins, whether it declares an
+    ``exception_type`` or not. The matching handlers are cached per
+    exception class.
+
     :param exception_handlers: List of
         :py:class:`ask_sdk_runtime.dispatch_components.exception_components.AbstractExceptionHandler`
         instances.
@@ -156,6 +215,8 @@ class GenericExceptionMapper(AbstractExceptionMapper):
             any object inside the input list is of invalid type
         """
         self._exception_handlers = []  # type: List
+        self._handler_types = []  # type: List[Tuple[AbstractExceptionHandler, Optional[type]]]
+        self._candidates_cache = {}  # type: Dict[type, Tuple[AbstractExceptionHandler, ...]]
         if exception_handlers is not None:
             for handler in exception_handlers:
                 self.add_exception_handler(exception_handler=handler)
@@ -174,7 +235,42 @@ class GenericExceptionMapper(AbstractExceptionMapper):
                 exception_handler, AbstractExceptionHandler):
             raise DispatchException(
                 "Input is not an AbstractExceptionHandler instance")
+
+        exception_type = getattr(exception_handler, "exception_type", None)
+        if exception_type is not None and not (
+                isinstance(exception_type, type) and
+                issubclass(exception_type, BaseException)):
+            raise DispatchException(
+                "Exception Handler exception_type should be an exception "
+                "class")
+
+        self._handler_types.append((exception_handler, exception_type))
         self._exception_handlers.append(exception_handler)
+        self._candidates_cache = {}
+
+    def get_candidate_handlers(self, exception):
+        # type: (Exception) -> Tuple[AbstractExceptionHandler, ...]
+        """Get the exception handlers that are checked for the
+        exception, in the order they are checked.
+
+        :param exception: Exception thrown by the dispatcher.
+        :type exception: Exception
+        :return: Handlers without an ``exception_type``, and handlers
+            whose ``exception_type`` is in the MRO of the exception
+            class, in registration order.
+        :rtype: tuple(
+            ask_sdk_runtime.dispatch_components.exception_components.AbstractExceptionHandler)
+        """
+        exception_class = type(exception)
+        candidates = self._candidates_cache.get(exception_class)
+        if candidates is None:
+            exception_classes = set(exception_class.__mro__)
+            candidates = tuple(
+                handler for handler, exception_type in self._handler_types
+                if exception_type is None or
+                exception_type in exception_classes)
+            self._candidates_cache[exception_class] = candidates
+        return candidates
 
     def get_handler(self, handler_input, exception):
         # type: (Input, Exception) -> Union[AbstractExceptionHandler, None]
@@ -191,7 +287,7 @@ class GenericExceptionMapper(AbstractExceptionMapper):
         :return: Exception Handler that can handle the input or None.
         :rtype: Union[None, ask_sdk_runtime.dispatch_components.exception_components.AbstractExceptionHandler]
         """
-        for handler in self.exception_handlers:
+        for handler in self.get_candidate_handlers(exception):
             if handler.can_handle(
                     handler_input=handler_input, exception=exception):
                 return handler
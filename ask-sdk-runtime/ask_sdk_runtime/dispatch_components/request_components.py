@@ -15,8 +15,13 @@
 # specific language governing permissions and limitations under the
 # License.
 #
+import functools
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import Union, List, TypeVar, Generic, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import (
+    Union, List, TypeVar, Generic, Optional, Callable, Dict, Tuple, Hashable,
+    Iterable, Any, Awaitable, Sequence)
 
 from ..exceptions import DispatchException
 
@@ -110,6 +115,213 @@ class AbstractResponseInterceptor(Generic[Input, Output]):
         raise NotImplementedError
 
 
+class AbstractAsyncRequestHandler(AbstractRequestHandler):
+    """Request Handler with coroutine ``can_handle`` and ``handle``
+    methods.
+
+    Async request handlers are dispatched by
+    :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`,
+    which awaits the coroutines returned by ``can_handle`` and
+    ``handle``, instead of running them on an executor.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def can_handle(self, handler_input):  # type: ignore
+        # type: (Input) -> Awaitable[bool]
+        """Coroutine returning true if Request Handler can handle the
+        dispatch input.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :return: Boolean value that tells the dispatcher if the
+            current input can be handled by this handler.
+        :rtype: Awaitable[bool]
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def handle(self, handler_input):  # type: ignore
+        # type: (Input) -> Awaitable[Union[None, Output]]
+        """Coroutine handling the dispatch input and providing an
+        output for dispatcher to return.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :return: Generic Output for the dispatcher to return or None
+        :rtype: Awaitable[Union[Output, None]]
+        """
+        raise NotImplementedError
+
+
+class AbstractAsyncRequestInterceptor(AbstractRequestInterceptor):
+    """Interceptor with a coroutine ``process`` method, that runs
+    before the handler is called.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def process(self, handler_input):  # type: ignore
+        # type: (Input) -> Awaitable[None]
+        """Coroutine processing the input before the Handler is run.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :rtype: Awaitable[None]
+        """
+        raise NotImplementedError
+
+
+class AbstractAsyncResponseInterceptor(AbstractResponseInterceptor):
+    """Interceptor with a coroutine ``process`` method, that runs
+    after the handler is called.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def process(self, handler_input, response):  # type: ignore
+        # type: (Input, Output) -> Awaitable[None]
+        """Coroutine processing the input and the output after the
+        Handler is run.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :param response: Execution result of the Handler on
+            dispatch input.
+        :type response: Union[None, Output]
+        :rtype: Awaitable[None]
+        """
+        raise NotImplementedError
+
+
+class RequestInterceptorGroup(AbstractRequestInterceptor):
+    """Group of independent request interceptors that are processed
+    concurrently.
+
+    The interceptors in the group shouldn't depend on each other's
+    side effects, since their ``process`` methods are run together on
+    a bounded thread pool, owned by the group. Processing of the group
+    finishes only after every interceptor in it has finished. If any
+    of the interceptors raise an exception, the exception raised by
+    the first of them, in registration order, is re-raised, so that it
+    is passed to the exception mapper irrespective of the completion
+    order.
+
+    :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`
+    gathers the interceptors of the group as coroutines instead. Groups
+    containing async interceptors can only be processed by it, and
+    raise a :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+    when processed by the synchronous dispatchers.
+
+    :param request_interceptors: Independent request interceptors to
+        be processed concurrently.
+    :type request_interceptors: list(AbstractRequestInterceptor)
+    :param max_workers: Maximum number of threads used for processing
+        the group. Defaulted to the number of interceptors.
+    :type max_workers: int
+    :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+        if the interceptors or max workers are invalid
+    """
+
+    def __init__(self, request_interceptors, max_workers=None):
+        # type: (List[AbstractRequestInterceptor], Optional[int]) -> None
+        """Group of independent request interceptors that are
+        processed concurrently.
+
+        :param request_interceptors: Independent request interceptors
+            to be processed concurrently.
+        :type request_interceptors: list(AbstractRequestInterceptor)
+        :param max_workers: Maximum number of threads used for
+            processing the group. Defaulted to the number of
+            interceptors.
+        :type max_workers: int
+        :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+            if the interceptors or max workers are invalid
+        """
+        if not request_interceptors:
+            raise DispatchException(
+                "Request Interceptor Group should contain at least one "
+                "Request Interceptor")
+
+        for request_interceptor in request_interceptors:
+            if not isinstance(
+                    request_interceptor, AbstractRequestInterceptor):
+                raise DispatchException(
+                    "Input should be a list of RequestInterceptor "
+                    "instances")
+
+        if max_workers is not None and max_workers < 1:
+            raise DispatchException(
+                "Max workers of Request Interceptor Group should be a "
+                "positive integer")
+
+        self.request_interceptors = list(request_interceptors)
+        self._async_interceptor_names = [
+            type(request_interceptor).__name__
+            for request_interceptor in request_interceptors
+            if isinstance(
+                request_interceptor, AbstractAsyncRequestInterceptor)]
+        self.max_workers = max_workers or len(request_interceptors)
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self):
+        # type: () -> ThreadPoolExecutor
+        """Thread pool used for processing the group, created on first
+        use.
+
+        :return: Thread pool executor bounded by max workers.
+        :rtype: concurrent.futures.ThreadPoolExecutor
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers)
+        return self._executor
+
+    def process(self, handler_input):
+        # type: (Input) -> None
+        """Process the input on all interceptors of the group
+        concurrently.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :rtype: None
+        :raises: Exception raised by the first failing interceptor, in
+            registration order.
+            :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+            if the group contains async interceptors.
+        """
+        if self._async_interceptor_names:
+            raise DispatchException(
+                "Request Interceptor Group contains async interceptors {}, "
+                "which can only be dispatched by AsyncRequestDispatcher, "
+                "e.g. through invoke_async of the skill".format(
+                    ", ".join(self._async_interceptor_names)))
+
+        if len(self.request_interceptors) == 1:
+            self.request_interceptors[0].process(handler_input=handler_input)
+            return
+
+        futures = [
+            self.executor.submit(functools.partial(
+                request_interceptor.process, handler_input=handler_input))
+            for request_interceptor in self.request_interceptors]
+        wait(futures)
+
+        for future in futures:
+            exception = future.exception()
+            if exception is not None:
+                raise exception
+
+
 class AbstractRequestHandlerChain(object):
     """Abstract class containing Request Handler and corresponding
     Interceptors.
@@ -360,12 +572,171 @@ class GenericRequestMapper(AbstractRequestMapper):
         :return: Handler Chain that can handle the input.
         :rtype: Union[None, GenericRequestHandlerChain]
         """
-        for chain in self.request_handler_chains:
+        for chain in self.get_candidate_handler_chains(handler_input):
             handler = chain.request_handler  # type: AbstractRequestHandler
             if handler.can_handle(handler_input=handler_input):
                 return chain
         return None
 
+    def get_candidate_handler_chains(self, handler_input):
+        # type: (Input) -> Sequence[GenericRequestHandlerChain]
+        """Get the request handler chains that are checked for the
+        dispatch input, in registration order.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :return: Handler Chains whose handlers are checked with
+            ``can_handle``, in order.
+        :rtype: Sequence[GenericRequestHandlerChain]
+        """
+        return self.request_handler_chains
+
+
+class IndexedRequestMapper(GenericRequestMapper):
+    """Implementation of :py:class:`GenericRequestMapper` that routes
+    inputs through a routing key index instead of a linear scan.
+
+    Request handlers can declare the input they match on, through an
+    optional ``routing_key`` attribute holding a hashable value. The
+    ``routing_keys_func`` provided to the mapper, returns the keys
+    that the dispatch input matches on. Handler chains are bucketed by
+    the routing key of their handler, while handlers without a
+    ``routing_key`` are kept for the ordered linear scan.
+
+    For every distinct set of indexed keys, the candidate chains from
+    the matching buckets and the non indexed chains are merged in
+    registration order and cached. The ``can_handle`` method is then
+    called on the candidates only, so that the first match semantics
+    are identical to :py:class:`GenericRequestMapper`.
+
+    :param request_handler_chains: List of
+            :py:class:`GenericRequestHandlerChain` instances.
+    :type request_handler_chains: list(GenericRequestHandlerChain)
+    :param routing_keys_func: Callable that takes the dispatch input
+        and returns the routing keys it matches on.
+    :type routing_keys_func: Callable[[Input], Iterable[Hashable]]
+    """
+
+    def __init__(self, request_handler_chains, routing_keys_func):
+        # type: (List[GenericRequestHandlerChain], Callable[[Any], Iterable[Hashable]]) -> None
+        """Implementation of :py:class:`GenericRequestMapper` that
+        routes inputs through a routing key index.
+
+        :param request_handler_chains: List of
+            :py:class:`GenericRequestHandlerChain` instances.
+        :type request_handler_chains: list(GenericRequestHandlerChain)
+        :param routing_keys_func: Callable that takes the dispatch
+            input and returns the routing keys it matches on.
+        :type routing_keys_func: Callable[[Input], Iterable[Hashable]]
+        :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+            if the routing keys function is not callable
+        """
+        if not callable(routing_keys_func):
+            raise DispatchException(
+                "Routing keys function should be a callable")
+        self.routing_keys_func = routing_keys_func
+        self._indexed_chains = {}  # type: Dict[Hashable, List[Tuple[int, GenericRequestHandlerChain]]]
+        self._unindexed_chains = []  # type: List[Tuple[int, GenericRequestHandlerChain]]
+        self._candidates_cache = {}  # type: Dict[Tuple, Tuple[GenericRequestHandlerChain, ...]]
+        super(IndexedRequestMapper, self).__init__(
+            request_handler_chains=request_handler_chains)
+
+    @property
+    def request_handler_chains(self):
+        # type: () -> List[GenericRequestHandlerChain]
+        """
+
+        :return: List of :py:class:`GenericRequestHandlerChain`
+            instances.
+        :rtype: list(GenericRequestHandlerChain)
+        """
+        return self._request_handler_chains
+
+    @request_handler_chains.setter
+    def request_handler_chains(self, request_handler_chains):
+        # type: (List[GenericRequestHandlerChain]) -> None
+        """
+
+        :param request_handler_chains: List of
+            :py:class:`GenericRequestHandlerChain` instances.
+        :type request_handler_chains: list(GenericRequestHandlerChain)
+        :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+            when any object inside the input list is of invalid type
+        """
+        self._indexed_chains = {}
+        self._unindexed_chains = []
+        self._candidates_cache = {}
+        self._request_handler_chains = []
+        if request_handler_chains is not None:
+            for chain in request_handler_chains:
+                self.add_request_handler_chain(request_handler_chain=chain)
+
+    def add_request_handler_chain(self, request_handler_chain):
+        # type: (GenericRequestHandlerChain) -> None
+        """Checks the type before adding it to the
+        request_handler_chains instance variable and indexes the chain
+        on the routing key of its request handler.
+
+        :param request_handler_chain:  Request Handler Chain instance.
+        :type request_handler_chain: RequestHandlerChain
+        :raises: :py:class:`ask_sdk_runtime.exceptions.DispatchException`
+            if a null input is provided or if the input is of invalid type
+        """
+        super(IndexedRequestMapper, self).add_request_handler_chain(
+            request_handler_chain=request_handler_chain)
+        position = len(self._request_handler_chains) - 1
+        routing_key = getattr(
+            request_handler_chain.request_handler, "routing_key", None)
+        if routing_key is None:
+            self._unindexed_chains.append((position, request_handler_chain))
+        else:
+            self._indexed_chains.setdefault(routing_key, []).append(
+                (position, request_handler_chain))
+        self._candidates_cache = {}
+
+    def get_candidate_handler_chains(self, handler_input):
+        # type: (Input) -> Sequence[GenericRequestHandlerChain]
+        """Get the request handler chains indexed under the routing
+        keys of the dispatch input, along with the non indexed chains,
+        in registration order.
+
+        :param handler_input: Generic input passed to the
+            dispatcher.
+        :type handler_input: Input
+        :return: Handler Chains whose handlers are checked with
+            ``can_handle``, in order.
+        :rtype: Sequence[GenericRequestHandlerChain]
+        """
+        indexed_chains = self._indexed_chains
+        routing_keys = tuple(
+            routing_key for routing_key in self.routing_keys_func(handler_input)
+            if routing_key in indexed_chains)
+        candidates = self._candidates_cache.get(routing_keys)
+        if candidates is None:
+            candidates = self.__get_candidates(routing_keys)
+        return candidates
+
+    def __get_candidates(self, routing_keys):
+        # type: (Tuple) -> Tuple[GenericRequestHandlerChain, ...]
+        """Merge the chains indexed under the routing keys with the
+        non indexed chains, in registration order, and cache them.
+
+        :param routing_keys: Routing keys of the dispatch input, that
+            are present in the index.
+        :type routing_keys: tuple
+        :return: Candidate chains in registration order.
+        :rtype: tuple(GenericRequestHandlerChain)
+        """
+        positioned_chains = list(self._unindexed_chains)
+        for routing_key in set(routing_keys):
+            positioned_chains.extend(self._indexed_chains[routing_key])
+        positioned_chains.sort(key=lambda positioned_chain: positioned_chain[0])
+
+        candidates = tuple(chain for _, chain in positioned_chains)
+        self._candidates_cache[routing_keys] = candidates
+        return candidates
+
 
 class AbstractHandlerAdapter(object):
     """Abstracts handling of a request for specific handler types."""
@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import logging
+import socket
+import threading
+import time
+import typing
+from abc import ABCMeta, abstractmethod
+from collections import defaultdict, deque
+
+if typing.TYPE_CHECKING:
+    from typing import (
+        List, Dict, Optional, Tuple, Deque, DefaultDict, Any)
+
+
+logger = logging.getLogger(__name__)
+
+#: Monotonic clock used for the dispatch timings. Falls back to the
+#: wall clock on Python 2, which has no monotonic clock.
+monotonic = getattr(time, "monotonic", time.time)
+
+
+class DispatchPhase(object):
+    """Names of the dispatch phases that are timed by the dispatchers.
+    """
+    GLOBAL_REQUEST_INTERCEPTORS = "global_request_interceptors"
+    REQUEST_MAPPING = "request_mapping"
+    HANDLER_ADAPTER_RESOLUTION = "handler_adapter_resolution"
+    LOCAL_REQUEST_INTERCEPTORS = "local_request_interceptors"
+    HANDLER_EXECUTION = "handler_execution"
+    LOCAL_RESPONSE_INTERCEPTORS = "local_response_interceptors"
+    GLOBAL_RESPONSE_INTERCEPTORS = "global_response_interceptors"
+    EXCEPTION_MAPPING = "exception_mapping"
+    EXCEPTION_HANDLING = "exception_handling"
+    DISPATCH = "dispatch"
+
+
+class PhaseTiming(object):
+    """Monotonic timestamps taken around a dispatch phase.
+
+    :param phase: Name of the dispatch phase.
+    :type phase: str
+    :param start: Monotonic timestamp at the start of the phase, in
+        seconds.
+    :type start: float
+    :param end: Monotonic timestamp at the end of the phase, in
+        seconds.
+    :type end: float
+    """
+    __slots__ = ("phase", "start", "end")
+
+    def __init__(self, phase, start, end):
+        # type: (str, float, float) -> None
+        """Monotonic timestamps taken around a dispatch phase.
+
+        :param phase: Name of the dispatch phase.
+        :type phase: str
+        :param start: Monotonic timestamp at the start of the phase,
+            in seconds.
+        :type start: float
+        :param end: Monotonic timestamp at the end of the phase, in
+            seconds.
+        :type end: float
+        """
+        self.phase = phase
+        self.start = start
+        self.end = end
+
+    @property
+    def duration(self):
+        # type: () -> float
+        """Duration of the phase, in seconds.
+
+        :rtype: float
+        """
+        return self.end - self.start
+
+    def __repr__(self):
+        # type: () -> str
+        return "PhaseTiming(phase={!r}, duration={:.6f})".format(
+            self.phase, self.duration)
+
+
+class DispatchTimings(object):
+    """Timings of the phases of a single dispatch.
+
+    The dispatcher records a :py:class:`PhaseTiming` for every phase it
+    goes through, along with the class names of the request handler
+    and exception handler that were picked, to be used as labels by
+    the metrics sinks.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """Timings of the phases of a single dispatch."""
+        self.phases = []  # type: List[PhaseTiming]
+        self.request_handler = None  # type: Optional[str]
+        self.exception_handler = None  # type: Optional[str]
+
+    def start(self):
+        # type: () -> float
+        """Take the timestamp at the start of a phase.
+
+        :return: Monotonic timestamp, in seconds.
+        :rtype: float
+        """
+        return monotonic()
+
+    def record(self, phase, start):
+        # type: (str, float) -> None
+        """Record a phase, ending now.
+
+        :param phase: Name of the dispatch phase.
+        :type phase: str
+        :param start: Timestamp returned by :py:meth:`start` at the
+            start of the phase.
+        :type start: float
+        :rtype: None
+        """
+        self.phases.append(PhaseTiming(phase, start, monotonic()))
+
+    def set_request_handler(self, request_handler):
+        # type: (Any) -> None
+        """Label the timings with the class name of the request
+        handler.
+
+        :param request_handler: Request handler picked for the input.
+        :type request_handler: object
+        :rtype: None
+        """
+        self.request_handler = type(request_handler).__name__
+
+    def set_exception_handler(self, exception_handler):
+        # type: (Any) -> None
+        """Label the timings with the class name of the exception
+        handler.
+
+        :param exception_handler: Exception handler picked for the
+            input.
+        :type exception_handler: object
+        :rtype: None
+        """
+        self.exception_handler = type(exception_handler).__name__
+
+    @property
+    def labels(self):
+        # type: () -> Dict[str, str]
+        """Labels of the dispatch, for the phases that were reached.
+
+        :rtype: Dict[str, str]
+        """
+        labels = {}
+        if self.request_handler is not None:
+            labels["request_handler"] = self.request_handler
+        if self.exception_handler is not None:
+            labels["exception_handler"] = self.exception_handler
+        return labels
+
+    def get_duration(self, phase):
+        # type: (str) -> Optional[float]
+        """Get the duration of a phase, in seconds.
+
+        :param phase: Name of the dispatch phase.
+        :type phase: str
+        :return: Duration of the phase, or None if the dispatch didn't
+            go through it.
+        :rtype: Optional[float]
+        """
+        for phase_timing in self.phases:
+            if phase_timing.phase == phase:
+                return phase_timing.duration
+        return None
+
+
+class _DisabledDispatchTimings(DispatchTimings):
+    """Dispatch timings used when no metrics sink is registered, which
+    don't take any timestamps.
+    """
+
+    def start(self):
+        # type: () -> float
+        return 0.0
+
+    def record(self, phase, start):
+        # type: (str, float) -> None
+        pass
+
+    def set_request_handler(self, request_handler):
+        # type: (Any) -> None
+        pass
+
+    def set_exception_handler(self, exception_handler):
+        # type: (Any) -> None
+        pass
+
+
+DISABLED_DISPATCH_TIMINGS = _DisabledDispatchTimings()
+
+
+def report_timings(metrics_sinks, timings):
+    # type: (List[AbstractMetricsSink], DispatchTimings) -> None
+    """Report the dispatch timings to the metrics sinks.
+
+    Exceptions raised by the sinks are logged and not propagated, so
+    that a failing sink doesn't fail the dispatch.
+
+    :param metrics_sinks: Metrics sinks to report the timings to.
+    :type metrics_sinks: list(AbstractMetricsSink)
+    :param timings: Timings of the dispatch.
+    :type timings: DispatchTimings
+    :rtype: None
+    """
+    for metrics_sink in metrics_sinks:
+        try:
+            metrics_sink.report(timings)
+        except Exception:
+            logger.exception(
+                "Metrics sink %s failed to report dispatch timings",
+                type(metrics_sink).__name__)
+
+
+def attach_timings(handler_input, timings):
+    # type: (Any, DispatchTimings) -> None
+    """Attach the dispatch timings to the handler input, as the
+    ``dispatch_timings`` attribute, if the input supports it.
+
+    :param handler_input: generic input to the dispatcher
+    :type handler_input: Input
+    :param timings: Timings of the dispatch.
+    :type timings: DispatchTimings
+    :rtype: None
+    """
+    try:
+        handler_input.dispatch_timings = timings
+    except (AttributeError, TypeError):
+        pass
+
+
+class AbstractMetricsSink(object):
+    """Destination of the dispatch timings.
+
+    Metrics sinks registered on the skill builder are reported the
+    :py:class:`DispatchTimings` at the end of every dispatch. Sinks
+    are called on the dispatching thread, so they should hand off any
+    slow work.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def report(self, timings):
+        # type: (DispatchTimings) -> None
+        """Report the timings of a dispatch.
+
+        :param timings: Timings of the dispatch.
+        :type timings: DispatchTimings
+        :rtype: None
+        """
+        raise NotImplementedError
+
+
+class LoggingMetricsSink(AbstractMetricsSink):
+    """Metrics sink that logs the dispatch timings, one line per
+    dispatch.
+
+    :param logger: Logger to log the timings to. Defaulted to the
+        logger of this module.
+    :type logger: logging.Logger
+    :param level: Logging level of the timings.
+    :type level: int
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        # type: (Optional[logging.Logger], int) -> None
+        """Metrics sink that logs the dispatch timings, one line per
+        dispatch.
+
+        :param logger: Logger to log the timings to. Defaulted to the
+            logger of this module.
+        :type logger: logging.Logger
+        :param level: Logging level of the timings.
+        :type level: int
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def report(self, timings):
+        # type: (DispatchTimings) -> None
+        """Log the timings of a dispatch, in milliseconds.
+
+        :param timings: Timings of the dispatch.
+        :type timings: DispatchTimings
+        :rtype: None
+        """
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        self.logger.log(
+            self.level, "Dispatch timings %s: %s",
+            " ".join("{}={}".format(k, v) for k, v in sorted(
+                timings.labels.items())),
+            " ".join("{}={:.3f}ms".format(
+                phase_timing.phase, phase_timing.duration * 1000)
+                for phase_timing in timings.phases))
+
+
+class StatsdMetricsSink(AbstractMetricsSink):
+    """Metrics sink that sends the dispatch timings as StatsD timers
+    over UDP.
+
+    Each phase is sent as a ``<prefix>.<phase>`` timer in
+    milliseconds. The handler labels are sent as DogStatsD style tags,
+    which can be disabled for servers that don't support them.
+
+    :param host: Host of the StatsD server.
+    :type host: str
+    :param port: Port of the StatsD server.
+    :type port: int
+    :param prefix: Prefix of the timer names.
+    :type prefix: str
+    :param use_tags: Send the handler labels as tags.
+    :type use_tags: bool
+    """
+
+    def __init__(self, host="localhost", port=8125,
+                 prefix="ask_sdk.dispatch", use_tags=True):
+        # type: (str, int, str, bool) -> None
+        """Metrics sink that sends the dispatch timings as StatsD
+        timers over UDP.
+
+        :param host: Host of the StatsD server.
+        :type host: str
+        :param port: Port of the StatsD server.
+        :type port: int
+        :param prefix: Prefix of the timer names.
+        :type prefix: str
+        :param use_tags: Send the handler labels as tags.
+        :type use_tags: bool
+        """
+        self.address = (host, port)
+        self.prefix = prefix
+        self.use_tags = use_tags
+        self._socket = None  # type: Optional[socket.socket]
+        self._socket_lock = threading.Lock()
+
+    def report(self, timings):
+        # type: (DispatchTimings) -> None
+        """Send the timings of a dispatch in a single UDP packet.
+
+        :param timings: Timings of the dispatch.
+        :type timings: DispatchTimings
+        :rtype: None
+        """
+        tags = ""
+        if self.use_tags and timings.labels:
+            tags = "|#" + ",".join(
+                "{}:{}".format(k, v) for k, v in sorted(
+                    timings.labels.items()))
+
+        payload = "\n".join(
+            "{}.{}:{:.3f}|ms{}".format(
+                self.prefix, phase_timing.phase,
+                phase_timing.duration * 1000, tags)
+            for phase_timing in timings.phases)
+
+        if payload:
+            self.__get_socket().sendto(
+                payload.encode("utf-8"), self.address)
+
+    def __get_socket(self):
+        # type: () -> socket.socket
+        """Get the UDP socket of the sink, creating it on first use."""
+        if self._socket is None:
+            with self._socket_lock:
+                if self._socket is None:
+                    self._socket = socket.socket(
+                        socket.AF_INET, socket.SOCK_DGRAM)
+        return self._socket
+
+
+class InMemoryMetricsSink(AbstractMetricsSink):
+    """Metrics sink that keeps the most recent phase durations in
+    memory, per phase and request handler.
+
+    Useful for tests, and for exposing latency histograms from a long
+    running webservice process.
+
+    :param max_samples: Number of most recent durations kept per phase
+        and request handler.
+    :type max_samples: int
+    """
+
+    def __init__(self, max_samples=1000):
+        # type: (int) -> None
+        """Metrics sink that keeps the most recent phase durations in
+        memory, per phase and request handler.
+
+        :param max_samples: Number of most recent durations kept per
+            phase and request handler.
+        :type max_samples: int
+        """
+        self.max_samples = max_samples
+        self._durations = defaultdict(
+            self.__new_samples)  # type: DefaultDict[Tuple[str, Optional[str]], Deque[float]]
+        self._lock = threading.Lock()
+
+    def __new_samples(self):
+        # type: () -> Deque[float]
+        return deque(maxlen=self.max_samples)
+
+    def report(self, timings):
+        # type: (DispatchTimings) -> None
+        """Store the durations of the phases of a dispatch.
+
+        :param timings: Timings of the dispatch.
+        :type timings: DispatchTimings
+        :rtype: None
+        """
+        with self._lock:
+            for phase_timing in timings.phases:
+                self._durations[
+                    (phase_timing.phase, timings.request_handler)].append(
+                    phase_timing.duration)
+
+    def get_durations(self, phase, request_handler=None):
+        # type: (str, Optional[str]) -> List[float]
+        """Get the stored durations of a phase, in seconds.
+
+        :param phase: Name of the dispatch phase.
+        :type phase: str
+        :param request_handler: Class name of the request handler to
+            filter on. Durations of all handlers are returned if not
+            provided.
+        :type request_handler: str
+        :return: Stored durations of the phase.
+        :rtype: list(float)
+        """
+        with self._lock:
+            durations = []  # type: List[float]
+            for (stored_phase, handler), samples in self._durations.items():
+                if stored_phase == phase and (
+                        request_handler is None or
+                        handler == request_handler):
+                    durations.extend(samples)
+            return durations
+
+    def clear(self):
+        # type: () -> None
+        """Remove all stored durations.
+
+        :rtype: None
+        """
+        with self._lock:
+            self._durations.clear()
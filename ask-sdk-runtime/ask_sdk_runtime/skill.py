@@ -15,14 +15,17 @@
 # specific language governing permissions and limitations under the
 # License.
 #
-from typing import List, TypeVar, Any, Generic
+from typing import (
+    List, TypeVar, Any, Generic, Callable, Iterable, Hashable, Optional)
 from abc import ABCMeta, abstractmethod
-from .exceptions import RuntimeConfigException
+from .exceptions import RuntimeConfigException, DispatchException
 from .dispatch_components import (
     AbstractRequestHandler, AbstractRequestInterceptor,
     AbstractResponseInterceptor, AbstractExceptionHandler,
     GenericRequestHandlerChain, GenericRequestMapper,
-    GenericHandlerAdapter, GenericExceptionMapper)
+    GenericHandlerAdapter, GenericExceptionMapper, IndexedRequestMapper,
+    RequestInterceptorGroup)
+from .metrics import AbstractMetricsSink
 from .view_resolvers import (
     AbstractTemplateLoader, AbstractTemplateRenderer)
 
@@ -48,13 +51,24 @@ class RuntimeConfiguration(object):
     :type response_interceptors: list(AbstractResponseInterceptor)
     :param exception_mapper: Exception mapper instance.
     :type exception_mapper: GenericExceptionMapper
+    :param loaders: List of loaders instance.
+    :type loaders: list(AbstractTemplateLoader)
+    :param renderer: Renderer instance.
+    :type renderer: AbstractTemplateRenderer
+    :param metrics_sinks: List of metrics sinks, the dispatch timings
+        are reported to.
+    :type metrics_sinks: list(ask_sdk_runtime.metrics.AbstractMetricsSink)
+    :param frozen: Dispatch through a pipeline precompiled from the
+        configuration.
+    :type frozen: bool
     """
 
     def __init__(
             self, request_mappers, handler_adapters,
             request_interceptors=None, response_interceptors=None,
-            exception_mapper=None, loaders=None, renderer=None):
-        # type: (List[GenericRequestMapper], List[GenericHandlerAdapter], List[AbstractRequestInterceptor], List[AbstractResponseInterceptor], GenericExceptionMapper, List[AbstractTemplateLoader], AbstractTemplateRenderer) -> None
+            exception_mapper=None, loaders=None, renderer=None,
+            metrics_sinks=None, frozen=False):
+        # type: (List[GenericRequestMapper], List[GenericHandlerAdapter], List[AbstractRequestInterceptor], List[AbstractResponseInterceptor], GenericExceptionMapper, List[AbstractTemplateLoader], AbstractTemplateRenderer, Optional[List[AbstractMetricsSink]], bool) -> None
         """Configuration object that represents standard components
         needed for building :py:class:`Skill`.
 
@@ -74,6 +88,12 @@ class RuntimeConfiguration(object):
         :type loaders: list(AbstractTemplateLoader)
         :param renderer: Renderer instance.
         :type renderer: AbstractTemplateRenderer
+        :param metrics_sinks: List of metrics sinks, the dispatch
+            timings are reported to.
+        :type metrics_sinks: list(ask_sdk_runtime.metrics.AbstractMetricsSink)
+        :param frozen: Dispatch through a pipeline precompiled from the
+            configuration.
+        :type frozen: bool
         """
         if request_mappers is None:
             request_mappers = []
@@ -99,6 +119,11 @@ class RuntimeConfiguration(object):
 
         self.renderer = renderer
 
+        if metrics_sinks is None:
+            metrics_sinks = []
+        self.metrics_sinks = metrics_sinks
+        self.frozen = frozen
+
 
 class RuntimeConfigurationBuilder(object):
     """Builder class for creating a runtime configuration object, from
@@ -116,6 +141,9 @@ class RuntimeConfigurationBuilder(object):
         self.exception_handlers = []  # type: List
         self.loaders = []  # type: List
         self.renderer = None  # type: Any
+        self.routing_keys_func = None  # type: Optional[Callable[[Any], Iterable[Hashable]]]
+        self.metrics_sinks = []  # type: List[AbstractMetricsSink]
+        self.frozen = False
 
     def add_request_handler(self, request_handler):
         # type: (AbstractRequestHandler) -> None
@@ -187,6 +215,33 @@ class RuntimeConfigurationBuilder(object):
 
         self.global_request_interceptors.append(request_interceptor)
 
+    def add_global_request_interceptor_group(
+            self, request_interceptors, max_workers=None):
+        # type: (List[AbstractRequestInterceptor], Optional[int]) -> None
+        """Register a group of independent request interceptors, that
+        are processed concurrently, to the global request interceptors
+        list.
+
+        :param request_interceptors: Independent request interceptors
+            to be processed concurrently.
+        :type request_interceptors: list(AbstractRequestInterceptor)
+        :param max_workers: Maximum number of threads used for
+            processing the group. Defaulted to the number of
+            interceptors.
+        :type max_workers: int
+        :return: None
+        :raises: :py:class:`ask_sdk_runtime.exceptions.RuntimeConfigException`
+            if the interceptors or max workers are invalid
+        """
+        try:
+            interceptor_group = RequestInterceptorGroup(
+                request_interceptors=request_interceptors,
+                max_workers=max_workers)
+        except DispatchException as e:
+            raise RuntimeConfigException(str(e))
+
+        self.global_request_interceptors.append(interceptor_group)
+
     def add_global_response_interceptor(self, response_interceptor):
         # type: (AbstractResponseInterceptor) -> None
         """Register input to the global response interceptors list.
@@ -250,6 +305,50 @@ class RuntimeConfigurationBuilder(object):
 
         self.renderer = renderer
 
+    def add_metrics_sink(self, metrics_sink):
+        # type: (AbstractMetricsSink) -> None
+        """Register input to the metrics sinks list.
+
+        :param metrics_sink: Metrics sink to report dispatch timings to.
+        :type metrics_sink: ask_sdk_runtime.metrics.AbstractMetricsSink
+        :return: None
+        """
+        if metrics_sink is None:
+            raise RuntimeConfigException(
+                "Valid Metrics Sink instance to be provided")
+
+        if not isinstance(metrics_sink, AbstractMetricsSink):
+            raise RuntimeConfigException(
+                "Input should be a MetricsSink instance")
+
+        self.metrics_sinks.append(metrics_sink)
+
+    def enable_request_indexing(self, routing_keys_func):
+        # type: (Callable[[Any], Iterable[Hashable]]) -> None
+        """Route requests through an
+        :py:class:`ask_sdk_runtime.dispatch_components.request_components.IndexedRequestMapper`.
+
+        :param routing_keys_func: Callable that takes the dispatch
+            input and returns the routing keys it matches on.
+        :type routing_keys_func: Callable[[Input], Iterable[Hashable]]
+        :return: None
+        """
+        if not callable(routing_keys_func):
+            raise RuntimeConfigException(
+                "Routing keys function should be a callable")
+
+        self.routing_keys_func = routing_keys_func
+
+    def enable_frozen_dispatch(self):
+        # type: () -> None
+        """Dispatch through a pipeline precompiled from the runtime
+        configuration, using
+        :py:class:`ask_sdk_runtime.dispatch.FrozenRequestDispatcher`.
+
+        :return: None
+        """
+        self.frozen = True
+
     def get_runtime_configuration(self):
         # type: () -> RuntimeConfiguration
         """Build the runtime configuration object from the registered
@@ -258,8 +357,14 @@ class RuntimeConfigurationBuilder(object):
         :return: Runtime Configuration Object
         :rtype: RuntimeConfiguration
         """
-        request_mapper = GenericRequestMapper(
-            request_handler_chains=self.request_handler_chains)
+        if self.routing_keys_func is not None:
+            request_mapper = IndexedRequestMapper(
+                request_handler_chains=self.request_handler_chains,
+                routing_keys_func=self.routing_keys_func
+            )  # type: GenericRequestMapper
+        else:
+            request_mapper = GenericRequestMapper(
+                request_handler_chains=self.request_handler_chains)
         exception_mapper = GenericExceptionMapper(
             exception_handlers=self.exception_handlers)
         handler_adapter = GenericHandlerAdapter()
@@ -271,7 +376,9 @@ class RuntimeConfigurationBuilder(object):
             request_interceptors=self.global_request_interceptors,
             response_interceptors=self.global_response_interceptors,
             loaders=self.loaders,
-            renderer=self.renderer)
+            renderer=self.renderer,
+            metrics_sinks=self.metrics_sinks,
+            frozen=self.frozen)
 
         return runtime_configuration
 
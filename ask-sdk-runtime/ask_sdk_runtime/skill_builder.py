@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations under the
 # License.
 #
+import functools
+import inspect
 import typing
 
 from abc import ABCMeta, abstractmethod
@@ -22,19 +24,46 @@ from .skill import RuntimeConfigurationBuilder
 
 from .dispatch_components import (
     AbstractRequestHandler, AbstractRequestInterceptor,
-    AbstractResponseInterceptor, AbstractExceptionHandler)
+    AbstractResponseInterceptor, AbstractExceptionHandler,
+    AbstractAsyncRequestHandler, AbstractAsyncRequestInterceptor,
+    AbstractAsyncResponseInterceptor, AbstractAsyncExceptionHandler)
 from .exceptions import SkillBuilderException
 from .view_resolvers import (
     AbstractTemplateLoader, AbstractTemplateRenderer)
 
 
 if typing.TYPE_CHECKING:
-    from typing import Callable, TypeVar, List
+    from typing import (
+        Callable, TypeVar, List, Iterable, Hashable, Any, Optional)
     from .skill import AbstractSkill
+    from .metrics import AbstractMetricsSink
     T = TypeVar('T')
     Input = TypeVar('Input')
 
 
+def _is_coroutine_function(func):
+    # type: (Callable) -> bool
+    """Check if the function is a coroutine function, on Python
+    versions supporting them.
+    """
+    is_coroutine_function = getattr(inspect, "iscoroutinefunction", None)
+    return is_coroutine_function is not None and is_coroutine_function(func)
+
+
+def _run_in_executor(func):
+    # type: (Callable) -> Callable
+    """Wrap a synchronous function of an async component, so that it
+    returns an awaitable running the function on the default executor
+    of the event loop, instead of blocking the event loop.
+    """
+    def run(*args):
+        # type: (*Any) -> Any
+        import asyncio
+        return asyncio.get_event_loop().run_in_executor(
+            None, functools.partial(func, *args))
+    return run
+
+
 class AbstractSkillBuilder(object):
     """Abstract Skill Builder with helper functions for building
     :py:class:`ask_sdk_runtime.skill.AbstractSkill` object.
@@ -84,6 +113,34 @@ class AbstractSkillBuilder(object):
         self.runtime_configuration_builder.add_global_request_interceptor(
             request_interceptor)
 
+    def add_global_request_interceptor_group(
+            self, request_interceptors, max_workers=None):
+        # type: (List[AbstractRequestInterceptor], Optional[int]) -> None
+        """Register a group of independent request interceptors to the
+        global request interceptors list.
+
+        The interceptors in the group are processed concurrently on a
+        bounded thread pool, or gathered as coroutines by the async
+        dispatcher. The group runs at its registration position,
+        relative to the other global request interceptors. If any of
+        the interceptors raise an exception, the one raised by the
+        first of them, in registration order, is passed to the
+        exception handlers.
+
+        :param request_interceptors: Independent Request Interceptor
+            instances.
+        :type request_interceptors: list(ask_sdk_runtime.dispatch_components.request_components.AbstractRequestInterceptor)
+        :param max_workers: Maximum number of threads used for
+            processing the group. Defaulted to the number of
+            interceptors.
+        :type max_workers: int
+        :return: None
+        """
+        (self.runtime_configuration_builder
+         .add_global_request_interceptor_group(
+            request_interceptors=request_interceptors,
+            max_workers=max_workers))
+
     def add_global_response_interceptor(self, response_interceptor):
         # type: (AbstractResponseInterceptor) -> None
         """Register input to the global response interceptors list.
@@ -123,6 +180,56 @@ class AbstractSkillBuilder(object):
         """
         self.runtime_configuration_builder.add_renderer(renderer)
 
+    def add_metrics_sink(self, metrics_sink):
+        # type: (AbstractMetricsSink) -> None
+        """Register a metrics sink, to report dispatch timings to.
+
+        When at least one sink is registered, the dispatcher takes
+        monotonic timestamps around each dispatch phase, labels them
+        with the class names of the request and exception handlers,
+        attaches them to the input as ``dispatch_timings`` and reports
+        them to the sinks. Without sinks, no timestamps are taken.
+
+        :param metrics_sink: Metrics sink to report dispatch timings to.
+        :type metrics_sink: ask_sdk_runtime.metrics.AbstractMetricsSink
+        :return: None
+        """
+        self.runtime_configuration_builder.add_metrics_sink(metrics_sink)
+
+    def enable_frozen_dispatch(self):
+        # type: () -> None
+        """Dispatch requests through a pipeline precompiled when the
+        skill is created.
+
+        The handler adapter of every request handler is resolved ahead
+        of time, the handler chains are flattened into tuples and
+        empty interceptor phases are skipped, removing fixed cost from
+        every dispatch. Components registered on the builder after the
+        skill is created are not picked up by the skill.
+
+        :return: None
+        """
+        self.runtime_configuration_builder.enable_frozen_dispatch()
+
+    def enable_request_indexing(self, routing_keys_func):
+        # type: (Callable[[Any], Iterable[Hashable]]) -> None
+        """Route requests to handlers through a routing key index.
+
+        Request handlers declaring a ``routing_key`` attribute are
+        bucketed on it, and only the handlers in the buckets matching
+        the keys returned by ``routing_keys_func``, along with the
+        handlers without a routing key, are checked for each input.
+        Handlers registered through the ``request_handler`` decorator
+        take the ``routing_key`` of their ``can_handle_func``, if any.
+
+        :param routing_keys_func: Callable that takes the dispatch
+            input and returns the routing keys it matches on.
+        :type routing_keys_func: Callable[[Input], Iterable[Hashable]]
+        :return: None
+        """
+        self.runtime_configuration_builder.enable_request_indexing(
+            routing_keys_func)
+
     def request_handler(self, can_handle_func):
         # type: (Callable[[Input], bool]) -> Callable
         """Decorator that can be used to add request handlers easily to
@@ -137,6 +244,17 @@ class AbstractSkillBuilder(object):
         :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractRequestHandler`
         class.
 
+        If the decorated function or the can_handle_func is a coroutine
+        function, an
+        :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractAsyncRequestHandler`
+        is registered, to be awaited by
+        :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`.
+        A synchronous function of such a handler is run on the default
+        executor of the event loop. Async handlers can't be dispatched
+        by the synchronous dispatchers, which raise a
+        :py:class:`ask_sdk_runtime.exceptions.DispatchException` when
+        they find one.
+
         :param can_handle_func: The function that validates if the
             request can be handled.
         :type can_handle_func: Callable[[Input], bool]
@@ -149,24 +267,35 @@ class AbstractSkillBuilder(object):
                     "Request Handler can_handle_func and handle_func "
                     "input parameters should be callable")
 
+            is_async = (_is_coroutine_function(handle_func) or
+                        _is_coroutine_function(can_handle_func))
+            handle = handle_func
+            if is_async and not _is_coroutine_function(handle_func):
+                handle = _run_in_executor(handle_func)
+
             class_attributes = {
                 "can_handle": lambda self, handler_input: can_handle_func(
                     handler_input),
-                "handle": lambda self, handler_input: handle_func(
-                    handler_input)
+                "handle": lambda self, handler_input: handle(handler_input),
+                "routing_key": getattr(can_handle_func, "routing_key", None)
             }
 
+            if is_async:
+                request_handler_base = AbstractAsyncRequestHandler  # type: type
+            else:
+                request_handler_base = AbstractRequestHandler
+
             request_handler_class = type(
                 "RequestHandler{}".format(
                     handle_func.__name__.title().replace("_", "")),
-                (AbstractRequestHandler,), class_attributes)
+                (request_handler_base,), class_attributes)
 
             self.add_request_handler(request_handler=request_handler_class())
             return handle_func
         return wrapper
 
-    def exception_handler(self, can_handle_func):
-        # type: (Callable[[Input, Exception], bool]) -> Callable
+    def exception_handler(self, can_handle_func=None, exception_type=None):
+        # type: (Optional[Callable[[Input, Exception], bool]], Optional[type]) -> Callable
         """Decorator that can be used to add exception handlers easily
         to the builder.
 
@@ -180,30 +309,86 @@ class AbstractSkillBuilder(object):
         :py:class:`ask_sdk_runtime.dispatch_components.exception_components.AbstractExceptionHandler`
         class.
 
+        If an exception_type is provided, the handler is registered
+        for exceptions of that class and its subclasses, and skipped by
+        :py:class:`ask_sdk_runtime.dispatch_components.exception_components.GenericExceptionMapper`
+        for other exceptions. The can_handle_func is then optional, and
+        checked only for exceptions of the exception_type. Handlers
+        with and without an exception_type are checked in registration
+        order, so register specific handlers before catch-all ones.
+
+        If the decorated function or the can_handle_func is a coroutine
+        function, an
+        :py:class:`ask_sdk_runtime.dispatch_components.exception_components.AbstractAsyncExceptionHandler`
+        is registered, to be awaited by
+        :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`.
+        A synchronous function of such a handler is run on the default
+        executor of the event loop. Async handlers can't be dispatched
+        by the synchronous dispatchers, which raise a
+        :py:class:`ask_sdk_runtime.exceptions.DispatchException` when
+        they find one.
+
         :param can_handle_func: The function that validates if the
             exception can be handled.
         :type can_handle_func: Callable[[Input, Exception], bool]
+        :param exception_type: Exception class handled by the
+            handler.
+        :type exception_type: type
         :return: Wrapper function that can be decorated on a handle
             function.
         """
         def wrapper(handle_func):
-            if not callable(can_handle_func) or not callable(handle_func):
+            if exception_type is not None and not (
+                    isinstance(exception_type, type) and
+                    issubclass(exception_type, BaseException)):
+                raise SkillBuilderException(
+                    "Exception Handler exception_type input parameter "
+                    "should be an exception class")
+
+            if ((can_handle_func is None and exception_type is None) or
+                    (can_handle_func is not None and
+                     not callable(can_handle_func)) or
+                    not callable(handle_func)):
                 raise SkillBuilderException(
                     "Exception Handler can_handle_func and handle_func input "
                     "parameters should be callable")
 
-            class_attributes = {
-                "can_handle": (
+            if exception_type is None:
+                can_handle = (
                     lambda self, handler_input, exception: can_handle_func(
-                        handler_input, exception)),
-                "handle": lambda self, handler_input, exception: handle_func(
-                    handler_input, exception)
+                        handler_input, exception))
+            elif can_handle_func is None:
+                can_handle = (
+                    lambda self, handler_input, exception: isinstance(
+                        exception, exception_type))
+            else:
+                can_handle = (
+                    lambda self, handler_input, exception: isinstance(
+                        exception, exception_type) and can_handle_func(
+                        handler_input, exception))
+
+            is_async = (_is_coroutine_function(handle_func) or
+                        _is_coroutine_function(can_handle_func))
+            handle = handle_func
+            if is_async and not _is_coroutine_function(handle_func):
+                handle = _run_in_executor(handle_func)
+
+            class_attributes = {
+                "can_handle": can_handle,
+                "handle": lambda self, handler_input, exception: handle(
+                    handler_input, exception),
+                "exception_type": exception_type
             }
 
+            if is_async:
+                exception_handler_base = AbstractAsyncExceptionHandler  # type: type
+            else:
+                exception_handler_base = AbstractExceptionHandler
+
             exception_handler_class = type(
                 "ExceptionHandler{}".format(
                     handle_func.__name__.title().replace("_", "")),
-                (AbstractExceptionHandler,), class_attributes)
+                (exception_handler_base,), class_attributes)
 
             self.add_exception_handler(
                 exception_handler=exception_handler_class())
@@ -219,7 +404,10 @@ class AbstractSkillBuilder(object):
         any function that processes the input. The function should
         follow the signature of the process function in
         :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractRequestInterceptor`
-        class.
+        class. If the decorated function is a coroutine function, an
+        :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractAsyncRequestInterceptor`
+        is registered, which can only be dispatched by
+        :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`.
 
         :return: Wrapper function that can be decorated on a
             interceptor process function.
@@ -235,10 +423,15 @@ class AbstractSkillBuilder(object):
                     handler_input)
             }
 
+            if _is_coroutine_function(process_func):
+                request_interceptor_base = AbstractAsyncRequestInterceptor  # type: type
+            else:
+                request_interceptor_base = AbstractRequestInterceptor
+
             request_interceptor = type(
                 "RequestInterceptor{}".format(
                     process_func.__name__.title().replace("_", "")),
-                (AbstractRequestInterceptor,), class_attributes)
+                (request_interceptor_base,), class_attributes)
 
             self.add_global_request_interceptor(
                 request_interceptor=request_interceptor())
@@ -255,7 +448,10 @@ class AbstractSkillBuilder(object):
         generated by the request handler. The function should follow
         the signature of the process function in
         :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractResponseInterceptor`
-        class.
+        class. If the decorated function is a coroutine function, an
+        :py:class:`ask_sdk_runtime.dispatch_components.request_components.AbstractAsyncResponseInterceptor`
+        is registered, which can only be dispatched by
+        :py:class:`ask_sdk_runtime.async_dispatch.AsyncRequestDispatcher`.
 
         :return: Wrapper function that can be decorated on a
             interceptor process function.
@@ -272,10 +468,15 @@ class AbstractSkillBuilder(object):
                         handler_input, response))
             }
 
+            if _is_coroutine_function(process_func):
+                response_interceptor_base = AbstractAsyncResponseInterceptor  # type: type
+            else:
+                response_interceptor_base = AbstractResponseInterceptor
+
             response_interceptor = type(
                 "ResponseInterceptor{}".format(
                     process_func.__name__.title().replace("_", "")),
-                (AbstractResponseInterceptor,), class_attributes)
+                (response_interceptor_base,), class_attributes)
 
             self.add_global_response_interceptor(
                 response_interceptor=response_interceptor())
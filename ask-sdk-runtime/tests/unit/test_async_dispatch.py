@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import asyncio
+import threading
+import unittest
+
+from ask_sdk_runtime.async_dispatch import AsyncRequestDispatcher
+from ask_sdk_runtime.dispatch import GenericRequestDispatcher
+from ask_sdk_runtime.skill import RuntimeConfiguration
+from ask_sdk_runtime.skill_builder import AbstractSkillBuilder
+from ask_sdk_runtime.dispatch_components import (
+    GenericRequestMapper, AbstractRequestHandler, GenericRequestHandlerChain,
+    AbstractRequestInterceptor,
+    GenericHandlerAdapter, GenericExceptionMapper, RequestInterceptorGroup,
+    AbstractAsyncRequestHandler, AbstractAsyncRequestInterceptor,
+    AbstractAsyncResponseInterceptor, AbstractAsyncExceptionHandler)
+from ask_sdk_runtime.exceptions import DispatchException
+from ask_sdk_runtime.metrics import DispatchPhase, InMemoryMetricsSink
+
+
+class AsyncHandler(AbstractAsyncRequestHandler):
+    def __init__(self, can_handle_result=True, output="async", error=None):
+        self.can_handle_result = can_handle_result
+        self.output = output
+        self.error = error
+
+    async def can_handle(self, handler_input):
+        await asyncio.sleep(0)
+        return self.can_handle_result
+
+    async def handle(self, handler_input):
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return self.output
+
+
+class SyncHandler(AbstractRequestHandler):
+    def __init__(self):
+        self.handle_thread = None
+
+    def can_handle(self, handler_input):
+        return True
+
+    def handle(self, handler_input):
+        self.handle_thread = threading.current_thread()
+        return "sync"
+
+
+class AsyncRequestInterceptor(AbstractAsyncRequestInterceptor):
+    async def process(self, handler_input):
+        handler_input.append("request_interceptor")
+
+
+class AsyncResponseInterceptor(AbstractAsyncResponseInterceptor):
+    async def process(self, handler_input, response):
+        handler_input.append("response_interceptor:{}".format(response))
+
+
+class SyncRequestInterceptor(AbstractRequestInterceptor):
+    def __init__(self):
+        self.processed = False
+
+    def process(self, handler_input):
+        self.processed = True
+
+
+class AsyncExceptionHandler(AbstractAsyncExceptionHandler):
+    async def can_handle(self, handler_input, exception):
+        return isinstance(exception, ValueError)
+
+    async def handle(self, handler_input, exception):
+        return "handled:{}".format(exception)
+
+
+class TestAsyncRequestDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def create_dispatcher(self, *request_handlers, **kwargs):
+        request_mapper = GenericRequestMapper(
+            request_handler_chains=[
+                GenericRequestHandlerChain(request_handler=handler)
+                for handler in request_handlers])
+        return AsyncRequestDispatcher(options=RuntimeConfiguration(
+            request_mappers=[request_mapper],
+            handler_adapters=[GenericHandlerAdapter()],
+            request_interceptors=kwargs.get("request_interceptors"),
+            response_interceptors=kwargs.get("response_interceptors"),
+            exception_mapper=kwargs.get("exception_mapper"),
+            metrics_sinks=kwargs.get("metrics_sinks")))
+
+    def dispatch(self, dispatcher, handler_input=None):
+        return self.loop.run_until_complete(
+            dispatcher.dispatch(handler_input=handler_input))
+
+    def test_dispatch_with_no_handlers_raises_dispatch_exception(self):
+        dispatcher = self.create_dispatcher()
+
+        with self.assertRaises(DispatchException) as exc:
+            self.dispatch(dispatcher)
+
+        assert "Unable to find a suitable request handler" in str(
+            exc.exception), (
+            "Async Dispatcher didn't throw Dispatch Exception when no "
+            "handlers are registered")
+
+    def test_dispatch_awaits_async_can_handle_and_handle(self):
+        dispatcher = self.create_dispatcher(
+            AsyncHandler(can_handle_result=False, output="first"),
+            AsyncHandler(output="second"))
+
+        assert self.dispatch(dispatcher) == "second", (
+            "Async Dispatcher didn't await can_handle and handle of async "
+            "request handlers")
+
+    def test_dispatch_runs_sync_handler_in_executor(self):
+        sync_handler = SyncHandler()
+        dispatcher = self.create_dispatcher(sync_handler)
+
+        assert self.dispatch(dispatcher) == "sync", (
+            "Async Dispatcher didn't return output of sync request handler")
+        assert sync_handler.handle_thread is not threading.current_thread(), (
+            "Async Dispatcher ran sync request handler on the event loop "
+            "thread instead of the executor")
+
+    def test_dispatch_runs_async_interceptors(self):
+        handler_input = []
+        dispatcher = self.create_dispatcher(
+            AsyncHandler(),
+            request_interceptors=[AsyncRequestInterceptor()],
+            response_interceptors=[AsyncResponseInterceptor()])
+
+        self.dispatch(dispatcher, handler_input=handler_input)
+
+        assert handler_input == [
+            "request_interceptor", "response_interceptor:async"], (
+            "Async Dispatcher didn't run async global interceptors around "
+            "the request handler")
+
+    def test_dispatch_gathers_interceptor_group(self):
+        events = []
+
+        class BlockingInterceptor(AbstractAsyncRequestInterceptor):
+            def __init__(self, name, wait_for=None):
+                self.name = name
+                self.wait_for = wait_for
+                self.done = asyncio.Event()
+
+            async def process(self, handler_input):
+                if self.wait_for is not None:
+                    await self.wait_for.done.wait()
+                events.append(self.name)
+                self.done.set()
+
+        first = BlockingInterceptor("first")
+        # first can only finish after second, which is registered later
+        first.wait_for = second = BlockingInterceptor("second")
+        sync_interceptor = SyncRequestInterceptor()
+        dispatcher = self.create_dispatcher(
+            AsyncHandler(),
+            request_interceptors=[RequestInterceptorGroup(
+                request_interceptors=[first, second, sync_interceptor])])
+
+        self.dispatch(dispatcher)
+
+        assert events == ["second", "first"], (
+            "Async Dispatcher didn't gather the interceptors of the group "
+            "concurrently")
+        assert sync_interceptor.processed, (
+            "Async Dispatcher didn't process synchronous interceptor of "
+            "the group")
+
+    def test_dispatch_raises_first_exception_of_interceptor_group(self):
+        class FailingInterceptor(AbstractAsyncRequestInterceptor):
+            def __init__(self, exception, delay):
+                self.exception = exception
+                self.delay = delay
+
+            async def process(self, handler_input):
+                await asyncio.sleep(self.delay)
+                raise self.exception
+
+        dispatcher = self.create_dispatcher(
+            AsyncHandler(),
+            request_interceptors=[RequestInterceptorGroup(
+                request_interceptors=[
+                    FailingInterceptor(TypeError("first"), 0.01),
+                    FailingInterceptor(ValueError("second"), 0)])])
+
+        with self.assertRaises(TypeError):
+            self.dispatch(dispatcher)
+
+    def test_dispatch_handles_exception_with_async_exception_handler(self):
+        dispatcher = self.create_dispatcher(
+            AsyncHandler(error=ValueError("test")),
+            exception_mapper=GenericExceptionMapper(
+                exception_handlers=[AsyncExceptionHandler()]))
+
+        assert self.dispatch(dispatcher) == "handled:test", (
+            "Async Dispatcher didn't run async exception handler on "
+            "exception raised by request handler")
+
+    def test_dispatch_raises_exception_if_no_exception_handler_found(self):
+        dispatcher = self.create_dispatcher(
+            AsyncHandler(error=TypeError("test")),
+            exception_mapper=GenericExceptionMapper(
+                exception_handlers=[AsyncExceptionHandler()]))
+
+        with self.assertRaises(TypeError):
+            self.dispatch(dispatcher)
+
+    def test_dispatch_reports_phase_timings_to_metrics_sinks(self):
+        test_metrics_sink = InMemoryMetricsSink()
+        dispatcher = self.create_dispatcher(
+            AsyncHandler(), metrics_sinks=[test_metrics_sink])
+
+        self.dispatch(dispatcher, handler_input=[])
+
+        assert len(test_metrics_sink.get_durations(
+            DispatchPhase.HANDLER_EXECUTION,
+            request_handler="AsyncHandler")) == 1, (
+            "Async Dispatcher didn't report handler execution timing "
+            "labelled with the request handler class name")
+        assert len(test_metrics_sink.get_durations(
+            DispatchPhase.DISPATCH)) == 1, (
+            "Async Dispatcher didn't report total dispatch timing")
+
+    def test_dispatch_coroutine_handler_registered_through_decorator(self):
+        skill_builder = AbstractSkillBuilder()
+
+        @skill_builder.request_handler(can_handle_func=lambda i: True)
+        async def test_handler(handler_input):
+            await asyncio.sleep(0)
+            return "decorated"
+
+        runtime_configuration = (
+            skill_builder.runtime_configuration_builder
+            .get_runtime_configuration())
+        request_handler = (
+            runtime_configuration.request_mappers[0]
+            .request_handler_chains[0].request_handler)
+        dispatcher = AsyncRequestDispatcher(options=runtime_configuration)
+
+        assert isinstance(request_handler, AbstractAsyncRequestHandler), (
+            "Request Handler decorator didn't create an async request handler "
+            "for coroutine handle function")
+        assert self.dispatch(dispatcher) == "decorated", (
+            "Async Dispatcher didn't await coroutine handler registered "
+            "through decorator")
+
+    def test_dispatch_coroutine_can_handle_registered_through_decorator(self):
+        skill_builder = AbstractSkillBuilder()
+
+        async def can_handle(handler_input):
+            await asyncio.sleep(0)
+            return True
+
+        @skill_builder.request_handler(can_handle_func=can_handle)
+        def test_handler(handler_input):
+            return "decorated"
+
+        runtime_configuration = (
+            skill_builder.runtime_configuration_builder
+            .get_runtime_configuration())
+        request_handler = (
+            runtime_configuration.request_mappers[0]
+            .request_handler_chains[0].request_handler)
+        dispatcher = AsyncRequestDispatcher(options=runtime_configuration)
+
+        assert isinstance(request_handler, AbstractAsyncRequestHandler), (
+            "Request Handler decorator didn't create an async request handler "
+            "for coroutine can_handle function")
+        assert self.dispatch(dispatcher) == "decorated", (
+            "Async Dispatcher didn't dispatch synchronous handler with "
+            "coroutine can_handle registered through decorator")
+        with self.assertRaises(DispatchException):
+            GenericRequestDispatcher(options=runtime_configuration).dispatch(
+                handler_input=object())
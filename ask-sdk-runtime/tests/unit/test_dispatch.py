@@ -17,13 +17,21 @@
 #
 import unittest
 
-from ask_sdk_runtime.dispatch import GenericRequestDispatcher
+from ask_sdk_runtime.dispatch import (
+    GenericRequestDispatcher, FrozenRequestDispatcher)
 from ask_sdk_runtime.skill import RuntimeConfiguration
 from ask_sdk_runtime.dispatch_components import (
     GenericRequestMapper, AbstractRequestHandler, GenericRequestHandlerChain,
+    IndexedRequestMapper,
     GenericHandlerAdapter, AbstractRequestInterceptor,
-    AbstractResponseInterceptor, AbstractExceptionHandler, GenericExceptionMapper)
+    AbstractResponseInterceptor, AbstractExceptionHandler, GenericExceptionMapper,
+    RequestInterceptorGroup, AbstractAsyncRequestHandler,
+    AbstractAsyncRequestInterceptor, AbstractAsyncExceptionHandler)
+from ask_sdk_runtime.dispatch_components.request_components import (
+    AbstractRequestMapper)
 from ask_sdk_runtime.exceptions import DispatchException
+from ask_sdk_runtime.metrics import (
+    AbstractMetricsSink, DispatchPhase, InMemoryMetricsSink)
 
 try:
     import mock
@@ -462,3 +470,381 @@ class TestRequestDispatcher(unittest.TestCase):
             "exception")
         test_exception_handler_2.handle.assert_called_once(), (
             "Suitable exception handler didn't handle custom exception")
+
+    def test_dispatch_exception_from_interceptor_group_to_exception_mapper(
+            self):
+        test_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        test_request_handler.can_handle.return_value = True
+        test_request_mapper = GenericRequestMapper(
+            request_handler_chains=[GenericRequestHandlerChain(
+                request_handler=test_request_handler)])
+
+        test_interceptor_1 = mock.MagicMock(spec=AbstractRequestInterceptor)
+        test_interceptor_2 = mock.MagicMock(spec=AbstractRequestInterceptor)
+        test_interceptor_2.process.side_effect = ValueError("Interceptor")
+
+        test_exception_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        test_exception_handler.can_handle.return_value = True
+        test_exception_handler.handle.return_value = "Exception response"
+
+        self.test_dispatcher = GenericRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[test_request_mapper],
+                handler_adapters=[GenericHandlerAdapter()],
+                request_interceptors=[RequestInterceptorGroup(
+                    request_interceptors=[
+                        test_interceptor_1, test_interceptor_2])],
+                exception_mapper=GenericExceptionMapper(
+                    exception_handlers=[test_exception_handler])))
+
+        assert self.test_dispatcher.dispatch(
+            handler_input=self.valid_handler_input) == "Exception response", (
+            "Dispatcher didn't pass exception raised in request interceptor "
+            "group to the exception mapper")
+
+        test_request_handler.handle.assert_not_called()
+        called_args, called_kwargs = test_exception_handler.handle.call_args
+        assert isinstance(called_args[1], ValueError), (
+            "Dispatcher didn't pass the exception raised by the interceptor "
+            "in the group to the exception handler")
+
+    def test_dispatch_async_request_handler_throws_error(self):
+        test_request_handler = mock.MagicMock(spec=AbstractAsyncRequestHandler)
+        test_dispatcher = GenericRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=test_request_handler)])],
+                handler_adapters=[GenericHandlerAdapter()]))
+
+        with self.assertRaises(DispatchException) as exc:
+            test_dispatcher.dispatch(handler_input=self.valid_handler_input)
+
+        assert "async dispatch component" in str(exc.exception), (
+            "Dispatcher didn't throw Dispatch Exception for async request "
+            "handler")
+        test_request_handler.handle.assert_not_called(), (
+            "Dispatcher called handle of async request handler")
+
+    def test_dispatch_async_request_interceptor_throws_error(self):
+        test_interceptor = mock.MagicMock(spec=AbstractAsyncRequestInterceptor)
+        test_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        test_request_handler.can_handle.return_value = True
+        test_dispatcher = GenericRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=test_request_handler)])],
+                handler_adapters=[GenericHandlerAdapter()],
+                request_interceptors=[test_interceptor]))
+
+        with self.assertRaises(DispatchException):
+            test_dispatcher.dispatch(handler_input=self.valid_handler_input)
+
+        test_interceptor.process.assert_not_called(), (
+            "Dispatcher called process of async request interceptor")
+
+    def test_dispatch_async_exception_handler_throws_error(self):
+        test_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        test_request_handler.can_handle.return_value = True
+        test_request_handler.handle.side_effect = ValueError("test")
+        test_exception_handler = mock.MagicMock(
+            spec=AbstractAsyncExceptionHandler)
+        test_exception_handler.can_handle.return_value = True
+        test_dispatcher = GenericRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=test_request_handler)])],
+                handler_adapters=[GenericHandlerAdapter()],
+                exception_mapper=GenericExceptionMapper(
+                    exception_handlers=[test_exception_handler])))
+
+        with self.assertRaises(DispatchException):
+            test_dispatcher.dispatch(handler_input=self.valid_handler_input)
+
+        test_exception_handler.handle.assert_not_called(), (
+            "Dispatcher called handle of async exception handler")
+
+    def test_dispatch_reports_phase_timings_to_metrics_sinks(self):
+        class TestRequestHandler(AbstractRequestHandler):
+            def can_handle(self, handler_input):
+                return True
+
+            def handle(self, handler_input):
+                return "Test Response"
+
+        test_metrics_sink = InMemoryMetricsSink()
+        self.test_dispatcher = GenericRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=TestRequestHandler())])],
+                handler_adapters=[GenericHandlerAdapter()],
+                metrics_sinks=[test_metrics_sink]))
+
+        test_handler_input = TestDispatchInput(request="test")
+        self.test_dispatcher.dispatch(handler_input=test_handler_input)
+
+        timings = test_handler_input.dispatch_timings
+        assert [phase_timing.phase for phase_timing in timings.phases] == [
+            DispatchPhase.GLOBAL_REQUEST_INTERCEPTORS,
+            DispatchPhase.REQUEST_MAPPING,
+            DispatchPhase.HANDLER_ADAPTER_RESOLUTION,
+            DispatchPhase.LOCAL_REQUEST_INTERCEPTORS,
+            DispatchPhase.HANDLER_EXECUTION,
+            DispatchPhase.LOCAL_RESPONSE_INTERCEPTORS,
+            DispatchPhase.GLOBAL_RESPONSE_INTERCEPTORS,
+            DispatchPhase.DISPATCH], (
+            "Dispatcher didn't attach the timings of all dispatch phases to "
+            "the handler input")
+        assert timings.request_handler == "TestRequestHandler", (
+            "Dispatcher didn't label the timings with the request handler "
+            "class name")
+        assert len(test_metrics_sink.get_durations(
+            DispatchPhase.HANDLER_EXECUTION,
+            request_handler="TestRequestHandler")) == 1, (
+            "Dispatcher didn't report the timings to the metrics sink")
+
+    def test_dispatch_reports_exception_phase_timings_to_metrics_sinks(self):
+        test_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        test_request_handler.can_handle.return_value = True
+        test_request_handler.handle.side_effect = ValueError("test")
+        test_exception_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        test_exception_handler.can_handle.return_value = True
+        test_metrics_sink = mock.MagicMock(spec=AbstractMetricsSink)
+
+        self.test_dispatcher = GenericRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=test_request_handler)])],
+                handler_adapters=[GenericHandlerAdapter()],
+                exception_mapper=GenericExceptionMapper(
+                    exception_handlers=[test_exception_handler]),
+                metrics_sinks=[test_metrics_sink]))
+
+        self.test_dispatcher.dispatch(handler_input=self.valid_handler_input)
+
+        called_args, called_kwargs = test_metrics_sink.report.call_args
+        timings = called_args[0]
+        assert timings.get_duration(
+            DispatchPhase.EXCEPTION_MAPPING) is not None, (
+            "Dispatcher didn't time exception mapping phase")
+        assert timings.get_duration(
+            DispatchPhase.EXCEPTION_HANDLING) is not None, (
+            "Dispatcher didn't time exception handling phase")
+        assert timings.get_duration(
+            DispatchPhase.HANDLER_EXECUTION) is None, (
+            "Dispatcher recorded handler execution phase for a handler "
+            "that raised an exception")
+
+    def test_dispatch_without_metrics_sinks_doesnt_attach_timings(self):
+        test_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        test_request_handler.can_handle.return_value = True
+        self.test_dispatcher = GenericRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=test_request_handler)])],
+                handler_adapters=[GenericHandlerAdapter()]))
+
+        test_handler_input = TestDispatchInput(request="test")
+        self.test_dispatcher.dispatch(handler_input=test_handler_input)
+
+        assert not hasattr(test_handler_input, "dispatch_timings"), (
+            "Dispatcher attached timings to handler input when no metrics "
+            "sinks are registered")
+
+
+class TestFrozenRequestDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.valid_handler_input = mock.Mock()
+        self.calls = []
+
+    def create_handler(self, name, can_handle=True):
+        test_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        test_request_handler.can_handle.return_value = can_handle
+        test_request_handler.handle.side_effect = (
+            lambda handler_input: self.calls.append(name) or name)
+        return test_request_handler
+
+    def create_interceptor(self, name, spec):
+        test_interceptor = mock.MagicMock(spec=spec)
+        test_interceptor.process.side_effect = (
+            lambda **kwargs: self.calls.append(name))
+        return test_interceptor
+
+    def test_dispatch_runs_compiled_chain_with_interceptors(self):
+        test_chain = GenericRequestHandlerChain(
+            request_handler=self.create_handler("handler"),
+            request_interceptors=[self.create_interceptor(
+                "local_request", AbstractRequestInterceptor)],
+            response_interceptors=[self.create_interceptor(
+                "local_response", AbstractResponseInterceptor)])
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=self.create_handler(
+                            "other", can_handle=False)), test_chain])],
+                handler_adapters=[GenericHandlerAdapter()],
+                request_interceptors=[self.create_interceptor(
+                    "global_request", AbstractRequestInterceptor)],
+                response_interceptors=[self.create_interceptor(
+                    "global_response", AbstractResponseInterceptor)]))
+
+        assert test_dispatcher.dispatch(
+            handler_input=self.valid_handler_input) == "handler", (
+            "Frozen Dispatcher didn't return the output of the handler that "
+            "can handle the input")
+        assert self.calls == [
+            "global_request", "local_request", "handler", "local_response",
+            "global_response"], (
+            "Frozen Dispatcher didn't run interceptors and handler in order")
+
+    def test_dispatch_with_no_suitable_handler_throws_error(self):
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=self.create_handler(
+                            "other", can_handle=False))])],
+                handler_adapters=[GenericHandlerAdapter()]))
+
+        with self.assertRaises(DispatchException) as exc:
+            test_dispatcher.dispatch(handler_input=self.valid_handler_input)
+
+        assert "Unable to find a suitable request handler" in str(
+            exc.exception), (
+            "Frozen Dispatcher didn't throw Dispatch Exception when no "
+            "handler can handle the input")
+
+    def test_dispatch_with_no_suitable_adapter_throws_error(self):
+        test_adapter = mock.MagicMock(spec=GenericHandlerAdapter)
+        test_adapter.supports.return_value = False
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=self.create_handler("handler"))])],
+                handler_adapters=[test_adapter]))
+
+        with self.assertRaises(DispatchException) as exc:
+            test_dispatcher.dispatch(handler_input=self.valid_handler_input)
+
+        assert "Unable to find a suitable request adapter" in str(
+            exc.exception), (
+            "Frozen Dispatcher didn't throw Dispatch Exception when no "
+            "adapter supports the handler")
+
+    def test_dispatch_resolves_adapters_ahead_of_time(self):
+        test_adapter = mock.MagicMock(spec=GenericHandlerAdapter)
+        test_adapter.supports.return_value = True
+        test_adapter.execute.return_value = "adapter output"
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=self.create_handler("handler"))])],
+                handler_adapters=[test_adapter]))
+
+        for _ in range(2):
+            assert test_dispatcher.dispatch(
+                handler_input=self.valid_handler_input) == "adapter output", (
+                "Frozen Dispatcher didn't execute the handler through the "
+                "supporting adapter")
+
+        test_adapter.supports.assert_called_once()
+        assert test_adapter.execute.call_count == 2
+
+    def test_dispatch_through_indexed_and_custom_mappers(self):
+        indexed_handler = self.create_handler("indexed", can_handle=False)
+        indexed_mapper = IndexedRequestMapper(
+            request_handler_chains=[GenericRequestHandlerChain(
+                request_handler=indexed_handler)],
+            routing_keys_func=lambda handler_input: ())
+        custom_mapper = mock.MagicMock(spec=AbstractRequestMapper)
+        custom_mapper.get_request_handler_chain.return_value = (
+            GenericRequestHandlerChain(
+                request_handler=self.create_handler("custom")))
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[indexed_mapper, custom_mapper],
+                handler_adapters=[GenericHandlerAdapter()]))
+
+        assert test_dispatcher.dispatch(
+            handler_input=self.valid_handler_input) == "custom", (
+            "Frozen Dispatcher didn't fall through to the handler chain of "
+            "custom request mapper")
+        indexed_handler.can_handle.assert_called_once_with(
+            handler_input=self.valid_handler_input)
+
+    def test_dispatch_exception_to_exception_mapper(self):
+        test_request_handler = self.create_handler("handler")
+        test_request_handler.handle.side_effect = ValueError("test")
+        test_exception_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        test_exception_handler.can_handle.return_value = True
+        test_exception_handler.handle.return_value = "exception output"
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=test_request_handler)])],
+                handler_adapters=[GenericHandlerAdapter()],
+                exception_mapper=GenericExceptionMapper(
+                    exception_handlers=[test_exception_handler])))
+
+        assert test_dispatcher.dispatch(
+            handler_input=self.valid_handler_input) == "exception output", (
+            "Frozen Dispatcher didn't handle exception raised by request "
+            "handler through the exception mapper")
+
+    def test_dispatch_async_components_throws_error(self):
+        test_request_handler = mock.MagicMock(spec=AbstractAsyncRequestHandler)
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=test_request_handler)])],
+                handler_adapters=[GenericHandlerAdapter()]))
+        test_interceptor_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=self.create_handler("handler"))])],
+                handler_adapters=[GenericHandlerAdapter()],
+                request_interceptors=[self.create_interceptor(
+                    "global_request", AbstractAsyncRequestInterceptor)]))
+
+        with self.assertRaises(DispatchException) as exc:
+            test_dispatcher.dispatch(handler_input=self.valid_handler_input)
+        with self.assertRaises(DispatchException):
+            test_interceptor_dispatcher.dispatch(
+                handler_input=self.valid_handler_input)
+
+        assert "async dispatch component" in str(exc.exception), (
+            "Frozen Dispatcher didn't throw Dispatch Exception for async "
+            "request handler")
+        test_request_handler.handle.assert_not_called(), (
+            "Frozen Dispatcher called handle of async request handler")
+        assert self.calls == [], (
+            "Frozen Dispatcher ran async interceptor or handler")
+
+    def test_dispatch_with_metrics_sink_falls_back_to_generic_dispatch(self):
+        test_metrics_sink = InMemoryMetricsSink()
+        test_dispatcher = FrozenRequestDispatcher(
+            options=RuntimeConfiguration(
+                request_mappers=[GenericRequestMapper(
+                    request_handler_chains=[GenericRequestHandlerChain(
+                        request_handler=self.create_handler("handler"))])],
+                handler_adapters=[GenericHandlerAdapter()],
+                metrics_sinks=[test_metrics_sink]))
+
+        assert test_dispatcher.dispatch(
+            handler_input=self.valid_handler_input) == "handler", (
+            "Frozen Dispatcher with metrics sinks didn't return the output "
+            "of the handler that can handle the input")
+        assert test_metrics_sink.get_durations(DispatchPhase.DISPATCH), (
+            "Frozen Dispatcher with metrics sinks didn't report dispatch "
+            "timings")
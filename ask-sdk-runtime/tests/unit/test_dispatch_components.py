@@ -15,13 +15,15 @@
 # specific language governing permissions and limitations under the
 # License.
 #
+import threading
 import unittest
 
 from ask_sdk_runtime.dispatch_components import (
     GenericRequestMapper, GenericRequestHandlerChain, AbstractRequestHandler,
     GenericRequestHandlerChain, AbstractRequestInterceptor,
     AbstractResponseInterceptor, GenericHandlerAdapter, AbstractExceptionHandler,
-    GenericExceptionMapper)
+    GenericExceptionMapper, IndexedRequestMapper, RequestInterceptorGroup,
+    AbstractAsyncRequestInterceptor)
 from ask_sdk_runtime.exceptions import DispatchException
 
 try:
@@ -208,6 +210,214 @@ class TestGenericRequestMapper(unittest.TestCase):
             "a Null Handler Chain is passed")
 
 
+class TestIndexedRequestMapper(unittest.TestCase):
+    def create_handler_chain(self, routing_key=None, can_handle=True):
+        test_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        test_request_handler.can_handle.return_value = can_handle
+        if routing_key is not None:
+            test_request_handler.routing_key = routing_key
+        return GenericRequestHandlerChain(request_handler=test_request_handler)
+
+    def test_indexed_request_mapper_initialization_with_invalid_keys_func_throw_error(self):
+        with self.assertRaises(DispatchException) as exc:
+            IndexedRequestMapper(
+                request_handler_chains=None, routing_keys_func=None)
+
+        assert "Routing keys function should be a callable" in str(
+            exc.exception), (
+            "Indexed Request Mapper didn't throw error during initialization "
+            "when an invalid routing keys function is passed")
+
+    def test_indexed_request_mapper_initialization_with_chain_containing_invalid_type_throw_error(self):
+        with self.assertRaises(DispatchException) as exc:
+            IndexedRequestMapper(
+                request_handler_chains=[mock.Mock()],
+                routing_keys_func=lambda handler_input: ())
+
+        assert ("Request Handler Chain is not a GenericRequestHandlerChain "
+                "instance") in str(exc.exception), (
+            "Indexed Request Mapper didn't throw error during initialization "
+            "when an invalid Handler Chain is passed")
+
+    def test_get_handler_chain_for_indexed_key(self):
+        test_handler_input = TestDispatchInput(request="test_intent")
+        test_other_chain = self.create_handler_chain(routing_key="other")
+        test_intent_chain = self.create_handler_chain(routing_key="intent")
+
+        test_request_mapper = IndexedRequestMapper(
+            request_handler_chains=[test_other_chain, test_intent_chain],
+            routing_keys_func=lambda handler_input: ["intent"])
+
+        assert test_request_mapper.get_request_handler_chain(
+            test_handler_input) == test_intent_chain, (
+            "get_request_handler_chain in Indexed Request Mapper found "
+            "incorrect request handler chain for indexed routing key")
+        test_other_chain.request_handler.can_handle.assert_not_called()
+
+    def test_get_handler_chain_keeps_registration_order(self):
+        test_handler_input = TestDispatchInput(request="test_intent")
+        test_unindexed_chain = self.create_handler_chain(can_handle=False)
+        test_type_chain = self.create_handler_chain(routing_key="type")
+        test_intent_chain = self.create_handler_chain(routing_key="intent")
+        test_fallback_chain = self.create_handler_chain()
+
+        test_request_mapper = IndexedRequestMapper(
+            request_handler_chains=[
+                test_unindexed_chain, test_type_chain, test_intent_chain,
+                test_fallback_chain],
+            routing_keys_func=lambda handler_input: ["intent", "type"])
+
+        assert test_request_mapper.get_request_handler_chain(
+            test_handler_input) == test_type_chain, (
+            "get_request_handler_chain in Indexed Request Mapper didn't "
+            "return the first registered matching handler chain")
+        test_unindexed_chain.request_handler.can_handle.assert_called_once_with(
+            handler_input=test_handler_input)
+
+    def test_get_handler_chain_falls_back_to_unindexed_chains(self):
+        test_handler_input = TestDispatchInput(request="test_input")
+        test_intent_chain = self.create_handler_chain(routing_key="intent")
+        test_fallback_chain = self.create_handler_chain()
+
+        test_request_mapper = IndexedRequestMapper(
+            request_handler_chains=[test_intent_chain, test_fallback_chain],
+            routing_keys_func=lambda handler_input: ["unknown"])
+
+        assert test_request_mapper.get_request_handler_chain(
+            test_handler_input) == test_fallback_chain, (
+            "get_request_handler_chain in Indexed Request Mapper didn't "
+            "fall back to the non indexed handler chains")
+
+    def test_no_handler_chain_registered_for_key(self):
+        test_handler_input = TestDispatchInput(request="test_input")
+        test_intent_chain = self.create_handler_chain(routing_key="intent")
+
+        test_request_mapper = IndexedRequestMapper(
+            request_handler_chains=[test_intent_chain],
+            routing_keys_func=lambda handler_input: ["unknown"])
+
+        assert test_request_mapper.get_request_handler_chain(
+            test_handler_input) is None, (
+            "get_request_handler_chain in Indexed Request Mapper found an "
+            "unsupported request handler chain")
+
+    def test_add_request_handler_chain_resets_candidates(self):
+        test_handler_input = TestDispatchInput(request="test_intent")
+        test_intent_chain = self.create_handler_chain(
+            routing_key="intent", can_handle=False)
+        test_new_intent_chain = self.create_handler_chain(routing_key="intent")
+
+        test_request_mapper = IndexedRequestMapper(
+            request_handler_chains=[test_intent_chain],
+            routing_keys_func=lambda handler_input: ["intent"])
+
+        assert test_request_mapper.get_request_handler_chain(
+            test_handler_input) is None
+        test_request_mapper.add_request_handler_chain(test_new_intent_chain)
+
+        assert test_request_mapper.get_request_handler_chain(
+            test_handler_input) == test_new_intent_chain, (
+            "Indexed Request Mapper didn't route to the handler chain added "
+            "after a lookup")
+        assert test_request_mapper.request_handler_chains == [
+            test_intent_chain, test_new_intent_chain]
+
+
+class TestRequestInterceptorGroup(unittest.TestCase):
+    def test_interceptor_group_with_empty_interceptors_throw_error(self):
+        with self.assertRaises(DispatchException) as exc:
+            RequestInterceptorGroup(request_interceptors=[])
+
+        assert "should contain at least one Request Interceptor" in str(
+            exc.exception), (
+            "Request Interceptor Group didn't throw exception when "
+            "initialized with no interceptors")
+
+    def test_interceptor_group_with_invalid_interceptor_throw_error(self):
+        with self.assertRaises(DispatchException) as exc:
+            RequestInterceptorGroup(request_interceptors=[mock.Mock()])
+
+        assert "Input should be a list of RequestInterceptor instances" in str(
+            exc.exception), (
+            "Request Interceptor Group didn't throw exception when "
+            "initialized with invalid interceptor")
+
+    def test_interceptor_group_with_invalid_max_workers_throw_error(self):
+        with self.assertRaises(DispatchException) as exc:
+            RequestInterceptorGroup(
+                request_interceptors=[
+                    mock.MagicMock(spec=AbstractRequestInterceptor)],
+                max_workers=0)
+
+        assert "Max workers of Request Interceptor Group" in str(
+            exc.exception), (
+            "Request Interceptor Group didn't throw exception when "
+            "initialized with non positive max workers")
+
+    def test_interceptor_group_processes_interceptors_concurrently(self):
+        second_processed = threading.Event()
+
+        class WaitingInterceptor(AbstractRequestInterceptor):
+            def process(self, handler_input):
+                handler_input.append(second_processed.wait(timeout=5))
+
+        class SignallingInterceptor(AbstractRequestInterceptor):
+            def process(self, handler_input):
+                second_processed.set()
+
+        test_handler_input = []
+        interceptor_group = RequestInterceptorGroup(
+            request_interceptors=[
+                WaitingInterceptor(), SignallingInterceptor()])
+
+        interceptor_group.process(handler_input=test_handler_input)
+
+        assert test_handler_input == [True], (
+            "Request Interceptor Group didn't process interceptors "
+            "concurrently")
+
+    def test_interceptor_group_raises_first_exception_in_registration_order(
+            self):
+        first_interceptor = mock.MagicMock(spec=AbstractRequestInterceptor)
+        first_interceptor.process.side_effect = ValueError("first")
+        second_interceptor = mock.MagicMock(spec=AbstractRequestInterceptor)
+        second_interceptor.process.side_effect = TypeError("second")
+        third_interceptor = mock.MagicMock(spec=AbstractRequestInterceptor)
+
+        interceptor_group = RequestInterceptorGroup(
+            request_interceptors=[
+                first_interceptor, second_interceptor, third_interceptor])
+
+        with self.assertRaises(ValueError):
+            interceptor_group.process(handler_input=None)
+
+        third_interceptor.process.assert_called_once_with(
+            handler_input=None), (
+            "Request Interceptor Group didn't process all interceptors "
+            "when one of them raised an exception")
+
+    def test_interceptor_group_with_async_interceptor_throws_error(self):
+        sync_interceptor = mock.MagicMock(spec=AbstractRequestInterceptor)
+        async_interceptor = mock.MagicMock(
+            spec=AbstractAsyncRequestInterceptor)
+
+        interceptor_group = RequestInterceptorGroup(
+            request_interceptors=[sync_interceptor, async_interceptor])
+
+        with self.assertRaises(DispatchException) as exc:
+            interceptor_group.process(handler_input=None)
+
+        assert "async interceptors" in str(exc.exception), (
+            "Request Interceptor Group didn't throw exception when "
+            "processed synchronously with async interceptors")
+        sync_interceptor.process.assert_not_called(), (
+            "Request Interceptor Group processed interceptors of a group "
+            "containing async interceptors")
+        async_interceptor.process.assert_not_called(), (
+            "Request Interceptor Group called process of async "
+            "interceptor synchronously")
+
+
 class TestGenericRequestHandlerChain(unittest.TestCase):
     def test_generic_handler_chain_with_null_request_handler_throws_error(self):
         with self.assertRaises(DispatchException) as exc:
@@ -468,3 +678,95 @@ class TestGenericExceptionMapper(unittest.TestCase):
             "get_handler in Generic Exception Mapper found incorrect request "
             "exception handler for "
             "input and custom exception")
+
+    def test_add_exception_handler_throw_error_for_invalid_exception_type(
+            self):
+        test_exception_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        test_exception_handler.exception_type = "ValueError"
+
+        with self.assertRaises(DispatchException) as exc:
+            GenericExceptionMapper(exception_handlers=[test_exception_handler])
+
+        assert "exception_type should be an exception class" in str(
+            exc.exception), (
+            "Exception Mapper didn't throw error when an Exception Handler "
+            "with invalid exception_type is registered")
+
+    def test_get_handler_resolves_typed_handlers_through_mro(self):
+        class TestBaseError(Exception):
+            pass
+
+        class TestChildError(TestBaseError):
+            pass
+
+        untyped_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        untyped_handler.can_handle.side_effect = (
+            lambda handler_input, exception: isinstance(exception, ValueError))
+        base_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        base_handler.exception_type = TestBaseError
+        base_handler.can_handle.return_value = True
+        child_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        child_handler.exception_type = TestChildError
+        child_handler.can_handle.return_value = True
+        test_exception_mapper = GenericExceptionMapper(
+            exception_handlers=[untyped_handler, base_handler, child_handler])
+
+        assert test_exception_mapper.get_candidate_handlers(
+            TestChildError()) == (
+            untyped_handler, base_handler, child_handler), (
+            "Exception Mapper didn't keep registration order of handlers "
+            "matching the exception MRO and untyped handlers")
+        assert test_exception_mapper.get_candidate_handlers(
+            TestBaseError()) == (untyped_handler, base_handler), (
+            "Exception Mapper didn't skip typed handlers registered on a "
+            "subclass of the exception class")
+        assert test_exception_mapper.get_handler(
+            handler_input=None, exception=TestBaseError()) == base_handler, (
+            "Exception Mapper didn't resolve typed handler registered on "
+            "exception class")
+        assert test_exception_mapper.get_handler(
+            handler_input=None, exception=ValueError()) == untyped_handler, (
+            "Exception Mapper didn't fall back to untyped handlers for "
+            "exceptions without typed handlers")
+        child_handler.can_handle.assert_not_called()
+        assert test_exception_mapper.exception_handlers == [
+            untyped_handler, base_handler, child_handler], (
+            "Exception Mapper didn't keep registration order of exception "
+            "handlers")
+
+    def test_get_handler_prefers_earlier_untyped_handler_over_typed(self):
+        untyped_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        untyped_handler.can_handle.return_value = True
+        typed_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        typed_handler.exception_type = ValueError
+        typed_handler.can_handle.return_value = True
+        test_exception_mapper = GenericExceptionMapper(
+            exception_handlers=[untyped_handler, typed_handler])
+
+        assert test_exception_mapper.get_handler(
+            handler_input=None, exception=ValueError()) == untyped_handler, (
+            "Exception Mapper didn't return the first registered handler "
+            "that can handle the exception")
+        typed_handler.can_handle.assert_not_called()
+
+    def test_get_handler_checks_untyped_handlers_in_registration_order(self):
+        test_exception_handler_1 = mock.MagicMock(
+            spec=AbstractExceptionHandler)
+        test_exception_handler_1.can_handle.return_value = False
+        test_exception_handler_2 = mock.MagicMock(
+            spec=AbstractExceptionHandler)
+        test_exception_handler_2.can_handle.return_value = True
+        typed_handler = mock.MagicMock(spec=AbstractExceptionHandler)
+        typed_handler.exception_type = ValueError
+        typed_handler.can_handle.return_value = False
+        test_exception_mapper = GenericExceptionMapper(
+            exception_handlers=[
+                test_exception_handler_1, typed_handler,
+                test_exception_handler_2])
+
+        assert test_exception_mapper.get_handler(
+            handler_input=None,
+            exception=ValueError()) == test_exception_handler_2, (
+            "Exception Mapper didn't check untyped handlers in "
+            "registration order, when the typed handler can't handle the "
+            "exception")
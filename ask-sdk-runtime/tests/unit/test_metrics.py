@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+import logging
+import unittest
+
+from ask_sdk_runtime.metrics import (
+    DispatchTimings, PhaseTiming, DispatchPhase, AbstractMetricsSink,
+    LoggingMetricsSink, StatsdMetricsSink, InMemoryMetricsSink,
+    report_timings)
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+
+class TestHandler(object):
+    pass
+
+
+def create_timings():
+    timings = DispatchTimings()
+    timings.phases = [
+        PhaseTiming(DispatchPhase.REQUEST_MAPPING, 1.0, 1.001),
+        PhaseTiming(DispatchPhase.HANDLER_EXECUTION, 1.001, 1.011)]
+    timings.set_request_handler(TestHandler())
+    return timings
+
+
+class TestDispatchTimings(unittest.TestCase):
+    def test_record_phase(self):
+        timings = DispatchTimings()
+        start = timings.start()
+        timings.record(DispatchPhase.HANDLER_EXECUTION, start)
+
+        assert timings.phases[0].phase == DispatchPhase.HANDLER_EXECUTION, (
+            "Dispatch Timings didn't record the phase")
+        assert timings.get_duration(DispatchPhase.HANDLER_EXECUTION) >= 0, (
+            "Dispatch Timings recorded a negative phase duration")
+        assert timings.get_duration(DispatchPhase.REQUEST_MAPPING) is None, (
+            "Dispatch Timings returned a duration for a phase that wasn't "
+            "recorded")
+
+    def test_labels_contain_handler_class_names(self):
+        timings = create_timings()
+
+        assert timings.labels == {"request_handler": "TestHandler"}, (
+            "Dispatch Timings labels don't contain request handler class "
+            "name")
+
+
+class TestMetricsSinks(unittest.TestCase):
+    def test_logging_sink_logs_phase_durations(self):
+        test_logger = mock.MagicMock(spec=logging.Logger)
+        test_logger.isEnabledFor.return_value = True
+
+        LoggingMetricsSink(logger=test_logger).report(create_timings())
+
+        called_args, called_kwargs = test_logger.log.call_args
+        log_line = called_args[1] % called_args[2:]
+        assert "request_handler=TestHandler" in log_line, (
+            "Logging Metrics Sink didn't log the request handler label")
+        assert "handler_execution=10.000ms" in log_line, (
+            "Logging Metrics Sink didn't log the phase duration")
+
+    def test_statsd_sink_sends_timers_with_tags(self):
+        sink = StatsdMetricsSink(host="test_host", port=1234, prefix="test")
+        test_socket = mock.MagicMock()
+        sink._socket = test_socket
+
+        sink.report(create_timings())
+
+        called_args, called_kwargs = test_socket.sendto.call_args
+        assert called_args[0].decode("utf-8").split("\n") == [
+            "test.request_mapping:1.000|ms|#request_handler:TestHandler",
+            "test.handler_execution:10.000|ms|#request_handler:TestHandler"
+        ], "StatsD Metrics Sink sent incorrect payload"
+        assert called_args[1] == ("test_host", 1234), (
+            "StatsD Metrics Sink sent payload to incorrect address")
+
+    def test_in_memory_sink_stores_durations_per_handler(self):
+        sink = InMemoryMetricsSink(max_samples=2)
+        for _ in range(3):
+            sink.report(create_timings())
+
+        durations = sink.get_durations(
+            DispatchPhase.HANDLER_EXECUTION, request_handler="TestHandler")
+        assert len(durations) == 2, (
+            "In Memory Metrics Sink didn't bound the stored durations")
+        assert sink.get_durations(
+            DispatchPhase.HANDLER_EXECUTION,
+            request_handler="OtherHandler") == [], (
+            "In Memory Metrics Sink returned durations of a different "
+            "request handler")
+
+        sink.clear()
+        assert sink.get_durations(DispatchPhase.HANDLER_EXECUTION) == [], (
+            "In Memory Metrics Sink didn't clear stored durations")
+
+    def test_report_timings_doesnt_raise_sink_exceptions(self):
+        failing_sink = mock.MagicMock(spec=AbstractMetricsSink)
+        failing_sink.report.side_effect = IOError("test")
+        other_sink = mock.MagicMock(spec=AbstractMetricsSink)
+        timings = create_timings()
+
+        report_timings([failing_sink, other_sink], timings)
+
+        other_sink.report.assert_called_once_with(timings)
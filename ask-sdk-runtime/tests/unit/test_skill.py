@@ -22,8 +22,10 @@ from ask_sdk_runtime.skill import (
 from ask_sdk_runtime.dispatch_components import (
     GenericHandlerAdapter, GenericRequestMapper, GenericRequestHandlerChain,
     AbstractRequestHandler, AbstractExceptionHandler,
-    AbstractRequestInterceptor, AbstractResponseInterceptor)
+    AbstractRequestInterceptor, AbstractResponseInterceptor,
+    RequestInterceptorGroup)
 from ask_sdk_runtime.exceptions import AskSdkException, RuntimeConfigException
+from ask_sdk_runtime.metrics import AbstractMetricsSink
 
 try:
     import mock
@@ -151,6 +153,66 @@ class TestRuntimeConfigurationBuilder(unittest.TestCase):
             "interceptor to Skill Builder "
             "Request Interceptors list")
 
+    def test_add_invalid_global_request_interceptor_group_throw_error(self):
+        with self.assertRaises(RuntimeConfigException) as exc:
+            self.rcb.add_global_request_interceptor_group(
+                request_interceptors=[mock.Mock()])
+
+        assert "Input should be a list of RequestInterceptor instances" in str(
+            exc.exception), (
+            "Add Global Request Interceptor Group method didn't throw "
+            "exception when an invalid request interceptor is added")
+
+    def test_add_valid_global_request_interceptor_group(self):
+        mock_request_interceptors = [
+            mock.MagicMock(spec=AbstractRequestInterceptor),
+            mock.MagicMock(spec=AbstractRequestInterceptor)]
+
+        self.rcb.add_global_request_interceptor_group(
+            request_interceptors=mock_request_interceptors, max_workers=1)
+
+        interceptor_group = self.rcb.global_request_interceptors[0]
+        assert isinstance(interceptor_group, RequestInterceptorGroup), (
+            "Add Global Request Interceptor Group method didn't add a "
+            "request interceptor group to the Request Interceptors list")
+        assert interceptor_group.request_interceptors == \
+            mock_request_interceptors, (
+            "Add Global Request Interceptor Group method didn't add the "
+            "provided interceptors to the group")
+        assert interceptor_group.max_workers == 1, (
+            "Add Global Request Interceptor Group method didn't set max "
+            "workers on the group")
+
+    def test_add_invalid_metrics_sink_throw_error(self):
+        with self.assertRaises(RuntimeConfigException) as exc:
+            self.rcb.add_metrics_sink(metrics_sink=mock.Mock())
+
+        assert "Input should be a MetricsSink instance" in str(
+            exc.exception), (
+            "Add Metrics Sink method didn't throw exception when an invalid "
+            "metrics sink is added")
+
+    def test_add_valid_metrics_sink(self):
+        mock_metrics_sink = mock.MagicMock(spec=AbstractMetricsSink)
+
+        self.rcb.add_metrics_sink(metrics_sink=mock_metrics_sink)
+
+        assert self.rcb.get_runtime_configuration().metrics_sinks == [
+            mock_metrics_sink], (
+            "Add Metrics Sink method didn't add valid metrics sink to the "
+            "runtime configuration")
+
+    def test_enable_frozen_dispatch(self):
+        assert not self.rcb.get_runtime_configuration().frozen, (
+            "Runtime Configuration Builder enabled frozen dispatch by "
+            "default")
+
+        self.rcb.enable_frozen_dispatch()
+
+        assert self.rcb.get_runtime_configuration().frozen, (
+            "Enable Frozen Dispatch method didn't set frozen flag on the "
+            "runtime configuration")
+
     def test_add_null_global_response_interceptor_throw_error(self):
         with self.assertRaises(RuntimeConfigException) as exc:
             self.rcb.add_global_response_interceptor(response_interceptor=None)
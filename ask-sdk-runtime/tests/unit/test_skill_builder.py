@@ -23,7 +23,7 @@ from ask_sdk_runtime.dispatch_components import (
     GenericHandlerAdapter, GenericRequestMapper, GenericRequestHandlerChain,
     AbstractRequestHandler, AbstractExceptionHandler,
     AbstractRequestInterceptor, AbstractResponseInterceptor,
-    GenericExceptionMapper)
+    GenericExceptionMapper, IndexedRequestMapper)
 from ask_sdk_runtime.view_resolvers import (
     AbstractTemplateLoader, AbstractTemplateRenderer)
 from ask_sdk_runtime.exceptions import (
@@ -384,6 +384,52 @@ class TestSkillBuilder(unittest.TestCase):
             "Request Handler decorator created Request Handler with incorrect "
             "handle function")
 
+    def test_request_handler_decorator_sets_routing_key(self):
+        def test_can_handle(input):
+            return True
+        test_can_handle.routing_key = "test_key"
+
+        def test_handle(input):
+            return "something"
+
+        self.sb.request_handler(can_handle_func=test_can_handle)(
+            handle_func=test_handle)
+
+        options = self.sb.runtime_configuration_builder
+        actual_request_handler = options.request_handler_chains[
+            0].request_handler
+
+        assert actual_request_handler.routing_key == "test_key", (
+            "Request Handler decorator didn't set the routing key of the "
+            "can_handle function on the Request Handler")
+
+    def test_enable_request_indexing_with_invalid_keys_func_throw_error(self):
+        with self.assertRaises(RuntimeConfigException) as exc:
+            self.sb.enable_request_indexing(routing_keys_func=None)
+
+        assert "Routing keys function should be a callable" in str(
+            exc.exception), (
+            "Enable Request Indexing method didn't throw exception when an "
+            "invalid routing keys function is provided")
+
+    def test_enable_request_indexing_creates_indexed_request_mapper(self):
+        mock_request_handler = mock.MagicMock(spec=AbstractRequestHandler)
+        self.sb.add_request_handler(request_handler=mock_request_handler)
+        self.sb.enable_request_indexing(
+            routing_keys_func=lambda handler_input: ())
+
+        actual_config = (
+            self.sb.runtime_configuration_builder.get_runtime_configuration())
+
+        assert isinstance(
+            actual_config.request_mappers[0], IndexedRequestMapper), (
+            "Runtime Configuration Builder didn't create an Indexed Request "
+            "Mapper when request indexing is enabled")
+        assert actual_config.request_mappers[0].request_handler_chains[
+            0].request_handler == mock_request_handler, (
+            "Runtime Configuration Builder didn't register the request "
+            "handlers in the Indexed Request Mapper")
+
     def test_exception_handler_decorator_creation(self):
         exception_handler_wrapper = self.sb.exception_handler(
             can_handle_func=None)
@@ -446,6 +492,61 @@ class TestSkillBuilder(unittest.TestCase):
             "Exception Handler decorator created Exception Handler with "
             "incorrect handle function")
 
+    def test_exception_handler_decorator_with_exception_type(self):
+        def test_handle(input, exc):
+            return "something"
+
+        self.sb.exception_handler(exception_type=ValueError)(
+            handle_func=test_handle)
+
+        options = self.sb.runtime_configuration_builder
+        actual_exception_handler = options.exception_handlers[0]
+
+        assert actual_exception_handler.exception_type is ValueError, (
+            "Exception Handler decorator didn't set exception_type on "
+            "created Exception Handler")
+        assert actual_exception_handler.can_handle(
+            None, ValueError()) is True, (
+            "Exception Handler decorator created Exception Handler that "
+            "can't handle exceptions of the exception_type")
+        assert actual_exception_handler.can_handle(
+            None, TypeError()) is False, (
+            "Exception Handler decorator created Exception Handler that "
+            "handles exceptions of other types")
+
+    def test_exception_handler_decorator_with_exception_type_and_can_handle_func(
+            self):
+        def test_handle(input, exc):
+            return "something"
+
+        self.sb.exception_handler(
+            can_handle_func=lambda input, exc: str(exc) == "handled",
+            exception_type=ValueError)(handle_func=test_handle)
+
+        actual_exception_handler = (
+            self.sb.runtime_configuration_builder.exception_handlers[0])
+
+        assert actual_exception_handler.can_handle(
+            None, ValueError("handled")) is True, (
+            "Exception Handler decorator created Exception Handler that "
+            "doesn't apply can_handle_func on the exception_type")
+        assert actual_exception_handler.can_handle(
+            None, ValueError("other")) is False, (
+            "Exception Handler decorator created Exception Handler that "
+            "ignores can_handle_func")
+
+    def test_exception_handler_decorator_invalid_exception_type(self):
+        exception_handler_wrapper = self.sb.exception_handler(
+            exception_type="ValueError")
+
+        with self.assertRaises(SkillBuilderException) as exc:
+            exception_handler_wrapper(handle_func=lambda i, e: None)
+
+        assert "exception_type input parameter should be an exception " \
+               "class" in str(exc.exception), (
+            "Exception Handler Decorator accepted invalid exception_type "
+            "parameter")
+
     def test_global_request_interceptor_decorator_creation(self):
         request_interceptor_wrapper = self.sb.global_request_interceptor()
         assert callable(request_interceptor_wrapper), (
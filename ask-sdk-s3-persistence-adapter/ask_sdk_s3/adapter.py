@@ -16,18 +16,22 @@
 # License.
 #
 import boto3
-import json
 import typing
+from collections import OrderedDict
 from boto3.session import ResourceNotExistsError
 from botocore.exceptions import ClientError
 from os.path import join
 from ask_sdk_core.attributes_manager import AbstractPersistenceAdapter
 from ask_sdk_core.exceptions import PersistenceException
+from ask_sdk_core.json_codec import get_default_json_codec
+from ask_sdk_core.utils.concurrency import map_concurrently
 
 from .object_keygen import user_id_keygen
 
 if typing.TYPE_CHECKING:
-    from typing import Callable, Dict
+    from typing import Callable, Dict, Optional, Iterable, List
+    from ask_sdk_core.attributes_codec import AbstractAttributesCodec
+    from ask_sdk_core.json_codec import AbstractJsonCodec
     from ask_sdk_model import RequestEnvelope
     from boto3.resources.base import ServiceResource
 
@@ -39,6 +43,13 @@ class S3Adapter(AbstractPersistenceAdapter):
     internally uses the AWS Python SDK (`boto3`) to process
     the s3 operations.
 
+    The attributes of many object keys can be retrieved, saved and
+    deleted at once, for offline jobs like migrations, through
+    :py:meth:`batch_get_attributes`, :py:meth:`batch_save_attributes`
+    and :py:meth:`batch_delete_attributes`. Objects are retrieved and
+    saved with bounded concurrency, and deleted through
+    ``delete_objects`` requests of up to 1000 keys.
+
     :param bucket_name: S3 bucket name to be used.
     :type bucket_name: str
     :param path_prefix: S3 path prefix
@@ -49,12 +60,23 @@ class S3Adapter(AbstractPersistenceAdapter):
         provides a unique key value.
         Defaulted to user id keygen function.
     :type object_keygen: Callable[[ask_sdk_model.request_envelope.RequestEnvelope], str]
+    :param json_codec: Codec used to encode and decode the attributes.
+        Defaulted to :py:func:`ask_sdk_core.json_codec.get_default_json_codec`
+    :type json_codec: ask_sdk_core.json_codec.AbstractJsonCodec
+    :param attributes_codec: Codec used to encode and decode the attributes to
+        compact and compressed bytes, like :py:class:`ask_sdk_core.attributes_codec.AttributesCodec`.
+        Objects stored as JSON text before the codec was set are still decoded.
+        Defaulted to None, storing the attributes as JSON text
+    :type attributes_codec: ask_sdk_core.attributes_codec.AbstractAttributesCodec
     """
     DEFAULT_PATH_PREFIX = ''
     S3_CLIENT_NAME = 's3'
     S3_OBJECT_BODY_NAME = 'Body'
+    S3_DELETE_OBJECTS_MAX_KEYS = 1000
+    DEFAULT_MAX_CONCURRENCY = 10
 
-    def __init__(self, bucket_name, path_prefix=None, s3_client=None, object_keygen=user_id_keygen):
+    def __init__(self, bucket_name, path_prefix=None, s3_client=None, object_keygen=user_id_keygen,
+                 json_codec=None, attributes_codec=None):
         self.bucket_name = bucket_name
         if not path_prefix:
             self.path_prefix = self.DEFAULT_PATH_PREFIX
@@ -66,6 +88,10 @@ class S3Adapter(AbstractPersistenceAdapter):
         else:
             self.s3_client = s3_client
         self.object_keygen = object_keygen
+        if json_codec is None:
+            json_codec = get_default_json_codec()
+        self.json_codec = json_codec
+        self.attributes_codec = attributes_codec
 
     def get_attributes(self, request_envelope):
         # type: (RequestEnvelope) -> Dict[str, object]
@@ -78,7 +104,121 @@ class S3Adapter(AbstractPersistenceAdapter):
         :rtype: Dict[str, object]
         :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
         """
+        attributes = self.__read_attributes(self.__get_object_id(request_envelope))
+        if attributes is None:
+            return {}
+        return attributes
+
+    def save_attributes(self, request_envelope, attributes):
+        # type: (RequestEnvelope, Dict[str, object]) -> None
+        """Saves attributes to the s3 bucket.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.request_envelope.RequestEnvelope
+        :param attributes: attributes to store in s3
+        :type attributes: Dict[str, object]
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        self.__write_attributes(self.__get_object_id(request_envelope), attributes)
+
+    def delete_attributes(self, request_envelope):
+        # type: (RequestEnvelope) -> None
+        """Deletes attributes from s3 bucket.
+
+        :param request_envelope: Request Envelope passed during skill
+            invocation
+        :type request_envelope: ask_sdk_model.request_envelope.RequestEnvelope
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
         obj_id = self.__get_object_id(request_envelope)
+        try:
+            self.s3_client.delete_object(Bucket=self.bucket_name, Key=obj_id)
+        except ResourceNotExistsError:
+            raise PersistenceException("Failed to delete attributes from s3 bucket {}."
+                                       "Resource does not exist".format(self.bucket_name))
+        except Exception as e:
+            raise PersistenceException("Failed to delete attributes from s3 bucket. "
+                                       "Exception of type {} occurred: {}".format(type(e).__name__, str(e)))
+
+    def batch_get_attributes(self, object_keys, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        # type: (Iterable[str], int) -> Dict[str, Dict[str, object]]
+        """Retrieves the attributes of many object keys from s3 bucket.
+
+        The objects are retrieved with at most ``max_concurrency``
+        ``get_object`` requests in flight.
+
+        :param object_keys: Object key values, as provided by the
+            object keygen function
+        :type object_keys: Iterable[str]
+        :param max_concurrency: Maximum number of requests sent at the
+            same time. Defaulted to 10
+        :type max_concurrency: int
+        :return: attributes by object key value, for the keys having an
+            object in the s3 bucket
+        :rtype: Dict[str, Dict[str, object]]
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        keys = list(OrderedDict.fromkeys(object_keys))
+        results = map_concurrently(
+            lambda key: self.__read_attributes(join(self.path_prefix, key)), keys, max_concurrency)
+        return {key: attributes for key, attributes in zip(keys, results) if attributes is not None}
+
+    def batch_save_attributes(self, attributes_by_key, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        # type: (Dict[str, Dict[str, object]], int) -> None
+        """Saves the attributes of many object keys to the s3 bucket.
+
+        The objects are saved with at most ``max_concurrency``
+        ``put_object`` requests in flight.
+
+        :param attributes_by_key: attributes to store in s3, by object
+            key value
+        :type attributes_by_key: Dict[str, Dict[str, object]]
+        :param max_concurrency: Maximum number of requests sent at the
+            same time. Defaulted to 10
+        :type max_concurrency: int
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        map_concurrently(
+            lambda item: self.__write_attributes(join(self.path_prefix, item[0]), item[1]),
+            list(attributes_by_key.items()), max_concurrency)
+
+    def batch_delete_attributes(self, object_keys, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        # type: (Iterable[str], int) -> None
+        """Deletes the attributes of many object keys from s3 bucket.
+
+        The objects are deleted through ``delete_objects`` requests of
+        up to 1000 keys, with at most ``max_concurrency`` requests in
+        flight.
+
+        :param object_keys: Object key values, as provided by the
+            object keygen function
+        :type object_keys: Iterable[str]
+        :param max_concurrency: Maximum number of requests sent at the
+            same time. Defaulted to 10
+        :type max_concurrency: int
+        :rtype: None
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
+        obj_ids = [join(self.path_prefix, key) for key in OrderedDict.fromkeys(object_keys)]
+        chunks = [obj_ids[index:index + self.S3_DELETE_OBJECTS_MAX_KEYS]
+                  for index in range(0, len(obj_ids), self.S3_DELETE_OBJECTS_MAX_KEYS)]
+        map_concurrently(self.__delete_objects, chunks, max_concurrency)
+
+    def __read_attributes(self, obj_id):
+        # type: (str) -> Optional[Dict[str, object]]
+        """Retrieves the attributes from the object in s3 bucket.
+
+        :param obj_id: Object id in the s3 bucket
+        :type obj_id: str
+        :return: attributes in the object, or None if the object
+            doesn't exist
+        :rtype: Dict[str, object]
+        :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
+        """
         try:
             obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=obj_id)
         except ResourceNotExistsError:
@@ -86,35 +226,38 @@ class S3Adapter(AbstractPersistenceAdapter):
                                        "Resource does not exist".format(self.bucket_name))
         except ClientError as ex:
             if ex.response['Error']['Code'] == 'NoSuchKey':
-                return {}
+                return None
             raise PersistenceException("Failed to get attributes from s3 bucket. "
                                        "Exception of type {} occurred: {}".format(type(ex).__name__, str(ex)))
         try:
             body = obj.get(self.S3_OBJECT_BODY_NAME)
             if not body:
                 return {}
-            attributes = json.loads(body.read())
-            return attributes
+            data = body.read()
+            if self.attributes_codec is not None:
+                return self.attributes_codec.decode(data)
+            return self.json_codec.loads(data)
         except Exception as e:
             raise PersistenceException("Failed to get attributes from s3 bucket. "
                                        "Exception of type {} occurred: {}".format(type(e).__name__, str(e)))
 
-    def save_attributes(self, request_envelope, attributes):
-        # type: (RequestEnvelope, Dict[str, object]) -> None
-        """Saves attributes to the s3 bucket.
+    def __write_attributes(self, obj_id, attributes):
+        # type: (str, Dict[str, object]) -> None
+        """Saves the attributes to the object in s3 bucket.
 
-        :param request_envelope: Request Envelope passed during skill
-            invocation
-        :type request_envelope: ask_sdk_model.request_envelope.RequestEnvelope
+        :param obj_id: Object id in the s3 bucket
+        :type obj_id: str
         :param attributes: attributes to store in s3
         :type attributes: Dict[str, object]
         :rtype: None
         :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
         """
-        obj_id = self.__get_object_id(request_envelope)
-        json_data = json.dumps(attributes)
+        if self.attributes_codec is not None:
+            data = self.attributes_codec.encode(attributes)
+        else:
+            data = self.json_codec.dumps(attributes)
         try:
-            self.s3_client.put_object(Body=json_data, Bucket=self.bucket_name, Key=obj_id)
+            self.s3_client.put_object(Body=data, Bucket=self.bucket_name, Key=obj_id)
         except ResourceNotExistsError:
             raise PersistenceException("Failed to save attributes to s3 bucket {}."
                                        "Resource does not exist".format(self.bucket_name))
@@ -122,25 +265,31 @@ class S3Adapter(AbstractPersistenceAdapter):
             raise PersistenceException("Failed to save attributes to s3 bucket. "
                                        "Exception of type {} occurred: {}".format(type(e).__name__, str(e)))
 
-    def delete_attributes(self, request_envelope):
-        # type: (RequestEnvelope) -> None
-        """Deletes attributes from s3 bucket.
+    def __delete_objects(self, obj_ids):
+        # type: (List[str]) -> None
+        """Deletes the objects from s3 bucket, in a single request.
 
-        :param request_envelope: Request Envelope passed during skill
-            invocation
-        :type request_envelope: ask_sdk_model.request_envelope.RequestEnvelope
+        :param obj_ids: Object ids in the s3 bucket
+        :type obj_ids: List[str]
         :rtype: None
         :raises: :py:class:`ask_sdk_core.exceptions.PersistenceException`
         """
-        obj_id = self.__get_object_id(request_envelope)
         try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=obj_id)
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": obj_id} for obj_id in obj_ids], "Quiet": True})
         except ResourceNotExistsError:
             raise PersistenceException("Failed to delete attributes from s3 bucket {}."
                                        "Resource does not exist".format(self.bucket_name))
         except Exception as e:
             raise PersistenceException("Failed to delete attributes from s3 bucket. "
                                        "Exception of type {} occurred: {}".format(type(e).__name__, str(e)))
+        errors = response.get("Errors")
+        if errors:
+            raise PersistenceException("Failed to delete attributes of {} objects from s3 bucket. "
+                                       "Error {} occurred for {}: {}".format(
+                                           len(errors), errors[0].get("Code"), errors[0].get("Key"),
+                                           errors[0].get("Message")))
 
     def __get_object_id(self, request_envelope):
         """ Joins the path prefix and the object_id.
@@ -3,8 +3,11 @@ import unittest
 import json
 import os
 from boto3.exceptions import ResourceNotExistsError
+from botocore.exceptions import ClientError
 from ask_sdk_model import RequestEnvelope
+from ask_sdk_core.attributes_codec import AttributesCodec, JsonAttributesFormat, ZlibCompression
 from ask_sdk_core.exceptions import PersistenceException
+from ask_sdk_core.json_codec import AbstractJsonCodec, StdlibJsonCodec
 from ask_sdk_s3.adapter import S3Adapter
 
 try:
@@ -105,7 +108,8 @@ class TestS3Adapter(unittest.TestCase):
         generated_key = os.path.join("test_key", "test_object_key")
 
         test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
-                                    s3_client=self.s3_client, object_keygen=self.object_keygen)
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen,
+                                    json_codec=StdlibJsonCodec())
         test_s3_adapter.save_attributes(request_envelope=self.request_envelope, attributes=_MOCK_DATA)
 
         self.object_keygen.assert_called_once_with(self.request_envelope)
@@ -113,6 +117,27 @@ class TestS3Adapter(unittest.TestCase):
                                                           Bucket=self.bucket_name,
                                                           Key=generated_key)
 
+    def test_save_and_get_attributes_with_configured_json_codec(self):
+        self.object_keygen.return_value = "test_object_key"
+        test_json_codec = mock.MagicMock(spec=AbstractJsonCodec)
+        test_json_codec.dumps.return_value = "encoded attributes"
+        test_json_codec.loads.return_value = _MOCK_DATA
+        self.s3_client.get_object = mock.MagicMock(
+            return_value={"Body": MockData()})
+
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen,
+                                    json_codec=test_json_codec)
+        test_s3_adapter.save_attributes(request_envelope=self.request_envelope, attributes=_MOCK_DATA)
+        result = test_s3_adapter.get_attributes(request_envelope=self.request_envelope)
+
+        test_json_codec.dumps.assert_called_once_with(_MOCK_DATA)
+        self.s3_client.put_object.assert_called_once_with(
+            Body="encoded attributes", Bucket=self.bucket_name,
+            Key=os.path.join("test_key", "test_object_key"))
+        test_json_codec.loads.assert_called_once_with(json.dumps(_MOCK_DATA))
+        self.assertEqual(_MOCK_DATA, result)
+
     def test_save_attributes_to_existing_bucket_put_item_fails(self):
         self.object_keygen.return_value = "test_object_key"
         self.s3_client.put_object.side_effect = Exception("test exception")
@@ -167,6 +192,106 @@ class TestS3Adapter(unittest.TestCase):
         with self.assertRaises(PersistenceException) as exc:
             test_s3_adapter.delete_attributes(request_envelope=self.request_envelope)
 
+    def test_batch_get_attributes(self):
+        def get_object(Bucket, Key):
+            if Key == os.path.join(self.bucket_key, "missing_key"):
+                raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+            return {"Body": MockData()}
+        self.s3_client.get_object.side_effect = get_object
+
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen)
+        result = test_s3_adapter.batch_get_attributes(
+            ["first_key", "missing_key", "second_key", "first_key"])
+
+        self.assertEqual({"first_key": _MOCK_DATA, "second_key": _MOCK_DATA}, result)
+        self.assertEqual(3, self.s3_client.get_object.call_count)
+
+    def test_batch_get_attributes_fails(self):
+        self.s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "test exception"}}, "GetObject")
+
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen)
+
+        with self.assertRaises(PersistenceException) as exc:
+            test_s3_adapter.batch_get_attributes(["first_key", "second_key"])
+
+        self.assertIn("test exception", str(exc.exception))
+
+    def test_batch_save_attributes(self):
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen,
+                                    json_codec=StdlibJsonCodec())
+        test_s3_adapter.batch_save_attributes(
+            {"first_key": {"key": "first"}, "second_key": {"key": "second"}})
+
+        self.assertEqual([
+            mock.call(Body=json.dumps({"key": "first"}), Bucket=self.bucket_name,
+                      Key=os.path.join(self.bucket_key, "first_key")),
+            mock.call(Body=json.dumps({"key": "second"}), Bucket=self.bucket_name,
+                      Key=os.path.join(self.bucket_key, "second_key"))],
+            sorted(self.s3_client.put_object.call_args_list, key=lambda call: call[1]["Key"]))
+
+    def test_batch_delete_attributes_in_chunks(self):
+        self.s3_client.delete_objects.return_value = {}
+        keys = ["key_{}".format(index) for index in range(1500)]
+
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen)
+        test_s3_adapter.batch_delete_attributes(keys, max_concurrency=1)
+
+        self.assertEqual(2, self.s3_client.delete_objects.call_count)
+        first_call, second_call = self.s3_client.delete_objects.call_args_list
+        self.assertEqual(self.bucket_name, first_call[1]["Bucket"])
+        self.assertTrue(first_call[1]["Delete"]["Quiet"])
+        self.assertEqual(
+            [{"Key": os.path.join(self.bucket_key, key)} for key in keys],
+            first_call[1]["Delete"]["Objects"] + second_call[1]["Delete"]["Objects"])
+        self.assertEqual(1000, len(first_call[1]["Delete"]["Objects"]))
+
+    def test_batch_delete_attributes_with_errors_fails(self):
+        self.s3_client.delete_objects.return_value = {"Errors": [
+            {"Key": "test_key/first_key", "Code": "AccessDenied", "Message": "Access Denied"}]}
+
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen)
+
+        with self.assertRaises(PersistenceException) as exc:
+            test_s3_adapter.batch_delete_attributes(["first_key"])
+
+        self.assertIn("AccessDenied", str(exc.exception))
+
+    def test_save_and_get_attributes_with_attributes_codec(self):
+        self.object_keygen.return_value = "test_object_key"
+        attributes_codec = AttributesCodec(
+            attributes_format=JsonAttributesFormat(json_codec=StdlibJsonCodec()),
+            compression=ZlibCompression(), min_compress_size=0)
+        encoded_data = attributes_codec.encode(_MOCK_DATA)
+        self.s3_client.get_object.return_value = {"Body": mock.Mock(read=mock.Mock(return_value=encoded_data))}
+
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen,
+                                    attributes_codec=attributes_codec)
+        test_s3_adapter.save_attributes(request_envelope=self.request_envelope, attributes=_MOCK_DATA)
+        result = test_s3_adapter.get_attributes(request_envelope=self.request_envelope)
+
+        self.s3_client.put_object.assert_called_once_with(
+            Body=encoded_data, Bucket=self.bucket_name, Key=os.path.join(self.bucket_key, "test_object_key"))
+        self.assertEqual(_MOCK_DATA, result)
+
+    def test_get_legacy_json_attributes_with_attributes_codec(self):
+        self.object_keygen.return_value = "test_object_key"
+        self.s3_client.get_object.return_value = {
+            "Body": mock.Mock(read=mock.Mock(return_value=json.dumps(_MOCK_DATA).encode("utf-8")))}
+
+        test_s3_adapter = S3Adapter(bucket_name=self.bucket_name, path_prefix=self.bucket_key,
+                                    s3_client=self.s3_client, object_keygen=self.object_keygen,
+                                    attributes_codec=AttributesCodec(compression=ZlibCompression()))
+        result = test_s3_adapter.get_attributes(request_envelope=self.request_envelope)
+
+        self.assertEqual(_MOCK_DATA, result)
+
     def tearDown(self):
         self.s3_client = None
         self.object_keygen = None
@@ -16,13 +16,16 @@
 # License.
 #
 import typing
+from ask_sdk_core.exceptions import SerializationException
+from ask_sdk_core.json_codec import get_default_json_codec
+from ask_sdk_core.serialize import DefaultSerializer
 from ask_sdk_core.skill import CustomSkill
 from ask_sdk_model import RequestEnvelope
 
 from .verifier import RequestVerifier, TimestampVerifier
 
 if typing.TYPE_CHECKING:
-    from typing import Dict, Any, List
+    from typing import Dict, Any, List, Optional
     from .verifier import AbstractVerifier
 
 
@@ -44,6 +47,13 @@ class WebserviceSkillHandler(object):
     The `verify_request_and_dispatch` method provides the dispatch
     functionality that can be used as an entry point for skill
     invocation as web service.
+
+    The verifiers run before the request body is deserialized by the
+    skill serializer. They are passed a lazily deserialized
+    :py:class:`ask_sdk_model.request_envelope.RequestEnvelope`, that
+    deserializes only the attributes the verifiers read, like the
+    request type and timestamp. Requests failing verification are
+    thus rejected without the cost of a full deserialization.
     """
     def __init__(
             self, skill, verify_signature=True,
@@ -79,6 +89,8 @@ class WebserviceSkillHandler(object):
         """
         self._skill = skill
         self._verifiers = []  # type: List[AbstractVerifier]
+        self._verification_serializer = DefaultSerializer(
+            lazy_deserialization=True)
 
         if not isinstance(skill, CustomSkill):
             raise TypeError(
@@ -119,11 +131,17 @@ class WebserviceSkillHandler(object):
         """Entry point for webservice skill invocation.
 
         This method takes in the input request headers and request body,
-        handles the deserialization of the input request to
+        run the input through registered verifiers, handles the
+        deserialization of the input request to
         the :py:class:`ask_sdk_model.request_envelope.RequestEnvelope`
-        object, run the input through registered verifiers, invoke the
-        skill and return the serialized response from the
-        skill invocation.
+        object, invoke the skill and return the serialized response
+        from the skill invocation.
+
+        The verifiers are passed the raw request body and a lazily
+        deserialized request envelope, that only deserializes the
+        attributes read during verification. The request body is fully
+        deserialized by the skill serializer only after all verifiers
+        pass. The raw request body is parsed only once, for both.
 
         :param http_request_headers: Request headers of the input
             request to the webservice
@@ -138,16 +156,51 @@ class WebserviceSkillHandler(object):
             when skill deserialization, verification, invocation or
             serialization fails
         """
-        request_envelope = self._skill.serializer.deserialize(
-            payload=http_request_body, obj_type=RequestEnvelope)
+        parsed_request_body = self._parse_request_body(http_request_body)
+
+        verification_request_envelope = (
+            self._verification_serializer.deserialize_from_dict(
+                payload=parsed_request_body, obj_type=RequestEnvelope))
 
         for verifier in self._verifiers:
             verifier.verify(
                 headers=http_request_headers,
                 serialized_request_env=http_request_body,
-                deserialized_request_env=request_envelope)
+                deserialized_request_env=verification_request_envelope)
+
+        request_envelope = self._skill.serializer.deserialize_from_dict(
+            payload=parsed_request_body, obj_type=RequestEnvelope)
 
         response_envelope = self._skill.invoke(
             request_envelope=request_envelope, context=None)
 
         return self._skill.serializer.serialize(response_envelope)  # type: ignore
+
+    def _parse_request_body(self, http_request_body):
+        # type: (Optional[str]) -> Optional[Dict[str, Any]]
+        """Parse the raw request body from JSON.
+
+        The body is parsed with the JSON codec of the skill serializer,
+        configured through the skill builder, or with the default
+        JSON codec if the serializer has no codec.
+
+        :param http_request_body: Raw request body of the input request
+            to the webservice
+        :type http_request_body: str
+        :return: Request body parsed from JSON, or None if no request
+            body is provided
+        :rtype: Dict[str, Any]
+        :raises: :py:class:`ask_sdk_core.exceptions.SerializationException`
+            when the request body is not valid JSON
+        """
+        if http_request_body is None:
+            return None
+
+        json_codec = (
+            getattr(self._skill.serializer, "json_codec", None) or
+            get_default_json_codec())
+        try:
+            return json_codec.loads(http_request_body)
+        except Exception:
+            raise SerializationException(
+                "Couldn't parse request body: {}".format(http_request_body))
@@ -15,17 +15,23 @@
 # specific language governing permissions and limitations under the
 # License.
 #
+import json
 import unittest
+from datetime import datetime, timedelta
 
 from ask_sdk_core.skill import CustomSkill
 from ask_sdk_core.serialize import DefaultSerializer
-from ask_sdk_core.exceptions import AskSdkException
+from ask_sdk_core.exceptions import AskSdkException, SerializationException
+from ask_sdk_core.json_codec import AbstractJsonCodec
+from ask_sdk_model import IntentRequest, RequestEnvelope
 from ask_sdk_webservice_support.webservice_handler import (
     WebserviceSkillHandler)
 from ask_sdk_webservice_support.verifier import (
     RequestVerifier, TimestampVerifier, AbstractVerifier,
     VerificationException)
 
+from dateutil.tz import tzutc
+
 try:
     import mock
 except ImportError:
@@ -169,10 +175,34 @@ class TestWebserviceSkillHandler(unittest.TestCase):
             "Webservice skill handler initialized invalid default verifier, "
             "when request signature verification env property is set to false")
 
+    def test_webservice_skill_handler_dispatch_invalid_body_throw_exc(self):
+        test_webservice_skill_handler = WebserviceSkillHandler(
+            skill=self.mock_skill, verify_signature=False,
+            verify_timestamp=False, verifiers=[self.mock_verifier])
+
+        with self.assertRaises(SerializationException) as exc:
+            test_webservice_skill_handler.verify_request_and_dispatch(
+                http_request_headers=None, http_request_body="{invalid")
+
+        self.assertIn(
+            "Couldn't parse request body", str(exc.exception),
+            "Webservice skill handler didn't raise serialization exception "
+            "for invalid request body during skill dispatch")
+
+        self.assertFalse(
+            self.mock_verifier.verify.called,
+            "Webservice skill handler called verifier verify when request "
+            "body parsing failed")
+
+        self.assertFalse(
+            self.mock_skill.invoke.called,
+            "Webservice skill handler called skill invoke when request "
+            "body parsing failed")
+
     def test_webservice_skill_handler_dispatch_serialization_failure_throw_exc(
             self):
-        self.mock_serializer.deserialize.side_effect = AskSdkException(
-            "test deserialization exception")
+        self.mock_serializer.deserialize_from_dict.side_effect = (
+            AskSdkException("test deserialization exception"))
         test_webservice_skill_handler = WebserviceSkillHandler(
             skill=self.mock_skill, verify_signature=False,
             verify_timestamp=False, verifiers=[self.mock_verifier])
@@ -186,15 +216,15 @@ class TestWebserviceSkillHandler(unittest.TestCase):
             "Webservice skill handler didn't raise deserialization exception "
             "during skill dispatch")
 
-        self.assertFalse(
+        self.assertTrue(
             self.mock_verifier.verify.called,
-            "Webservice skill handler called verifier verify when request "
-            "deserialization failed")
+            "Webservice skill handler didn't call verifier verify before "
+            "request deserialization")
 
         self.assertFalse(
             self.mock_skill.invoke.called,
             "Webservice skill handler called skill invoke when request "
-            "verification failed")
+            "deserialization failed")
 
     def test_webservice_skill_handler_dispatch_verification_failure_throw_exc(
             self):
@@ -213,6 +243,11 @@ class TestWebserviceSkillHandler(unittest.TestCase):
             "Webservice skill handler didn't raise verification exception "
             "during skill dispatch")
 
+        self.assertFalse(
+            self.mock_serializer.deserialize_from_dict.called,
+            "Webservice skill handler deserialized request body when "
+            "request verification failed")
+
         self.assertFalse(
             self.mock_skill.invoke.called,
             "Webservice skill handler called skill invoke when request "
@@ -247,3 +282,85 @@ class TestWebserviceSkillHandler(unittest.TestCase):
                 "Webservice skill handler failed request verification "
                 "and request dispatch for a valid input request")
 
+
+    def test_webservice_skill_handler_dispatch_uses_skill_json_codec(self):
+        test_request_body = '{"version": "1.0"}'
+        self.mock_serializer.json_codec = mock.MagicMock(
+            spec=AbstractJsonCodec)
+        self.mock_serializer.json_codec.loads.return_value = {
+            "version": "1.0"}
+        test_webservice_skill_handler = WebserviceSkillHandler(
+            skill=self.mock_skill, verify_signature=False,
+            verify_timestamp=False)
+
+        test_webservice_skill_handler.verify_request_and_dispatch(
+            http_request_headers=None, http_request_body=test_request_body)
+
+        self.mock_serializer.json_codec.loads.assert_called_once_with(
+            test_request_body), (
+            "Webservice skill handler didn't parse the request body with "
+            "the JSON codec of the skill serializer")
+        self.mock_serializer.deserialize_from_dict.assert_called_once_with(
+            payload={"version": "1.0"}, obj_type=RequestEnvelope)
+
+    def test_webservice_skill_handler_dispatch_verifies_before_deserialization(
+            self):
+        test_request_body = json.dumps({
+            "version": "1.0",
+            "session": {"new": True, "sessionId": "test-session-id"},
+            "request": {
+                "type": "IntentRequest",
+                "requestId": "test-request-id",
+                "timestamp": datetime.now(tzutc()).isoformat(),
+                "intent": {"name": "TestIntent", "slots": {}}
+            }
+        })
+        test_verifier = TimestampVerifier()
+        test_webservice_skill_handler = WebserviceSkillHandler(
+            skill=self.mock_skill, verify_signature=False,
+            verify_timestamp=False, verifiers=[test_verifier])
+
+        with mock.patch.object(
+                test_verifier, "verify",
+                wraps=test_verifier.verify) as mock_verify:
+            test_webservice_skill_handler.verify_request_and_dispatch(
+                http_request_headers={}, http_request_body=test_request_body)
+
+        verification_request_envelope = (
+            mock_verify.call_args[1]["deserialized_request_env"])
+        self.assertNotIn(
+            "session", verification_request_envelope.__dict__,
+            "Webservice skill handler fully deserialized request envelope "
+            "for verification")
+        self.assertIsInstance(
+            verification_request_envelope.request, IntentRequest,
+            "Webservice skill handler didn't deserialize request envelope "
+            "request for verification")
+        self.mock_serializer.deserialize_from_dict.assert_called_once_with(
+            payload=json.loads(test_request_body), obj_type=RequestEnvelope)
+
+    def test_webservice_skill_handler_dispatch_stale_request_not_deserialized(
+            self):
+        test_request_body = json.dumps({
+            "version": "1.0",
+            "request": {
+                "type": "IntentRequest",
+                "requestId": "test-request-id",
+                "timestamp": (
+                    datetime.now(tzutc()) - timedelta(hours=1)).isoformat()
+            }
+        })
+        test_webservice_skill_handler = WebserviceSkillHandler(
+            skill=self.mock_skill, verify_signature=False)
+
+        with self.assertRaises(VerificationException) as exc:
+            test_webservice_skill_handler.verify_request_and_dispatch(
+                http_request_headers={}, http_request_body=test_request_body)
+
+        self.assertIn(
+            "Timestamp verification failed", str(exc.exception),
+            "Webservice skill handler didn't raise verification exception "
+            "for stale request")
+        self.assertFalse(
+            self.mock_serializer.deserialize_from_dict.called,
+            "Webservice skill handler deserialized stale request body")
@@ -45,7 +45,8 @@ class StandardSkillBuilder(SkillBuilder):
         envelope and provides a unique partition key value.
     :type partition_keygen: Callable[[RequestEnvelope], str]
     :param dynamodb_client: Resource to be used, to perform dynamo
-        operations.
+        operations. Defaulted to resource generated from boto3, when
+        the persistence adapter is first used.
     :type dynamodb_client: boto3.resources.base.ServiceResource
     """
 
@@ -69,7 +70,8 @@ class StandardSkillBuilder(SkillBuilder):
             envelope and provides a unique partition key value.
         :type partition_keygen: Callable[[ask_sdk_model.RequestEnvelope], str]
         :param dynamodb_client: Resource to be used, to perform dynamo
-            operations.
+            operations. Defaulted to resource generated from boto3,
+            when the persistence adapter is first used.
         :type dynamodb_client: boto3.resources.base.ServiceResource
         """
         super(StandardSkillBuilder, self).__init__()
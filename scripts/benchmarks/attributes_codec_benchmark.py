@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+# Compares the attributes codec formats and compressions encoding and
+# decoding ~40 KB of persistent attributes, with the size of the
+# encoded attributes, for the libraries installed.
+#
+# Usage: python scripts/benchmarks/attributes_codec_benchmark.py
+import json
+import timeit
+
+from ask_sdk_core.attributes_codec import (
+    AttributesCodec, JsonAttributesFormat, MsgpackAttributesFormat,
+    CborAttributesFormat, ZlibCompression, ZstdCompression)
+
+ITERATIONS = 200
+REPEAT = 5
+
+ATTRIBUTES = {
+    "games": [
+        {
+            "id": "game_{}".format(index),
+            "score": index * 10,
+            "completed": index % 2 == 0,
+            "answers": ["answer_{}".format(answer) for answer in range(10)],
+            "stats": {"attempts": index, "hints": 2, "streak": index % 5}
+        } for index in range(150)
+    ],
+    "profile": {"name": "test user", "level": 12, "badges": list(range(20))}
+}
+
+
+def create(name, factory):
+    try:
+        return factory()
+    except ImportError:
+        print("{} is not installed, skipping".format(name))
+        return None
+
+
+def get_codecs():
+    formats = [("json", create("json", JsonAttributesFormat)),
+               ("msgpack", create("msgpack", MsgpackAttributesFormat)),
+               ("cbor", create("cbor2", CborAttributesFormat))]
+    compressions = [("none", None),
+                    ("zlib", ZlibCompression()),
+                    ("zstd", create("zstandard", ZstdCompression))]
+    codecs = []
+    for format_name, attributes_format in formats:
+        if attributes_format is None:
+            continue
+        for compression_name, compression in compressions:
+            if compression is None and compression_name != "none":
+                continue
+            codecs.append(("{}+{}".format(format_name, compression_name),
+                           AttributesCodec(
+                               attributes_format=attributes_format,
+                               compression=compression)))
+    return codecs
+
+
+def main():
+    codecs = get_codecs()
+    print("JSON text size: {} bytes".format(len(json.dumps(ATTRIBUTES))))
+    print("{:<14} {:>12} {:>14} {:>14}".format(
+        "codec", "size (bytes)", "encode (us)", "decode (us)"))
+    for name, codec in codecs:
+        encoded = codec.encode(ATTRIBUTES)
+        results = []
+        for func in (lambda: codec.encode(ATTRIBUTES),
+                     lambda: codec.decode(encoded)):
+            elapsed = min(timeit.repeat(
+                func, number=ITERATIONS, repeat=REPEAT))
+            results.append(elapsed / ITERATIONS * 1e6)
+        print("{:<14} {:>12} {:>14.2f} {:>14.2f}".format(
+            name, len(encoded), *results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Compares deserializing the datetime formats found in Alexa payloads
+# with the default serializer, against parsing them with dateutil.
+#
+# Usage: python scripts/benchmarks/datetime_benchmark.py
+import timeit
+from datetime import datetime
+
+from dateutil.parser import parse
+
+from ask_sdk_core.serialize import DefaultSerializer
+
+ITERATIONS = 20000
+REPEAT = 5
+
+DATETIME_FORMATS = [
+    # request.timestamp
+    ("utc", "2019-05-22T17:04:39Z"),
+    # reminders createdTime / updatedTime
+    ("utc millis", "2019-05-22T17:04:39.123Z"),
+    # reminders scheduledTime, in the device time zone
+    ("local", "2019-09-22T19:04:00.000"),
+    # timestamps with an explicit offset
+    ("offset", "2019-05-22T17:04:39+05:30"),
+]
+
+
+def main():
+    serializer = DefaultSerializer()
+    print("{:<12} {:>14} {:>16}".format(
+        "format", "dateutil (us)", "serializer (us)"))
+    for name, payload in DATETIME_FORMATS:
+        results = []
+        for func in (
+                lambda: parse(payload),
+                lambda: serializer.deserialize_from_dict(payload, datetime)):
+            elapsed = min(timeit.repeat(
+                func, number=ITERATIONS, repeat=REPEAT))
+            results.append(elapsed / ITERATIONS * 1e6)
+        print("{:<12} {:>14.2f} {:>16.2f}".format(name, *results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Compares the per request dispatch overhead of the generic request
+# dispatcher with the frozen request dispatcher, for a request handled
+# by the handler registered last, with a global request and response
+# interceptor registered, as the number of registered handlers grows.
+#
+# Usage: python scripts/benchmarks/dispatcher_benchmark.py
+import timeit
+
+from ask_sdk_core.skill_builder import SkillBuilder
+
+HANDLER_COUNTS = [1, 10, 40, 160]
+ITERATIONS = 20000
+
+
+def build_dispatcher(handler_count, frozen):
+    sb = SkillBuilder()
+    for i in range(handler_count):
+        sb.request_handler(
+            can_handle_func=(
+                lambda handler_input, i=i: handler_input == i))(
+            lambda handler_input: handler_input)
+    sb.global_request_interceptor()(lambda handler_input: None)
+    sb.global_response_interceptor()(lambda handler_input, response: None)
+    if frozen:
+        sb.enable_frozen_dispatch()
+    return sb.create().request_dispatcher
+
+
+def main():
+    print("{:>10} {:>16} {:>16}".format(
+        "handlers", "generic (us)", "frozen (us)"))
+    for handler_count in HANDLER_COUNTS:
+        handler_input = handler_count - 1
+        results = []
+        for frozen in (False, True):
+            dispatcher = build_dispatcher(handler_count, frozen)
+            assert dispatcher.dispatch(handler_input) == handler_input
+            elapsed = timeit.timeit(
+                lambda: dispatcher.dispatch(handler_input),
+                number=ITERATIONS)
+            results.append(elapsed / ITERATIONS * 1e6)
+        print("{:>10} {:>16.2f} {:>16.2f}".format(handler_count, *results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Compares the resource based DynamoDbAdapter with the client based
+# DynamoDbClientAdapter getting and saving a large nested attributes
+# map. Requests are answered by an in-memory DynamoDb stand-in hooked
+# into botocore before sending, so the whole boto3 stack runs except
+# for the network.
+#
+# Usage: PYTHONPATH=ask-sdk-core:ask-sdk-runtime:ask-sdk-dynamodb-persistence-adapter \
+#     python scripts/benchmarks/dynamodb_adapter_benchmark.py
+import json
+import os
+import timeit
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from ask_sdk_model import RequestEnvelope
+from ask_sdk_dynamodb.adapter import DynamoDbAdapter
+from ask_sdk_dynamodb.client_adapter import (
+    DynamoDbClientAdapter, serialize_item, deserialize_item)
+
+ITERATIONS = 200
+REPEAT = 5
+
+ATTRIBUTES = {
+    "games": [
+        {
+            "id": "game_{}".format(index),
+            "score": index * 10,
+            "completed": index % 2 == 0,
+            "answers": ["answer_{}".format(answer) for answer in range(10)],
+            "stats": {"attempts": index, "hints": 2, "streak": index % 5}
+        } for index in range(50)
+    ],
+    "profile": {"name": "test user", "level": 12, "badges": list(range(20))}
+}
+
+
+class _RawResponse(object):
+    def __init__(self, body):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+class DynamoDbStandIn(object):
+    """In-memory DynamoDb table answering GetItem, PutItem and
+    DeleteItem requests with the item stored by the last PutItem.
+    """
+
+    def __init__(self, item):
+        self.item = item
+
+    def __call__(self, request, **kwargs):
+        operation = request.headers["X-Amz-Target"].decode("utf-8")
+        body = {}
+        if operation.endswith("GetItem"):
+            body = {"Item": self.item}
+        elif operation.endswith("PutItem"):
+            self.item = json.loads(request.body.decode("utf-8"))["Item"]
+        return AWSResponse(
+            request.url, 200, {},
+            _RawResponse(json.dumps(body).encode("utf-8")))
+
+
+def attach_stand_in(client, item):
+    client.meta.events.register(
+        "before-send.dynamodb", DynamoDbStandIn(item))
+
+
+def main():
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+    item = serialize_item({"id": "test_user", "attributes": ATTRIBUTES})
+    request_envelope = RequestEnvelope()
+
+    resource = boto3.resource("dynamodb")
+    attach_stand_in(resource.meta.client, item)
+    client = boto3.client("dynamodb")
+    attach_stand_in(client, item)
+    unvalidated_client = boto3.client(
+        "dynamodb", config=Config(parameter_validation=False))
+    attach_stand_in(unvalidated_client, item)
+
+    adapters = [
+        ("resource", DynamoDbAdapter(
+            table_name="test_table", dynamodb_resource=resource,
+            partition_keygen=lambda request_envelope: "test_user")),
+        ("client", DynamoDbClientAdapter(
+            table_name="test_table", dynamodb_client=client,
+            partition_keygen=lambda request_envelope: "test_user")),
+        ("client*", DynamoDbClientAdapter(
+            table_name="test_table", dynamodb_client=unvalidated_client,
+            partition_keygen=lambda request_envelope: "test_user"))
+    ]
+
+    print("{:<10} {:>16} {:>16} {:>18}".format(
+        "adapter", "get attrs (us)", "save attrs (us)", "unmarshal only (us)"))
+    for name, adapter in adapters:
+        results = []
+        for func in (
+                lambda: adapter.get_attributes(request_envelope),
+                lambda: adapter.save_attributes(
+                    request_envelope, ATTRIBUTES)):
+            elapsed = min(timeit.repeat(
+                func, number=ITERATIONS, repeat=REPEAT))
+            results.append(elapsed / ITERATIONS * 1e6)
+        if name == "resource":
+            type_deserializer = TypeDeserializer()
+            unmarshal = lambda: {
+                key: type_deserializer.deserialize(value)
+                for key, value in item.items()}
+        else:
+            unmarshal = lambda: deserialize_item(item)
+        elapsed = min(timeit.repeat(
+            unmarshal, number=ITERATIONS, repeat=REPEAT))
+        results.append(elapsed / ITERATIONS * 1e6)
+        print("{:<10} {:>16.2f} {:>16.2f} {:>18.2f}".format(name, *results))
+    print("* client with botocore parameter validation disabled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Compares the exception handler lookup cost of predicate based
+# exception handlers with handlers registered by exception type, for
+# an exception handled by the handler registered last, as the number
+# of registered handlers grows.
+#
+# Usage: python scripts/benchmarks/exception_mapper_benchmark.py
+import timeit
+
+from ask_sdk_core.skill_builder import SkillBuilder
+
+HANDLER_COUNTS = [10, 20, 40, 80, 160]
+ITERATIONS = 20000
+
+
+def build_exception_mapper(exception_types, typed):
+    sb = SkillBuilder()
+    for exception_type in exception_types:
+        if typed:
+            sb.exception_handler(exception_type=exception_type)(
+                lambda handler_input, exception: None)
+        else:
+            sb.exception_handler(
+                can_handle_func=(
+                    lambda handler_input, exception, t=exception_type:
+                    isinstance(exception, t)))(
+                lambda handler_input, exception: None)
+    return sb.skill_configuration.exception_mapper
+
+
+def main():
+    print("{:>10} {:>16} {:>16}".format(
+        "handlers", "predicate (us)", "typed (us)"))
+    for handler_count in HANDLER_COUNTS:
+        exception_types = [
+            type("Error{}".format(i), (Exception,), {})
+            for i in range(handler_count)]
+        exception = exception_types[-1]()
+        results = []
+        for typed in (False, True):
+            mapper = build_exception_mapper(exception_types, typed)
+            assert mapper.get_handler(None, exception) is not None
+            elapsed = timeit.timeit(
+                lambda: mapper.get_handler(None, exception),
+                number=ITERATIONS)
+            results.append(elapsed / ITERATIONS * 1e6)
+        print("{:>10} {:>16.2f} {:>16.2f}".format(handler_count, *results))
+
+
+if __name__ == "__main__":
+    main()
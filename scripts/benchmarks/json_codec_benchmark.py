@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Compares the JSON codec backends decoding an intent request envelope
+# and encoding a response envelope with an APL directive, for the
+# backends installed.
+#
+# Usage: python scripts/benchmarks/json_codec_benchmark.py
+import json
+import timeit
+
+from ask_sdk_core.json_codec import StdlibJsonCodec, OrjsonCodec, UjsonCodec
+
+from serializer_benchmark import REQUEST_ENVELOPE, RESPONSE_ENVELOPE
+
+ITERATIONS = 5000
+REPEAT = 5
+
+
+def get_codecs():
+    codecs = [("json", StdlibJsonCodec())]
+    for name, codec_class in (("orjson", OrjsonCodec), ("ujson", UjsonCodec)):
+        try:
+            codecs.append((name, codec_class()))
+        except ImportError:
+            print("{} is not installed, skipping".format(name))
+    return codecs
+
+
+def main():
+    request_json = json.dumps(REQUEST_ENVELOPE)
+    print("{:<10} {:>16} {:>16}".format(
+        "backend", "loads req (us)", "dumps resp (us)"))
+    for name, codec in get_codecs():
+        results = []
+        for func in (lambda: codec.loads(request_json),
+                     lambda: codec.dumps(RESPONSE_ENVELOPE)):
+            elapsed = min(timeit.repeat(
+                func, number=ITERATIONS, repeat=REPEAT))
+            results.append(elapsed / ITERATIONS * 1e6)
+        print("{:<10} {:>16.2f} {:>16.2f}".format(name, *results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Compares the handler lookup cost of the linear GenericRequestMapper
+# with the IndexedRequestMapper, for an intent handler registered
+# last, as the number of registered handlers grows.
+#
+# Usage: python scripts/benchmarks/request_mapper_benchmark.py
+import timeit
+
+from ask_sdk_model import RequestEnvelope, IntentRequest, Intent
+from ask_sdk_core.skill_builder import SkillBuilder
+from ask_sdk_core.handler_input import HandlerInput
+from ask_sdk_core.utils import is_intent_name, is_request_type
+
+HANDLER_COUNTS = [10, 20, 40, 80, 160]
+ITERATIONS = 20000
+
+
+def build_request_mapper(handler_count, indexed):
+    sb = SkillBuilder()
+    sb.request_handler(can_handle_func=is_request_type("LaunchRequest"))(
+        lambda handler_input: None)
+    for i in range(handler_count - 1):
+        sb.request_handler(can_handle_func=is_intent_name(
+            "Intent{}".format(i)))(lambda handler_input: None)
+    if indexed:
+        sb.enable_request_indexing()
+    return sb.skill_configuration.request_mappers[0]
+
+
+def main():
+    print("{:>10} {:>16} {:>16}".format(
+        "handlers", "generic (us)", "indexed (us)"))
+    for handler_count in HANDLER_COUNTS:
+        handler_input = HandlerInput(request_envelope=RequestEnvelope(
+            request=IntentRequest(intent=Intent(
+                name="Intent{}".format(handler_count - 2)))))
+        results = []
+        for indexed in (False, True):
+            mapper = build_request_mapper(handler_count, indexed)
+            assert mapper.get_request_handler_chain(handler_input) is not None
+            elapsed = timeit.timeit(
+                lambda: mapper.get_request_handler_chain(handler_input),
+                number=ITERATIONS)
+            results.append(elapsed / ITERATIONS * 1e6)
+        print("{:>10} {:>16.2f} {:>16.2f}".format(handler_count, *results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Measures the default serializer cost of deserializing a parsed
+# intent request envelope, eagerly and lazily (with and without reading
+# the attributes a typical handler reads), and of serializing a
+# response envelope with speech, card, reprompt and an APL directive.
+#
+# Usage: python scripts/benchmarks/serializer_benchmark.py
+import timeit
+
+from ask_sdk_model import RequestEnvelope, ResponseEnvelope
+
+from ask_sdk_core.serialize import DefaultSerializer
+
+ITERATIONS = 2000
+REPEAT = 5
+
+REQUEST_ENVELOPE = {
+    "version": "1.0",
+    "session": {
+        "new": False,
+        "sessionId": "amzn1.echo-api.session.1",
+        "application": {"applicationId": "amzn1.ask.skill.1"},
+        "attributes": {"counter": 3, "last_intent": "OrderIntent"},
+        "user": {"userId": "amzn1.ask.account.1"}
+    },
+    "context": {
+        "System": {
+            "application": {"applicationId": "amzn1.ask.skill.1"},
+            "user": {"userId": "amzn1.ask.account.1"},
+            "device": {
+                "deviceId": "amzn1.ask.device.1",
+                "supportedInterfaces": {
+                    "AudioPlayer": {},
+                    "Alexa.Presentation.APL": {"runtime": {"maxVersion": "1.9"}}
+                }
+            },
+            "apiEndpoint": "https://api.amazonalexa.com",
+            "apiAccessToken": "token"
+        },
+        "Viewport": {
+            "experiences": [{"arcMinuteWidth": 246, "arcMinuteHeight": 144,
+                             "canRotate": False, "canResize": False}],
+            "mode": "HUB",
+            "shape": "RECTANGLE",
+            "pixelWidth": 1024,
+            "pixelHeight": 600,
+            "dpi": 160,
+            "currentPixelWidth": 1024,
+            "currentPixelHeight": 600,
+            "touch": ["SINGLE"]
+        }
+    },
+    "request": {
+        "type": "IntentRequest",
+        "requestId": "amzn1.echo-api.request.1",
+        "timestamp": "2020-01-01T10:20:30Z",
+        "locale": "en-US",
+        "dialogState": "IN_PROGRESS",
+        "intent": {
+            "name": "OrderIntent",
+            "confirmationStatus": "NONE",
+            "slots": {
+                name: {
+                    "name": name,
+                    "value": "value",
+                    "confirmationStatus": "NONE",
+                    "resolutions": {
+                        "resolutionsPerAuthority": [{
+                            "authority": "amzn1.er-authority.1",
+                            "status": {"code": "ER_SUCCESS_MATCH"},
+                            "values": [{"value": {"name": "value",
+                                                  "id": "1"}}]
+                        }]
+                    }
+                } for name in ("size", "crust", "topping", "quantity")
+            }
+        }
+    }
+}
+
+RESPONSE_ENVELOPE = {
+    "version": "1.0",
+    "sessionAttributes": {"counter": 4, "last_intent": "OrderIntent"},
+    "userAgent": "ask-python/1.0.0 Python/3.8",
+    "response": {
+        "outputSpeech": {"type": "SSML", "ssml": "<speak>Done</speak>"},
+        "card": {"type": "Simple", "title": "Order", "content": "Done"},
+        "reprompt": {
+            "outputSpeech": {"type": "PlainText", "text": "Anything else?"}
+        },
+        "directives": [{
+            "type": "Alexa.Presentation.APL.RenderDocument",
+            "token": "order",
+            "document": {
+                "type": "APL",
+                "version": "1.9",
+                "mainTemplate": {
+                    "parameters": ["payload"],
+                    "items": [{
+                        "type": "Container",
+                        "items": [{"type": "Text", "text": "Item {}".format(i)}
+                                  for i in range(20)]
+                    }]
+                }
+            },
+            "datasources": {"payload": {"items": list(range(20))}}
+        }],
+        "shouldEndSession": False
+    }
+}
+
+
+def read_handler_attributes(request_envelope):
+    return (request_envelope.request.intent.name,
+            request_envelope.session.attributes,
+            request_envelope.context.system.user.user_id)
+
+
+def main():
+    serializer = DefaultSerializer()
+    lazy_serializer = DefaultSerializer(lazy_deserialization=True)
+    response_envelope = serializer.deserialize_from_dict(
+        RESPONSE_ENVELOPE, ResponseEnvelope)
+
+    benchmarks = [
+        ("deserialize RequestEnvelope",
+         lambda: serializer.deserialize_from_dict(
+             REQUEST_ENVELOPE, RequestEnvelope)),
+        ("lazy deserialize",
+         lambda: lazy_serializer.deserialize_from_dict(
+             REQUEST_ENVELOPE, RequestEnvelope)),
+        ("lazy deserialize + read",
+         lambda: read_handler_attributes(
+             lazy_serializer.deserialize_from_dict(
+                 REQUEST_ENVELOPE, RequestEnvelope))),
+        ("serialize ResponseEnvelope",
+         lambda: serializer.serialize(response_envelope)),
+    ]
+    print("{:<30} {:>12}".format("operation", "time (us)"))
+    for name, func in benchmarks:
+        elapsed = min(timeit.repeat(func, number=ITERATIONS, repeat=REPEAT))
+        print("{:<30} {:>12.2f}".format(name, elapsed / ITERATIONS * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights
+# Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the
+# License.
+#
+# Compares the latency and allocated memory of the copy on write
+# session attributes in the attributes manager against a deepcopy of
+# the request envelope session attributes, for a game state of a few
+# KB. Each scenario starts from a new attributes manager.
+#
+# Usage: python scripts/benchmarks/session_attributes_benchmark.py
+import json
+import timeit
+import tracemalloc
+from copy import deepcopy
+
+from ask_sdk_model import RequestEnvelope
+from ask_sdk_model.session import Session
+
+from ask_sdk_core.attributes_manager import (
+    AttributesManager, _unwrap_copy_on_write)
+from ask_sdk_core.serialize import DefaultSerializer
+
+ITERATIONS = 2000
+REPEAT = 5
+
+SESSION_ATTRIBUTES = {
+    "score": 120,
+    "turn": "player-1",
+    "board": [[None if (row + col) % 3 else "x" for col in range(8)]
+              for row in range(8)],
+    "players": [
+        {
+            "id": "player-{}".format(index),
+            "name": "Player {}".format(index),
+            "wins": index,
+            "inventory": [{"item": "item-{}".format(item), "count": item}
+                          for item in range(10)],
+        }
+        for index in range(4)
+    ],
+    "history": [{"turn": turn, "move": [turn % 8, turn // 8]}
+                for turn in range(30)],
+    "settings": {"level": 3, "sound": True, "locale": "en-US"},
+}
+
+REQUEST_ENVELOPE = RequestEnvelope(
+    session=Session(attributes=SESSION_ATTRIBUTES))
+
+
+def read_keys(session_attributes):
+    return session_attributes["score"], session_attributes["settings"]["level"]
+
+
+def change_board(session_attributes):
+    session_attributes["score"] += 1
+    session_attributes["board"][3][4] = "o"
+
+
+SERIALIZER = DefaultSerializer()
+
+
+def full_turn(session_attributes):
+    # Same as the custom skill building and serializing the response
+    change_board(session_attributes)
+    return SERIALIZER.serialize(_unwrap_copy_on_write(session_attributes))
+
+
+SCENARIOS = [
+    ("init", lambda session_attributes: None),
+    ("read 2 keys", read_keys),
+    ("change path", change_board),
+    ("change+serialize", full_turn),
+]
+
+
+def deepcopy_attributes():
+    return deepcopy(REQUEST_ENVELOPE.session.attributes)
+
+
+def copy_on_write_attributes():
+    return AttributesManager(
+        request_envelope=REQUEST_ENVELOPE).session_attributes
+
+
+def measure_allocations(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024.0
+
+
+def main():
+    print("Session attributes size: {:.1f} KB".format(
+        len(json.dumps(SESSION_ATTRIBUTES)) / 1024.0))
+    print("{:<18} {:>14} {:>10} {:>14} {:>10}".format(
+        "scenario", "deepcopy (us)", "cow (us)", "deepcopy (KB)", "cow (KB)"))
+    for name, scenario in SCENARIOS:
+        times = []
+        allocations = []
+        for get_attributes in (deepcopy_attributes, copy_on_write_attributes):
+            def run():
+                return scenario(get_attributes())
+            elapsed = min(timeit.repeat(
+                run, number=ITERATIONS, repeat=REPEAT))
+            times.append(elapsed / ITERATIONS * 1e6)
+            allocations.append(measure_allocations(run))
+        print("{:<18} {:>14.2f} {:>10.2f} {:>14.1f} {:>10.1f}".format(
+            name, times[0], times[1], allocations[0], allocations[1]))
+
+
+if __name__ == "__main__":
+    main()